@@ -101,6 +101,11 @@ setup(
 
     install_requires=required,
 
+    extras_require={
+        # The concurrent.futures backport
+        ":python_version < '3.0'": ["futures>=3.2.0"],
+    },
+
     entry_points={
         'console_scripts': ['pgadmin4=pgadmin4.pgAdmin4.__init__:main'],
     },
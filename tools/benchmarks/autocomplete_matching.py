@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility measures the time taken by the query tool auto complete to
+# find the table and view suggestions in a synthetic catalog, using the
+# full scan of the collection and the prefix index.
+#
+# Usage (from the top-level directory of the source tree):
+#
+#     python tools/benchmarks/autocomplete_matching.py [--objects 500000]
+
+from __future__ import print_function
+import argparse
+import os
+import random
+import re
+import sys
+import timeit
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..',
+                    'web')
+)
+
+from pgadmin.utils.sqlautocomplete.autocomplete import SQLAutoComplete
+from pgadmin.utils.sqlautocomplete.metadata_cache import \
+    AutoCompleteMetadata
+from pgadmin.utils.sqlautocomplete.prioritization import PrevalenceCounter
+from pgadmin.utils.sqlautocomplete.sqlcompletion import Table
+
+WORDS = ['account', 'address', 'audit', 'balance', 'customer', 'event',
+         'invoice', 'item', 'ledger', 'order', 'payment', 'product',
+         'region', 'shipment', 'stock', 'supplier', 'tax', 'user']
+
+PREFIXES = ['', 'i', 'inv', 'invoice_ta', 'order_item_12', 'zz']
+
+
+class OfflineAutoComplete(SQLAutoComplete):
+    """
+    SQLAutoComplete without the database connection, the metadata is
+    provided by the caller.
+    """
+
+    def __init__(self):
+        self.sid = self.did = self.conn = None
+        self.databases = []
+        self.functions = []
+        self.search_path = ['public']
+        self.name_pattern = re.compile("^[_a-z][_a-z0-9\\$]*$")
+        self.metadata = AutoCompleteMetadata()
+        self.metadata.keywords = []
+        self.metadata.prioritizer = PrevalenceCounter([])
+        self.metadata.reserved_words = set()
+        self._bind_metadata()
+        self.search_path_filter = True
+        self.generate_aliases = False
+        self.max_completions = None
+
+        self.extend_schemata(['public'])
+        for obj_type in ('tables', 'views', 'datatypes', 'functions'):
+            self.metadata.loaded[obj_type].add('public')
+
+
+def make_names(count):
+    rnd = random.Random(42)
+    return [
+        '{0}_{1}_{2}'.format(rnd.choice(WORDS), rnd.choice(WORDS), idx)
+        for idx in range(count)
+    ]
+
+
+def full_scan(completer, text):
+    tables = completer.populate_schema_objects(None, 'tables')
+    tables = [completer._make_cand(t, False, None) for t in tables]
+    return completer.find_matches(text, tables, mode='strict', meta='table')
+
+
+def indexed(completer, text):
+    return completer.get_table_matches(Table(None, [], ()), text)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--objects', type=int, default=500000,
+                        help='number of tables in the synthetic catalog')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    completer = OfflineAutoComplete()
+    names = make_names(args.objects)
+
+    start = timeit.default_timer()
+    completer.extend_relations([('public', n) for n in names], 'tables')
+    completer.populate_schema_objects(None, 'tables', '')
+    print('Loaded {0} tables and built the index in {1:.2f}s\n'.format(
+        len(names), timeit.default_timer() - start))
+
+    print('{0:<16} {1:>8} {2:>12} {3:>12}'.format(
+        'prefix', 'matches', 'full scan', 'indexed'))
+    for text in PREFIXES:
+        matches = len(indexed(completer, text))
+        assert matches == len(full_scan(completer, text))
+        timings = []
+        for func in (full_scan, indexed):
+            timings.append(min(timeit.repeat(
+                lambda: func(completer, text), number=1, repeat=args.repeat
+            )))
+        print('{0:<16} {1:>8} {2:>11.3f}s {3:>11.3f}s'.format(
+            repr(text), matches, timings[0], timings[1]))
+
+
+if __name__ == '__main__':
+    main()
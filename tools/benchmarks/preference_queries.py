@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility counts the configuration database queries run, and measures
+# the time taken to read the preferences of a user in a typical request
+# (i.e. opening the Query Tool, which reads the editor, display, explain,
+# and keyboard shortcut preferences). The preferences are read with one
+# query per preference (as Preference.get used to do), and from the
+# snapshot of the preferences of the user loaded once per request.
+#
+# The preferences are registered in a temporary SQLite configuration
+# database, and half of them are set for the user.
+#
+# Usage (from the top-level directory of the source tree):
+#
+#     python tools/benchmarks/preference_queries.py [--preferences 60] \
+#         [--requests 1000]
+
+from __future__ import print_function
+import argparse
+import os
+import sys
+import timeit
+
+root = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'web'
+)
+sys.path.insert(0, root)
+
+from flask import Flask
+from sqlalchemy import event
+
+from pgadmin.model import db, User, UserPreference as UserPrefTable
+from pgadmin.utils import preferences
+from pgadmin.utils.preferences import Preferences
+
+
+class BenchmarkUser(object):
+    def __init__(self, uid):
+        self.id = uid
+
+
+def register_preferences(count):
+    """Register the preferences in a few modules, and categories"""
+    prefs = []
+    types = [
+        ('boolean', False, 'True'),
+        ('integer', 10, '20'),
+        ('text', 'a', 'b'),
+        ('options', 'x', 'y'),
+        ('keyboardshortcut', {'key': 'F5'}, '{"key": "F7"}')
+    ]
+    for idx in range(count):
+        module = Preferences('bench_module_{0}'.format(idx % 3))
+        _type, default, value = types[idx % len(types)]
+        pref = module.register(
+            'category_{0}'.format(idx % 4), 'pref_{0}'.format(idx),
+            'Preference {0}'.format(idx), _type, default,
+            options=[{'label': 'X', 'value': 'x'},
+                     {'label': 'Y', 'value': 'y'}]
+            if _type == 'options' else None
+        )
+        if idx % 2:
+            db.session.add(
+                UserPrefTable(pid=pref.pid, uid=1, value=value)
+            )
+        prefs.append(pref)
+    db.session.commit()
+    return prefs
+
+
+def get_per_query(pref):
+    res = UserPrefTable.query.filter_by(
+        pid=pref.pid
+    ).filter_by(uid=preferences.current_user.id).first()
+    return pref._value(None if res is None else res.value)
+
+
+def get_snapshot(pref):
+    return pref.get()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--preferences', type=int, default=60)
+    parser.add_argument('--requests', type=int, default=1000)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    db.init_app(app)
+
+    # The preferences are read for this user
+    preferences.current_user = BenchmarkUser(1)
+
+    with app.app_context():
+        db.create_all()
+        db.session.add(User(id=1, email='bench@example.com', active=True))
+        db.session.commit()
+
+        prefs = register_preferences(args.preferences)
+
+        queries = [0]
+
+        @event.listens_for(db.engine, 'before_cursor_execute')
+        def count(*args):
+            queries[0] += 1
+
+        for label, func in (
+            ('per query', get_per_query),
+            ('snapshot', get_snapshot)
+        ):
+            queries[0] = 0
+            start = timeit.default_timer()
+            for _ in range(args.requests):
+                with app.test_request_context():
+                    values = [func(pref) for pref in prefs]
+            elapsed = timeit.default_timer() - start
+
+            print(
+                '{0:<10} {1} preferences, {2:.1f} queries/request, '
+                '{3:.2f}ms/request'.format(
+                    label, len(values), float(queries[0]) / args.requests,
+                    elapsed * 1000 / args.requests
+                )
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility measures the number of rows per second fetched for the query
+# tool grid, using the dictionary cursor (rows converted to dictionaries and
+# back to lists, as async_fetchmany_2darray used to do) and the tuple
+# cursor (rows returned positionally).
+#
+# Usage (from the top-level directory of the source tree):
+#
+#     python tools/benchmarks/query_tool_fetch.py \
+#         --dsn "host=localhost dbname=postgres user=postgres" \
+#         [--rows 1000000] [--columns 20] [--batch 1000]
+
+from __future__ import print_function
+import argparse
+import os
+import sys
+import timeit
+
+import psycopg2
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..',
+                    'web')
+)
+
+from pgadmin.utils.driver.psycopg2.cursor import DictCursor, TupleCursor
+
+
+def fetch_as_dict(cur, batch):
+    columns = [desc.to_dict() for desc in cur.ordered_description()]
+    count = 0
+    while True:
+        res = cur.fetchmany(batch)
+        if not res:
+            break
+        result = []
+        for row in res:
+            new_row = []
+            for col in columns:
+                new_row.append(row[col['name']])
+            result.append(new_row)
+        count += len(result)
+    return count
+
+
+def fetch_as_tuple(cur, batch):
+    # Column information is still generated for the grid.
+    [desc.to_dict() for desc in cur.ordered_description()]
+    count = 0
+    while True:
+        result = cur.fetchmany(batch)
+        if not result:
+            break
+        count += len(result)
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--dsn', required=True,
+                        help='libpq connection string of the database')
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--columns', type=int, default=20)
+    parser.add_argument('--batch', type=int, default=1000,
+                        help='rows per fetch (ON_DEMAND_RECORD_COUNT)')
+    args = parser.parse_args()
+
+    query = 'SELECT {0} FROM generate_series(1, {1}) i'.format(
+        ', '.join('i + {0} AS c{0}'.format(idx)
+                  for idx in range(args.columns)),
+        args.rows
+    )
+
+    conn = psycopg2.connect(args.dsn)
+
+    for label, factory, func in (
+        ('dict cursor', DictCursor, fetch_as_dict),
+        ('tuple cursor', TupleCursor, fetch_as_tuple)
+    ):
+        cur = conn.cursor(cursor_factory=factory)
+        cur.execute(query)
+
+        start = timeit.default_timer()
+        count = func(cur, args.batch)
+        elapsed = timeit.default_timer() - start
+        cur.close()
+
+        print('{0:<14} {1} rows in {2:.2f}s ({3:.0f} rows/sec)'.format(
+            label, count, elapsed, count / elapsed))
+
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility measures the number of catalog queries and the time taken to
+# fetch the table properties compared by the schema diff, for a synthetic
+# schema. The tables are fetched one by one (running the complete properties
+# chain for each table, as TableView.fetch_tables used to do) and in bulk
+# (one properties query for the schema, and one query per object type for
+# the columns and constraints).
+#
+# The synthetic schema is created (and dropped at the end) in the given
+# database. Each table has a primary key, a unique constraint, a foreign key
+# to the previous table, a check constraint and an index.
+#
+# Usage (from the top-level directory of the source tree):
+#
+#     python tools/benchmarks/schema_diff_fetch.py \
+#         --dsn "host=localhost dbname=postgres user=postgres" \
+#         [--tables 5000] [--schema pgadmin_schema_diff_bench]
+
+from __future__ import print_function
+import argparse
+import os
+import sys
+import timeit
+
+import psycopg2
+import psycopg2.extras
+
+root = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'web'
+)
+sys.path.insert(0, root)
+
+from flask import Flask
+from jinja2 import ChoiceLoader, FileSystemLoader
+
+from pgadmin.utils.versioned_template_loader import VersionedTemplateLoader
+from pgadmin.utils.compile_template_name import compile_template_path
+from pgadmin.browser.server_groups.servers.databases.schemas.tables import \
+    TableView
+from pgadmin.browser.server_groups.servers.databases.schemas.tables.utils \
+    import BaseTableView
+
+
+class BenchmarkApp(Flask):
+    """Flask application finding the templates of all the pgAdmin modules"""
+
+    def __init__(self, *args, **kwargs):
+        self.jinja_options = dict(
+            Flask.jinja_options, loader=VersionedTemplateLoader(self)
+        )
+        super(BenchmarkApp, self).__init__(*args, **kwargs)
+        self.jinja_env.trim_blocks = True
+
+    @property
+    def jinja_loader(self):
+        return ChoiceLoader([
+            FileSystemLoader(os.path.join(path, 'templates'))
+            for path, dirs, _ in os.walk(os.path.join(root, 'pgadmin'))
+            if 'templates' in dirs
+        ])
+
+
+class Manager(object):
+    def __init__(self, conn):
+        self.sid = 0
+        self.version = conn.server_version
+        self.server_type = 'pg'
+
+
+class Connection(object):
+    """
+    Implements the part of the pgAdmin connection wrapper used while fetching
+    the table properties, and counts the executed queries.
+    """
+
+    def __init__(self, dsn):
+        self.conn = psycopg2.connect(dsn)
+        self.conn.autocommit = True
+        self.manager = Manager(self.conn)
+        self.queries = 0
+
+    def _execute(self, query):
+        self.queries += 1
+        cur = self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+        try:
+            cur.execute(query)
+            rows = cur.fetchall() if cur.description else []
+        except psycopg2.Error as e:
+            return False, str(e)
+        finally:
+            cur.close()
+        return True, rows
+
+    def execute_dict(self, query):
+        status, rows = self._execute(query)
+        if not status:
+            return status, rows
+        return True, {'rows': [dict(row) for row in rows]}
+
+    execute_2darray = execute_dict
+
+    def execute_scalar(self, query):
+        status, rows = self._execute(query)
+        if not status or not rows:
+            return status, rows if not status else None
+        return True, list(rows[0].values())[0]
+
+
+def create_schema(conn, schema, tables):
+    cur = conn.conn.cursor()
+    cur.execute('DROP SCHEMA IF EXISTS {0} CASCADE'.format(schema))
+    cur.execute('CREATE SCHEMA {0}'.format(schema))
+    for idx in range(tables):
+        cur.execute(
+            'CREATE TABLE {0}.t{1} ('
+            'id serial PRIMARY KEY, '
+            'code varchar(32) UNIQUE, '
+            'name text CHECK (length(name) < 256), '
+            'created timestamptz DEFAULT now(), '
+            'parent integer{2})'.format(
+                schema, idx,
+                ' REFERENCES {0}.t{1} (id)'.format(schema, idx - 1)
+                if idx else ''
+            )
+        )
+        cur.execute('CREATE INDEX ON {0}.t{1} (name)'.format(schema, idx))
+    cur.execute(
+        "SELECT oid FROM pg_namespace WHERE nspname = %s", (schema,)
+    )
+    scid = cur.fetchone()[0]
+    cur.execute(
+        "SELECT oid FROM pg_database WHERE datname = current_database()"
+    )
+    did = cur.fetchone()[0]
+    cur.close()
+    return did, scid
+
+
+def get_view(conn):
+    view = TableView(cmd='properties')
+    view.conn = conn
+    view.manager = conn.manager
+    view.datlastsysoid = 0
+    view.table_template_path = compile_template_path(
+        'tables/sql', conn.manager.server_type, conn.manager.version
+    )
+    view.partition_template_path = 'partitions/sql/{0}/#{0}#{1}#'.format(
+        conn.manager.server_type, conn.manager.version
+    )
+    return view
+
+
+def fetch_per_table(view, did, scid):
+    status, res = view.conn.execute_dict(render_properties(view, did, scid))
+    tables = dict()
+    for row in res['rows']:
+        status, data = view.conn.execute_dict(
+            render_properties(view, did, scid, row['oid'])
+        )
+        tables[row['name']] = BaseTableView.properties(
+            view, 0, 0, did, scid, row['oid'], data, False
+        )
+    return tables
+
+
+def fetch_bulk(view, did, scid):
+    status, res = view.conn.execute_dict(render_properties(view, did, scid))
+    status, prefetched = view._prefetch_table_objects(
+        did, [row['oid'] for row in res['rows']]
+    )
+    tables = dict()
+    for row in res['rows']:
+        tables[row['name']] = BaseTableView.properties(
+            view, 0, 0, did, scid, row['oid'], {'rows': [row]}, False,
+            prefetched[row['oid']]
+        )
+    return tables
+
+
+def render_properties(view, did, scid, tid=None):
+    from flask import render_template
+    return render_template(
+        '/'.join([view.table_template_path, 'properties.sql']),
+        did=did, scid=scid, tid=tid, datlastsysoid=view.datlastsysoid
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--dsn', required=True,
+                        help='libpq connection string of the database')
+    parser.add_argument('--tables', type=int, default=5000)
+    parser.add_argument('--schema', default='pgadmin_schema_diff_bench')
+    args = parser.parse_args()
+
+    app = BenchmarkApp(__name__)
+    conn = Connection(args.dsn)
+
+    print('creating {0} tables in {1}...'.format(args.tables, args.schema))
+    did, scid = create_schema(conn, args.schema, args.tables)
+
+    try:
+        with app.test_request_context():
+            view = get_view(conn)
+            results = dict()
+
+            for label, func in (
+                ('per table', fetch_per_table),
+                ('bulk', fetch_bulk)
+            ):
+                conn.queries = 0
+                start = timeit.default_timer()
+                results[label] = func(view, did, scid)
+                elapsed = timeit.default_timer() - start
+
+                print('{0:<10} {1} tables, {2} queries in {3:.2f}s'.format(
+                    label, len(results[label]), conn.queries, elapsed))
+    finally:
+        cur = conn.conn.cursor()
+        cur.execute('DROP SCHEMA IF EXISTS {0} CASCADE'.format(args.schema))
+        cur.close()
+        conn.conn.close()
+
+
+if __name__ == '__main__':
+    main()
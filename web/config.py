@@ -263,6 +263,22 @@ PG_DEFAULT_DRIVER = 'psycopg2'
 # for the particular session. (in minutes)
 MAX_SESSION_IDLE_TIME = 60
 
+# The information about the databases and the connected user is fetched once
+# per server, and shared by all of its connections for the given time (in
+# seconds). It is fetched again after that, or when a database is created,
+# renamed or dropped from pgAdmin.
+SERVER_METADATA_CACHE_TTL = 300
+
+# When pgAdmin is served by several processes, each one of them opens its
+# own database connections for a user session. To keep a single set of the
+# connections per session, run several single process pgAdmin instances on
+# their own ports, each one of them with a unique WORKER_ID, behind a load
+# balancer routing the requests by the CONNECTION_AFFINITY_COOKIE cookie,
+# which is set to the WORKER_ID of the instance serving the session (see the
+# server deployment documentation).
+WORKER_ID = None
+CONNECTION_AFFINITY_COOKIE = 'pga4_worker'
+
 ##########################################################################
 # User account and settings storage
 ##########################################################################
@@ -307,6 +323,18 @@ MAX_QUERY_HIST_STORED = 20
 ##########################################################################
 SESSION_DB_PATH = os.path.join(DATA_DIR, 'sessions')
 
+# SESSION_BACKEND selects the storage of the server-side sessions:
+#  'file'   - every session is pickled in a file in SESSION_DB_PATH, and the
+#             whole file is written again on every change.
+#  'sqlite' - the sessions are stored in the SQLite database at
+#             SESSION_SQLITE_PATH. Every session entry (and every Query Tool
+#             transaction) is stored separately, and only the changed entries
+#             are written. Recommended for the heavy Query Tool users. Do not
+#             use it on a network file system.
+# SESSION_SQLITE_PATH defaults to 'sessions.db' in SESSION_DB_PATH.
+SESSION_BACKEND = 'file'
+SESSION_SQLITE_PATH = None
+
 SESSION_COOKIE_NAME = 'pga4_session'
 
 ##########################################################################
@@ -416,6 +444,138 @@ SQLALCHEMY_TRACK_MODIFICATIONS = False
 ##########################################################################
 ON_DEMAND_RECORD_COUNT = 1000
 
+##########################################################################
+# Spool the large query tool results (more than ON_DEMAND_RECORD_COUNT rows)
+# to a temporary file. The rows are written to the file in batches, as soon
+# as the query has been executed, and the memory held for the result by the
+# database driver is released right after that. The pages of the result are
+# then served from the file at any offset.
+#
+# QUERY_TOOL_SPOOL_DIR is the directory for the spool files, the system
+# temporary directory is used when set to None.
+##########################################################################
+QUERY_TOOL_RESULT_SPOOLING = False
+QUERY_TOOL_SPOOL_DIR = None
+
+##########################################################################
+# Maximum number of the Query Tool/View Data transaction objects kept alive
+# in a server process. The objects are unpickled from the session again,
+# when evicted.
+##########################################################################
+QUERY_TOOL_MAX_LIVE_TRANSACTIONS = 1000
+
+##########################################################################
+# Maximum number of (server, database, search_path) combinations for which
+# the catalog metadata used by the query tool auto complete is cached.
+# The least recently used entries are evicted first.
+##########################################################################
+AUTOCOMPLETE_CACHE_MAX_ENTRIES = 32
+
+##########################################################################
+# Maximum number of suggestions returned by the query tool auto complete.
+# Only the highest priority suggestions are returned, set to None to
+# return all of them.
+##########################################################################
+AUTOCOMPLETE_MAX_SUGGESTIONS = 1000
+
+##########################################################################
+# Maximum time (in seconds) to wait for the recovery state of a connected
+# server, while listing the servers of a server group in the browser tree.
+# The servers are probed concurrently; a server, which does not respond in
+# time, is listed as disconnected (not responding), and its query is
+# cancelled. Set to None to wait for all of them.
+##########################################################################
+SERVER_STATUS_PROBE_TIMEOUT = 5
+
+##########################################################################
+# Maximum number of the threads checking the recovery state of the servers
+# (shared by all the requests). The servers above it wait for a free thread
+# within the SERVER_STATUS_PROBE_TIMEOUT.
+##########################################################################
+SERVER_STATUS_PROBE_MAX_WORKERS = 8
+
+##########################################################################
+# Maximum time (in seconds) a request for the logs of a running background
+# process waits for the new log lines on the server, before returning an
+# empty response (long-poll). Set to 0 to return immediately, and let the
+# client poll the logs periodically.
+##########################################################################
+BGPROCESS_LONG_POLL_TIMEOUT = 20
+
+##########################################################################
+# Maximum time (in seconds) a request of the debugger waits for the result,
+# or the messages of the function being debugged on the server, before
+# returning a 'Busy' response (long-poll). Set to 0 to return immediately,
+# and let the debugger poll the server periodically.
+##########################################################################
+DEBUGGER_LONG_POLL_TIMEOUT = 20
+
+##########################################################################
+# Number of days the finished background processes (i.e. backup, restore,
+# maintenance jobs) are kept, along with their logs, before they are
+# removed automatically. By default (None), they are kept till the user
+# acknowledges them. To remove them automatically, set the number of days in
+# config_local.py, e.g.:
+#
+#   BGPROCESS_RETENTION_DAYS = 30
+#
+# Note: once enabled, the processes of a user finished more than the given
+# number of days ago (including the ones finished before the setting was
+# enabled) are removed along with their logs, when the user lists the
+# processes (at most once an hour).
+##########################################################################
+BGPROCESS_RETENTION_DAYS = None
+
+##########################################################################
+# The grant wizard applies the privileges on more than the given number of
+# objects by a background job (using psql), in chunks of the given number of
+# objects, each one of them in its own transaction. Set the threshold to
+# None to always apply the privileges within the request. The privileges are
+# applied within the request too, when the psql utility of the server can not
+# be found (see the Binary paths preferences).
+#
+# When GRANT_WIZARD_COLLAPSE_SCHEMAS is True, and all the tables (including
+# the views), or all the sequences of a schema are selected, they are granted
+# by a single GRANT ... ON ALL TABLES/SEQUENCES IN SCHEMA statement, which
+# also affects the objects created after they were listed by the wizard.
+##########################################################################
+GRANT_WIZARD_JOB_THRESHOLD = 1000
+GRANT_WIZARD_BATCH_SIZE = 1000
+GRANT_WIZARD_COLLAPSE_SCHEMAS = False
+
+##########################################################################
+# Number of the node types (i.e. tables, functions, views), which are
+# compared concurrently by the schema diff. Each one of them uses its own
+# pair of the database connections to the source and the target server.
+# Set to 1 to compare the node types one by one on the default database
+# connections.
+##########################################################################
+SCHEMA_DIFF_MAX_WORKERS = 4
+
+##########################################################################
+# Directory to store the schema snapshots captured by the schema diff.
+##########################################################################
+SCHEMA_DIFF_SNAPSHOT_DIR = os.path.join(DATA_DIR, 'schema_diff_snapshots')
+
+##########################################################################
+# Default use of the stored schema snapshots by the schema diff, when not
+# given in the compare request (source_snapshot/target_snapshot):
+#   'never'  - always compare the live schemas.
+#   'auto'   - compare the snapshot of a schema instead of the live schema,
+#              as long as the catalog change marker of the database matches
+#              the one saved in the snapshot.
+#   'always' - compare the snapshot of a schema, without connecting to the
+#              database at all.
+#
+# The marker is built from the statistics counters of the catalogs, which
+# are reported by the other sessions asynchronously (i.e. after their
+# transactions end, and at most every 500ms), hence - a change made lately
+# may not be noticed by 'auto', and the snapshots are not reused at all when
+# 'track_counts' is off. Use 'auto' only when a slightly stale schema is
+# acceptable.
+##########################################################################
+SCHEMA_DIFF_SNAPSHOT_MODE = 'never'
+
 ##########################################################################
 # Allow users to display Gravatar image for their username in Server mode
 ##########################################################################
@@ -0,0 +1,39 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+""" Index the background processes by the user and time
+
+Revision ID: b2a1f8d5c3e7
+Revises: aff1436e3c8c
+Create Date: 2020-04-20 11:32:05.164320
+
+"""
+
+from pgadmin.model import db
+
+# revision identifiers, used by Alembic.
+revision = 'b2a1f8d5c3e7'
+down_revision = 'aff1436e3c8c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    db.engine.execute(
+        'CREATE INDEX IF NOT EXISTS ix_process_user_id_start_time '
+        'ON process (user_id, start_time)'
+    )
+    db.engine.execute(
+        'CREATE INDEX IF NOT EXISTS ix_process_user_id_end_time '
+        'ON process (user_id, end_time)'
+    )
+
+
+def downgrade():
+    pass
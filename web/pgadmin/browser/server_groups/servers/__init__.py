@@ -9,9 +9,10 @@
 
 import simplejson as json
 import re
+import threading
 import pgadmin.browser.server_groups as sg
 from flask import render_template, request, make_response, jsonify, \
-    current_app, url_for
+    current_app, url_for, copy_current_request_context
 from flask_babelex import gettext
 from flask_security import current_user, login_required
 from pgadmin.browser.server_groups.servers.types import ServerType
@@ -30,6 +31,7 @@ from pgadmin.utils.master_password import get_crypt_key
 from pgadmin.utils.exception import CryptKeyMissing
 from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
 from psycopg2 import Error as psycopg2_Error, OperationalError
+from concurrent.futures import ThreadPoolExecutor, wait
 
 
 def has_any(data, keys):
@@ -63,6 +65,91 @@ def recovery_state(connection, postgres_version):
     return status, result, in_recovery, wal_paused
 
 
+# The pools of the threads checking the recovery state of the servers, and
+# cancelling the checks, which did not finish in time. They are shared by all
+# the requests (see get_probe_executors).
+probe_executors = None
+probe_executors_lock = threading.Lock()
+
+
+def get_probe_executors():
+    """
+    Returns the (probe, cancel) pools of the threads, limited to
+    config.SERVER_STATUS_PROBE_MAX_WORKERS threads each.
+    """
+    global probe_executors
+
+    with probe_executors_lock:
+        if probe_executors is None:
+            max_workers = getattr(
+                config, 'SERVER_STATUS_PROBE_MAX_WORKERS', None
+            ) or 8
+            probe_executors = (
+                ThreadPoolExecutor(max_workers=max_workers),
+                ThreadPoolExecutor(max_workers=max_workers)
+            )
+
+    return probe_executors
+
+
+def probe_recovery_states(probes, timeout=None):
+    """
+    Check the recovery state of the given servers concurrently.
+
+    Args:
+        probes: Dictionary of (connection, postgres version) by a key
+        timeout: Maximum time (in seconds) to wait for all the probes
+
+    Returns:
+        Dictionary of the recovery_state(...) results by the key. The probes,
+        which did not finish in time, are not included, and their queries are
+        cancelled (so that the connections are not kept busy by them).
+    """
+    probe_executor, cancel_executor = get_probe_executors()
+
+    def cancel(key, conn):
+        @copy_current_request_context
+        def run():
+            try:
+                status, msg = conn.cancel_transaction(conn.conn_id)
+                if not status:
+                    current_app.logger.warning(
+                        "Failed to cancel the recovery state check of the "
+                        "server #{0}: {1}".format(key, msg)
+                    )
+            except Exception as e:
+                current_app.logger.exception(e)
+        return run
+
+    def probe(conn, version):
+        @copy_current_request_context
+        def run():
+            try:
+                return recovery_state(conn, version)
+            except Exception as e:
+                current_app.logger.exception(e)
+                return False, str(e), None, None
+        return run
+
+    futures = dict(
+        (probe_executor.submit(probe(conn, version)), key)
+        for key, (conn, version) in probes.items()
+    )
+
+    done, not_done = wait(futures, timeout=timeout)
+    states = dict((futures[future], future.result()) for future in done)
+
+    for future in not_done:
+        # The probe, which has not started yet, is simply dropped.
+        if not future.cancel():
+            # Cancelling the query needs another connection to the server,
+            # do not wait for it either.
+            key = futures[future]
+            cancel_executor.submit(cancel(key, probes[key][0]))
+
+    return states
+
+
 def server_icon_and_background(is_connected, manager, server):
     """
 
@@ -128,7 +215,7 @@ class ServerModule(sg.ServerGroupPluginModule):
             in_recovery = None
             wal_paused = None
             try:
-                manager = driver.connection_manager(server.id)
+                manager = driver.connection_manager(server.id, server=server)
                 conn = manager.connection()
                 was_connected = conn.wasConnected
             except CryptKeyMissing:
@@ -350,24 +437,44 @@ class ServerNode(PGChildNodeView):
         for the user.
         """
         servers = Server.query.filter_by(user_id=current_user.id,
-                                         servergroup_id=gid)
+                                         servergroup_id=gid).all()
 
         driver = get_driver(PG_DEFAULT_DRIVER)
+        managers = dict()
+        probes = dict()
 
         for server in servers:
-            manager = driver.connection_manager(server.id)
+            manager = managers[server.id] = driver.connection_manager(
+                server.id, server=server)
             conn = manager.connection()
-            connected = conn.connected()
+            if conn.connected():
+                probes[server.id] = (conn, manager.version)
+
+        states = probe_recovery_states(
+            probes, getattr(config, 'SERVER_STATUS_PROBE_TIMEOUT', None)
+        )
+
+        for server in servers:
+            manager = managers[server.id]
+            connected = server.id in probes
             errmsg = None
             in_recovery = None
             wal_paused = None
-            if connected:
-                status, result, in_recovery, wal_paused =\
-                    recovery_state(conn, manager.version)
+            if server.id in states:
+                status, result, in_recovery, wal_paused = states[server.id]
                 if not status:
                     connected = False
                     manager.release()
                     errmsg = "{0} : {1}".format(server.name, result)
+            elif connected:
+                current_app.logger.warning(
+                    "Timed out checking the recovery state of the server "
+                    "'{0}'.".format(server.name)
+                )
+                connected = False
+                errmsg = "{0} : {1}".format(
+                    server.name, gettext('The server is not responding.')
+                )
 
             res.append(
                 self.blueprint.generate_browser_node(
@@ -417,7 +524,8 @@ class ServerNode(PGChildNodeView):
                 )
             )
 
-        manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(server.id)
+        manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(
+            server.id, server=server)
         conn = manager.connection()
         connected = conn.connected()
         errmsg = None
@@ -579,6 +579,9 @@ class DatabaseView(PGChildNodeView):
         if not status:
             return internal_server_error(errormsg=msg)
 
+        # The new database is not known to the connection manager yet.
+        self.manager.invalidate_metadata()
+
         if 'datacl' in data:
             data['datacl'] = parse_priv_to_db(data['datacl'], 'DATABASE')
 
@@ -663,6 +666,7 @@ class DatabaseView(PGChildNodeView):
         # Release any existing connection from connection manager
         # to perform offline operation
         self.manager.release(did=did)
+        self.manager.invalidate_metadata()
 
         for action in ["rename_database", "tablespace"]:
             SQL = self.get_offline_sql(gid, sid, data, did, action)
@@ -786,6 +790,7 @@ class DatabaseView(PGChildNodeView):
             else:
 
                 status = self.manager.release(did=did)
+                self.manager.invalidate_metadata()
 
                 SQL = render_template(
                     "/".join([self.template_path, 'delete.sql']),
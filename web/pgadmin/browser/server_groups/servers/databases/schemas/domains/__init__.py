@@ -407,9 +407,6 @@ It may have been removed by another user or moved to another schema.
 
         data = res['rows'][0]
 
-        # Get Type Length and Precision
-        data.update(self._parse_type(data['fulltype']))
-
         # Get Domain Constraints
         SQL = render_template("/".join([self.template_path,
                                         'get_constraints.sql']),
@@ -418,7 +415,23 @@ It may have been removed by another user or moved to another schema.
         if not status:
             return False, internal_server_error(errormsg=res)
 
-        data['constraints'] = res['rows']
+        return True, self._format_properties(did, doid, data, res['rows'])
+
+    def _format_properties(self, did, doid, data, constraints):
+        """
+        This function is used to format the properties of the domain fetched
+        using the properties.sql
+        :param did:
+        :param doid:
+        :param data: Domain properties
+        :param constraints: Domain constraints (fetched using
+            get_constraints.sql)
+        :return:
+        """
+        # Get Type Length and Precision
+        data.update(self._parse_type(data['fulltype']))
+
+        data['constraints'] = constraints
 
         # Get formatted Security Labels
         if 'seclabels' in data:
@@ -429,7 +442,42 @@ It may have been removed by another user or moved to another schema.
         if doid <= self.manager.db_info[did]['datlastsysoid']:
             data['sysdomain'] = True
 
-        return True, data
+        return data
+
+    def _fetch_all_properties(self, did, scid):
+        """
+        This function is used to fetch the properties of all the domains of
+        the specified schema, using a single query for their properties and
+        another one for their constraints, instead of running the
+        properties.sql and get_constraints.sql for each domain.
+        :param did:
+        :param scid:
+        :return: Properties of the domains by their oid
+        """
+        SQL = render_template("/".join([self.template_path, 'properties.sql']),
+                              scid=scid)
+        status, res = self.conn.execute_dict(SQL)
+        if not status:
+            return False, res
+
+        SQL = render_template("/".join([self.template_path,
+                                        'get_constraints.sql']),
+                              scid=scid)
+        status, rset = self.conn.execute_dict(SQL)
+        if not status:
+            return False, rset
+
+        constraints = dict()
+        for row in rset['rows']:
+            constraints.setdefault(row.pop('contypid'), []).append(row)
+
+        result = dict()
+        for row in res['rows']:
+            result[row['oid']] = self._format_properties(
+                did, row['oid'], row, constraints.get(row['oid'], [])
+            )
+
+        return True, result
 
     def _parse_type(self, basetype):
         """
@@ -888,10 +936,14 @@ AND relkind != 'c'))"""
         if not status:
             return internal_server_error(errormsg=res)
 
+        status, props = self._fetch_all_properties(did, scid)
+        if not status:
+            return internal_server_error(errormsg=props)
+
         for row in rset['rows']:
-            status, data = self._fetch_properties(did, scid, row['oid'])
+            data = props.get(row['oid'], None)
 
-            if status:
+            if data is not None:
                 if 'constraints' in data and len(data['constraints']) > 0:
                     for item in data['constraints']:
                         # Remove keys that should not be the part
@@ -25,7 +25,7 @@ from pgadmin.browser.server_groups.servers.databases.schemas.utils import \
 from pgadmin.browser.server_groups.servers.databases.utils import \
     parse_sec_labels_from_db, parse_variables_from_db
 from pgadmin.browser.server_groups.servers.utils import parse_priv_from_db, \
-    parse_priv_to_db
+    parse_priv_to_db, parse_acl_items
 from pgadmin.browser.utils import PGChildNodeView
 from pgadmin.utils.ajax import make_json_response, internal_server_error, \
     make_response as ajax_response, gone
@@ -457,12 +457,14 @@ class FunctionView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
             status=200
         )
 
-    def _format_arguments_from_db(self, data):
+    def _format_arguments_from_db(self, data, out_types=None):
         """
         Create Argument list of the Function.
 
         Args:
             data: Function Data
+            out_types: Data types of the OUT arguments by their type oid
+                (fetched using _fetch_out_types), optional
 
         Returns:
             Function Arguments in the following format.
@@ -521,7 +523,13 @@ class FunctionView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
         proargnames_fltrd = []
         cnt = 0
         for m in proargmodes:
-            if m == 'o':  # Out Mode
+            if m == 'o' and out_types is not None:  # Out Mode
+                out_arg_type = out_types.get(str(proallargtypes[cnt]))
+
+                # Insert out parameter datatype
+                proargtypes.insert(cnt, out_arg_type)
+                proargdefaultvals.insert(cnt, '')
+            elif m == 'o':  # Out Mode
                 SQL = render_template("/".join([self.sql_template_path,
                                                 'get_out_types.sql']),
                                       out_arg_oid=proallargtypes[cnt])
@@ -1341,13 +1349,6 @@ class FunctionView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
                 gettext("Could not find the function in the database.")
             )
 
-        resp_data = res['rows'][0]
-
-        # Get formatted Arguments
-        frmtd_params, frmtd_proargs = self._format_arguments_from_db(resp_data)
-        resp_data.update(frmtd_params)
-        resp_data.update(frmtd_proargs)
-
         # Fetch privileges
         SQL = render_template("/".join([self.sql_template_path, 'acl.sql']),
                               fnid=fnid)
@@ -1355,8 +1356,32 @@ class FunctionView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
         if not status:
             return internal_server_error(errormsg=res)
 
+        return self._format_properties(
+            did, fnid, res['rows'][0], proaclres['rows']
+        )
+
+    def _format_properties(self, did, fnid, resp_data, proacl,
+                           out_types=None):
+        """
+        Format the Function Properties fetched using the properties.sql.
+
+        Args:
+            did: Database Id
+            fnid: Function Id
+            resp_data: Function Properties
+            proacl: Privileges (rows in the format of the acl.sql)
+            out_types: Data types of the OUT arguments by their type oid
+                (fetched using _fetch_out_types), optional
+        """
+        # Get formatted Arguments
+        frmtd_params, frmtd_proargs = self._format_arguments_from_db(
+            resp_data, out_types
+        )
+        resp_data.update(frmtd_params)
+        resp_data.update(frmtd_proargs)
+
         # Get Formatted Privileges
-        resp_data.update(self._format_proacl_from_db(proaclres['rows']))
+        resp_data.update(self._format_proacl_from_db(proacl))
 
         # Set System Functions Status
         resp_data['sysfunc'] = False
@@ -1384,6 +1409,34 @@ class FunctionView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
 
         return resp_data
 
+    def _fetch_out_types(self, functions):
+        """
+        Returns the data types of the OUT arguments of the given functions
+        by their type oid (as string).
+
+        Args:
+            functions: Function Properties (fetched using the properties.sql)
+        """
+        out_arg_oids = set()
+        for data in functions:
+            for idx, mode in enumerate(data['proargmodes'] or []):
+                if mode == 'o':
+                    out_arg_oids.add(int(data['proallargtypes'][idx]))
+
+        if len(out_arg_oids) == 0:
+            return True, dict()
+
+        SQL = render_template("/".join([self.sql_template_path,
+                                        'get_out_types.sql']),
+                              out_arg_oids=sorted(out_arg_oids))
+        status, res = self.conn.execute_dict(SQL)
+        if not status:
+            return False, res
+
+        return True, dict(
+            (str(row['oid']), row['out_arg_type']) for row in res['rows']
+        )
+
     def _get_schema(self, scid):
         """
         Returns Schema Name from its OID.
@@ -1666,10 +1719,28 @@ class FunctionView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
             if not status:
                 return internal_server_error(errormsg=res)
 
+            names = dict((row['oid'], row['name']) for row in rset['rows'])
+
+            # Fetch the properties of all the functions using a single
+            # query, and the types of their OUT arguments using another one,
+            # instead of fetching the properties of each function.
+            SQL = render_template("/".join([self.sql_template_path,
+                                            'properties.sql']), scid=scid)
+            status, rset = self.conn.execute_dict(SQL)
+            if not status:
+                return internal_server_error(errormsg=rset)
+
+            status, out_types = self._fetch_out_types(rset['rows'])
+            if not status:
+                return internal_server_error(errormsg=out_types)
+
             for row in rset['rows']:
-                data = self._fetch_properties(0, sid, did, scid, row['oid'])
-                if isinstance(data, dict):
-                    res[row['name']] = data
+                if row['oid'] not in names:
+                    continue
+                res[names[row['oid']]] = self._format_properties(
+                    did, row['oid'], row,
+                    parse_acl_items(row['proacl'], 'proacl'), out_types
+                )
         else:
             data = self._fetch_properties(0, sid, did, scid, oid)
             res = data
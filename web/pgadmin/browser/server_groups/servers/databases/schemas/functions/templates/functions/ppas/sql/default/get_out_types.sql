@@ -1,6 +1,11 @@
 SELECT
-    format_type(oid, NULL) AS out_arg_type
+    format_type(oid, NULL) AS out_arg_type{% if out_arg_oids %}, oid{% endif %}
+
 FROM
     pg_type
 WHERE
+{% if out_arg_oids %}
+    oid IN ({% for out_arg_oid in out_arg_oids %}{% if loop.index != 1 %}, {% endif %}{{ out_arg_oid }}::oid{% endfor %});
+{% else %}
     oid = {{ out_arg_oid }}::oid;
+{% endif %}
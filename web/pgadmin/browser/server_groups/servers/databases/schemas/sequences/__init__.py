@@ -12,12 +12,13 @@
 import simplejson as json
 from functools import wraps
 import pgadmin.browser.server_groups.servers.databases as database
-from flask import render_template, make_response, request, jsonify
+from flask import render_template, make_response, request, jsonify, \
+    current_app
 from flask_babelex import gettext as _
 from pgadmin.browser.server_groups.servers.databases.schemas.utils \
     import SchemaChildModule
 from pgadmin.browser.server_groups.servers.utils import parse_priv_from_db, \
-    parse_priv_to_db
+    parse_priv_to_db, parse_acl_items
 from pgadmin.browser.utils import PGChildNodeView
 from pgadmin.utils.ajax import make_json_response, internal_server_error, \
     make_response as ajax_response, gone
@@ -306,33 +307,14 @@ class SequenceView(PGChildNodeView, SchemaDiffObjectCompare):
             return False, gone(
                 _("Could not find the sequence in the database."))
 
-        for row in res['rows']:
-            SQL = render_template(
-                "/".join([self.template_path, 'get_def.sql']),
-                data=row
-            )
-            status, rset1 = self.conn.execute_dict(SQL)
-            if not status:
-                return False, internal_server_error(errormsg=rset1)
-
-            row['current_value'] = rset1['rows'][0]['last_value']
-            row['minimum'] = rset1['rows'][0]['min_value']
-            row['maximum'] = rset1['rows'][0]['max_value']
-            row['increment'] = rset1['rows'][0]['increment_by']
-            row['start'] = rset1['rows'][0]['start_value']
-            row['cache'] = rset1['rows'][0]['cache_value']
-            row['cycled'] = rset1['rows'][0]['is_cycled']
-
-            sec_lbls = []
-            if 'securities' in row and row['securities'] is not None:
-                for sec in row['securities']:
-                    import re
-                    sec = re.search(r'([^=]+)=(.*$)', sec)
-                    sec_lbls.append({
-                        'provider': sec.group(1),
-                        'label': sec.group(2)
-                    })
-            row['securities'] = sec_lbls
+        row = res['rows'][0]
+        SQL = render_template(
+            "/".join([self.template_path, 'get_def.sql']),
+            data=row
+        )
+        status, rset1 = self.conn.execute_dict(SQL)
+        if not status:
+            return False, internal_server_error(errormsg=rset1)
 
         SQL = render_template(
             "/".join([self.template_path, 'acl.sql']),
@@ -342,14 +324,87 @@ class SequenceView(PGChildNodeView, SchemaDiffObjectCompare):
         if not status:
             return False, internal_server_error(errormsg=res)
 
-        for row in dataclres['rows']:
-            priv = parse_priv_from_db(row)
-            if row['deftype'] in res['rows'][0]:
-                res['rows'][0][row['deftype']].append(priv)
+        return True, self._format_properties(
+            row, rset1['rows'][0], dataclres['rows']
+        )
+
+    def _format_properties(self, row, definition, acl):
+        """
+        This function is used to format the properties of the sequence
+        fetched using the properties.sql and get_def.sql.
+        :param row: Sequence properties
+        :param definition: Sequence definition (fetched using get_def.sql)
+        :param acl: Privileges (rows in the format of the acl.sql)
+        :return:
+        """
+        # Privileges are already fetched in the format of the acl.sql
+        row.pop('relacl_str', None)
+
+        row['current_value'] = definition['last_value']
+        row['minimum'] = definition['min_value']
+        row['maximum'] = definition['max_value']
+        row['increment'] = definition['increment_by']
+        row['start'] = definition['start_value']
+        row['cache'] = definition['cache_value']
+        row['cycled'] = definition['is_cycled']
+
+        sec_lbls = []
+        if 'securities' in row and row['securities'] is not None:
+            for sec in row['securities']:
+                import re
+                sec = re.search(r'([^=]+)=(.*$)', sec)
+                sec_lbls.append({
+                    'provider': sec.group(1),
+                    'label': sec.group(2)
+                })
+        row['securities'] = sec_lbls
+
+        for acl_row in acl:
+            priv = parse_priv_from_db(acl_row)
+            if acl_row['deftype'] in row:
+                row[acl_row['deftype']].append(priv)
             else:
-                res['rows'][0][row['deftype']] = [priv]
+                row[acl_row['deftype']] = [priv]
+
+        return row
+
+    def _fetch_all_properties(self, scid):
+        """
+        This function is used to fetch the properties of all the sequences
+        of the specified schema, using a single query for their properties
+        and another one for their definitions, instead of running the
+        properties.sql, get_def.sql and acl.sql for each sequence.
+        :param scid: Schema Id
+        :return: Properties of the sequences by their oid
+        """
+        SQL = render_template(
+            "/".join([self.template_path, 'properties.sql']), scid=scid
+        )
+        status, res = self.conn.execute_dict(SQL)
+        if not status:
+            return False, res
 
-        return True, res['rows'][0]
+        if len(res['rows']) == 0:
+            return True, dict()
+
+        SQL = render_template(
+            "/".join([self.template_path, 'get_def.sql']),
+            sequences=res['rows']
+        )
+        status, rset = self.conn.execute_dict(SQL)
+        if not status:
+            return False, rset
+
+        definitions = dict((row['oid'], row) for row in rset['rows'])
+
+        result = dict()
+        for row in res['rows']:
+            result[row['oid']] = self._format_properties(
+                row, definitions[row['oid']],
+                parse_acl_items(row['relacl_str'], 'relacl')
+            )
+
+        return True, result
 
     @check_precondition(action="create")
     def create(self, gid, sid, did, scid):
@@ -905,10 +960,20 @@ class SequenceView(PGChildNodeView, SchemaDiffObjectCompare):
         if not status:
             return internal_server_error(errormsg=res)
 
+        status, props = self._fetch_all_properties(scid)
+        if not status:
+            # Reading the definitions of all the sequences at once fails,
+            # if any of them can not be read, fetch them one by one then.
+            current_app.logger.warning(props)
+            props = dict()
+            for row in rset['rows']:
+                status, data = self._fetch_properties(scid, row['oid'])
+                if status:
+                    props[row['oid']] = data
+
         for row in rset['rows']:
-            status, data = self._fetch_properties(scid, row['oid'])
-            if status:
-                res[row['name']] = data
+            if row['oid'] in props:
+                res[row['name']] = props[row['oid']]
 
         return res
 
@@ -1,4 +1,11 @@
+{% for data in sequences or [data] %}
+{% if not loop.first %}
+UNION ALL
+{% endif %}
 SELECT
+{% if sequences %}
+    {{data.oid}}::oid AS oid,
+{% endif %}
     last_value,
     seqmin AS min_value,
     seqmax AS max_value,
@@ -9,3 +16,4 @@ SELECT
     is_called
 FROM pg_sequence, {{ conn|qtIdent(data.schema) }}.{{ conn|qtIdent(data.name) }}
 WHERE seqrelid = {{data.oid}}
+{% endfor %}
@@ -1,4 +1,11 @@
+{% for data in sequences or [data] %}
+{% if not loop.first %}
+UNION ALL
+{% endif %}
 SELECT 
+{% if sequences %}
+    {{data.oid}}::oid AS oid,
+{% endif %}
     last_value, 
     min_value, 
     max_value,
@@ -7,4 +14,5 @@ SELECT
     is_cycled, 
     increment_by,
     is_called
-FROM {{ conn|qtIdent(data.schema) }}.{{ conn|qtIdent(data.name) }}
\ No newline at end of file
+FROM {{ conn|qtIdent(data.schema) }}.{{ conn|qtIdent(data.name) }}
+{% endfor %}
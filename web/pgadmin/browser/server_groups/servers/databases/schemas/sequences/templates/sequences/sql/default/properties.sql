@@ -6,6 +6,7 @@ SELECT
     pg_get_userbyid(relowner) AS seqowner,
     description as comment,
     array_to_string(relacl::text[], ', ') as acl,
+    relacl as relacl_str,
     (SELECT array_agg(provider || '=' || label) FROM pg_seclabels sl1 WHERE sl1.objoid=cl.oid) AS securities
 FROM pg_class cl
     LEFT OUTER JOIN pg_namespace nsp ON cl.relnamespace = nsp.oid
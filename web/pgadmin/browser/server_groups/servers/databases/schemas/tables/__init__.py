@@ -15,7 +15,8 @@ import copy
 import random
 
 import pgadmin.browser.server_groups.servers.databases as database
-from flask import render_template, request, jsonify, url_for, current_app
+from flask import render_template, request, jsonify, url_for, current_app, \
+    Response
 from flask_babelex import gettext
 from pgadmin.browser.server_groups.servers.databases.schemas.utils \
     import SchemaChildModule, DataTypeReader, VacuumSettings
@@ -23,6 +24,8 @@ from pgadmin.browser.server_groups.servers.utils import parse_priv_to_db
 from pgadmin.utils.ajax import make_json_response, internal_server_error, \
     make_response as ajax_response, gone
 from .utils import BaseTableView
+from pgadmin.browser.utils import get_node_page_args, like_prefix, \
+    make_node_page_response
 from pgadmin.utils.preferences import Preferences
 from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
 from pgadmin.tools.schema_diff.directory_compare import compare_dictionaries,\
@@ -266,6 +269,7 @@ class TableView(BaseTableView, DataTypeReader, VacuumSettings,
         'children': [{'get': 'children'}],
         'nodes': [{'get': 'node'}, {'get': 'nodes'}],
         'sql': [{'get': 'sql'}],
+        'schema_sql': [{}, {'get': 'schema_sql'}],
         'msql': [{'get': 'msql'}, {'get': 'msql'}],
         'stats': [{'get': 'statistics'}, {'get': 'statistics'}],
         'dependency': [{'get': 'dependencies'}],
@@ -404,12 +408,19 @@ class TableView(BaseTableView, DataTypeReader, VacuumSettings,
             scid: Schema ID
 
         Returns:
-            JSON of available table nodes
+            JSON of available table nodes, a page of them when requested
+            using the filter, after and limit arguments (see
+            get_node_page_args)
         """
         res = []
+        name_filter, after, limit = get_node_page_args()
         SQL = render_template(
             "/".join([self.table_template_path, 'nodes.sql']),
-            scid=scid
+            scid=scid,
+            name_filter=like_prefix(name_filter),
+            after=after,
+            # Fetch one more table to know, if there is a next page
+            limit=limit + 1 if limit is not None else None
         )
         status, rset = self.conn.execute_2darray(SQL)
         if not status:
@@ -430,10 +441,7 @@ class TableView(BaseTableView, DataTypeReader, VacuumSettings,
                     rows_cnt=0
                 ))
 
-        return make_json_response(
-            data=res,
-            status=200
-        )
+        return make_node_page_response(res, limit)
 
     @BaseTableView.check_precondition
     def get_all_tables(self, gid, sid, did, scid, tid=None):
@@ -1374,8 +1382,67 @@ class TableView(BaseTableView, DataTypeReader, VacuumSettings,
 
         data = res['rows'][0]
 
+        # Fetch the columns, constraints and child objects of the table
+        # using one query per object type.
+        status, prefetched = self._prefetch_table_objects(did, [tid])
+        if not status:
+            return prefetched
+
+        try:
+            self._prefetch_table_children(did, scid, [tid], prefetched)
+        except Exception as e:
+            return internal_server_error(errormsg=str(e))
+
         return BaseTableView.get_reverse_engineered_sql(
-            self, did, scid, tid, main_sql, data)
+            self, did, scid, tid, main_sql, data,
+            prefetched=prefetched[tid])
+
+    @BaseTableView.check_precondition
+    def schema_sql(self, gid, sid, did, scid):
+        """
+        This function will creates reverse engineered sql for all the
+        tables of the schema. The properties, columns, constraints and child
+        objects of all the tables are fetched using one query per object
+        type.
+
+         Args:
+           gid: Server Group ID
+           sid: Server ID
+           did: Database ID
+           scid: Schema ID
+        """
+        SQL = render_template(
+            "/".join([self.table_template_path, 'properties.sql']),
+            did=did, scid=scid, datlastsysoid=self.datlastsysoid
+        )
+        status, res = self.conn.execute_dict(SQL)
+        if not status:
+            return internal_server_error(errormsg=res)
+
+        tids = [row['oid'] for row in res['rows']]
+        status, prefetched = self._prefetch_table_objects(did, tids)
+        if not status:
+            return prefetched
+
+        sql = []
+        try:
+            self._prefetch_table_children(did, scid, tids, prefetched)
+
+            for row in res['rows']:
+                table_sql = BaseTableView.get_reverse_engineered_sql(
+                    self, did, scid, row['oid'], [], row,
+                    prefetched=prefetched[row['oid']],
+                    return_ajax_response=False)
+
+                # Error response for the objects still fetched per table
+                if isinstance(table_sql, Response):
+                    return table_sql
+
+                sql.append(table_sql)
+        except Exception as e:
+            return internal_server_error(errormsg=str(e))
+
+        return ajax_response(response='\n\n'.join(sql))
 
     @BaseTableView.check_precondition
     def select_sql(self, gid, sid, did, scid, tid):
@@ -1641,23 +1708,34 @@ class TableView(BaseTableView, DataTypeReader, VacuumSettings,
 
         else:
             res = dict()
-            SQL = render_template("/".join([self.table_template_path,
-                                            'nodes.sql']), scid=scid)
-            status, tables = self.conn.execute_2darray(SQL)
+            # Fetch the properties of all the tables using a single query,
+            # and their columns and constraints using one query per object
+            # type, instead of running the complete properties chain for
+            # each table.
+            SQL = render_template(
+                "/".join([self.table_template_path, 'properties.sql']),
+                did=did, scid=scid, datlastsysoid=self.datlastsysoid
+            )
+            status, tables = self.conn.execute_dict(SQL)
             if not status:
                 current_app.logger.error(tables)
                 return False
 
-            for row in tables['rows']:
-                status, data = self._fetch_properties(did, scid, row['oid'])
+            status, prefetched = self._prefetch_table_objects(
+                did, [row['oid'] for row in tables['rows']]
+            )
+            if not status:
+                current_app.logger.error(prefetched)
+                return False
 
-                if status:
-                    data = super(TableView, self).properties(
-                        0, sid, did, scid, row['oid'], data, False
-                    )
+            for row in tables['rows']:
+                data = super(TableView, self).properties(
+                    0, sid, did, scid, row['oid'], {'rows': [row]}, False,
+                    prefetched[row['oid']]
+                )
 
-                    self.remove_keys_for_comparision(data, keys_to_remove)
-                    res[row['name']] = data
+                self.remove_keys_for_comparision(data, keys_to_remove)
+                res[row['name']] = data
 
             return res
 
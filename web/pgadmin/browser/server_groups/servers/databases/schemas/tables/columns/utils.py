@@ -16,7 +16,7 @@ from pgadmin.utils.exception import ObjectGone
 from pgadmin.browser.server_groups.servers.databases.schemas.utils \
     import DataTypeReader
 from pgadmin.browser.server_groups.servers.utils import parse_priv_from_db, \
-    parse_priv_to_db
+    parse_priv_to_db, parse_acl_items
 from functools import wraps
 
 
@@ -65,7 +65,8 @@ def get_parent(conn, tid, template_path=None):
 
 @get_template_path
 def column_formatter(conn, tid, clid, data, edit_types_list=None,
-                     fetch_inherited_tables=True, template_path=None):
+                     fetch_inherited_tables=True, template_path=None,
+                     fetch_acl=True):
     """
     This function will return formatted output of query result
     as per client model format for column node
@@ -76,6 +77,8 @@ def column_formatter(conn, tid, clid, data, edit_types_list=None,
     :param edit_types_list:
     :param fetch_inherited_tables:
     :param template_path: Optional template path
+    :param fetch_acl: If False then parse the privileges from the attacl
+                      fetched with the column, instead of running acl.sql
     :return:
     """
 
@@ -129,12 +132,15 @@ def column_formatter(conn, tid, clid, data, edit_types_list=None,
         data['seclabels'] = seclabels
 
     # We need to parse & convert ACL coming from database to json format
-    SQL = render_template("/".join([template_path, 'acl.sql']),
-                          tid=tid, clid=clid)
-    status, acl = conn.execute_dict(SQL)
+    if fetch_acl:
+        SQL = render_template("/".join([template_path, 'acl.sql']),
+                              tid=tid, clid=clid)
+        status, acl = conn.execute_dict(SQL)
 
-    if not status:
-        return internal_server_error(errormsg=acl)
+        if not status:
+            return internal_server_error(errormsg=acl)
+    else:
+        acl = {'rows': parse_acl_items(data.get('attacl'), 'attacl')}
 
     # We will set get privileges from acl sql so we don't need
     # it from properties sql
@@ -165,9 +171,34 @@ def column_formatter(conn, tid, clid, data, edit_types_list=None,
     return data
 
 
+@get_template_path
+def get_edit_types(conn, type_ids, template_path=None):
+    """
+    This function will return the types, which can be used in the edit mode
+    for each of the given column types.
+    :param conn: Connection Object
+    :param type_ids: Column type ids
+    :param template_path: Optional template path
+    :return: Dictionary of the type id and list of the type names
+    """
+    edit_types = dict((type_id, []) for type_id in type_ids)
+
+    if len(edit_types) > 0:
+        SQL = render_template("/".join([template_path,
+                                        'edit_mode_types_multi.sql']),
+                              type_ids=",".join(map(lambda x: str(x),
+                                                    edit_types.keys())))
+        status, res = conn.execute_2darray(SQL)
+        for row in res['rows']:
+            edit_types[row['main_oid']] = row['edit_types']
+
+    return edit_types
+
+
 @get_template_path
 def get_formatted_columns(conn, tid, data, other_columns,
-                          table_or_type, template_path=None):
+                          table_or_type, template_path=None, columns=None,
+                          edit_types=None):
     """
     This function will iterate and return formatted data for all
     the columns.
@@ -177,20 +208,27 @@ def get_formatted_columns(conn, tid, data, other_columns,
     :param other_columns:
     :param table_or_type:
     :param template_path: Optional template path
+    :param columns: Columns of the table already fetched using
+                    get_columns_for_tables (optional)
+    :param edit_types: Edit mode types for the column types, fetched using
+                       get_edit_types (optional)
     :return:
     """
-    SQL = render_template("/".join([template_path, 'properties.sql']),
-                          tid=tid, show_sys_objects=False)
+    prefetched = columns is not None
 
-    status, res = conn.execute_dict(SQL)
-    if not status:
-        raise Exception(res)
+    if not prefetched:
+        SQL = render_template("/".join([template_path, 'properties.sql']),
+                              tid=tid, show_sys_objects=False)
+
+        status, res = conn.execute_dict(SQL)
+        if not status:
+            raise Exception(res)
 
-    all_columns = res['rows']
-    edit_types = {}
+        columns = res['rows']
+
+    all_columns = columns
     # Add inherited from details from other columns - type, table
     for col in all_columns:
-        edit_types[col['atttypid']] = []
         for other_col in other_columns:
             if col['name'] == other_col['name']:
                 col['inheritedfrom' + table_or_type] = \
@@ -199,21 +237,48 @@ def get_formatted_columns(conn, tid, data, other_columns,
     data['columns'] = all_columns
 
     if 'columns' in data and len(data['columns']) > 0:
-        SQL = render_template("/".join([template_path,
-                                        'edit_mode_types_multi.sql']),
-                              type_ids=",".join(map(lambda x: str(x),
-                                                    edit_types.keys())))
-        status, res = conn.execute_2darray(SQL)
-        for row in res['rows']:
-            edit_types[row['main_oid']] = row['edit_types']
+        if edit_types is None:
+            edit_types = get_edit_types(
+                conn, set(col['atttypid'] for col in all_columns)
+            )
 
         for column in data['columns']:
             column_formatter(conn, tid, column['attnum'], column,
-                             edit_types[column['atttypid']], False)
+                             list(edit_types[column['atttypid']]), False,
+                             fetch_acl=not prefetched)
 
     return data
 
 
+@get_template_path
+def get_columns_for_tables(conn, tids, template_path=None):
+    """
+    This function will fetch the columns of all the given tables using a
+    single query. The columns are not formatted, they are meant to be passed
+    to get_formatted_columns.
+    :param conn: Connection Object
+    :param tids: List of the table ids
+    :param template_path: Optional template path
+    :return: Dictionary of the table id and list of its columns
+    """
+    res = dict((tid, []) for tid in tids)
+    if len(res) == 0:
+        return res
+
+    SQL = render_template("/".join([template_path, 'properties.sql']),
+                          tids=",".join(map(lambda x: str(x), tids)),
+                          show_sys_objects=False)
+
+    status, rset = conn.execute_dict(SQL)
+    if not status:
+        raise Exception(rset)
+
+    for row in rset['rows']:
+        res[row['attrelid']].append(row)
+
+    return res
+
+
 def parse_format_columns(data, mode=None):
     """
     This function will parse and return formatted list of columns
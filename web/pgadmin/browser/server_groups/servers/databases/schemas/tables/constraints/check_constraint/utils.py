@@ -81,6 +81,33 @@ def get_check_constraints(conn, tid, cid=None, template_path=None):
     return True, result['rows']
 
 
+@get_template_path
+def get_check_constraints_for_tables(conn, tids, template_path=None):
+    """
+    This function is used to fetch information of the check constraint(s)
+    for all the given tables using a single query.
+    :param conn: Connection Object
+    :param tids: List of the table ids
+    :param template_path: Template Path
+    :return: Dictionary of the table id and list of its constraints
+    """
+    res = dict((tid, []) for tid in tids)
+    if len(res) == 0:
+        return True, res
+
+    sql = render_template("/".join(
+        [template_path, 'properties.sql']), tids=",".join(map(str, tids)))
+
+    status, result = conn.execute_dict(sql)
+    if not status:
+        return status, internal_server_error(errormsg=result)
+
+    for row in result['rows']:
+        res[row.pop('tid')].append(row)
+
+    return True, res
+
+
 @get_template_path
 def get_check_constraint_sql(conn, tid, data, template_path=None):
     """
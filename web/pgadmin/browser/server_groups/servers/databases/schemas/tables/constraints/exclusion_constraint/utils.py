@@ -59,6 +59,56 @@ def get_parent(conn, tid, template_path=None):
     return schema, table
 
 
+def _fetch_exclusion_columns(conn, ex, template_path):
+    """
+    This function is used to fetch the columns (and include columns) of the
+    given exclusion constraint.
+    :param conn: Connection Object
+    :param ex: Exclusion Constraint
+    :param template_path: Template Path
+    :return:
+    """
+    sql = render_template("/".join([template_path,
+                                    'get_constraint_cols.sql']),
+                          cid=ex['oid'], colcnt=ex['col_count'])
+
+    status, res = conn.execute_dict(sql)
+    if not status:
+        return status, internal_server_error(errormsg=res)
+
+    columns = []
+    for row in res['rows']:
+        if row['options'] & 1:
+            order = False
+            nulls_order = True if (row['options'] & 2) else False
+        else:
+            order = True
+            nulls_order = True if (row['options'] & 2) else False
+
+        columns.append({"column": row['coldef'].strip('"'),
+                        "oper_class": row['opcname'],
+                        "order": order,
+                        "nulls_order": nulls_order,
+                        "operator": row['oprname'],
+                        "col_type": row['datatype']
+                        })
+
+    ex['columns'] = columns
+
+    # INCLUDE clause in index is supported from PG-11+
+    if conn.manager.version >= 110000:
+        sql = render_template("/".join([template_path,
+                                        'get_constraint_include.sql']),
+                              cid=ex['oid'])
+        status, res = conn.execute_dict(sql)
+        if not status:
+            return status, internal_server_error(errormsg=res)
+
+        ex['include'] = [col['colname'] for col in res['rows']]
+
+    return True, ex
+
+
 @get_template_path
 def get_exclusion_constraints(conn, did, tid, exid=None, template_path=None):
     """
@@ -79,45 +129,45 @@ def get_exclusion_constraints(conn, did, tid, exid=None, template_path=None):
         return status, internal_server_error(errormsg=result)
 
     for ex in result['rows']:
-        sql = render_template("/".join([template_path,
-                                        'get_constraint_cols.sql']),
-                              cid=ex['oid'], colcnt=ex['col_count'])
+        status, res = _fetch_exclusion_columns(conn, ex, template_path)
+        if not status:
+            return status, res
 
-        status, res = conn.execute_dict(sql)
+    return True, result['rows']
+
+
+@get_template_path
+def get_exclusion_constraints_for_tables(conn, did, tids, template_path=None):
+    """
+    This function is used to fetch information of the exclusion
+    constraint(s) for all the given tables. The constraints are fetched
+    using a single query, the columns are still fetched per constraint
+    (exclusion constraints are rare).
+    :param conn: Connection Object
+    :param did: Database ID
+    :param tids: List of the table ids
+    :param template_path: Template Path
+    :return: Dictionary of the table id and list of its constraints
+    """
+    res = dict((tid, []) for tid in tids)
+    if len(res) == 0:
+        return True, res
+
+    sql = render_template("/".join([template_path, 'properties.sql']),
+                          did=did, tids=",".join(map(str, tids)))
+
+    status, result = conn.execute_dict(sql)
+    if not status:
+        return status, internal_server_error(errormsg=result)
+
+    for ex in result['rows']:
+        status, err = _fetch_exclusion_columns(conn, ex, template_path)
         if not status:
-            return status, internal_server_error(errormsg=res)
+            return status, err
 
-        columns = []
-        for row in res['rows']:
-            if row['options'] & 1:
-                order = False
-                nulls_order = True if (row['options'] & 2) else False
-            else:
-                order = True
-                nulls_order = True if (row['options'] & 2) else False
-
-            columns.append({"column": row['coldef'].strip('"'),
-                            "oper_class": row['opcname'],
-                            "order": order,
-                            "nulls_order": nulls_order,
-                            "operator": row['oprname'],
-                            "col_type": row['datatype']
-                            })
-
-        ex['columns'] = columns
-
-        # INCLUDE clause in index is supported from PG-11+
-        if conn.manager.version >= 110000:
-            sql = render_template("/".join([template_path,
-                                            'get_constraint_include.sql']),
-                                  cid=ex['oid'])
-            status, res = conn.execute_dict(sql)
-            if not status:
-                return status, internal_server_error(errormsg=res)
-
-            ex['include'] = [col['colname'] for col in res['rows']]
+        res[ex.pop('tid')].append(ex)
 
-    return True, result['rows']
+    return True, res
 
 
 @get_template_path
@@ -91,6 +91,73 @@ def get_foreign_keys(conn, tid, fkid=None, template_path=None):
     return True, result['rows']
 
 
+@get_template_path
+def get_foreign_keys_for_tables(conn, tids, template_path=None):
+    """
+    This function is used to fetch information of the foreign key(s) for
+    all the given tables. The foreign keys with their columns, and the
+    indexes (to search the covering index) of all the tables are fetched
+    using one query each.
+    :param conn: Connection Object
+    :param tids: List of the table ids
+    :param template_path: Template Path
+    :return: Dictionary of the table id and list of its foreign keys
+    """
+    res = dict((tid, []) for tid in tids)
+    if len(res) == 0:
+        return True, res
+
+    tids = ",".join(map(str, tids))
+    sql = render_template("/".join(
+        [template_path, 'properties.sql']), tids=tids)
+
+    status, result = conn.execute_dict(sql)
+    if not status:
+        return status, internal_server_error(errormsg=result)
+
+    if len(result['rows']) == 0:
+        return True, res
+
+    sql = render_template("/".join([template_path,
+                                    'get_constraints.sql']), tids=tids)
+    status, constraints = conn.execute_dict(sql)
+    if not status:
+        return status, internal_server_error(errormsg=constraints)
+
+    index_cols = dict()
+    for constraint in constraints['rows']:
+        index_cols.setdefault(constraint['tid'], []).append((
+            constraint['idxname'],
+            set(col.strip('"') for col in constraint['column_names'])
+        ))
+
+    for fk in result['rows']:
+        tid = fk.pop('tid')
+        cols = fk.pop('conattnames')
+        fk['columns'] = [
+            {"local_column": local_col,
+             "references": fk['confrelid'],
+             "referenced": ref_col}
+            for local_col, ref_col in zip(cols, fk.pop('confattnames'))
+        ]
+        fk['remote_schema'] = fk['refnsp']
+        fk['remote_table'] = fk['reftab']
+
+        cols = set(cols)
+        coveringindex = None
+        for idxname, idx_cols in index_cols.get(tid, []):
+            if cols == idx_cols:
+                coveringindex = idxname
+                break
+
+        fk['coveringindex'] = coveringindex
+        fk['autoindex'] = fk['hasindex'] = coveringindex is not None
+
+        res[tid].append(fk)
+
+    return True, res
+
+
 @get_template_path
 def search_coveringindex(conn, tid, cols, template_path=None):
     """
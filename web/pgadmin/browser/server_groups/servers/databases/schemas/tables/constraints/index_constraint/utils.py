@@ -112,6 +112,46 @@ def get_index_constraints(conn, did, tid, ctype, cid=None, template_path=None):
     return True, result['rows']
 
 
+@get_template_path
+def get_index_constraints_for_tables(conn, did, tids, ctype,
+                                     template_path=None):
+    """
+    This function is used to fetch information of the index constraint(s)
+    for all the given tables using a single query. The columns (and include
+    columns) are fetched as arrays with the constraints.
+    :param conn: Connection Object
+    :param did: Database ID
+    :param tids: List of the table ids
+    :param ctype: Constraint Type
+    :param template_path: Template Path
+    :return: Dictionary of the table id and list of its constraints
+    """
+    res = dict((tid, []) for tid in tids)
+    if len(res) == 0:
+        return True, res
+
+    sql = render_template("/".join([template_path, 'properties.sql']),
+                          did=did, tids=",".join(map(str, tids)),
+                          constraint_type=ctype)
+    status, result = conn.execute_dict(sql)
+    if not status:
+        return status, internal_server_error(errormsg=result)
+
+    for idx_cons in result['rows']:
+        idx_cons['columns'] = [
+            {"column": col.strip('"')}
+            for col in idx_cons.pop('column_names')
+        ]
+
+        # INCLUDE clause in index is supported from PG-11+
+        if 'include_names' in idx_cons:
+            idx_cons['include'] = idx_cons.pop('include_names')
+
+        res[idx_cons.pop('tid')].append(idx_cons)
+
+    return True, res
+
+
 @get_template_path
 def get_index_constraint_sql(conn, did, tid, data, template_path=None):
     """
@@ -60,7 +60,8 @@ def get_parent(conn, tid, template_path=None):
 
 
 @get_template_path
-def get_column_details(conn, idx, data, mode='properties', template_path=None):
+def get_column_details(conn, idx, data, mode='properties', template_path=None,
+                       rset=None):
     """
     This functional will fetch list of column for index.
 
@@ -69,15 +70,18 @@ def get_column_details(conn, idx, data, mode='properties', template_path=None):
     :param data: Data
     :param mode: 'create' or 'properties'
     :param template_path: Optional template path
+    :param rset: Optional column details of the index (already fetched
+     using get_indexes_for_tables)
     :return:
     """
 
-    SQL = render_template(
-        "/".join([template_path, 'column_details.sql']), idx=idx
-    )
-    status, rset = conn.execute_2darray(SQL)
-    if not status:
-        return internal_server_error(errormsg=rset)
+    if rset is None:
+        SQL = render_template(
+            "/".join([template_path, 'column_details.sql']), idx=idx
+        )
+        status, rset = conn.execute_2darray(SQL)
+        if not status:
+            return internal_server_error(errormsg=rset)
 
     # 'attdef' comes with quotes from query so we need to strip them
     # 'options' we need true/false to render switch ASC(false)/DESC(true)
@@ -131,7 +135,7 @@ def get_column_details(conn, idx, data, mode='properties', template_path=None):
 
 
 @get_template_path
-def get_include_details(conn, idx, data, template_path=None):
+def get_include_details(conn, idx, data, template_path=None, rset=None):
     """
     This functional will fetch list of include details for index
     supported with Postgres 11+
@@ -140,15 +144,18 @@ def get_include_details(conn, idx, data, template_path=None):
     :param idx: Index ID
     :param data: data
     :param template_path: Optional template path
+    :param rset: Optional include details of the index (already fetched
+     using get_indexes_for_tables)
     :return:
     """
 
-    SQL = render_template(
-        "/".join([template_path, 'include_details.sql']), idx=idx
-    )
-    status, rset = conn.execute_2darray(SQL)
-    if not status:
-        return internal_server_error(errormsg=rset)
+    if rset is None:
+        SQL = render_template(
+            "/".join([template_path, 'include_details.sql']), idx=idx
+        )
+        status, rset = conn.execute_2darray(SQL)
+        if not status:
+            return internal_server_error(errormsg=rset)
 
     # Push as collection
     data['include'] = [col['colname'] for col in rset['rows']]
@@ -226,10 +233,65 @@ def get_sql(conn, data, did, tid, idx, datlastsysoid,
     return SQL, name
 
 
+@get_template_path
+def get_indexes_for_tables(conn, did, tids, datlastsysoid,
+                           template_path=None):
+    """
+    This function will fetch the properties, column and include details of
+    the indexes of all the given tables using one query for each of them.
+
+    :param conn: Connection Object
+    :param did: Database ID
+    :param tids: List of the table ids
+    :param datlastsysoid:
+    :param template_path: Optional template path
+    :return: Dictionary of the table id and list of its indexes, which can
+     be passed to get_reverse_engineered_sql (as prefetched)
+    """
+    res = dict((tid, []) for tid in tids)
+    if len(res) == 0:
+        return res
+
+    SQL = render_template("/".join([template_path, 'properties.sql']),
+                          did=did, tids=",".join(map(str, tids)),
+                          datlastsysoid=datlastsysoid)
+    status, rset = conn.execute_dict(SQL)
+    if not status:
+        raise Exception(rset)
+
+    indexes = dict()
+    for row in rset['rows']:
+        indexes[row['oid']] = index = {
+            'properties': row, 'columns': {'rows': []},
+            'include': {'rows': []}
+        }
+        res[row['indrelid']].append(index)
+
+    if len(indexes) == 0:
+        return res
+
+    details = [('columns', 'column_details.sql')]
+    if conn.manager.version >= 110000:
+        details.append(('include', 'include_details.sql'))
+
+    for key, template in details:
+        SQL = render_template("/".join([template_path, template]),
+                              idxs=",".join(map(str, indexes)))
+        status, rset = conn.execute_2darray(SQL)
+        if not status:
+            raise Exception(rset)
+
+        for row in rset['rows']:
+            indexes[row['indexrelid']][key]['rows'].append(row)
+
+    return res
+
+
 @get_template_path
 def get_reverse_engineered_sql(conn, schema, table, did, tid, idx,
                                datlastsysoid,
-                               template_path=None, with_header=True):
+                               template_path=None, with_header=True,
+                               prefetched=None):
     """
     This function will return reverse engineered sql for specified trigger.
 
@@ -242,30 +304,37 @@ def get_reverse_engineered_sql(conn, schema, table, did, tid, idx,
     :param template_path: Optional template path
     :param with_header: Optional parameter to decide whether the SQL will be
      returned with header or not
+    :param prefetched: Optional properties, column and include details of
+     the index fetched using get_indexes_for_tables
     :return:
     """
-    SQL = render_template("/".join([template_path, 'properties.sql']),
-                          did=did, tid=tid, idx=idx,
-                          datlastsysoid=datlastsysoid)
+    if prefetched is None:
+        SQL = render_template("/".join([template_path, 'properties.sql']),
+                              did=did, tid=tid, idx=idx,
+                              datlastsysoid=datlastsysoid)
 
-    status, res = conn.execute_dict(SQL)
-    if not status:
-        raise Exception(res)
+        status, res = conn.execute_dict(SQL)
+        if not status:
+            raise Exception(res)
+
+        if len(res['rows']) == 0:
+            raise ObjectGone(_('Could not find the index in the table.'))
 
-    if len(res['rows']) == 0:
-        raise ObjectGone(_('Could not find the index in the table.'))
+        prefetched = {'properties': res['rows'][0]}
 
-    data = dict(res['rows'][0])
+    data = dict(prefetched['properties'])
     # Adding parent into data dict, will be using it while creating sql
     data['schema'] = schema
     data['table'] = table
 
     # Add column details for current index
-    data = get_column_details(conn, idx, data, 'create')
+    data = get_column_details(conn, idx, data, 'create',
+                              rset=prefetched.get('columns'))
 
     # Add Include details of the index
     if conn.manager.version >= 110000:
-        data = get_include_details(conn, idx, data)
+        data = get_include_details(conn, idx, data,
+                                   rset=prefetched.get('include'))
 
     SQL, name = get_sql(conn, data, did, tid, None, datlastsysoid)
 
@@ -23,7 +23,8 @@ from pgadmin.browser.server_groups.servers.databases.schemas.tables.utils \
 from pgadmin.browser.collection import CollectionNodeModule
 from pgadmin.utils.ajax import make_json_response, precondition_required
 from config import PG_DEFAULT_DRIVER
-from pgadmin.browser.utils import PGChildModule
+from pgadmin.browser.utils import PGChildModule, get_node_page_args, \
+    like_prefix, make_node_page_response
 from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
 from pgadmin.tools.schema_diff.directory_compare import compare_dictionaries,\
     directory_diff
@@ -276,11 +277,19 @@ class PartitionsView(BaseTableView, DataTypeReader, VacuumSettings,
             ptid: Partition Table ID
 
         Returns:
-            JSON of available table nodes
+            JSON of available table nodes, a page of them when requested
+            using the filter, after and limit arguments (see
+            get_node_page_args)
         """
+        name_filter, after, limit = get_node_page_args() \
+            if ptid is None else (None, None, None)
         SQL = render_template(
             "/".join([self.partition_template_path, 'nodes.sql']),
-            scid=scid, tid=tid, ptid=ptid
+            scid=scid, tid=tid, ptid=ptid,
+            name_filter=like_prefix(name_filter),
+            after=after,
+            # Fetch one more partition to know, if there is a next page
+            limit=limit + 1 if limit is not None else None
         )
         status, rset = self.conn.execute_2darray(SQL)
         if not status:
@@ -314,10 +323,7 @@ class PartitionsView(BaseTableView, DataTypeReader, VacuumSettings,
         for row in rset['rows']:
             res.append(browser_node(row))
 
-        return make_json_response(
-            data=res,
-            status=200
-        )
+        return make_node_page_response(res, limit)
 
     @BaseTableView.check_precondition
     def properties(self, gid, sid, did, scid, tid, ptid):
@@ -19,13 +19,25 @@ from pgadmin.tools.schema_diff.directory_compare import compare_dictionaries,\
 from pgadmin.tools.schema_diff.model import SchemaDiffModel
 from pgadmin.tools.schema_diff.compare import SchemaDiffObjectCompare
 from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
+from pgadmin.tools.schema_diff.executor import fetch_concurrently
 
 
 class SchemaDiffTableCompare(SchemaDiffObjectCompare):
 
     keys_to_ignore = ['oid', 'schema', 'vacuum_table',
                       'vacuum_toast', 'edit_types', 'attnum', 'col_type',
-                      'references', 'reltuples', 'rows_cnt']
+                      'references', 'reltuples', 'rows_cnt', 'relhasindex',
+                      'relhasrules', 'relhastriggers']
+
+    # The catalog flags, which tell that the table may have the objects of
+    # the sub module. The sub module objects are not fetched for the tables
+    # having the flag off.
+    sub_module_flags = {
+        'index': 'relhasindex',
+        'rule': 'relhasrules',
+        'trigger': 'relhastriggers',
+        'compound_trigger': 'relhastriggers'
+    }
 
     keys_to_ignore_ddl_comp = ['oid',
                                'schema',
@@ -36,7 +48,10 @@ class SchemaDiffTableCompare(SchemaDiffObjectCompare):
                                'check_constraint',
                                'foreign_key',
                                'reltuples',
-                               'rows_cnt'
+                               'rows_cnt',
+                               'relhasindex',
+                               'relhasrules',
+                               'relhastriggers'
                                ]
 
     keys_to_remove = {
@@ -68,62 +83,90 @@ class SchemaDiffTableCompare(SchemaDiffObjectCompare):
         tar_sid = kwargs.get('target_sid')
         tar_did = kwargs.get('target_did')
         tar_scid = kwargs.get('target_scid')
-        sub_modules = ['index', 'rule', 'trigger']
-
-        source_tables = self.fetch_tables(sid=src_sid, did=src_did,
-                                          scid=src_scid)
-
-        target_tables = self.fetch_tables(sid=tar_sid, did=tar_did,
-                                          scid=tar_scid)
 
-        if self.manager.version >= 120000:
-            sub_modules.append('compound_trigger')
+        # The target tables are fetched using another view object, as the
+        # fetch may run concurrently (see fetch_concurrently). The stored
+        # snapshots of the schemas (if given) are compared instead of the
+        # live schemas.
+        target_view = SchemaDiffRegistry.get_node_view(self.node_type)
+
+        source_tables, target_tables = fetch_concurrently(
+            lambda: self.fetch_schema_objects(
+                kwargs.get('source_snapshot'),
+                sid=src_sid, did=src_did, scid=src_scid
+            ),
+            lambda: target_view.fetch_schema_objects(
+                kwargs.get('target_snapshot'),
+                sid=tar_sid, did=tar_did, scid=tar_scid
+            )
+        )
 
         # If both the dict have no items then return None.
         if not (source_tables or target_tables) or (
                 len(source_tables) <= 0 and len(target_tables) <= 0):
             return None
 
-        src_server_type, tar_server_type = self.get_server_type(src_sid,
-                                                                tar_sid)
-        for module in sub_modules:
-
-            module_view = SchemaDiffRegistry.get_node_view(
-                module)
-
-            # Get sub module data for source tables
-            if module_view.blueprint.server_type is None or \
-                    src_server_type in module_view.blueprint.server_type:
-                for key, val in source_tables.items():
-                    source = module_view.fetch_objects_to_compare(
-                        sid=src_sid,
-                        did=src_did,
-                        scid=src_scid,
-                        tid=val['oid'],
-                        oid=None,
-                        ignore_keys=True
-                    )
-                    source_tables[key][module] = source
-
-            # Get sub module data for target tables
-            if module_view.blueprint.server_type is None or \
-                    tar_server_type in module_view.blueprint.server_type:
-                for key, val in target_tables.items():
-                    target = module_view.fetch_objects_to_compare(
-                        sid=tar_sid,
-                        did=tar_did,
-                        scid=tar_scid,
-                        tid=val['oid'],
-                        oid=None,
-                        ignore_keys=True
-                    )
-                    target_tables[key][module] = target
-
         return compare_dictionaries(source_tables, target_tables,
                                     self.node_type,
                                     self.blueprint.COLLECTION_LABEL,
                                     self.keys_to_ignore)
 
+    def fetch_schema_objects(self, snapshot=None, **kwargs):
+        """
+        This function returns the tables of the schema (along with the
+        objects of their sub modules, i.e. indexes) to be compared, either
+        from the given snapshot of the schema, or fetched from the database.
+
+        :param snapshot: SchemaSnapshot object
+        :param kwargs: Server, database and schema id
+        :return: Tables keyed by their names
+        """
+        if snapshot is not None:
+            return snapshot.get_objects(self.node_type)
+
+        tables = self.fetch_tables(**kwargs)
+        if not tables:
+            return tables
+
+        sub_modules = ['index', 'rule', 'trigger']
+        if self.manager.version >= 120000:
+            sub_modules.append('compound_trigger')
+
+        for module in sub_modules:
+            self.fetch_sub_module_objects(
+                module, self.manager.server_type, tables, **kwargs
+            )
+
+        return tables
+
+    def fetch_sub_module_objects(self, module, server_type, tables, **kwargs):
+        """
+        Fetch the objects of the sub module (i.e. indexes) of each one of
+        the given tables, and store them in the table data.
+
+        :param module: Name of the sub module
+        :param server_type: Type of the server
+        :param tables: Tables fetched by fetch_tables
+        :param kwargs: Server, database and schema id
+        """
+        module_view = SchemaDiffRegistry.get_node_view(module)
+
+        if module_view.blueprint.server_type is not None and \
+                server_type not in module_view.blueprint.server_type:
+            return
+
+        for key, val in tables.items():
+            if not val.get(self.sub_module_flags[module], True):
+                tables[key][module] = dict()
+                continue
+
+            tables[key][module] = module_view.fetch_objects_to_compare(
+                tid=val['oid'],
+                oid=None,
+                ignore_keys=True,
+                **kwargs
+            )
+
     @staticmethod
     def get_server_type(src_id, tar_id):
         """Get server types of source and target servers."""
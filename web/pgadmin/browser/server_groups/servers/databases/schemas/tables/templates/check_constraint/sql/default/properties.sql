@@ -1,4 +1,4 @@
-SELECT c.oid, conname as name, relname, nspname, description as comment ,
+SELECT c.oid, {% if tids %}conrelid AS tid, {% endif %}conname as name, relname, nspname, description as comment ,
        pg_get_expr(conbin, conrelid, true) as consrc
     FROM pg_constraint c
     JOIN pg_class cl ON cl.oid=conrelid
@@ -7,7 +7,11 @@ LEFT OUTER JOIN
     pg_description des ON (des.objoid=c.oid AND
                            des.classoid='pg_constraint'::regclass)
 WHERE contype = 'c'
+{% if tids %}
+    AND conrelid IN ({{ tids }})
+{% else %}
     AND conrelid = {{ tid }}::oid
+{% endif %}
 {% if cid %}
     AND c.oid = {{ cid }}::oid
 {% endif %}
\ No newline at end of file
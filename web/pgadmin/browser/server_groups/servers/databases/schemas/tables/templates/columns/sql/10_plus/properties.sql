@@ -1,4 +1,4 @@
-SELECT att.attname as name, att.atttypid, att.attlen, att.attnum, att.attndims,
+SELECT att.attname as name, att.attrelid, att.atttypid, att.attlen, att.attnum, att.attndims,
 		att.atttypmod, att.attacl, att.attnotnull, att.attoptions, att.attstattarget,
 		att.attstorage, att.attidentity,
 		pg_catalog.pg_get_expr(def.adbin, def.adrelid) AS defval,
@@ -27,7 +27,11 @@ FROM pg_attribute att
   LEFT OUTER JOIN pg_collation coll ON att.attcollation=coll.oid
   LEFT OUTER JOIN pg_namespace nspc ON coll.collnamespace=nspc.oid
   LEFT OUTER JOIN pg_sequence seq ON cs.oid=seq.seqrelid
+{% if tids %}
+WHERE att.attrelid IN ({{tids}})
+{% else %}
 WHERE att.attrelid = {{tid}}::oid
+{% endif %}
 {% if clid %}
     AND att.attnum = {{clid}}::int
 {% endif %}
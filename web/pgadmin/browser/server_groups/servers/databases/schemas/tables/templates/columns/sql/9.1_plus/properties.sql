@@ -34,7 +34,11 @@ FROM pg_attribute att
   LEFT OUTER JOIN pg_index pi ON pi.indrelid=att.attrelid AND indisprimary
   LEFT OUTER JOIN pg_collation coll ON att.attcollation=coll.oid
   LEFT OUTER JOIN pg_namespace nspc ON coll.collnamespace=nspc.oid
+{% if tids %}
+WHERE att.attrelid IN ({{tids}})
+{% else %}
 WHERE att.attrelid = {{tid}}::oid
+{% endif %}
 {% if clid %}
     AND att.attnum = {{clid}}::int
 {% endif %}
@@ -25,7 +25,11 @@ FROM pg_attribute att
   LEFT OUTER JOIN (pg_depend JOIN pg_class cs ON classid='pg_class'::regclass AND objid=cs.oid AND cs.relkind='S') ON refobjid=att.attrelid AND refobjsubid=att.attnum
   LEFT OUTER JOIN pg_namespace ns ON ns.oid=cs.relnamespace
   LEFT OUTER JOIN pg_index pi ON pi.indrelid=att.attrelid AND indisprimary
+{% if tids %}
+WHERE att.attrelid IN ({{tids}})
+{% else %}
 WHERE att.attrelid = {{tid}}::oid
+{% endif %}
 {% if clid %}
     AND att.attnum = {{clid}}::int
 {% endif %}
@@ -1,4 +1,13 @@
 SELECT ct.oid,
+{% if tids %}
+      conrelid AS tid,
+      ARRAY(SELECT a.attname FROM generate_subscripts(ct.conkey, 1) s
+          JOIN pg_attribute a ON (a.attrelid = ct.conrelid AND a.attnum = ct.conkey[s])
+          ORDER BY s) AS conattnames,
+      ARRAY(SELECT a.attname FROM generate_subscripts(ct.confkey, 1) s
+          JOIN pg_attribute a ON (a.attrelid = ct.confrelid AND a.attnum = ct.confkey[s])
+          ORDER BY s) AS confattnames,
+{% endif %}
       conname as name,
       condeferrable,
       condeferred,
@@ -24,7 +33,11 @@ JOIN pg_class cr ON cr.oid=confrelid
 JOIN pg_namespace nr ON nr.oid=cr.relnamespace
 LEFT OUTER JOIN pg_description des ON (des.objoid=ct.oid AND des.classoid='pg_constraint'::regclass)
 WHERE contype='f' AND
+{% if tids %}
+conrelid IN ({{tids}})
+{% else %}
 conrelid = {{tid}}::oid
+{% endif %}
 {% if cid %}
 AND ct.oid = {{cid}}::oid
 {% endif %}
@@ -1,3 +1,15 @@
+{% if tids %}
+SELECT idx.indrelid AS tid, cls.oid, cls.relname as idxname, indnatts as col_count,
+    ARRAY(SELECT pg_get_indexdef(cls.oid, k, true)
+        FROM generate_series(1, indnatts) k ORDER BY k) AS column_names
+  FROM pg_index idx
+  JOIN pg_class cls ON cls.oid=indexrelid
+  LEFT JOIN pg_depend dep ON (dep.classid = cls.tableoid AND dep.objid = cls.oid AND dep.refobjsubid = '0' AND dep.refclassid=(SELECT oid FROM pg_class WHERE relname='pg_constraint') AND dep.deptype='i')
+  LEFT OUTER JOIN pg_constraint con ON (con.tableoid = dep.refclassid AND con.oid = dep.refobjid)
+WHERE idx.indrelid IN ({{tids}})
+    AND (con.contype IN ('p', 'x', 'u') OR conname IS NULL)
+ORDER BY idx.indrelid, cls.relname
+{% else %}
 SELECT   cls.oid, cls.relname as idxname, indnatts as col_count
   FROM pg_index idx
   JOIN pg_class cls ON cls.oid=indexrelid
@@ -35,3 +47,4 @@ SELECT  cls.oid, cls.relname as idxname, indnatts
     LEFT OUTER JOIN pg_constraint con ON (con.tableoid = dep.refclassid AND con.oid = dep.refobjid)
 WHERE idx.indrelid = {{tid}}::oid
    AND conname IS NULL
+{% endif %}
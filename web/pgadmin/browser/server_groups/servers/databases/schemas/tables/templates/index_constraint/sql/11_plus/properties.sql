@@ -1,4 +1,13 @@
 SELECT cls.oid,
+{% if tids %}
+    indrelid AS tid,
+    ARRAY(SELECT pg_get_indexdef(cls.oid, k, true)
+        FROM generate_series(1, indnkeyatts) k ORDER BY k) AS column_names,
+    ARRAY(SELECT a.attname
+        FROM generate_series(indnkeyatts + 1, indnatts) k
+        JOIN pg_attribute a ON (a.attrelid = indrelid AND a.attnum = indkey[k - 1])
+        ORDER BY k) AS include_names,
+{% endif %}
     cls.relname as name,
     indnkeyatts as col_count,
     CASE WHEN length(spcname) > 0 THEN spcname ELSE
@@ -22,7 +31,11 @@ LEFT JOIN pg_depend dep ON (dep.classid = cls.tableoid AND dep.objid = cls.oid A
 LEFT OUTER JOIN pg_constraint con ON (con.tableoid = dep.refclassid AND con.oid = dep.refobjid)
 LEFT OUTER JOIN pg_description des ON (des.objoid=cls.oid AND des.classoid='pg_class'::regclass)
 LEFT OUTER JOIN pg_description desp ON (desp.objoid=con.oid AND desp.objsubid = 0 AND desp.classoid='pg_constraint'::regclass)
+{% if tids %}
+WHERE indrelid IN ({{tids}})
+{% else %}
 WHERE indrelid = {{tid}}::oid
+{% endif %}
 {% if cid %}
 AND cls.oid = {{cid}}::oid
 {% endif %}
@@ -20,7 +20,11 @@ FROM (
           unnest(ARRAY(SELECT generate_series(1, i.indnkeyatts) AS n)) AS attnum
       FROM
           pg_index i
+{% if idxs %}
+      WHERE i.indexrelid IN ({{ idxs }})
+{% else %}
       WHERE i.indexrelid = {{idx}}::OID
+{% endif %}
 ) i
     LEFT JOIN pg_opclass o ON (o.oid = i.indclass[i.attnum - 1])
     LEFT OUTER JOIN pg_constraint c ON (c.conindid = i.indexrelid)
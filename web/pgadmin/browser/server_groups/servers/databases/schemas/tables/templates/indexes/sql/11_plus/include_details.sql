@@ -1,15 +1,20 @@
 -- pg_get_indexdef did not support INCLUDE columns
 
-SELECT a.attname as colname
+SELECT {% if idxs %}i.indexrelid, {% endif %}a.attname as colname
 FROM (
     SELECT
+      i.indexrelid,
       i.indnkeyatts,
       i.indrelid,
       unnest(indkey) AS table_colnum,
       unnest(ARRAY(SELECT generate_series(1, i.indnatts) AS n)) attnum
     FROM
       pg_index i
+{% if idxs %}
+    WHERE i.indexrelid IN ({{ idxs }})
+{% else %}
     WHERE i.indexrelid = {{idx}}::OID
+{% endif %}
 ) i JOIN pg_attribute a
 ON (a.attrelid = i.indrelid AND i.table_colnum = a.attnum)
 WHERE i.attnum > i.indnkeyatts
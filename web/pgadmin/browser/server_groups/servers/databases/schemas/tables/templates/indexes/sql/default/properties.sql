@@ -1,4 +1,4 @@
-SELECT DISTINCT ON(cls.relname) cls.oid, cls.relname as name, indrelid, indkey, indisclustered,
+SELECT DISTINCT ON({% if tids %}indrelid, {% endif %}cls.relname) cls.oid, cls.relname as name, indrelid, indkey, indisclustered,
     indisvalid, indisunique, indisprimary, n.nspname,indnatts,cls.reltablespace AS spcoid,
     CASE WHEN length(spcname) > 0 THEN spcname ELSE
         (SELECT sp.spcname FROM pg_database dtb
@@ -21,7 +21,11 @@ FROM pg_index idx
     LEFT OUTER JOIN pg_constraint con ON (con.tableoid = dep.refclassid AND con.oid = dep.refobjid)
     LEFT OUTER JOIN pg_description des ON (des.objoid=cls.oid AND des.classoid='pg_class'::regclass)
     LEFT OUTER JOIN pg_description desp ON (desp.objoid=con.oid AND desp.objsubid = 0 AND desp.classoid='pg_constraint'::regclass)
+{% if tids %}
+WHERE indrelid IN ({{ tids }})
+{% else %}
 WHERE indrelid = {{tid}}::OID
+{% endif %}
     AND conname is NULL
     {% if idx %}AND cls.oid = {{idx}}::OID {% endif %}
-    ORDER BY cls.relname
\ No newline at end of file
+    ORDER BY {% if tids %}indrelid, {% endif %}cls.relname
\ No newline at end of file
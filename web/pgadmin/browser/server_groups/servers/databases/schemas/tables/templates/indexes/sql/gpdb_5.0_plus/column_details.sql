@@ -18,7 +18,11 @@ FROM (
           unnest(ARRAY(SELECT generate_series(1, i.indnatts) AS n)) AS attnum
       FROM
           pg_index i
+{% if idxs %}
+      WHERE i.indexrelid IN ({{ idxs }})
+{% else %}
       WHERE i.indexrelid = {{idx}}::OID
+{% endif %}
 ) i
     LEFT JOIN pg_opclass o ON (o.oid = i.indclass[i.attnum - 1])
     LEFT JOIN pg_attribute a ON (a.attrelid = i.indexrelid AND a.attnum = i.attnum)
@@ -36,4 +36,19 @@ FROM
              GROUP BY parentpartitiontablename) sub_partitions
     ON partitions.partitiontablename = sub_partitions.parentpartitiontablename
   LEFT JOIN pg_class table_class ON partitions.relnamespace = table_class.relnamespace AND partitions.partitiontablename = table_class.relname
-ORDER BY partitions.partitiontablename;
+{% if name_filter or after %}
+WHERE
+  {% if name_filter %}
+  partitions.partitiontablename LIKE {{ name_filter|qtLiteral }}
+  {% endif %}
+  {% if name_filter and after %}
+  AND
+  {% endif %}
+  {% if after %}
+  partitions.partitiontablename > {{ after|qtLiteral }}
+  {% endif %}
+{% endif %}
+ORDER BY partitions.partitiontablename
+{% if limit %}
+LIMIT {{ limit }}
+{% endif %};
@@ -1,4 +1,4 @@
-SELECT rel.oid, rel.relname AS name,
+SELECT rel.oid, {% if tids %}inh.inhparent AS tid, {% endif %}rel.relname AS name,
     (SELECT count(*) FROM pg_trigger WHERE tgrelid=rel.oid AND tgisinternal = FALSE) AS triggercount,
     (SELECT count(*) FROM pg_trigger WHERE tgrelid=rel.oid AND tgisinternal = FALSE AND tgenabled = 'O') AS has_enable_triggers,
     pg_get_expr(rel.relpartbound, rel.oid) AS partition_value,
@@ -7,9 +7,22 @@ SELECT rel.oid, rel.relname AS name,
     (CASE WHEN rel.relkind = 'p' THEN true ELSE false END) AS is_partitioned,
     (CASE WHEN rel.relkind = 'p' THEN pg_get_partkeydef(rel.oid::oid) ELSE '' END) AS partition_scheme
 FROM
+{% if tids %}
+    (SELECT * FROM pg_inherits WHERE inhparent IN ({{ tids }})) inh
+{% else %}
     (SELECT * FROM pg_inherits WHERE inhparent = {{ tid }}::oid) inh
+{% endif %}
     LEFT JOIN pg_class rel ON inh.inhrelid = rel.oid
     LEFT JOIN pg_namespace nsp ON rel.relnamespace = nsp.oid
     WHERE rel.relispartition
     {% if ptid %} AND rel.oid = {{ ptid }}::OID {% endif %}
-    ORDER BY rel.relname;
+    {% if name_filter %}
+      AND rel.relname LIKE {{ name_filter|qtLiteral }}
+    {% endif %}
+    {% if after %}
+      AND rel.relname > {{ after|qtLiteral }}
+    {% endif %}
+    ORDER BY rel.relname
+    {% if limit %}
+    LIMIT {{ limit }}
+    {% endif %};
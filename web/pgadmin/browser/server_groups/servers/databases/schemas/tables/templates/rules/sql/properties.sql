@@ -1,8 +1,11 @@
 {# =================== Fetch Rules ==================== #}
-{% if tid or rid %}
+{% if tid or rid or tids %}
 SELECT
     rw.oid AS oid,
     rw.rulename AS name,
+{% if tids %}
+    rw.ev_class AS tid,
+{% endif %}
     relname AS view,
     CASE WHEN relkind = 'r' THEN TRUE ELSE FALSE END AS parentistable,
     nspname AS schema,
@@ -17,7 +20,9 @@ JOIN pg_class cl ON cl.oid=rw.ev_class
 JOIN pg_namespace nsp ON nsp.oid=cl.relnamespace
 LEFT OUTER JOIN pg_description des ON (des.objoid=rw.oid AND des.classoid='pg_rewrite'::regclass)
 WHERE
-  {% if tid %}
+  {% if tids %}
+      ev_class IN ({{ tids }})
+  {% elif tid %}
       ev_class = {{ tid }}
   {% elif rid %}
       rw.oid = {{ rid }}
@@ -8,4 +8,13 @@ FROM pg_class rel
     WHERE rel.relkind IN ('r','s','t','p') AND rel.relnamespace = {{ scid }}::oid
     AND NOT rel.relispartition
     {% if tid %} AND rel.oid = {{tid}}::OID {% endif %}
-    ORDER BY rel.relname;
+    {% if name_filter %}
+      AND rel.relname LIKE {{ name_filter|qtLiteral }}
+    {% endif %}
+    {% if after %}
+      AND rel.relname > {{ after|qtLiteral }}
+    {% endif %}
+    ORDER BY rel.relname
+    {% if limit %}
+    LIMIT {{ limit }}
+    {% endif %};
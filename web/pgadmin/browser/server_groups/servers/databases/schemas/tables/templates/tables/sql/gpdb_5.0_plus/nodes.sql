@@ -11,4 +11,13 @@ FROM pg_class rel
     {% if tid %}
       AND rel.oid = {{tid}}::OID
     {% endif %}
-    ORDER BY rel.relname;
+    {% if name_filter %}
+      AND rel.relname LIKE {{ name_filter|qtLiteral }}
+    {% endif %}
+    {% if after %}
+      AND rel.relname > {{ after|qtLiteral }}
+    {% endif %}
+    ORDER BY rel.relname
+    {% if limit %}
+    LIMIT {{ limit }}
+    {% endif %};
@@ -1,6 +1,6 @@
 SELECT *,
 	(CASE when pre_coll_inherits is NULL then ARRAY[]::varchar[] else pre_coll_inherits END) as coll_inherits
-  {% if tid %}, (CASE WHEN is_partitioned THEN (SELECT substring(pg_get_partition_def({{ tid }}::oid, true) from 14)) ELSE '' END) AS partition_scheme {% endif %}
+  , (CASE WHEN is_partitioned THEN (SELECT substring(pg_get_partition_def(oid, true) from 14)) ELSE '' END) AS partition_scheme
 FROM (
 	SELECT rel.oid, rel.relname AS name, rel.reltablespace AS spcoid,rel.relacl AS relacl_str,
 		(CASE WHEN length(spc.spcname) > 0 THEN spc.spcname ELSE
@@ -10,7 +10,7 @@ FROM (
 		END) as spcname,
 		(select nspname FROM pg_namespace WHERE oid = {{scid}}::oid ) as schema,
 		pg_get_userbyid(rel.relowner) AS relowner, rel.relhasoids,
-		rel.relhassubclass, rel.reltuples::bigint, des.description, con.conname, con.conkey,
+		rel.relhassubclass, rel.relhasindex, rel.relhasrules, rel.reltuples::bigint, des.description, con.conname, con.conkey,
 		EXISTS(select 1 FROM pg_trigger
 				JOIN pg_proc pt ON pt.oid=tgfoid AND pt.proname='logtrigger'
 				JOIN pg_proc pc ON pc.pronamespace=pt.pronamespace AND pc.proname='slonyversion'
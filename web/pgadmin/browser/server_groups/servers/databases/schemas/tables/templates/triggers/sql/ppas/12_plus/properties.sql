@@ -17,7 +17,11 @@ FROM pg_trigger t
     LEFT OUTER JOIN pg_proc p ON p.oid=t.tgfoid
     LEFT OUTER JOIN pg_language l ON l.oid=p.prolang
 WHERE NOT tgisinternal
+{% if tids %}
+    AND tgrelid IN ({{ tids }})
+{% else %}
     AND tgrelid = {{tid}}::OID
+{% endif %}
     AND tgpackageoid = 0
 {% if trid %}
     AND t.oid = {{trid}}::OID
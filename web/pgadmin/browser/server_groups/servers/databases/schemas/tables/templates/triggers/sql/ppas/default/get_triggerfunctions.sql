@@ -1,4 +1,4 @@
-SELECT quote_ident(nspname) || '.' || quote_ident(proname) AS tfunctions
+SELECT {% if tgfoids %}p.oid AS tgfoid, {% endif %}quote_ident(nspname) || '.' || quote_ident(proname) AS tfunctions
 FROM pg_proc p, pg_namespace n, pg_language l
     WHERE p.pronamespace = n.oid
     AND p.prolang = l.oid
@@ -9,7 +9,9 @@ FROM pg_proc p, pg_namespace n, pg_language l
     AND (nspname NOT LIKE 'pg\_%' AND nspname NOT in ('information_schema'))
     {% endif %}
     -- Find function for specific OID
-    {% if tgfoid %}
+    {% if tgfoids %}
+    AND p.oid IN ({{ tgfoids }})
+    {% elif tgfoid %}
     AND p.oid = {{tgfoid}}::OID
     {% endif %}
     ORDER BY nspname ASC, proname ASC
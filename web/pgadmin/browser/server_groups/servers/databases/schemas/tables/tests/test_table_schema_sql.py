@@ -0,0 +1,72 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+import uuid
+
+from pgadmin.browser.server_groups.servers.databases.schemas.tests import \
+    utils as schema_utils
+from pgadmin.browser.server_groups.servers.databases.tests import utils as \
+    database_utils
+from pgadmin.utils.route import BaseTestGenerator
+from regression import parent_node_dict
+from regression.python_test_utils import test_utils as utils
+from . import utils as tables_utils
+
+
+class TableSchemaSqlTestCase(BaseTestGenerator):
+    """This class will fetch the reverse engineered SQL of the tables."""
+    scenarios = [
+        ('Fetch the SQL of all the tables of the schema',
+         dict(url='/browser/table/schema_sql/')),
+    ]
+
+    def setUp(self):
+        self.db_name = parent_node_dict["database"][-1]["db_name"]
+        schema_info = parent_node_dict["schema"][-1]
+        self.server_id = schema_info["server_id"]
+        self.db_id = schema_info["db_id"]
+        db_con = database_utils.connect_database(self, utils.SERVER_GROUP,
+                                                 self.server_id, self.db_id)
+        if not db_con['data']["connected"]:
+            raise Exception("Could not connect to database to add a table.")
+        self.schema_id = schema_info["schema_id"]
+        self.schema_name = schema_info["schema_name"]
+        schema_response = schema_utils.verify_schemas(self.server,
+                                                      self.db_name,
+                                                      self.schema_name)
+        if not schema_response:
+            raise Exception("Could not find the schema to add a table.")
+        self.table_name = "test_table_sql_%s" % (str(uuid.uuid4())[1:8])
+        self.table_id = tables_utils.create_table(self.server, self.db_name,
+                                                  self.schema_name,
+                                                  self.table_name)
+
+    def runTest(self):
+        """This function will fetch the SQL of the table and the schema."""
+        url = '/' + str(utils.SERVER_GROUP) + '/' + str(self.server_id) + \
+            '/' + str(self.db_id) + '/' + str(self.schema_id)
+
+        response = self.tester.get('/browser/table/sql' + url + '/' +
+                                   str(self.table_id),
+                                   follow_redirects=True)
+        self.assertEquals(response.status_code, 200)
+        table_sql = json.loads(response.data.decode('utf-8'))
+
+        response = self.tester.get(self.url + url, follow_redirects=True)
+        self.assertEquals(response.status_code, 200)
+        schema_sql = json.loads(response.data.decode('utf-8'))
+
+        # The SQL of the table must be the same in the SQL of the schema
+        self.assertIn(self.table_name, table_sql)
+        self.assertIn(table_sql, schema_sql)
+
+    def tearDown(self):
+        # Disconnect the database
+        database_utils.disconnect_database(self, self.server_id, self.db_id)
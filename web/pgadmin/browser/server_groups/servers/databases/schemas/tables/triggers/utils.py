@@ -90,7 +90,8 @@ def get_column_details(conn, tid, clist, template_path=None):
 
 @get_template_path
 def get_trigger_function_and_columns(conn, data, tid,
-                                     show_system_objects, template_path=None):
+                                     show_system_objects, template_path=None,
+                                     tfunctions=None, columns=None):
     """
     This function will return trigger function with schema name.
     :param conn: Connection Object
@@ -98,6 +99,10 @@ def get_trigger_function_and_columns(conn, data, tid,
     :param tid: Table ID
     :param show_system_objects: show system object
     :param template_path: Optional Template Path
+    :param tfunctions: Optional dictionary of the trigger function names
+     with schema name by the function oid (see get_triggers_for_tables)
+    :param columns: Optional dictionary of the column names of the table by
+     the column number
     :return:
     """
     # If language is 'edbspl' then trigger function should be
@@ -106,21 +111,24 @@ def get_trigger_function_and_columns(conn, data, tid,
     if data['lanname'] == 'edbspl':
         data['tfunction'] = 'Inline EDB-SPL'
     else:
-        SQL = render_template("/".join(
-            [template_path, 'get_triggerfunctions.sql']),
-            tgfoid=data['tgfoid'],
-            show_system_objects=show_system_objects
-        )
-
-        status, result = conn.execute_dict(SQL)
-        if not status:
-            return internal_server_error(errormsg=result)
-
-        # Update the trigger function which we have fetched with
-        # schema name
-        if 'rows' in result and len(result['rows']) > 0 and \
-                'tfunctions' in result['rows'][0]:
-            data['tfunction'] = result['rows'][0]['tfunctions']
+        if tfunctions is None:
+            SQL = render_template("/".join(
+                [template_path, 'get_triggerfunctions.sql']),
+                tgfoid=data['tgfoid'],
+                show_system_objects=show_system_objects
+            )
+
+            status, result = conn.execute_dict(SQL)
+            if not status:
+                return internal_server_error(errormsg=result)
+
+            # Update the trigger function which we have fetched with
+            # schema name
+            if 'rows' in result and len(result['rows']) > 0 and \
+                    'tfunctions' in result['rows'][0]:
+                data['tfunction'] = result['rows'][0]['tfunctions']
+        elif data['tgfoid'] in tfunctions:
+            data['tfunction'] = tfunctions[data['tgfoid']]
 
         if len(data['custom_tgargs']) > 0:
             driver = get_driver(PG_DEFAULT_DRIVER)
@@ -133,8 +141,15 @@ def get_trigger_function_and_columns(conn, data, tid,
             data['tgargs'] = formatted_args
 
         if len(data['tgattr']) >= 1:
-            columns = ', '.join(data['tgattr'].split(' '))
-            data['columns'] = get_column_details(conn, tid, columns)
+            if columns is None:
+                columns = ', '.join(data['tgattr'].split(' '))
+                data['columns'] = get_column_details(conn, tid, columns)
+            else:
+                attnums = [int(attnum) for attnum in data['tgattr'].split(' ')]
+                data['columns'] = [
+                    columns[attnum] for attnum in sorted(attnums)
+                    if attnum in columns
+                ]
 
     return data
 
@@ -198,10 +213,61 @@ def get_sql(conn, data, tid, trid, datlastsysoid,
     return SQL, name
 
 
+@get_template_path
+def get_triggers_for_tables(conn, tids, datlastsysoid, show_system_objects,
+                            template_path=None):
+    """
+    This function will fetch the properties of the triggers of all the given
+    tables, and their trigger functions using one query for each of them.
+
+    :param conn: Connection Object
+    :param tids: List of the table ids
+    :param datlastsysoid:
+    :param show_system_objects: Show System Object value True or False
+    :param template_path: Optional template path
+    :return: Dictionary of the table id and list of its triggers, which can
+     be passed to get_reverse_engineered_sql (as prefetched)
+    """
+    res = dict((tid, []) for tid in tids)
+    if len(res) == 0:
+        return res
+
+    SQL = render_template("/".join([template_path, 'properties.sql']),
+                          tids=",".join(map(str, tids)),
+                          datlastsysoid=datlastsysoid)
+    status, rset = conn.execute_dict(SQL)
+    if not status:
+        raise Exception(rset)
+
+    tgfoids = set(row['tgfoid'] for row in rset['rows']
+                  if row['lanname'] != 'edbspl')
+    tfunctions = dict()
+    if len(tgfoids) > 0:
+        SQL = render_template("/".join(
+            [template_path, 'get_triggerfunctions.sql']),
+            tgfoids=",".join(map(str, tgfoids)),
+            show_system_objects=show_system_objects
+        )
+        status, result = conn.execute_dict(SQL)
+        if not status:
+            raise Exception(result)
+
+        for row in result['rows']:
+            tfunctions[row['tgfoid']] = row['tfunctions']
+
+    for row in rset['rows']:
+        res[row['tgrelid']].append({
+            'properties': row, 'tfunctions': tfunctions
+        })
+
+    return res
+
+
 @get_template_path
 def get_reverse_engineered_sql(conn, schema, table, tid, trid,
                                datlastsysoid, show_system_objects,
-                               template_path=None, with_header=True):
+                               template_path=None, with_header=True,
+                               prefetched=None, columns=None):
     """
     This function will return reverse engineered sql for specified trigger.
 
@@ -215,27 +281,37 @@ def get_reverse_engineered_sql(conn, schema, table, tid, trid,
     :param template_path: Optional template path
     :param with_header: Optional parameter to decide whether the SQL will be
      returned with header or not
+    :param prefetched: Optional properties and trigger functions of the
+     trigger fetched using get_triggers_for_tables
+    :param columns: Optional dictionary of the column names of the table by
+     the column number
     :return:
     """
-    SQL = render_template("/".join([template_path, 'properties.sql']),
-                          tid=tid, trid=trid,
-                          datlastsysoid=datlastsysoid)
+    if prefetched is None:
+        SQL = render_template("/".join([template_path, 'properties.sql']),
+                              tid=tid, trid=trid,
+                              datlastsysoid=datlastsysoid)
 
-    status, res = conn.execute_dict(SQL)
-    if not status:
-        raise Exception(res)
+        status, res = conn.execute_dict(SQL)
+        if not status:
+            raise Exception(res)
+
+        if len(res['rows']) == 0:
+            raise ObjectGone(_('Could not find the trigger in the table.'))
 
-    if len(res['rows']) == 0:
-        raise ObjectGone(_('Could not find the trigger in the table.'))
+        prefetched = {'properties': res['rows'][0]}
 
-    data = dict(res['rows'][0])
+    data = dict(prefetched['properties'])
 
     # Adding parent into data dict, will be using it while creating sql
     data['schema'] = schema
     data['table'] = table
 
-    data = \
-        get_trigger_function_and_columns(conn, data, tid, show_system_objects)
+    data = get_trigger_function_and_columns(
+        conn, data, tid, show_system_objects,
+        tfunctions=prefetched.get('tfunctions'),
+        columns=columns if 'tfunctions' in prefetched else None
+    )
 
     data = trigger_definition(data)
 
@@ -23,7 +23,7 @@ from pgadmin.utils.ajax import make_json_response, internal_server_error, \
 from pgadmin.browser.server_groups.servers.databases.schemas.utils \
     import DataTypeReader, parse_rule_definition
 from pgadmin.browser.server_groups.servers.utils import parse_priv_from_db, \
-    parse_priv_to_db
+    parse_priv_to_db, parse_acl_items
 from pgadmin.browser.utils import PGChildNodeView
 from pgadmin.utils import IS_PY2
 from pgadmin.utils.compile_template_name import compile_template_path
@@ -143,12 +143,14 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
 
         return wrap
 
-    def _formatter(self, did, scid, tid, data):
+    def _formatter(self, did, scid, tid, data, prefetched=None):
         """
         Args:
             data: dict of query result
             scid: schema oid
             tid: table oid
+            prefetched: columns and constraints of the table fetched using
+                        _prefetch_table_objects (optional)
 
         Returns:
             It will return formatted output of query result
@@ -164,11 +166,16 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
             data['seclabels'] = seclabels
 
         # We need to parse & convert ACL coming from database to json format
-        SQL = render_template("/".join([self.table_template_path, 'acl.sql']),
-                              tid=tid, scid=scid)
-        status, acl = self.conn.execute_dict(SQL)
-        if not status:
-            return internal_server_error(errormsg=acl)
+        if prefetched is None:
+            SQL = render_template(
+                "/".join([self.table_template_path, 'acl.sql']),
+                tid=tid, scid=scid
+            )
+            status, acl = self.conn.execute_dict(SQL)
+            if not status:
+                return internal_server_error(errormsg=acl)
+        else:
+            acl = {'rows': parse_acl_items(data['relacl_str'], 'relacl')}
 
         # We will set get privileges from acl sql so we don't need
         # it from properties sql
@@ -236,9 +243,16 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
 
         # We will fetch all the columns for the table using
         # columns properties.sql, so we need to set template path
-        data = column_utils.get_formatted_columns(self.conn, tid,
-                                                  data, other_columns,
-                                                  table_or_type)
+        if prefetched is None:
+            data = column_utils.get_formatted_columns(self.conn, tid,
+                                                      data, other_columns,
+                                                      table_or_type)
+        else:
+            data = column_utils.get_formatted_columns(
+                self.conn, tid, data, other_columns, table_or_type,
+                columns=prefetched['columns'],
+                edit_types=prefetched['edit_types']
+            )
 
         # Here we will add constraint in our output
         index_constraints = {
@@ -246,34 +260,101 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
         }
         for ctype in index_constraints.keys():
             data[index_constraints[ctype]] = []
-            status, constraints = \
-                idxcons_utils.get_index_constraints(self.conn, did, tid, ctype)
+            if prefetched is None:
+                status, constraints = idxcons_utils.get_index_constraints(
+                    self.conn, did, tid, ctype)
+            else:
+                status, constraints = \
+                    True, prefetched[index_constraints[ctype]]
             if status:
                 for cons in constraints:
                     data.setdefault(
                         index_constraints[ctype], []).append(cons)
 
         # Add Foreign Keys
-        status, foreign_keys = fkey_utils.get_foreign_keys(self.conn, tid)
+        if prefetched is None:
+            status, foreign_keys = fkey_utils.get_foreign_keys(self.conn, tid)
+        else:
+            status, foreign_keys = True, prefetched['foreign_key']
         if status:
             for fk in foreign_keys:
                 data.setdefault('foreign_key', []).append(fk)
 
         # Add Check Constraints
-        status, check_constraints = \
-            check_utils.get_check_constraints(self.conn, tid)
+        if prefetched is None:
+            status, check_constraints = \
+                check_utils.get_check_constraints(self.conn, tid)
+        else:
+            status, check_constraints = True, prefetched['check_constraint']
         if status:
             data['check_constraint'] = check_constraints
 
         # Add Exclusion Constraint
-        status, exclusion_constraints = \
-            exclusion_utils.get_exclusion_constraints(self.conn, did, tid)
+        if prefetched is None:
+            status, exclusion_constraints = \
+                exclusion_utils.get_exclusion_constraints(self.conn, did, tid)
+        else:
+            status, exclusion_constraints = \
+                True, prefetched['exclude_constraint']
         if status:
             for ex in exclusion_constraints:
                 data.setdefault('exclude_constraint', []).append(ex)
 
         return data
 
+    def _prefetch_table_objects(self, did, tids):
+        """
+        This function will fetch the columns and constraints of all the given
+        tables using a few set based queries (one per object type), instead
+        of running the queries of the _formatter for each table.
+
+        Args:
+            did: Database ID
+            tids: List of the table ids
+
+        Returns:
+            Status and dictionary of the table id and its prefetched objects,
+            which can be passed to the properties (and _formatter).
+        """
+        prefetched = dict((tid, dict()) for tid in tids)
+        if len(prefetched) == 0:
+            return True, prefetched
+
+        columns = column_utils.get_columns_for_tables(self.conn, tids)
+        edit_types = column_utils.get_edit_types(
+            self.conn,
+            set(col['atttypid'] for cols in columns.values() for col in cols)
+        )
+        for tid, cols in columns.items():
+            prefetched[tid]['columns'] = cols
+            prefetched[tid]['edit_types'] = edit_types
+
+        constraints = [
+            ('primary_key', idxcons_utils.get_index_constraints_for_tables,
+             (self.conn, did, tids, 'p')),
+            ('unique_constraint',
+             idxcons_utils.get_index_constraints_for_tables,
+             (self.conn, did, tids, 'u')),
+            ('foreign_key', fkey_utils.get_foreign_keys_for_tables,
+             (self.conn, tids)),
+            ('check_constraint',
+             check_utils.get_check_constraints_for_tables,
+             (self.conn, tids)),
+            ('exclude_constraint',
+             exclusion_utils.get_exclusion_constraints_for_tables,
+             (self.conn, did, tids))
+        ]
+
+        for key, fetch, args in constraints:
+            status, res = fetch(*args)
+            if not status:
+                return False, res
+
+            for tid, rows in res.items():
+                prefetched[tid][key] = rows
+
+        return True, prefetched
+
     def get_table_dependents(self, tid):
         """
         This function get the dependents and return ajax response
@@ -408,8 +489,71 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
             status=200
         )
 
+    def _prefetch_table_children(self, did, scid, tids, prefetched):
+        """
+        This function will fetch the indexes, triggers, rules and partitions
+        of all the given tables using a few set based queries (one per object
+        type), instead of running the queries of the
+        get_reverse_engineered_sql for each of those objects.
+
+        Args:
+            did: Database ID
+            scid: Schema ID
+            tids: List of the table ids
+            prefetched: Dictionary of the table id and its prefetched objects
+                        (see _prefetch_table_objects), the child objects are
+                        added to it.
+        """
+        if len(tids) == 0:
+            return
+
+        # Dynamically load index utils to avoid circular dependency.
+        from pgadmin.browser.server_groups.servers.databases.schemas. \
+            tables.indexes import utils as index_utils
+
+        children = [
+            ('index', index_utils.get_indexes_for_tables(
+                self.conn, did, tids, self.datlastsysoid)),
+            ('trigger', trigger_utils.get_triggers_for_tables(
+                self.conn, tids, self.datlastsysoid,
+                self.blueprint.show_system_objects))
+        ]
+
+        SQL = render_template("/".join(
+            [self.rules_template_path, 'properties.sql']),
+            tids=",".join(map(str, tids)), datlastsysoid=self.datlastsysoid)
+        status, rset = self.conn.execute_dict(SQL)
+        if not status:
+            raise Exception(rset)
+
+        rules = dict((tid, []) for tid in tids)
+        for row in rset['rows']:
+            rules[row['tid']].append(row)
+        children.append(('rule', rules))
+
+        # Greenplum partitions are still fetched for each table.
+        if self.manager.version >= 100000 and \
+                self.manager.server_type != 'gpdb':
+            SQL = render_template("/".join([self.partition_template_path,
+                                            'nodes.sql']),
+                                  scid=scid, tids=",".join(map(str, tids)))
+            status, rset = self.conn.execute_2darray(SQL)
+            if not status:
+                raise Exception(rset)
+
+            partitions = dict((tid, []) for tid in tids)
+            for row in rset['rows']:
+                partitions[row['tid']].append(row)
+            children.append(('partition', partitions))
+
+        for key, objects in children:
+            for tid, rows in objects.items():
+                prefetched.setdefault(tid, dict())[key] = rows
+
     def get_reverse_engineered_sql(self, did, scid, tid, main_sql, data,
-                                   json_resp=True, diff_partition_sql=False):
+                                   json_resp=True, diff_partition_sql=False,
+                                   prefetched=None,
+                                   return_ajax_response=True):
         """
         This function will creates reverse engineered sql for
         the table object
@@ -423,6 +567,11 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
            json_resp: Json response or plain SQL
            diff_partition_sql: In Schema diff, the Partition sql should be
            return separately to perform further task
+           prefetched: columns, constraints and child objects of the table
+                       fetched using _prefetch_table_objects and
+                       _prefetch_table_children (optional)
+           return_ajax_response: If False, return the SQL instead of the
+                                 ajax response (for json_resp)
         """
         """
         #####################################
@@ -435,8 +584,14 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
         table = data['name']
         is_partitioned = 'is_partitioned' in data and data['is_partitioned']
         sql_header = ''
+        children = prefetched if prefetched is not None else dict()
+
+        # Column names by number, used by the prefetched triggers
+        columns = dict(
+            (c['attnum'], c['name']) for c in children.get('columns', [])
+        )
 
-        data = self._formatter(did, scid, tid, data)
+        data = self._formatter(did, scid, tid, data, prefetched)
 
         # Now we have all lis of columns which we need
         # to include in our create definition, Let's format them
@@ -491,20 +646,27 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
         ######################################
         """
 
-        SQL = render_template("/".join([self.index_template_path,
-                                        'nodes.sql']), tid=tid)
-        status, rset = self.conn.execute_2darray(SQL)
-        if not status:
-            return internal_server_error(errormsg=rset)
+        if 'index' in children:
+            indexes = [(index['properties']['oid'], index)
+                       for index in children['index']]
+        else:
+            SQL = render_template("/".join([self.index_template_path,
+                                            'nodes.sql']), tid=tid)
+            status, rset = self.conn.execute_2darray(SQL)
+            if not status:
+                return internal_server_error(errormsg=rset)
+
+            indexes = [(row['oid'], None) for row in rset['rows']]
 
         # Dynamically load index utils to avoid circular dependency.
         from pgadmin.browser.server_groups.servers.databases.schemas. \
             tables.indexes import utils as index_utils
-        for row in rset['rows']:
+        for idx, index in indexes:
             index_sql = index_utils.get_reverse_engineered_sql(
-                self.conn, schema, table, did, tid, row['oid'],
+                self.conn, schema, table, did, tid, idx,
                 self.datlastsysoid,
-                template_path=None, with_header=json_resp)
+                template_path=None, with_header=json_resp,
+                prefetched=index)
             index_sql = u"\n" + index_sql
 
             # Add into main sql
@@ -517,17 +679,24 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
         # 3) Reverse engineered sql for TRIGGERS
         ########################################
         """
-        SQL = render_template("/".join([self.trigger_template_path,
-                                        'nodes.sql']), tid=tid)
-        status, rset = self.conn.execute_2darray(SQL)
-        if not status:
-            return internal_server_error(errormsg=rset)
+        if 'trigger' in children:
+            triggers = [(trigger['properties']['oid'], trigger)
+                        for trigger in children['trigger']]
+        else:
+            SQL = render_template("/".join([self.trigger_template_path,
+                                            'nodes.sql']), tid=tid)
+            status, rset = self.conn.execute_2darray(SQL)
+            if not status:
+                return internal_server_error(errormsg=rset)
 
-        for row in rset['rows']:
+            triggers = [(row['oid'], None) for row in rset['rows']]
+
+        for trid, trigger in triggers:
             trigger_sql = trigger_utils.get_reverse_engineered_sql(
-                self.conn, schema, table, tid, row['oid'],
+                self.conn, schema, table, tid, trid,
                 self.datlastsysoid, self.blueprint.show_system_objects,
-                template_path=None, with_header=json_resp)
+                template_path=None, with_header=json_resp,
+                prefetched=trigger, columns=columns)
             trigger_sql = u"\n" + trigger_sql
 
             # Add into main sql
@@ -567,23 +736,30 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
         #####################################
         """
 
-        SQL = render_template("/".join(
-            [self.rules_template_path, 'nodes.sql']), tid=tid)
-
-        status, rset = self.conn.execute_2darray(SQL)
-        if not status:
-            return internal_server_error(errormsg=rset)
-
-        for row in rset['rows']:
-            rules_sql = '\n'
+        if 'rule' in children:
+            rules = [{'rows': [rule]} for rule in children['rule']]
+        else:
             SQL = render_template("/".join(
-                [self.rules_template_path, 'properties.sql']
-            ), rid=row['oid'], datlastsysoid=self.datlastsysoid)
+                [self.rules_template_path, 'nodes.sql']), tid=tid)
 
-            status, res = self.conn.execute_dict(SQL)
+            status, rset = self.conn.execute_2darray(SQL)
             if not status:
-                return internal_server_error(errormsg=res)
+                return internal_server_error(errormsg=rset)
+
+            rules = []
+            for row in rset['rows']:
+                SQL = render_template("/".join(
+                    [self.rules_template_path, 'properties.sql']
+                ), rid=row['oid'], datlastsysoid=self.datlastsysoid)
+
+                status, res = self.conn.execute_dict(SQL)
+                if not status:
+                    return internal_server_error(errormsg=res)
+
+                rules.append(res)
 
+        for res in rules:
+            rules_sql = '\n'
             display_comments = True
             if not json_resp:
                 display_comments = False
@@ -602,18 +778,23 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
         ##########################################
         """
         if is_partitioned:
-            SQL = render_template("/".join([self.partition_template_path,
-                                            'nodes.sql']),
-                                  scid=scid, tid=tid)
-            status, rset = self.conn.execute_2darray(SQL)
-            if not status:
-                return internal_server_error(errormsg=rset)
+            if 'partition' in children:
+                partitions = children['partition']
+            else:
+                SQL = render_template("/".join([self.partition_template_path,
+                                                'nodes.sql']),
+                                      scid=scid, tid=tid)
+                status, rset = self.conn.execute_2darray(SQL)
+                if not status:
+                    return internal_server_error(errormsg=rset)
 
-            if len(rset['rows']):
+                partitions = rset['rows']
+
+            if len(partitions):
                 if json_resp:
                     sql_header = u"\n-- Partitions SQL"
                 partition_sql = ''
-                for row in rset['rows']:
+                for row in partitions:
                     part_data = dict()
                     part_data['partitioned_table_name'] = data['name']
                     part_data['parent_schema'] = data['schema']
@@ -644,6 +825,8 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
 
         if not json_resp:
             return sql, partition_main_sql
+        if not return_ajax_response:
+            return sql.strip('\n')
         return ajax_response(response=sql.strip('\n'))
 
     def reset_statistics(self, scid, tid):
@@ -1160,7 +1343,7 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
             return internal_server_error(errormsg=str(e))
 
     def properties(self, gid, sid, did, scid, tid, res,
-                   return_ajax_response=True):
+                   return_ajax_response=True, prefetched=None):
         """
         This function will show the properties of the selected table node.
 
@@ -1173,6 +1356,8 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
             tid: Table ID
             res: Table/Partition table properties
             return_ajax_response: If True then return the ajax response
+            prefetched: columns and constraints of the table fetched using
+                        _prefetch_table_objects (optional)
 
         Returns:
             JSON of selected table node
@@ -1195,7 +1380,7 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
             'vacuum_settings_str'
         ].replace("=", " = ")
 
-        data = self._formatter(did, scid, tid, data)
+        data = self._formatter(did, scid, tid, data, prefetched)
 
         # Fetch partition of this table if it is partitioned table.
         if 'is_partitioned' in data and data['is_partitioned']:
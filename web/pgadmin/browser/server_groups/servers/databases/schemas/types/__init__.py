@@ -20,7 +20,7 @@ from config import PG_DEFAULT_DRIVER
 from pgadmin.browser.server_groups.servers.databases.schemas.utils \
     import SchemaChildModule, DataTypeReader
 from pgadmin.browser.server_groups.servers.utils import parse_priv_from_db, \
-    parse_priv_to_db
+    parse_priv_to_db, parse_acl_items
 from pgadmin.browser.utils import PGChildNodeView
 from pgadmin.utils import IS_PY2
 from pgadmin.utils.ajax import make_json_response, internal_server_error, \
@@ -597,9 +597,6 @@ class TypeView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
             return False, gone(
                 gettext("""Could not find the type in the database."""))
 
-        # Making copy of output for future use
-        copy_dict = dict(res['rows'][0])
-
         # We need to parse & convert ACL coming from database to json format
         SQL = render_template("/".join([self.template_path, 'acl.sql']),
                               scid=scid, tid=tid)
@@ -607,11 +604,26 @@ class TypeView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
         if not status:
             return False, internal_server_error(errormsg=acl)
 
+        return True, self._format_properties(res['rows'][0], tid,
+                                             acl['rows'])
+
+    def _format_properties(self, row, tid, acl):
+        """
+        This function is used to format the properties of the type fetched
+        using the properties.sql
+        :param row: Type properties
+        :param tid: Type Id
+        :param acl: Privileges (rows in the format of the acl.sql)
+        :return:
+        """
+        # Making copy of output for future use
+        copy_dict = dict(row)
+
         # We will set get privileges from acl sql so we don't need
         # it from properties sql
         copy_dict['typacl'] = []
 
-        for row in acl['rows']:
+        for row in acl:
             priv = parse_priv_from_db(row)
             if row['deftype'] in copy_dict:
                 copy_dict[row['deftype']].append(priv)
@@ -621,7 +633,35 @@ class TypeView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
         # Calling function to check and additional properties if available
         copy_dict.update(self.additional_properties(copy_dict, tid))
 
-        return True, copy_dict
+        return copy_dict
+
+    def _fetch_all_properties(self, scid):
+        """
+        This function is used to fetch the properties of all the types of
+        the specified schema using a single query, instead of running the
+        properties.sql and acl.sql for each type.
+        :param scid: Schema Id
+        :return: Properties of the types by their oid
+        """
+        SQL = render_template(
+            "/".join([self.template_path,
+                      'properties.sql']),
+            scid=scid,
+            datlastsysoid=self.datlastsysoid,
+            show_system_objects=self.blueprint.show_system_objects
+        )
+        status, res = self.conn.execute_dict(SQL)
+        if not status:
+            return False, res
+
+        result = dict()
+        for row in res['rows']:
+            result[row['oid']] = self._format_properties(
+                row, row['oid'],
+                parse_acl_items(row.get('type_acl', None), 'typacl')
+            )
+
+        return True, result
 
     @check_precondition
     def get_collations(self, gid, sid, did, scid, tid=None):
@@ -1466,10 +1506,13 @@ class TypeView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
         if not status:
             return internal_server_error(errormsg=res)
 
+        status, props = self._fetch_all_properties(scid)
+        if not status:
+            return internal_server_error(errormsg=props)
+
         for row in rset['rows']:
-            status, data = self._fetch_properties(scid, row['oid'])
-            if status:
-                res[row['name']] = data
+            if row['oid'] in props:
+                res[row['name']] = props[row['oid']]
 
         return res
 
@@ -21,7 +21,7 @@ from config import PG_DEFAULT_DRIVER
 from pgadmin.browser.server_groups.servers.databases.schemas.utils import \
     SchemaChildModule, parse_rule_definition, VacuumSettings, get_schema
 from pgadmin.browser.server_groups.servers.utils import parse_priv_from_db, \
-    parse_priv_to_db
+    parse_priv_to_db, parse_acl_items
 from pgadmin.browser.utils import PGChildNodeView
 from pgadmin.utils.ajax import make_json_response, internal_server_error, \
     make_response as ajax_response, gone
@@ -442,11 +442,23 @@ class ViewNode(PGChildNodeView, VacuumSettings, SchemaDiffObjectCompare):
         if not status:
             return False, internal_server_error(errormsg=res)
 
-        for row in dataclres['rows']:
-            priv = parse_priv_from_db(row)
-            res['rows'][0].setdefault(row['deftype'], []).append(priv)
+        return True, self._format_properties(res['rows'][0],
+                                             dataclres['rows'])
 
-        result = res['rows'][0]
+    def _format_properties(self, result, acl):
+        """
+        This function is used to format the properties of the view
+        fetched using the properties.sql
+        :param result: View properties
+        :param acl: Privileges (rows in the format of the acl.sql)
+        :return:
+        """
+        # Privileges are already fetched in the format of the acl.sql
+        result.pop('relacl_str', None)
+
+        for row in acl:
+            priv = parse_priv_from_db(row)
+            result.setdefault(row['deftype'], []).append(priv)
 
         # sending result to formtter
         frmtd_reslt = self.formatter(result)
@@ -454,6 +466,30 @@ class ViewNode(PGChildNodeView, VacuumSettings, SchemaDiffObjectCompare):
         # merging formated result with main result again
         result.update(frmtd_reslt)
 
+        return result
+
+    def _fetch_all_properties(self, scid):
+        """
+        This function is used to fetch the properties of all the views of
+        the specified schema using a single query, instead of running the
+        properties.sql and acl.sql for each view.
+        :param scid: Schema Id
+        :return: Properties of the views by their oid
+        """
+        SQL = render_template("/".join(
+            [self.template_path, 'sql/properties.sql']
+        ), scid=scid, datlastsysoid=self.datlastsysoid)
+        status, res = self.conn.execute_dict(SQL)
+        if not status:
+            return False, res
+
+        result = dict()
+        for row in res['rows']:
+            row['system_view'] = row['oid'] <= self.datlastsysoid
+            result[row['oid']] = self._format_properties(
+                row, parse_acl_items(row['relacl_str'], 'datacl')
+            )
+
         return True, result
 
     @staticmethod
@@ -1417,10 +1453,14 @@ class ViewNode(PGChildNodeView, VacuumSettings, SchemaDiffObjectCompare):
                 current_app.logger.error(views)
                 return False
 
+            status, props = self._fetch_all_properties(scid)
+            if not status:
+                current_app.logger.error(props)
+                return False
+
             for row in views['rows']:
-                status, data = self._fetch_properties(scid, row['oid'])
-                if status:
-                    res[row['name']] = data
+                if row['oid'] in props:
+                    res[row['name']] = props[row['oid']]
         else:
             status, data = self._fetch_properties(scid, oid)
             if not status:
@@ -1923,23 +1963,48 @@ class MViewNode(ViewNode, VacuumSettings):
         if not status:
             return False, internal_server_error(errormsg=res)
 
-        for row in dataclres['rows']:
-            priv = parse_priv_from_db(row)
-            res['rows'][0].setdefault(row['deftype'], []).append(priv)
-
-        result = res['rows'][0]
+        return True, self._format_properties(res['rows'][0],
+                                             dataclres['rows'])
 
-        # sending result to formtter
-        frmtd_reslt = self.formatter(result)
-
-        # merging formated result with main result again
-        result.update(frmtd_reslt)
+    def _format_properties(self, result, acl):
+        """
+        This function is used to format the properties of the materialized
+        view fetched using the properties.sql
+        :param result: Materialized view properties
+        :param acl: Privileges (rows in the format of the acl.sql)
+        :return:
+        """
+        result = super(MViewNode, self)._format_properties(result, acl)
 
         result['vacuum_table'] = self.parse_vacuum_data(
             self.conn, result, 'table')
         result['vacuum_toast'] = self.parse_vacuum_data(
             self.conn, result, 'toast')
 
+        return result
+
+    def _fetch_all_properties(self, scid, did=None):
+        """
+        This function is used to fetch the properties of all the
+        materialized views of the specified schema using a single query.
+        :param scid: Schema Id
+        :param did: Database Id
+        :return: Properties of the materialized views by their oid
+        """
+        SQL = render_template("/".join(
+            [self.template_path, 'sql/properties.sql']
+        ), did=did, scid=scid, datlastsysoid=self.datlastsysoid)
+        status, res = self.conn.execute_dict(SQL)
+        if not status:
+            return False, res
+
+        result = dict()
+        for row in res['rows']:
+            row['system_view'] = row['oid'] <= self.datlastsysoid
+            result[row['oid']] = self._format_properties(
+                row, parse_acl_items(row['relacl'], 'datacl')
+            )
+
         return True, result
 
     @check_precondition
@@ -2011,10 +2076,13 @@ class MViewNode(ViewNode, VacuumSettings):
         if not status:
             return internal_server_error(errormsg=res)
 
+        status, props = self._fetch_all_properties(scid, did)
+        if not status:
+            return internal_server_error(errormsg=props)
+
         for row in rset['rows']:
-            status, data = self._fetch_properties(did, scid, row['oid'])
-            if status:
-                res[row['name']] = data
+            if row['oid'] in props:
+                res[row['name']] = props[row['oid']]
 
         return res
 
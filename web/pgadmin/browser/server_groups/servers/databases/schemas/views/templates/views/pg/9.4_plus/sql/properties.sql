@@ -12,6 +12,7 @@ SELECT
     c.relispopulated AS ispopulated,
     pg_get_userbyid(c.relowner) AS owner,
     array_to_string(c.relacl::text[], ', ') AS acl,
+    c.relacl AS relacl_str,
     pg_get_viewdef(c.oid, true) AS definition,
     {# ===== Checks if it is system view ===== #}
     {% if vid and datlastsysoid %}
@@ -10,6 +10,7 @@ SELECT
     pg_get_viewdef(c.oid, true) AS definition,
     nsp.nspname AS schema,
     array_to_string(c.relacl::text[], ', ') AS acl,
+    c.relacl AS relacl_str,
     {#=============Checks if it is system view================#}
     {% if vid and datlastsysoid %}
     CASE WHEN {{vid}} <= {{datlastsysoid}} THEN True ELSE False END AS system_view,
@@ -834,6 +834,9 @@ rolmembership:{
                 _("Could not create the role.\n{0}").format(msg)
             )
 
+        # The privileges of the connected user might have been changed.
+        self.manager.invalidate_metadata()
+
         status, rset = self.conn.execute_dict(
             render_template(self.sql_path + 'nodes.sql',
                             rid=rid
@@ -0,0 +1,69 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.browser.server_groups.servers.utils import parse_acl_items
+
+
+class TestParseAclItems(BaseTestGenerator):
+    """ This class will test the parsing of the aclitem[] values. """
+    scenarios = [
+        (
+            'When the acl is empty',
+            dict(
+                acl=None,
+                expected=[]
+            )
+        ), (
+            'When the privileges are granted to PUBLIC',
+            dict(
+                acl='{=r/postgres}',
+                expected=[
+                    ('PUBLIC', 'postgres', ['r'], [False])
+                ]
+            )
+        ), (
+            'When the privileges are granted with the grant option',
+            dict(
+                acl='{postgres=arwdDxt/postgres,bob=a*r/postgres}',
+                expected=[
+                    ('bob', 'postgres', ['a', 'r'], [True, False]),
+                    ('postgres', 'postgres',
+                     ['a', 'r', 'w', 'd', 'D', 'x', 't'], [False] * 7)
+                ]
+            )
+        ), (
+            'When the role names are quoted',
+            dict(
+                acl='{"\\"my user\\"=r*/\\"x\\"\\"y\\""}',
+                expected=[
+                    ('my user', 'x"y', ['r'], [True])
+                ]
+            )
+        ), (
+            'When the acl is fetched as a list',
+            dict(
+                acl=['alice=U/postgres'],
+                expected=[
+                    ('alice', 'postgres', ['U'], [False])
+                ]
+            )
+        )
+    ]
+
+    def runTest(self):
+        rows = parse_acl_items(self.acl, 'relacl')
+
+        self.assertEqual(
+            [(row['grantee'], row['grantor'], row['privileges'],
+              row['grantable']) for row in rows],
+            self.expected
+        )
+        for row in rows:
+            self.assertEqual(row['deftype'], 'relacl')
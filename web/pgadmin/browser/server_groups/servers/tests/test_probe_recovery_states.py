@@ -0,0 +1,82 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import threading
+import time
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.browser.server_groups.servers import probe_recovery_states
+
+
+class _Connection(object):
+    def __init__(self, in_recovery=False, error=None, delay=0):
+        self.conn_id = 'DB:postgres'
+        self.in_recovery = in_recovery
+        self.error = error
+        self.delay = delay
+        self.thread = None
+        self.cancelled = threading.Event()
+
+    def execute_dict(self, sql):
+        self.thread = threading.current_thread()
+        if self.cancelled.wait(self.delay):
+            return False, 'canceling statement due to user request'
+        if self.error is not None:
+            return False, self.error
+        return True, {'rows': [{'inrecovery': self.in_recovery,
+                                'isreplaypaused': False}]}
+
+    def cancel_transaction(self, conn_id, did=None):
+        assert conn_id == self.conn_id
+        self.cancelled.set()
+        return True, ''
+
+
+class TestProbeRecoveryStates(BaseTestGenerator):
+    """
+    This class will test the concurrent check of the recovery state of the
+    servers.
+    """
+
+    scenarios = [
+        (
+            'When all the servers respond',
+            dict(scenario='respond')
+        ),
+        (
+            'When a server fails to respond in time',
+            dict(scenario='timeout')
+        )
+    ]
+
+    def runTest(self):
+        probes = {
+            1: (_Connection(in_recovery=True), 100000),
+            2: (_Connection(error='server closed the connection'), 90600),
+        }
+        if self.scenario == 'timeout':
+            probes[3] = (_Connection(delay=2), 100000)
+
+        with self.app.test_request_context():
+            started = time.time()
+            states = probe_recovery_states(probes, timeout=0.5)
+
+        self.assertLess(time.time() - started, 1.5)
+        self.assertEqual(states[1][0], True)
+        self.assertEqual(states[1][2:], (True, False))
+        self.assertEqual(states[2],
+                         (False, 'server closed the connection', None, None))
+        self.assertNotIn(3, states)
+        if self.scenario == 'timeout':
+            # The query of the server, which did not respond in time, has
+            # been cancelled.
+            self.assertTrue(probes[3][0].cancelled.wait(1))
+        self.assertFalse(probes[1][0].cancelled.is_set())
+        # The servers have been probed outside of the request thread.
+        self.assertNotEqual(probes[1][0].thread, threading.current_thread())
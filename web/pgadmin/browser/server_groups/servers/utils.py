@@ -36,6 +36,112 @@ def parse_priv_from_db(db_privileges):
     return acl
 
 
+def _split_acl_array(acl):
+    """
+    Split the text representation of an aclitem[] (i.e. '{a=r/b,c=w/b}')
+    into the (unquoted) aclitems.
+    """
+    items = []
+    item = []
+    quoted = False
+    escaped = False
+
+    for ch in acl.strip()[1:-1]:
+        if escaped:
+            item.append(ch)
+            escaped = False
+        elif ch == '\\':
+            escaped = True
+        elif ch == '"':
+            quoted = not quoted
+        elif ch == ',' and not quoted:
+            items.append(''.join(item))
+            item = []
+        else:
+            item.append(ch)
+
+    if item:
+        items.append(''.join(item))
+
+    return items
+
+
+def _read_acl_role(aclitem, pos, stop):
+    """
+    Read a (possibly double quoted) role name from the aclitem starting at
+    the given position, till the stop character.
+
+    Returns the role name and the position of the stop character.
+    """
+    name = []
+    quoted = False
+
+    while pos < len(aclitem):
+        ch = aclitem[pos]
+        if ch == '"':
+            if quoted and aclitem[pos + 1:pos + 2] == '"':
+                name.append(ch)
+                pos += 1
+            else:
+                quoted = not quoted
+        elif ch == stop and not quoted:
+            break
+        else:
+            name.append(ch)
+        pos += 1
+
+    return ''.join(name), pos
+
+
+def parse_acl_items(acl, deftype):
+    """
+    Parse the aclitem[] value of a catalog object (i.e. pg_class.relacl),
+    fetched as it is, into the rows in the same format as returned by the
+    acl.sql templates, so that they can be passed to parse_priv_from_db.
+
+    This avoids running the acl.sql for each object, when the privileges of
+    a lot of objects are needed (i.e. by the schema diff).
+
+    Args:
+        acl: aclitem[] as text (or list of the aclitems)
+        deftype: Type of the privileges (i.e. relacl, attacl)
+
+    Returns:
+        List of the privilege rows sorted by the grantee
+    """
+    if not acl:
+        return []
+
+    items = acl if isinstance(acl, (list, tuple)) else \
+        _split_acl_array(acl)
+    rows = []
+
+    for aclitem in items:
+        grantee, pos = _read_acl_role(aclitem, 0, '=')
+        slash = aclitem.find('/', pos)
+        privs = aclitem[pos + 1:slash]
+        grantor, _ = _read_acl_role(aclitem, slash + 1, None)
+
+        privileges = []
+        grantable = []
+        for ch in privs:
+            if ch == '*':
+                grantable[-1] = True
+            else:
+                privileges.append(ch)
+                grantable.append(False)
+
+        rows.append({
+            'deftype': deftype,
+            'grantee': grantee or 'PUBLIC',
+            'grantor': grantor,
+            'privileges': privileges,
+            'grantable': grantable
+        })
+
+    return sorted(rows, key=lambda row: (row['grantee'], row['grantor']))
+
+
 def parse_priv_to_db(str_privileges, allowed_acls=[]):
     """
     Common utility function to parse privileges before sending to database.
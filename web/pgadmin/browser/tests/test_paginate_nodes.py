@@ -0,0 +1,61 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import simplejson as json
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.browser.utils import paginate_nodes, like_prefix
+
+
+class PaginateNodesTestCase(BaseTestGenerator):
+    """ This class will test the paging of the browser tree nodes. """
+
+    scenarios = [
+        (
+            'When the nodes are not paged',
+            dict(query_string='',
+                 expected=['a1', 'a2', 'b1', 'b2', 'c1'],
+                 result=None)
+        ),
+        (
+            'When the first page is requested',
+            dict(query_string='limit=2',
+                 expected=['a1', 'a2'],
+                 result={'has_more': True, 'after': 'a2'})
+        ),
+        (
+            'When the next page is requested',
+            dict(query_string='limit=2&after=a2',
+                 expected=['b1', 'b2'],
+                 result={'has_more': True, 'after': 'b2'})
+        ),
+        (
+            'When the last page is requested',
+            dict(query_string='limit=2&after=b2',
+                 expected=['c1'],
+                 result={'has_more': False, 'after': None})
+        ),
+        (
+            'When the nodes are filtered',
+            dict(query_string='filter=b&limit=2',
+                 expected=['b1', 'b2'],
+                 result={'has_more': False, 'after': None})
+        )
+    ]
+
+    def runTest(self):
+        nodes = [{'label': label} for label in ['b2', 'a1', 'c1', 'b1', 'a2']]
+
+        with self.app.test_request_context('/?' + self.query_string):
+            response = paginate_nodes(nodes)
+
+        doc = json.loads(response.data.decode('utf-8'))
+        self.assertEqual([n['label'] for n in doc['data']], self.expected)
+        self.assertEqual(doc['result'], self.result)
+        self.assertEqual(like_prefix('a_b%'), 'a\\_b\\%%')
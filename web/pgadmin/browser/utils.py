@@ -85,6 +85,91 @@ def is_version_in_range(sversion, min_ver, max_ver):
     return False
 
 
+def get_node_page_args():
+    """
+    Returns the paging arguments of the request listing the browser tree
+    nodes of a collection.
+
+     * filter - only the nodes with the name (label) starting with it
+     * after  - only the nodes after the given name, i.e. the name of the
+                last node of the previous page
+     * limit  - maximum number of the nodes to return
+
+    Returns:
+        (filter, after, limit), None for a missing argument
+    """
+    args = flask.request.args
+    limit = args.get('limit', type=int)
+
+    return (
+        args.get('filter') or None,
+        args.get('after') or None,
+        limit if limit is not None and limit > 0 else None
+    )
+
+
+def like_prefix(prefix):
+    """
+    Returns the LIKE pattern matching the strings starting with the given
+    prefix.
+    """
+    if prefix is None:
+        return None
+
+    return prefix.replace('\\', '\\\\').replace('%', '\\%')\
+        .replace('_', '\\_') + '%'
+
+
+def make_node_page_response(nodes, limit=None):
+    """
+    Create the response listing a page of the browser tree nodes.
+
+    Args:
+        nodes: Nodes sorted by the label, optionally followed by one more
+            node (i.e. fetched with limit + 1), telling that there are more
+            nodes after this page
+        limit: Maximum number of the nodes in a page, None when the nodes
+            have not been paged
+
+    Returns:
+        The nodes as the data, and the key to fetch the next page as the
+        'after' argument (None for the last page) in the result, when paged.
+    """
+    if limit is None:
+        return make_json_response(data=nodes, status=200)
+
+    has_more = len(nodes) > limit
+    nodes = nodes[:limit]
+
+    return make_json_response(
+        data=nodes,
+        result={
+            'has_more': has_more,
+            'after': nodes[-1]['label'] if has_more else None
+        },
+        status=200
+    )
+
+
+def paginate_nodes(nodes):
+    """
+    Sort the given browser tree nodes by the label, and create the response
+    listing the page of them requested by the paging arguments (see
+    get_node_page_args).
+    """
+    name_filter, after, limit = get_node_page_args()
+    nodes = sorted(nodes, key=lambda c: c['label'])
+
+    if name_filter is not None:
+        nodes = [n for n in nodes if n['label'].startswith(name_filter)]
+    if after is not None:
+        nodes = [n for n in nodes if n['label'] > after]
+
+    return make_node_page_response(
+        nodes if limit is None else nodes[:limit + 1], limit
+    )
+
+
 class PGChildModule(object):
     """
     class PGChildModule
@@ -345,12 +430,8 @@ class NodeView(with_metaclass(MethodViewType, View)):
         """Build a list of treeview nodes from the child nodes."""
         children = self.get_children_nodes(*args, **kwargs)
 
-        # Return sorted nodes based on label
-        return make_json_response(
-            data=sorted(
-                children, key=lambda c: c['label']
-            )
-        )
+        # Return sorted nodes based on label (a page of them, if requested)
+        return paginate_nodes(children)
 
     def get_children_nodes(self, *args, **kwargs):
         """
@@ -424,13 +505,8 @@ class PGChildNodeView(NodeView):
                 )
             )
 
-        # Return sorted nodes based on label
-        return make_json_response(
-            data=sorted(
-                self.get_children_nodes(manager, **kwargs),
-                key=lambda c: c['label']
-            )
-        )
+        # Return sorted nodes based on label (a page of them, if requested)
+        return paginate_nodes(self.get_children_nodes(manager, **kwargs))
 
     def get_dependencies(self, conn, object_id, where=None,
                          show_system_objects=None):
@@ -11,10 +11,15 @@
 A blueprint module providing utility functions for the notify the user about
 the long running background-processes.
 """
-from flask import url_for
+import pytz
+from dateutil import parser
+from flask import url_for, request
 from flask_security import login_required
 from pgadmin.utils import PgAdminModule
-from pgadmin.utils.ajax import make_response, gone, success_return
+from pgadmin.utils.ajax import make_response, gone, success_return, \
+    bad_request
+
+import config
 
 from .processes import BatchProcess
 
@@ -55,10 +60,39 @@ blueprint = BGProcessModule(
 )
 
 
+def _process_time(value):
+    """Convert the given time to the format of the process start time."""
+    if value is None:
+        return None
+    value = parser.parse(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=pytz.utc)
+    return value.astimezone(pytz.utc).strftime('%Y-%m-%d %H:%M:%S.%f %z')
+
+
 @blueprint.route('/', methods=['GET'], endpoint='list')
 @login_required
 def index():
-    return make_response(response=BatchProcess.list())
+    """
+    List the background processes of the user.
+
+    The request may have the 'state' ('running', or 'finished'), 'since',
+    'before' (the start time of the last process of the previous page), and
+    'limit' arguments to list only a page of the processes.
+    """
+    try:
+        since = _process_time(request.args.get('since', None))
+        before = _process_time(request.args.get('before', None))
+    except (ValueError, OverflowError) as e:
+        return bad_request(errormsg=str(e))
+
+    BatchProcess.cleanup()
+
+    return make_response(response=BatchProcess.list(
+        state=request.args.get('state', None),
+        since=since, before=before,
+        limit=request.args.get('limit', None, type=int)
+    ))
 
 
 @blueprint.route('/<pid>', methods=['GET'], endpoint='status')
@@ -77,13 +111,19 @@ def status(pid, out=-1, err=-1):
         out: position of the last stdout fetched
         err: position of the last stderr fetched
 
+    The 'wait' argument (in seconds) of the request makes it wait for the new
+    lines of the logs of the running process (long-poll).
+
     Returns:
         Status of the process and logs (if out, and err not equal to -1)
     """
+    wait = request.args.get('wait', 0, type=int)
+    wait = max(0, min(wait, config.BGPROCESS_LONG_POLL_TIMEOUT or 0))
+
     try:
         process = BatchProcess(id=pid)
 
-        return make_response(response=process.status(out, err))
+        return make_response(response=process.status(out, err, wait))
     except LookupError as lerr:
         return gone(errormsg=str(lerr))
 
@@ -0,0 +1,335 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL License
+#
+##########################################################################
+
+"""
+Incremental reading of the logs of the background processes.
+
+The process executor appends the timestamped output of the utility to the
+'out' and 'err' files in the log directory of the process, and writes its
+state to the 'status' file. The log watcher keeps the lines read from those
+files in memory, reads only the bytes appended since the last read, and
+re-reads the status file only when it has been modified. The clients fetch
+the lines after the byte offset they have already seen, and may wait for
+the new lines (long-poll), which are picked up by a single background
+thread watching the files of the running processes.
+"""
+
+import json
+import os
+import re
+import sys
+import threading
+import time
+from bisect import bisect_right
+
+# Maximum number of the log lines returned at once
+MAX_LOG_LINES = 1024
+
+_LOG_LINE = re.compile(r"(\d+),(.*$)")
+
+
+def _encoding():
+    enc = sys.getdefaultencoding()
+    if enc is None or enc == 'ascii':
+        enc = 'utf-8'
+    return enc
+
+
+class ProcessLog(object):
+    """
+    class ProcessLog
+
+        The lines of a log file (stdout, or stderr) of a background process,
+        along with the byte offset of the end of each of them.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        # Number of bytes read from the file
+        self.size = 0
+        # Offset of the end of the last complete line read
+        self.pos = 0
+        self.partial = b''
+        self.offsets = []
+        self.lines = []
+
+    def ingest(self):
+        """
+        Read the lines appended to the file since the last call.
+
+        Returns:
+            True, if any new bytes have been read.
+        """
+        try:
+            size = os.stat(self.path).st_size
+        except OSError:
+            return False
+
+        if size <= self.size:
+            return False
+
+        with open(self.path, 'rb') as f:
+            f.seek(self.size, 0)
+            data = self.partial + f.read(size - self.size)
+        self.size = size
+
+        enc = _encoding()
+        lines = data.split(b'\n')
+        # The last line is not complete yet (or, empty)
+        self.partial = lines.pop()
+
+        for line in lines:
+            self.pos += len(line) + 1
+            r = _LOG_LINE.split(line.decode(enc, 'replace'))
+            if len(r) < 3:
+                # ignore this line
+                continue
+            self.offsets.append(self.pos)
+            self.lines.append([r[1], r[2]])
+
+        return True
+
+    def exists(self):
+        return self.size > 0 or os.path.isfile(self.path)
+
+    def has_more(self, pos):
+        return self.pos > pos
+
+    def read(self, pos, ctime, ecode=None):
+        """
+        Returns the lines after the given byte offset, logged till the given
+        time (at most MAX_LOG_LINES).
+
+        Returns:
+            (offset of the end of the last line returned, lines, completed)
+        """
+        if not self.exists():
+            return 0, [], False
+
+        log = []
+        idx = bisect_right(self.offsets, pos)
+        end = min(len(self.lines), idx + MAX_LOG_LINES)
+        stopped = end < len(self.lines)
+
+        while idx < end:
+            if self.lines[idx][0] > ctime:
+                stopped = True
+                break
+            log.append(self.lines[idx])
+            pos = self.offsets[idx]
+            idx += 1
+
+        if not stopped:
+            # Skip the lines, which could not be parsed
+            pos = max(pos, self.pos)
+
+        completed = not stopped and ecode is not None and \
+            pos == self.size
+
+        return pos, log, completed
+
+
+class ProcessStatus(object):
+    """
+    class ProcessStatus
+
+        The content of the status file of a background process, re-read only
+        when the file has been modified.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.stamp = None
+        self.data = None
+
+    def get(self):
+        """
+        Returns the status written by the process executor, None if the
+        file does not exist.
+
+        Raises:
+            ValueError, when the status could not be parsed.
+        """
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+
+        stamp = (st.st_mtime, st.st_size)
+        if stamp != self.stamp:
+            with open(self.path, 'r') as fp:
+                self.data = json.load(fp)
+            self.stamp = stamp
+
+        return self.data
+
+
+class WatchedProcess(object):
+    def __init__(self, log_dir, status):
+        self.log_dir = log_dir
+        self.out = ProcessLog(os.path.join(log_dir, 'out'))
+        self.err = ProcessLog(os.path.join(log_dir, 'err'))
+        self.status = status
+        self.finished = False
+        self.accessed = time.time()
+
+    def ingest(self):
+        out = self.out.ingest()
+        err = self.err.ingest()
+        return out or err
+
+
+class ProcessLogWatcher(object):
+    """
+    class ProcessLogWatcher
+
+        Keeps the logs of the background processes read so far, and notifies
+        the requests waiting for the new log lines of a process.
+    """
+
+    def __init__(self, interval=0.5, idle_timeout=600):
+        """
+        Args:
+            interval: Time (in seconds) between two checks of the log files
+                of the processes having waiting requests
+            idle_timeout: Time (in seconds) after which the logs of a process
+                not requested anymore are forgotten
+        """
+        self.interval = interval
+        self.idle_timeout = idle_timeout
+        self.processes = dict()
+        self.statuses = dict()
+        self.waiting = dict()
+        self.cond = threading.Condition()
+        self.thread = None
+
+    def get(self, log_dir):
+        """
+        Returns the watched process for the given log directory, after
+        reading the new lines of its logs.
+        """
+        with self.cond:
+            process = self.processes.get(log_dir)
+            if process is None:
+                process = self.processes[log_dir] = WatchedProcess(
+                    log_dir, self._status(log_dir)
+                )
+            process.accessed = time.time()
+            process.ingest()
+            self._forget_idle()
+
+        return process
+
+    def read(self, process, out, err, ctime, ecode=None):
+        """
+        Returns the lines of the stdout, and stderr logs of the process after
+        the given offsets (see ProcessLog.read).
+        """
+        with self.cond:
+            return (
+                process.out.read(out, ctime, ecode),
+                process.err.read(err, ctime, ecode)
+            )
+
+    def read_status(self, log_dir):
+        """
+        Returns the status written by the process executor in the given log
+        directory (see ProcessStatus.get).
+        """
+        with self.cond:
+            return self._status(log_dir).get()
+
+    def forget(self, log_dir):
+        """Forget the logs of the process (i.e. it has been removed)."""
+        with self.cond:
+            self.processes.pop(log_dir, None)
+            self.statuses.pop(log_dir, None)
+
+    def _status(self, log_dir):
+        status = self.statuses.get(log_dir)
+        if status is None:
+            status = self.statuses[log_dir] = ProcessStatus(
+                os.path.join(log_dir, 'status')
+            )
+        return status
+
+    def wait(self, process, out, err, timeout):
+        """
+        Wait till there are new lines after the given offsets in any of the
+        logs of the process, or the process finishes, at most timeout
+        seconds.
+        """
+        deadline = time.time() + timeout
+
+        with self.cond:
+            self.waiting[process.log_dir] = \
+                self.waiting.get(process.log_dir, 0) + 1
+            self._start()
+
+            try:
+                while not (process.finished or
+                           process.out.has_more(out) or
+                           process.err.has_more(err)):
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        break
+                    self.cond.wait(remaining)
+            finally:
+                self.waiting[process.log_dir] -= 1
+                if self.waiting[process.log_dir] == 0:
+                    del self.waiting[process.log_dir]
+
+    def _start(self):
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self._run)
+            self.thread.daemon = True
+            self.thread.start()
+
+    def _check(self, process):
+        changed = process.ingest()
+        try:
+            status = process.status.get()
+        except ValueError:
+            status = None
+
+        if status is not None and status.get('exit_code') is not None \
+                and not process.finished:
+            # Read the lines written just before the exit
+            process.ingest()
+            process.finished = changed = True
+
+        return changed
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+
+            with self.cond:
+                if len(self.waiting) == 0:
+                    self.thread = None
+                    return
+
+                changed = False
+                for log_dir in list(self.waiting):
+                    process = self.processes.get(log_dir)
+                    if process is not None and self._check(process):
+                        changed = True
+
+                if changed:
+                    self.cond.notify_all()
+
+    def _forget_idle(self):
+        now = time.time()
+        for log_dir, process in list(self.processes.items()):
+            if log_dir not in self.waiting and \
+                    now - process.accessed > self.idle_timeout:
+                del self.processes[log_dir]
+
+
+process_log_watcher = ProcessLogWatcher()
@@ -14,9 +14,12 @@ Introduce a function to run the process executor in detached mode.
 import csv
 import os
 import sys
+import time
 import psutil
+import threading
 from abc import ABCMeta, abstractproperty, abstractmethod
-from datetime import datetime
+from collections import OrderedDict
+from datetime import datetime, timedelta
 from pickle import dumps, loads
 from subprocess import Popen
 
@@ -26,11 +29,12 @@ from pgadmin.utils import IS_PY2, u, file_quote, fs_encoding, \
 import pytz
 from dateutil import parser
 from flask import current_app
-from flask_babelex import gettext as _
+from flask_babelex import gettext as _, get_locale
 from flask_security import current_user
 
 import config
 from pgadmin.model import Process, db
+from pgadmin.misc.bgprocess.log_watcher import process_log_watcher
 if IS_PY2:
     from StringIO import StringIO
 else:
@@ -41,6 +45,19 @@ PROCESS_STARTED = 1
 PROCESS_FINISHED = 2
 PROCESS_TERMINATED = 3
 
+# Interval (in seconds) between two cleanups of the old processes of a user
+CLEANUP_INTERVAL = 3600
+
+# Maximum number of the decoded process descriptions kept in the memory
+MAX_PROCESS_DETAILS = 1000
+
+# Decoded descriptions of the processes (by the process id, and locale), in
+# the order of their last use
+_process_details = OrderedDict()
+_process_details_lock = threading.Lock()
+# Time of the last cleanup of the old processes (by the user id)
+_last_cleanup = dict()
+
 
 def get_current_time(format='%Y-%m-%d %H:%M:%S.%f %z'):
     """
@@ -120,6 +137,8 @@ class BatchProcess(object):
         self.ecode = p.exit_code
         # Process State
         self.process_state = p.process_state
+        # Process row (reused by the status)
+        self._process = p
 
     def _create_process(self, _desc, _cmd, _args):
         ctime = get_current_time(format='%y%m%d%H%M%S%f')
@@ -176,8 +195,10 @@ class BatchProcess(object):
         # Process State
         self.process_state = PROCESS_NOT_STARTED
 
-        # Arguments
-        self.args = _args
+        # Arguments (may be generated from the log directory, i.e. to pass
+        # the path of an input file written in it)
+        self.args = _args(log_dir) if callable(_args) else _args
+        _args = self.args
         args_csv_io = StringIO()
         csv_writer = csv.writer(
             args_csv_io, delimiter=str(','), quoting=csv.QUOTE_MINIMAL
@@ -412,60 +433,27 @@ class BatchProcess(object):
             p.process_state = PROCESS_STARTED
             db.session.commit()
 
-    def status(self, out=0, err=0):
-        import re
-
-        ctime = get_current_time(format='%Y%m%d%H%M%S%f')
-
+    def status(self, out=0, err=0, wait=0):
+        """
+        Returns the status of the process, and the lines of its stdout and
+        stderr logs after the given byte offsets (unless any of them is -1).
+
+        Args:
+            out: Offset of the end of the last stdout line fetched
+            err: Offset of the end of the last stderr line fetched
+            wait: Maximum time (in seconds) to wait for the new lines, while
+                the process is running (long-poll)
+        """
         stdout = []
         stderr = []
         out_completed = err_completed = False
         process_output = (out != -1 and err != -1)
-        enc = sys.getdefaultencoding()
-        if enc is None or enc == 'ascii':
-            enc = 'utf-8'
-
-        def read_log(logfile, log, pos, ctime, ecode=None):
-            completed = True
-            idx = 0
-            c = re.compile(r"(\d+),(.*$)")
-
-            if not os.path.isfile(logfile):
-                return 0, False
-
-            with open(logfile, 'rb') as f:
-                eofs = os.fstat(f.fileno()).st_size
-                f.seek(pos, 0)
-                if pos == eofs and ecode is None:
-                    completed = False
-
-                while pos < eofs:
-                    idx += 1
-                    line = f.readline()
-                    line = line.decode(enc, 'replace')
-                    r = c.split(line)
-                    if len(r) < 3:
-                        # ignore this line
-                        pos = f.tell()
-                        continue
-                    if r[1] > ctime:
-                        completed = False
-                        break
-                    log.append([r[1], r[2]])
-                    pos = f.tell()
-                    if idx >= 1024:
-                        completed = False
-                        break
-                    if pos == eofs:
-                        if ecode is None:
-                            completed = False
-                        break
-
-            return pos, completed
-
-        j = Process.query.filter_by(
-            pid=self.id, user_id=current_user.id
-        ).first()
+
+        j = getattr(self, '_process', None)
+        if j is None:
+            j = Process.query.filter_by(
+                pid=self.id, user_id=current_user.id
+            ).first()
 
         execution_time = None
 
@@ -473,6 +461,22 @@ class BatchProcess(object):
             status, updated = BatchProcess.update_process_info(j)
             if updated:
                 db.session.commit()
+
+            if process_output:
+                watched = process_log_watcher.get(j.logdir)
+
+                if wait > 0 and j.exit_code is None and \
+                        j.process_state != PROCESS_TERMINATED:
+                    process_log_watcher.wait(watched, out, err, wait)
+                    status, updated = BatchProcess.update_process_info(j)
+                    if updated:
+                        db.session.commit()
+                    # Read the lines logged till the process info was
+                    # refreshed (i.e. just before the process exited).
+                    watched = process_log_watcher.get(j.logdir)
+                else:
+                    wait = 0
+
             self.stime = j.start_time
             self.etime = j.end_time
             self.ecode = j.exit_code
@@ -484,12 +488,12 @@ class BatchProcess(object):
                 execution_time = BatchProcess.total_seconds(etime - stime)
 
             if process_output:
-                out, out_completed = read_log(
-                    self.stdout, stdout, out, ctime, self.ecode
-                )
-                err, err_completed = read_log(
-                    self.stderr, stderr, err, ctime, self.ecode
+                ctime = get_current_time(format='%Y%m%d%H%M%S%f')
+                out_result, err_result = process_log_watcher.read(
+                    watched, out, err, ctime, self.ecode
                 )
+                out, stdout, out_completed = out_result
+                err, stderr, err_completed = err_result
         else:
             out_completed = err_completed = False
 
@@ -515,56 +519,103 @@ class BatchProcess(object):
             'start_time': self.stime,
             'exit_code': self.ecode,
             'execution_time': execution_time,
-            'process_state': self.process_state
+            'process_state': self.process_state,
+            # Time waited for the new lines (at most), the client polls
+            # again right away only when the request has waited.
+            'wait': wait
         }
 
     @staticmethod
     def update_process_info(p):
+        """
+        Update the process row from the status file written by the process
+        executor (it is read again only when it has been modified).
+
+        Returns:
+            (False, False) if the status is not available, else (True, True
+            when the row has been changed)
+        """
         if p.start_time is None or p.end_time is None:
-            status = os.path.join(p.logdir, 'status')
-            if not os.path.isfile(status):
+            try:
+                data = process_log_watcher.read_status(p.logdir)
+            except ValueError as e:
+                current_app.logger.warning(
+                    _("Status for the background process '{0}' could "
+                      "not be loaded.").format(p.pid)
+                )
+                current_app.logger.exception(e)
+                return False, False
+
+            if data is None:
                 return False, False
 
-            with open(status, 'r') as fp:
-                import json
-                try:
-                    data = json.load(fp)
-
-                    #  First - check for the existance of 'start_time'.
-                    if 'start_time' in data and data['start_time']:
-                        p.start_time = data['start_time']
-
-                        # We can't have 'exit_code' without the 'start_time'
-                        if 'exit_code' in data and \
-                                data['exit_code'] is not None:
-                            p.exit_code = data['exit_code']
-
-                            # We can't have 'end_time' without the 'exit_code'.
-                            if 'end_time' in data and data['end_time']:
-                                p.end_time = data['end_time']
-
-                    # get the pid of the utility.
-                    if 'pid' in data:
-                        p.utility_pid = data['pid']
-
-                    return True, True
-
-                except ValueError as e:
-                    current_app.logger.warning(
-                        _("Status for the background process '{0}' could "
-                          "not be loaded.").format(p.pid)
-                    )
-                    current_app.logger.exception(e)
-                    return False, False
+            info = dict()
+            #  First - check for the existance of 'start_time'.
+            if 'start_time' in data and data['start_time']:
+                info['start_time'] = data['start_time']
+
+                # We can't have 'exit_code' without the 'start_time'
+                if 'exit_code' in data and data['exit_code'] is not None:
+                    info['exit_code'] = data['exit_code']
+
+                    # We can't have 'end_time' without the 'exit_code'.
+                    if 'end_time' in data and data['end_time']:
+                        info['end_time'] = data['end_time']
+
+            # get the pid of the utility.
+            if 'pid' in data:
+                info['utility_pid'] = data['pid']
+
+            updated = False
+            for key, value in info.items():
+                if getattr(p, key) != value:
+                    setattr(p, key, value)
+                    updated = True
+
+            return True, updated
         return True, False
 
     @staticmethod
-    def list():
+    def list(state=None, since=None, before=None, limit=None):
+        """
+        Returns the background processes of the current user, the most
+        recently started first.
+
+        Args:
+            state: List only the 'running', or 'finished' processes
+            since: List only the processes started at/after this time
+            before: List only the processes started before this time (i.e.
+                the start time of the last process of the previous page)
+            limit: Maximum number of the processes to be listed
+        """
         processes = Process.query.filter_by(user_id=current_user.id)
+
+        if state == 'running':
+            processes = processes.filter(Process.end_time.is_(None))
+        elif state == 'finished':
+            processes = processes.filter(Process.end_time.isnot(None))
+
+        # The start time of the processes, which have just been started, is
+        # not known yet.
+        if since is not None:
+            processes = processes.filter(db.or_(
+                Process.start_time.is_(None), Process.start_time >= since
+            ))
+        if before is not None:
+            processes = processes.filter(Process.start_time < before)
+
+        processes = processes.order_by(
+            Process.start_time.is_(None).desc(), Process.start_time.desc(),
+            Process.pid
+        )
+        if limit:
+            processes = processes.limit(limit)
+
         changed = False
 
         res = []
         for p in processes:
+            # The status file is read only for the running processes
             status, updated = BatchProcess.update_process_info(p)
             if not status:
                 continue
@@ -583,31 +634,7 @@ class BatchProcess(object):
             etime = parser.parse(p.end_time or get_current_time())
 
             execution_time = BatchProcess.total_seconds(etime - stime)
-            desc = ""
-            try:
-                desc = loads(p.desc.encode('latin-1')) if \
-                    IS_PY2 and hasattr(p.desc, 'encode') else loads(p.desc)
-            except UnicodeDecodeError:
-                desc = loads(p.desc.encode('utf-8')) if \
-                    IS_PY2 and hasattr(p.desc, 'encode') else loads(p.desc)
-            except Exception:
-                desc = loads(p.desc.encode('utf-8', 'ignore')) if \
-                    IS_PY2 and hasattr(p.desc, 'encode') else loads(p.desc)
-
-            details = desc
-
-            if isinstance(desc, IProcessDesc):
-                args = []
-                args_csv = StringIO(
-                    p.arguments.encode('utf-8')
-                    if hasattr(p.arguments, 'decode') else p.arguments
-                )
-                args_reader = csv.reader(args_csv, delimiter=str(','))
-                for arg in args_reader:
-                    args = args + arg
-                details = desc.details(p.command, args)
-                type_desc = desc.type_desc
-                desc = desc.message
+            desc, type_desc, details = BatchProcess._details(p)
 
             res.append({
                 'id': p.pid,
@@ -627,6 +654,108 @@ class BatchProcess(object):
 
         return res
 
+    @staticmethod
+    def _details(p):
+        """
+        Returns the message, type, and details of the process from its
+        pickled description (decoded only once per process, and locale).
+        """
+        key = (p.pid, str(get_locale()))
+        with _process_details_lock:
+            if key in _process_details:
+                # Mark it as the most recently used
+                _process_details[key] = _process_details.pop(key)
+                return _process_details[key]
+
+        desc = ""
+        try:
+            desc = loads(p.desc.encode('latin-1')) if \
+                IS_PY2 and hasattr(p.desc, 'encode') else loads(p.desc)
+        except UnicodeDecodeError:
+            desc = loads(p.desc.encode('utf-8')) if \
+                IS_PY2 and hasattr(p.desc, 'encode') else loads(p.desc)
+        except Exception:
+            desc = loads(p.desc.encode('utf-8', 'ignore')) if \
+                IS_PY2 and hasattr(p.desc, 'encode') else loads(p.desc)
+
+        details = desc
+        type_desc = ""
+
+        if isinstance(desc, IProcessDesc):
+            args = []
+            args_csv = StringIO(
+                p.arguments.encode('utf-8')
+                if hasattr(p.arguments, 'decode') else p.arguments
+            )
+            args_reader = csv.reader(args_csv, delimiter=str(','))
+            for arg in args_reader:
+                args = args + arg
+            details = desc.details(p.command, args)
+            type_desc = desc.type_desc
+            desc = desc.message
+
+        with _process_details_lock:
+            _process_details[key] = (desc, type_desc, details)
+
+            # Forget the least recently used ones
+            while len(_process_details) > MAX_PROCESS_DETAILS:
+                _process_details.popitem(last=False)
+
+        return desc, type_desc, details
+
+    @staticmethod
+    def _remove(p):
+        """
+        Remove the process information from the configuration, and its log
+        files (the changes are not committed).
+        """
+        logdir = p.logdir
+        db.session.delete(p)
+        import shutil
+        shutil.rmtree(logdir, True)
+        process_log_watcher.forget(logdir)
+
+        with _process_details_lock:
+            for key in list(_process_details):
+                if key[0] == p.pid:
+                    _process_details.pop(key, None)
+
+    @staticmethod
+    def cleanup():
+        """
+        Remove the processes of the current user finished more than
+        BGPROCESS_RETENTION_DAYS days ago, along with their log files.
+
+        It is done at most once every CLEANUP_INTERVAL seconds per user.
+        """
+        retention = getattr(config, 'BGPROCESS_RETENTION_DAYS', None)
+        if not retention:
+            return
+
+        now = time.time()
+        if now - _last_cleanup.get(current_user.id, 0) < CLEANUP_INTERVAL:
+            return
+        _last_cleanup[current_user.id] = now
+
+        cutoff = (
+            datetime.utcnow().replace(tzinfo=pytz.utc) -
+            timedelta(days=retention)
+        ).strftime('%Y-%m-%d %H:%M:%S.%f %z')
+
+        processes = Process.query.filter(
+            Process.user_id == current_user.id,
+            Process.end_time.isnot(None),
+            Process.end_time < cutoff
+        ).all()
+
+        if len(processes) == 0:
+            return
+
+        for p in processes:
+            BatchProcess._remove(p)
+
+        db.session.commit()
+
     @staticmethod
     def total_seconds(dt):
         return round(dt.total_seconds(), 2)
@@ -650,10 +779,7 @@ class BatchProcess(object):
             )
 
         if p.end_time is not None:
-            logdir = p.logdir
-            db.session.delete(p)
-            import shutil
-            shutil.rmtree(logdir, True)
+            BatchProcess._remove(p)
         else:
             p.acknowledge = get_current_time()
 
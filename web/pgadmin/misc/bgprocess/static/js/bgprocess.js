@@ -22,6 +22,10 @@ define('misc.bgprocess', [
 
   var wcDocker = window.wcDocker;
 
+  // Time (in seconds) to wait on the server for the new log lines of the
+  // process (capped by the server).
+  var LOG_WAIT_TIMEOUT = 20;
+
   var BGProcess = function(info, notify) {
     var self = this;
     setTimeout(
@@ -111,13 +115,14 @@ define('misc.bgprocess', [
         switch (type) {
         case 'status':
           if (this.details && this.out != -1 && this.err != -1) {
+            // Wait on the server for the new log lines (long-poll)
             return url_for(
               'bgprocess.detailed_status', {
                 'pid': this.id,
                 'out': this.out,
                 'err': this.err,
               }
-            );
+            ) + '?wait=' + LOG_WAIT_TIMEOUT;
           }
           return url_for('bgprocess.status', {
             'pid': this.id,
@@ -256,10 +261,12 @@ define('misc.bgprocess', [
         }
 
         if (!self.completed) {
+          // Poll again right away, only if the server has waited for the new
+          // log lines (long-poll is enabled).
           setTimeout(
             function() {
               self.status.apply(self);
-            }, 1000
+            }, self.details && data.wait > 0 ? 10 : 1000
           );
         }
       },
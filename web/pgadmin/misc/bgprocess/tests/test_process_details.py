@@ -0,0 +1,66 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pickle import dumps
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.misc.bgprocess import processes
+from pgadmin.misc.bgprocess.processes import BatchProcess
+
+
+class _Process(object):
+    def __init__(self, pid):
+        self.pid = pid
+        self.desc = dumps('Process {0}'.format(pid))
+        self.command = 'psql'
+        self.arguments = ''
+
+
+class TestProcessDetails(BaseTestGenerator):
+    """ This class will test the cache of the process descriptions. """
+    scenarios = [
+        (
+            'When more processes are listed than the cache can hold',
+            dict(scenario='bound')
+        ), (
+            'When the cached process is used again',
+            dict(scenario='recent')
+        )
+    ]
+
+    def setUp(self):
+        self.max_details = processes.MAX_PROCESS_DETAILS
+        processes.MAX_PROCESS_DETAILS = 3
+        processes._process_details.clear()
+
+    def tearDown(self):
+        processes.MAX_PROCESS_DETAILS = self.max_details
+        processes._process_details.clear()
+
+    def runTest(self):
+        with self.app.test_request_context():
+            for pid in ('p1', 'p2', 'p3'):
+                self.assertEqual(
+                    BatchProcess._details(_Process(pid))[0],
+                    'Process {0}'.format(pid)
+                )
+
+            if self.scenario == 'recent':
+                BatchProcess._details(_Process('p1'))
+
+            BatchProcess._details(_Process('p4'))
+
+        pids = [key[0] for key in processes._process_details]
+        self.assertEqual(len(pids), 3)
+        self.assertIn('p4', pids)
+        # The least recently used one has been forgotten
+        if self.scenario == 'recent':
+            self.assertEqual(pids, ['p3', 'p1', 'p4'])
+        else:
+            self.assertEqual(pids, ['p2', 'p3', 'p4'])
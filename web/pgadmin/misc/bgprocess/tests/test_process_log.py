@@ -0,0 +1,89 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.misc.bgprocess.log_watcher import ProcessLog, ProcessLogWatcher
+
+
+class TestProcessLog(BaseTestGenerator):
+    """ This class will test the incremental reading of the process logs. """
+    scenarios = [
+        (
+            'When the lines are appended to the log',
+            dict(scenario='append')
+        ), (
+            'When the new lines are waited for',
+            dict(scenario='wait')
+        )
+    ]
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.out = os.path.join(self.directory, 'out')
+        open(self.out, 'wb').close()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _write(self, data):
+        with open(self.out, 'ab') as f:
+            f.write(data)
+
+    def runTest(self):
+        if self.scenario == 'append':
+            log = ProcessLog(self.out)
+            self._write(b'1,first\n2,sec')
+            log.ingest()
+
+            pos, lines, completed = log.read(0, '9')
+            self.assertEqual(lines, [['1', 'first']])
+            self.assertEqual(pos, 8)
+
+            self._write(b'ond\n3,third\n')
+            log.ingest()
+
+            # Only the lines after the offset, and logged till the given time
+            pos, lines, completed = log.read(pos, '2')
+            self.assertEqual(lines, [['2', 'second']])
+            self.assertFalse(completed)
+
+            pos, lines, completed = log.read(pos, '9', ecode=0)
+            self.assertEqual(lines, [['3', 'third']])
+            self.assertEqual(pos, os.path.getsize(self.out))
+            self.assertTrue(completed)
+        else:
+            watcher = ProcessLogWatcher(interval=0.05)
+            process = watcher.get(self.directory)
+
+            def finish():
+                time.sleep(0.2)
+                self._write(b'1,done\n')
+                with open(os.path.join(self.directory, 'status'), 'w') as f:
+                    json.dump({'start_time': '1', 'exit_code': 0}, f)
+
+            thread = threading.Thread(target=finish)
+            thread.start()
+            started = time.time()
+            watcher.wait(process, 0, 0, 5)
+            thread.join()
+
+            self.assertLess(time.time() - started, 4)
+            (out, stdout, _), (err, stderr, _) = \
+                watcher.read(process, 0, 0, '9', 0)
+            self.assertEqual(stdout, [['1', 'done']])
+            self.assertEqual(stderr, [])
+            self.assertEqual(watcher.read_status(self.directory)['exit_code'],
+                             0)
@@ -13,7 +13,6 @@ import os
 import os.path
 import random
 import string
-import sys
 import time
 from sys import platform as _platform
 import config
@@ -28,6 +27,8 @@ from pgadmin.utils import PgAdminModule
 from pgadmin.utils import get_storage_directory
 from pgadmin.utils.ajax import make_json_response
 from pgadmin.utils.preferences import Preferences
+from pgadmin.misc.file_manager.dir_listing import listing_cache, \
+    sort_entries, splitext
 
 # Checks if platform is Windows
 if _platform == "win32":
@@ -83,32 +84,6 @@ def getDriveSize(path):
         return free_bytes.value
 
 
-# split extension for files
-def splitext(path):
-    for ext in ['.tar.gz', '.tar.bz2']:
-        if path.endswith(ext):
-            path, ext = path[:-len(ext)], path[-len(ext):]
-            break
-    else:
-        path, ext = os.path.splitext(path)
-    return ext[1:]
-
-
-# check if file is hidden in windows platform
-def is_folder_hidden(filepath):
-    if _platform == "win32":
-        try:
-            attrs = ctypes.windll.kernel32.GetFileAttributesW(
-                unicode(filepath) if sys.version_info[0] < 3 else filepath
-            )
-            assert attrs != -1
-            result = bool(attrs & 2)
-        except (AttributeError, AssertionError):
-            result = False
-        return result
-    return False
-
-
 class FileManagerModule(PgAdminModule):
     """
     FileManager lists files and folders and does
@@ -548,10 +523,15 @@ class Filemanager(object):
             kernel32.SetThreadErrorMode(oldmode, ctypes.byref(oldmode))
 
     @staticmethod
-    def list_filesystem(dir, path, trans_data, file_type, show_hidden):
+    def list_filesystem(dir, path, trans_data, file_type, show_hidden,
+                        sort_by=None, sort_order=None, offset=0, limit=None):
         """
         It lists all file and folders within the given
         directory.
+
+        When a limit is given, only the files (sorted by the given key, and
+        order) starting at the given offset are returned, along with the
+        total number of the files.
         """
         Filemanager.suspend_windows_warning()
         is_show_hidden_files = show_hidden
@@ -617,33 +597,20 @@ class Filemanager(object):
 
         orig_path = unquote(orig_path)
         try:
-            mylist = [x for x in sorted(os.listdir(orig_path))]
-            for f in mylist:
-                protected = 0
-                system_path = os.path.join(os.path.join(orig_path, f))
-
+            selected = []
+            for entry in sort_entries(
+                listing_cache.get(orig_path), sort_by, sort_order
+            ):
                 # continue if file/folder is hidden (based on user preference)
-                if not is_show_hidden_files and \
-                        (is_folder_hidden(system_path) or f.startswith('.')):
+                if not is_show_hidden_files and entry.hidden:
                     continue
 
-                user_path = os.path.join(os.path.join(user_dir, f))
-                created = time.ctime(os.path.getctime(system_path))
-                modified = time.ctime(os.path.getmtime(system_path))
-                file_extension = str(splitext(system_path))
-
-                # set protected to 1 if no write or read permission
-                if (not os.access(system_path, os.R_OK) or
-                        not os.access(system_path, os.W_OK)):
-                    protected = 1
-
                 # list files only or folders only
-                if os.path.isdir(system_path):
+                if entry.is_dir:
                     if files_only == 'true':
                         continue
-                    file_extension = u"dir"
-                    user_path = u"{0}/".format(user_path)
                 else:
+                    file_extension = entry.extension
                     # filter files based on file_type
                     if file_type is not None and file_type != "*":
                         if folders_only or len(supported_types) > 0 and \
@@ -651,18 +618,37 @@ class Filemanager(object):
                                 file_type != file_extension:
                             continue
 
+                selected.append(entry)
+
+            total = len(selected)
+            if limit is not None:
+                selected = selected[offset:offset + limit]
+
+            for entry in selected:
+                user_path = os.path.join(os.path.join(user_dir, entry.name))
+                if entry.is_dir:
+                    user_path = u"{0}/".format(user_path)
+
                 # create a list of files and folders
-                files[f] = {
-                    "Filename": f,
+                files[entry.name] = {
+                    "Filename": entry.name,
                     "Path": user_path,
-                    "file_type": file_extension,
-                    "Protected": protected,
+                    "file_type": entry.extension,
+                    "Protected": entry.protected,
                     "Properties": {
-                        "Date Created": created,
-                        "Date Modified": modified,
-                        "Size": sizeof_fmt(getSize(system_path))
+                        "Date Created": time.ctime(entry.created),
+                        "Date Modified": time.ctime(entry.modified),
+                        "Size": sizeof_fmt(entry.size)
                     }
                 }
+
+            if limit is not None:
+                files = {
+                    'Code': 1,
+                    'Total': total,
+                    'Offset': offset,
+                    'Files': [files[entry.name] for entry in selected]
+                }
         except Exception as e:
             Filemanager.resume_windows_warning()
             if (hasattr(e, 'strerror') and
@@ -815,9 +801,11 @@ class Filemanager(object):
         return thefile
 
     def getfolder(self, path=None, file_type="", name=None, req=None,
-                  show_hidden=False):
+                  show_hidden=False, sort_by=None, sort_order=None, offset=0,
+                  limit=None):
         """
-        Returns files and folders in give path
+        Returns files and folders in give path (a page of them, if the limit
+        is given)
         """
         trans_data = Filemanager.get_trasaction_selection(self.trans_id)
         dir = None
@@ -827,7 +815,9 @@ class Filemanager(object):
                 dir += u'/'
 
         filelist = self.list_filesystem(
-            dir, path, trans_data, file_type, show_hidden)
+            dir, path, trans_data, file_type, show_hidden, sort_by,
+            sort_order, int(offset or 0),
+            None if limit is None else int(limit))
         return filelist
 
     def rename(self, old=None, new=None, req=None):
@@ -884,6 +874,9 @@ class Filemanager(object):
             error_msg = u"{0} {1}".format(
                 gettext(u'There was an error renaming the file:'), e)
 
+        listing_cache.invalidate(oldpath_sys)
+        listing_cache.invalidate(newpath_sys)
+
         result = {
             'Old Path': old,
             'Old Name': oldname,
@@ -930,6 +923,8 @@ class Filemanager(object):
             code = 0
             err_msg = u"Error: {0}".format(e.strerror)
 
+        listing_cache.invalidate(orig_path)
+
         result = {
             'Path': path,
             'Error': err_msg,
@@ -970,6 +965,8 @@ class Filemanager(object):
                     if not data:
                         break
                     f.write(data)
+
+            listing_cache.invalidate(newName)
         except Exception as e:
             code = 0
             err_msg = u"Error: {0}".format(
@@ -1162,6 +1159,8 @@ class Filemanager(object):
                 code = 0
                 err_msg = u"Error: {0}".format(e.strerror)
 
+        listing_cache.invalidate(newPath)
+
         result = {
             'Parent': path,
             'Name': newName,
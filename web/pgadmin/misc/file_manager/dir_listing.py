@@ -0,0 +1,194 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Reading, and caching of the directory listings of the file manager.
+
+The entries of a directory are read using scandir(), and each one of them is
+stat-ed only once. The listing of a directory is cached, and reused as long
+as the modification time of the directory is unchanged (i.e. no entry has
+been added, removed, or renamed), and the listing is not too old (the size,
+and the times of the files change without modifying the directory).
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from stat import S_ISDIR
+
+try:
+    from os import scandir
+except ImportError:
+    try:
+        # Python 2 (backport of the os.scandir)
+        from scandir import scandir
+    except ImportError:
+        scandir = None
+
+# Maximum number of the directory listings kept in the cache
+MAX_CACHED_LISTINGS = 16
+# Maximum age (in seconds) of a cached listing
+MAX_LISTING_AGE = 30
+# The listing of a directory modified in the last few seconds is not cached,
+# as the resolution of the modification time may be as coarse as a second.
+MIN_DIRECTORY_AGE = 2
+
+# Windows file attribute of the hidden files
+FILE_ATTRIBUTE_HIDDEN = 2
+
+SORT_KEYS = {
+    'name': lambda e: e.name.lower(),
+    'type': lambda e: (not e.is_dir, e.extension.lower(), e.name.lower()),
+    'size': lambda e: (e.size, e.name.lower()),
+    'created': lambda e: (e.created, e.name.lower()),
+    'modified': lambda e: (e.modified, e.name.lower())
+}
+
+
+def splitext(path):
+    """Returns the extension of the file (including .tar.gz, and .tar.bz2)"""
+    for ext in ['.tar.gz', '.tar.bz2']:
+        if path.endswith(ext):
+            return ext[1:]
+    return os.path.splitext(path)[1][1:]
+
+
+class ListingEntry(object):
+    """
+    class ListingEntry
+
+        A file, or a folder of a directory listing.
+    """
+    __slots__ = ('name', 'is_dir', 'extension', 'created', 'modified',
+                 'size', 'protected', 'hidden')
+
+    def __init__(self, name, path, st):
+        self.name = name
+        self.is_dir = S_ISDIR(st.st_mode)
+        self.extension = u"dir" if self.is_dir else str(splitext(name))
+        self.created = st.st_ctime
+        self.modified = st.st_mtime
+        self.size = st.st_size
+        # Protected, if there is no read or write permission
+        self.protected = 0 if os.access(path, os.R_OK | os.W_OK) else 1
+        self.hidden = name.startswith('.') or bool(
+            getattr(st, 'st_file_attributes', 0) & FILE_ATTRIBUTE_HIDDEN
+        )
+
+
+def _scan(path):
+    """
+    Yields the name, path, and stat result of the entries of the directory.
+    """
+    if scandir is not None:
+        for entry in scandir(path):
+            try:
+                st = entry.stat()
+            except OSError:
+                # i.e. a broken symbolic link
+                st = entry.stat(follow_symlinks=False)
+            yield entry.name, entry.path, st
+        return
+
+    for name in os.listdir(path):
+        entry_path = os.path.join(path, name)
+        try:
+            st = os.stat(entry_path)
+        except OSError:
+            st = os.lstat(entry_path)
+        yield name, entry_path, st
+
+
+def read_directory(path):
+    """Returns the entries of the directory sorted by their names."""
+    entries = [
+        ListingEntry(name, entry_path, st)
+        for name, entry_path, st in _scan(path)
+    ]
+    entries.sort(key=lambda e: e.name)
+    return entries
+
+
+def sort_entries(entries, sort_by=None, sort_order=None):
+    """
+    Returns the entries sorted by the given key ('name', 'type', 'size',
+    'created', or 'modified') in the given order ('asc', or 'desc').
+
+    The entries are returned as they are, if no sort key is given.
+    """
+    if sort_by is None:
+        return entries
+
+    if sort_by not in SORT_KEYS:
+        raise ValueError(u"Invalid sort key: {0}".format(sort_by))
+
+    return sorted(
+        entries, key=SORT_KEYS[sort_by], reverse=(sort_order == 'desc')
+    )
+
+
+class DirectoryListingCache(object):
+    """
+    class DirectoryListingCache
+
+        Keeps the listings of the recently read directories, validated
+        against the modification time of the directory.
+    """
+
+    def __init__(self, max_size=MAX_CACHED_LISTINGS,
+                 max_age=MAX_LISTING_AGE):
+        self.max_size = max_size
+        self.max_age = max_age
+        self.listings = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, path):
+        """
+        Returns the entries of the directory (see read_directory), from the
+        cache if the directory has not been modified since it was read.
+        """
+        mtime = os.stat(path).st_mtime
+        now = time.time()
+        key = os.path.normpath(path)
+
+        with self.lock:
+            cached = self.listings.pop(key, None)
+            if cached is not None and cached[0] == mtime and \
+                    now - cached[1] <= self.max_age:
+                # Keep the most recently used listings at the end
+                self.listings[key] = cached
+                return cached[2]
+
+        entries = read_directory(path)
+
+        if now - mtime >= MIN_DIRECTORY_AGE:
+            with self.lock:
+                self.listings[key] = (mtime, now, entries)
+                while len(self.listings) > self.max_size:
+                    self.listings.popitem(last=False)
+
+        return entries
+
+    def invalidate(self, path):
+        """
+        Forget the listings affected by a change of the given file, or folder
+        (i.e. the listing of its parent directory, and its own).
+
+        The file manager calls it after changing the file system, as the
+        modification time of the directory is not changed by writing a file,
+        and may not be precise enough to notice a change.
+        """
+        path = os.path.normpath(path)
+        with self.lock:
+            self.listings.pop(path, None)
+            self.listings.pop(os.path.dirname(path), None)
+
+
+listing_cache = DirectoryListingCache()
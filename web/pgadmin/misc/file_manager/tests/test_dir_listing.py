@@ -0,0 +1,96 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+import shutil
+import tempfile
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.misc.file_manager.dir_listing import DirectoryListingCache, \
+    sort_entries
+
+
+class TestDirectoryListing(BaseTestGenerator):
+    """ This class will test the cached directory listing. """
+    scenarios = [
+        (
+            'When the directory is listed, and sorted',
+            dict(scenario='sort')
+        ), (
+            'When the directory is modified after it has been cached',
+            dict(scenario='modified')
+        ), (
+            'When a file of the directory is changed by the file manager',
+            dict(scenario='invalidate')
+        )
+    ]
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.directory, 'folder'))
+        for name, size in [('b.sql', 30), ('a.backup', 10), ('.hidden', 0),
+                           ('c.tar.gz', 20)]:
+            with open(os.path.join(self.directory, name), 'wb') as f:
+                f.write(b'x' * size)
+        # Make the directory old enough to be cached
+        os.utime(self.directory, (1, 1))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def runTest(self):
+        cache = DirectoryListingCache()
+        entries = cache.get(self.directory)
+
+        if self.scenario == 'sort':
+            self.assertEqual(
+                [e.name for e in entries],
+                ['.hidden', 'a.backup', 'b.sql', 'c.tar.gz', 'folder']
+            )
+            self.assertEqual(
+                [(e.extension, e.hidden) for e in entries],
+                [('', True), ('backup', False), ('sql', False),
+                 ('tar.gz', False), ('dir', False)]
+            )
+            files = [e for e in entries if not e.is_dir]
+            self.assertEqual(
+                [e.name for e in sort_entries(files, 'size', 'desc')][:3],
+                ['b.sql', 'c.tar.gz', 'a.backup']
+            )
+            self.assertEqual(
+                [e.name for e in sort_entries(entries, 'type')][0], 'folder'
+            )
+            self.assertRaises(ValueError, sort_entries, entries, 'owner')
+        elif self.scenario == 'invalidate':
+            self.assertIs(cache.get(self.directory), entries)
+
+            # Writing a file does not change the modification time of the
+            # directory.
+            with open(os.path.join(self.directory, 'b.sql'), 'wb') as f:
+                f.write(b'x' * 40)
+            os.utime(self.directory, (1, 1))
+            self.assertIs(cache.get(self.directory), entries)
+
+            cache.invalidate(os.path.join(self.directory, 'b.sql'))
+            self.assertEqual(
+                [e.size for e in cache.get(self.directory + '/')
+                 if e.name == 'b.sql'],
+                [40]
+            )
+        else:
+            # The cached listing is reused
+            self.assertIs(cache.get(self.directory), entries)
+
+            os.remove(os.path.join(self.directory, 'b.sql'))
+            os.utime(self.directory, (2, 2))
+
+            self.assertEqual(
+                [e.name for e in cache.get(self.directory)],
+                ['.hidden', 'a.backup', 'c.tar.gz', 'folder']
+            )
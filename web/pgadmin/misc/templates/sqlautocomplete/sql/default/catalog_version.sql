@@ -0,0 +1,29 @@
+{# ============= Fetch the change markers of the catalogs used by the autocomplete cache ============= #}
+{# The markers are built from the tuple counters of the catalogs, and will be NULL when the counters are not being tracked. #}
+SELECT
+    CASE WHEN current_setting('track_counts')::boolean THEN (
+        SELECT sum(
+            pg_stat_get_tuples_inserted(c.oid) +
+            pg_stat_get_tuples_updated(c.oid) +
+            pg_stat_get_tuples_deleted(c.oid) +
+            pg_stat_get_xact_tuples_inserted(c.oid) +
+            pg_stat_get_xact_tuples_updated(c.oid) +
+            pg_stat_get_xact_tuples_deleted(c.oid)
+        )::text
+        FROM (VALUES
+            ('pg_catalog.pg_namespace'::regclass),
+            ('pg_catalog.pg_class'::regclass),
+            ('pg_catalog.pg_attribute'::regclass),
+            ('pg_catalog.pg_attrdef'::regclass),
+            ('pg_catalog.pg_constraint'::regclass),
+            ('pg_catalog.pg_type'::regclass)
+        ) c(oid)
+    ) END AS rel_version,
+    CASE WHEN current_setting('track_counts')::boolean THEN (
+        pg_stat_get_tuples_inserted('pg_catalog.pg_proc'::regclass) +
+        pg_stat_get_tuples_updated('pg_catalog.pg_proc'::regclass) +
+        pg_stat_get_tuples_deleted('pg_catalog.pg_proc'::regclass) +
+        pg_stat_get_xact_tuples_inserted('pg_catalog.pg_proc'::regclass) +
+        pg_stat_get_xact_tuples_updated('pg_catalog.pg_proc'::regclass) +
+        pg_stat_get_xact_tuples_deleted('pg_catalog.pg_proc'::regclass)
+    )::text END AS func_version
@@ -29,7 +29,7 @@ from flask_sqlalchemy import SQLAlchemy
 #
 ##########################################################################
 
-SCHEMA_VERSION = 24
+SCHEMA_VERSION = 25
 
 ##########################################################################
 #
@@ -245,6 +245,10 @@ class DebuggerFunctionArguments(db.Model):
 class Process(db.Model):
     """Define the Process table."""
     __tablename__ = 'process'
+    __table_args__ = (
+        db.Index('ix_process_user_id_start_time', 'user_id', 'start_time'),
+        db.Index('ix_process_user_id_end_time', 'user_id', 'end_time'),
+    )
     pid = db.Column(db.String(), nullable=False, primary_key=True)
     user_id = db.Column(
         db.Integer,
@@ -31,6 +31,8 @@ from pgadmin.utils.exception import ConnectionLost, SSHTunnelConnectionLost
 from pgadmin.utils.preferences import Preferences
 from pgadmin.settings import get_setting
 from pgadmin.browser.utils import underscore_unescape
+from pgadmin.tools.sqleditor.utils.transaction_registry import \
+    transaction_registry
 
 
 query_tool_close_session_lock = Lock()
@@ -459,9 +461,10 @@ def close_query_tool_session(trans_id):
     :return:
     """
 
-    cmd_obj_str = session['gridData'][str(trans_id)]['command_obj']
-    # Use pickle.loads function to get the command object
-    cmd_obj = pickle.loads(cmd_obj_str)
+    cmd_obj = transaction_registry.get(
+        trans_id, session['gridData'][str(trans_id)]
+    )
+    transaction_registry.remove(trans_id)
 
     # if connection id is None then no need to release the connection
     if cmd_obj.conn_id is not None:
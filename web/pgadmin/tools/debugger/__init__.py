@@ -14,6 +14,7 @@ MODULE_NAME = 'debugger'
 import simplejson as json
 import random
 import re
+import time
 
 from flask import url_for, Response, render_template, request, session, \
     current_app
@@ -30,12 +31,18 @@ from pgadmin.utils.ajax import make_json_response, \
 from pgadmin.utils.driver import get_driver
 from pgadmin.settings import get_setting
 
+import config
 from config import PG_DEFAULT_DRIVER
 from pgadmin.model import db, DebuggerFunctionArguments
 from pgadmin.tools.debugger.utils.debugger_instance import DebuggerInstance
 
 # Constants
 ASYNC_OK = 1
+ASYNC_READ_TIMEOUT = 2
+
+# Notice sent by the target function when it reaches a breakpoint, with the
+# port to attach to (i.e. "NOTICE:  PLDBGBREAK:7")
+PLDBGBREAK = re.compile(r'PLDBGBREAK:(\d+)')
 
 
 class DebuggerModule(PgAdminModule):
@@ -852,6 +859,7 @@ def restart_debugging(trans_id):
             'proargnames': de_inst.function_data['args_name'],
             'require_input': de_inst.function_data['require_input']
         })
+        de_inst.update_session()
 
         return make_json_response(
             data={
@@ -1192,6 +1200,47 @@ def execute_debugger_query(trans_id, query_type):
     )
 
 
+def get_wait_time():
+    """
+    Returns the time (in seconds) the request may wait for the database
+    server (the 'wait' argument of the request, capped by the
+    DEBUGGER_LONG_POLL_TIMEOUT).
+    """
+    wait = request.args.get('wait', 0, type=int)
+    return max(0, min(wait, config.DEBUGGER_LONG_POLL_TIMEOUT or 0))
+
+
+def poll_async(conn, wait, ready=None):
+    """
+    Polls the result of the query running on the asynchronous connection,
+    waiting on the connection (at most 'wait' seconds) for the database
+    server to send the result, or the messages accepted by ready(messages)
+    (long-poll).
+
+    Returns:
+        (status, result, messages received)
+
+        The messages are read from the connection only if ready is given.
+    """
+    deadline = time.time() + wait
+    messages = []
+
+    while True:
+        status, result = conn.poll()
+        if ready is not None:
+            messages.extend(conn.messages())
+
+        if status != ASYNC_READ_TIMEOUT or \
+                (ready is not None and ready(messages)):
+            break
+
+        remaining = deadline - time.time()
+        if remaining <= 0 or not conn.wait_for_server(remaining):
+            break
+
+    return status, result, messages
+
+
 @blueprint.route(
     '/messages/<int:trans_id>/', methods=["GET"], endpoint='messages'
 )
@@ -1200,7 +1249,8 @@ def messages(trans_id):
     """
     messages(trans_id)
 
-    This method polls the messages returned by the database server.
+    This method polls the messages returned by the database server. The
+    request waits for the breakpoint notice at most 'wait' seconds.
 
     Parameters:
         trans_id
@@ -1228,29 +1278,22 @@ def messages(trans_id):
     port_number = ''
 
     if conn.connected():
-        status, result = conn.poll()
-        notify = conn.messages()
-        if notify:
-            # In notice message we need to find "PLDBGBREAK" string to find
-            # the port number to attach.
-            # Notice message returned by the server is
-            # "NOTICE:  PLDBGBREAK:7".
-            # From the above message we need to find out port number
-            # as "7" so below logic will find 7 as port number
-            # and attach listened to that port number
-            port_found = False
-            tmp_list = list(filter(lambda x: 'PLDBGBREAK' in x, notify))
-            if len(tmp_list) > 0:
-                port_number = re.search(r'\d+', tmp_list[0])
-                if port_number is not None:
-                    status = 'Success'
-                    port_number = port_number.group(0)
-                    port_found = True
-
-            if not port_found:
-                status = 'Busy'
-        else:
-            status = 'Busy'
+        def port_found(messages):
+            return any(PLDBGBREAK.search(msg) for msg in messages)
+
+        status, result, notify = poll_async(
+            conn, get_wait_time(), port_found
+        )
+
+        # In notice message we need to find "PLDBGBREAK" string to find the
+        # port number to attach.
+        status = 'Busy'
+        for msg in notify:
+            match = PLDBGBREAK.search(msg)
+            if match is not None:
+                status = 'Success'
+                port_number = match.group(1)
+                break
 
         return make_json_response(
             data={'status': status, 'result': port_number}
@@ -1860,7 +1903,8 @@ def poll_end_execution_result(trans_id):
     poll_end_execution_result(trans_id)
 
     This method polls the end of execution result messages returned by the
-    database server.
+    database server. The request waits for the result, or the messages at
+    most 'wait' seconds.
 
     Parameters:
         trans_id
@@ -1887,7 +1931,9 @@ def poll_end_execution_result(trans_id):
         statusmsg = conn.status_message()
         if statusmsg and statusmsg == 'SELECT 1':
             statusmsg = ''
-        status, result = conn.poll()
+        status, result, additional_msgs = poll_async(
+            conn, get_wait_time(), lambda messages: len(messages) > 0
+        )
         if not status:
             status = 'ERROR'
             return make_json_response(
@@ -1903,7 +1949,6 @@ def poll_end_execution_result(trans_id):
             (de_inst.function_data['language'] == 'edbspl' or
                 de_inst.function_data['language'] == 'plpgsql'):
             status = 'Success'
-            additional_msgs = conn.messages()
             if len(additional_msgs) > 0:
                 additional_msgs = [msg.strip("\n") for msg in additional_msgs]
                 additional_msgs = "\n".join(additional_msgs)
@@ -1932,7 +1977,6 @@ def poll_end_execution_result(trans_id):
                 )
             else:
                 status = 'Success'
-                additional_msgs = conn.messages()
                 if len(additional_msgs) > 0:
                     additional_msgs = [msg.strip("\n")
                                        for msg in additional_msgs]
@@ -1955,7 +1999,6 @@ def poll_end_execution_result(trans_id):
                 )
         else:
             status = 'Busy'
-            additional_msgs = conn.messages()
             if len(additional_msgs) > 0:
                 additional_msgs = [msg.strip("\n") for msg in additional_msgs]
                 additional_msgs = "\n".join(additional_msgs)
@@ -1987,7 +2030,7 @@ def poll_result(trans_id):
     poll_result(trans_id)
 
     This method polls the result of the asynchronous query and returns the
-    result.
+    result. The request waits for the result at most 'wait' seconds.
 
     Parameters:
         trans_id
@@ -2011,7 +2054,7 @@ def poll_result(trans_id):
         conn_id=de_inst.debugger_data['exe_conn_id'])
 
     if conn.connected():
-        status, result = conn.poll()
+        status, result, _ = poll_async(conn, get_wait_time())
         if not status:
             status = 'ERROR'
         elif status == ASYNC_OK and result is not None:
@@ -31,6 +31,10 @@ define([
   if (pgTools.DirectDebug)
     return pgTools.DirectDebug;
 
+  // Time (in seconds) to wait on the server for the result, or the messages
+  // of the function being debugged (capped by the server).
+  var POLL_WAIT_TIMEOUT = 20;
+
   var controller = new(function() {});
 
   _.extend(
@@ -353,7 +357,7 @@ define([
         // Make ajax call to listen the database message
         var baseUrl = url_for('debugger.poll_result', {
             'trans_id': trans_id,
-          }),
+          }) + '?wait=' + POLL_WAIT_TIMEOUT,
           poll_timeout;
 
         /*
@@ -495,7 +499,7 @@ define([
         // Make ajax call to listen the database message
         var baseUrl = url_for('debugger.poll_end_execution_result', {
             'trans_id': trans_id,
-          }),
+          }) + '?wait=' + POLL_WAIT_TIMEOUT,
           poll_end_timeout;
 
         /*
@@ -1612,7 +1616,7 @@ define([
       // Make ajax call to listen the database message
       var baseUrl = url_for('debugger.messages', {
         'trans_id': trans_id,
-      });
+      }) + '?wait=' + POLL_WAIT_TIMEOUT;
 
       $.ajax({
         url: baseUrl,
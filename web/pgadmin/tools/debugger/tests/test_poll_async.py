@@ -0,0 +1,106 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+
+import config
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.debugger import get_wait_time, poll_async, PLDBGBREAK, \
+    ASYNC_OK, ASYNC_READ_TIMEOUT
+
+if sys.version_info < (3, 3):
+    from mock import patch, MagicMock
+else:
+    from unittest.mock import patch, MagicMock
+
+
+class TestGetWaitTime(BaseTestGenerator):
+    """ This class will test the wait time of the debugger requests. """
+    scenarios = [
+        (
+            'When the wait time is not given',
+            dict(query_string=None, timeout=20, expected=0)
+        ), (
+            'When the wait time is within the limit',
+            dict(query_string='wait=5', timeout=20, expected=5)
+        ), (
+            'When the wait time is beyond the limit',
+            dict(query_string='wait=600', timeout=20, expected=20)
+        ), (
+            'When the wait time is negative',
+            dict(query_string='wait=-3', timeout=20, expected=0)
+        ), (
+            'When the long-poll is disabled',
+            dict(query_string='wait=5', timeout=0, expected=0)
+        )
+    ]
+
+    def runTest(self):
+        with patch.object(config, 'DEBUGGER_LONG_POLL_TIMEOUT',
+                          self.timeout):
+            with self.app.test_request_context(
+                query_string=self.query_string
+            ):
+                self.assertEqual(get_wait_time(), self.expected)
+
+
+def breakpoint_reached(messages):
+    return any(PLDBGBREAK.search(msg) for msg in messages)
+
+
+class TestPollAsync(BaseTestGenerator):
+    """ This class will test the long-poll of the debugger connection. """
+    scenarios = [
+        (
+            'When not waiting for the server',
+            dict(wait=0,
+                 polls=[(ASYNC_READ_TIMEOUT, None, [])],
+                 readable=[],
+                 expected=(ASYNC_READ_TIMEOUT, None, []))
+        ), (
+            'When the result arrives while waiting',
+            dict(wait=5,
+                 polls=[(ASYNC_READ_TIMEOUT, None, []),
+                        (ASYNC_OK, 'result', [])],
+                 readable=[True],
+                 expected=(ASYNC_OK, 'result', []))
+        ), (
+            'When the breakpoint notice arrives while waiting',
+            dict(wait=5,
+                 polls=[(ASYNC_READ_TIMEOUT, None, ['NOTICE:  started\n']),
+                        (ASYNC_READ_TIMEOUT, None,
+                         ['NOTICE:  PLDBGBREAK:7\n'])],
+                 readable=[True],
+                 expected=(ASYNC_READ_TIMEOUT, None,
+                           ['NOTICE:  started\n', 'NOTICE:  PLDBGBREAK:7\n']))
+        ), (
+            'When the server does not respond in time',
+            dict(wait=5,
+                 polls=[(ASYNC_READ_TIMEOUT, None, [])],
+                 readable=[False],
+                 expected=(ASYNC_READ_TIMEOUT, None, []))
+        )
+    ]
+
+    def runTest(self):
+        conn = MagicMock()
+        conn.poll.side_effect = [poll[:2] for poll in self.polls]
+        conn.messages.side_effect = [poll[2] for poll in self.polls]
+        conn.wait_for_server.side_effect = self.readable
+
+        self.assertEqual(
+            poll_async(conn, self.wait, breakpoint_reached), self.expected
+        )
+
+        # The connection is polled again only after the server has sent
+        # something, and never waited on beyond the given time.
+        self.assertEqual(conn.poll.call_count, len(self.polls))
+        self.assertEqual(conn.wait_for_server.call_count, len(self.readable))
+        for call in conn.wait_for_server.call_args_list:
+            self.assertTrue(0 < call[0][0] <= self.wait)
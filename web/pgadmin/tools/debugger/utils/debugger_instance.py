@@ -61,8 +61,9 @@ class DebuggerInstance(object):
         if '__debugger_sessions' in session:
             if str(self.trans_id) in session['__debugger_sessions']:
                 trans_data = session['__debugger_sessions'][str(self.trans_id)]
-                self.function_data = trans_data.get('function_data', None)
-                self.debugger_data = trans_data.get('debugger_data', None)
+                # Loading the data does not modify the session
+                self._function_data = trans_data.get('function_data', None)
+                self._debugger_data = trans_data.get('debugger_data', None)
 
     def update_session(self):
         with debugger_sessions_lock:
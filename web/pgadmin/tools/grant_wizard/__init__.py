@@ -9,18 +9,26 @@
 
 """Implements Grant Wizard"""
 
+import io
+import os
+
 import simplejson as json
 from flask import Response, url_for
 from flask import render_template, request, current_app
 from flask_babelex import gettext
-from flask_security import login_required
+from flask_security import login_required, current_user
 from pgadmin.browser.server_groups.servers.utils import parse_priv_to_db
-from pgadmin.utils import PgAdminModule
+from pgadmin.browser.utils import like_prefix
+from pgadmin.misc.bgprocess.processes import BatchProcess, IProcessDesc
+from pgadmin.model import Server
+from pgadmin.utils import PgAdminModule, html, does_utility_exist
 from pgadmin.utils.ajax import make_response as ajax_response, \
     make_json_response, internal_server_error
 from pgadmin.utils.driver import get_driver
 
+import config
 from config import PG_DEFAULT_DRIVER
+from .batch import collapse_schema_objects, grant_script
 
 try:
     from urllib import unquote
@@ -103,6 +111,33 @@ blueprint = GrantWizardModule(
     MODULE_NAME, __name__, static_url_path='')
 
 
+class Message(IProcessDesc):
+    def __init__(self, _sid, _database, _count, _batch_size):
+        self.sid = _sid
+        self.database = _database
+        self.count = _count
+        self.batch_size = _batch_size
+
+    @property
+    def message(self):
+        return gettext(
+            "Grant Wizard ({0} objects of the database '{1}')"
+        ).format(self.count, self.database)
+
+    @property
+    def type_desc(self):
+        return gettext("Grant Wizard")
+
+    def details(self, cmd, args):
+        res = '<div>' + html.safe_str(gettext(
+            "Applying the privileges on {0} objects of the database '{1}' "
+            "(in the transactions of {2} objects)"
+        ).format(self.count, self.database, self.batch_size))
+        res += '</div>'
+
+        return res
+
+
 def check_precondition(f):
     """
     This function will behave as a decorator which will checks
@@ -183,6 +218,12 @@ def acl_list(sid, did):
 def properties(sid, did, node_id, node_type):
     """It fetches the properties of object types
        and render into selection page of wizard
+
+    The objects of each type are fetched for all the schemas by a single
+    query. The request may have the 'filter' (a part of the name of the
+    objects), 'offset', and 'limit' arguments to fetch a page of the
+    objects, in which case the total number of the objects is returned in
+    the data.
     """
 
     # unquote encoded url parameter
@@ -195,6 +236,12 @@ def properties(sid, did, node_id, node_type):
     manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(sid)
     conn = manager.connection(did=did)
 
+    name_filter = request.args.get('filter', None)
+    if name_filter:
+        name_filter = '%' + like_prefix(name_filter)
+    offset = request.args.get('offset', 0, type=int)
+    limit = request.args.get('limit', None, type=int)
+
     node_types = []
     show_sysobj = blueprint.show_system_objects().get()
     if node_type == 'database':
@@ -221,105 +268,59 @@ def properties(sid, did, node_id, node_type):
         node_types = res['rows']
         ntype = node_type
 
-    for row in node_types:
-        if 'oid' in row:
-            node_id = row['oid']
-
-        # Fetch functions against schema
-        if ntype in ['schema', 'function']:
-            SQL = render_template("/".join(
-                [server_prop['template_path'], '/sql/function.sql']),
-                node_id=node_id, type='function')
-
-            status, res = conn.execute_dict(SQL)
-            if not status:
-                current_app.logger.error(res)
-                failed_objects.append('function')
-            else:
-                res_data.extend(res['rows'])
-
-        # Fetch procedures only if server type is EPAS or PG >= 11
-        if (len(server_prop) > 0 and
-            (server_prop['server_type'] == 'ppas' or
-             (server_prop['server_type'] == 'pg' and
-              server_prop['version'] >= 11000)) and
-                ntype in ['schema', 'procedure']):
-            SQL = render_template("/".join(
-                [server_prop['template_path'], '/sql/function.sql']),
-                node_id=node_id, type='procedure')
-
-            status, res = conn.execute_dict(SQL)
-
-            if not status:
-                current_app.logger.error(res)
-                failed_objects.append('procedure')
-            else:
-                res_data.extend(res['rows'])
-
-        # Fetch trigger functions
-        if ntype in ['schema', 'trigger_function']:
-            SQL = render_template("/".join(
-                [server_prop['template_path'], '/sql/function.sql']),
-                node_id=node_id, type='trigger_function')
-            status, res = conn.execute_dict(SQL)
-
-            if not status:
-                current_app.logger.error(res)
-                failed_objects.append('trigger function')
-            else:
-                res_data.extend(res['rows'])
-
-        # Fetch Sequences against schema
-        if ntype in ['schema', 'sequence']:
-            SQL = render_template("/".join(
-                [server_prop['template_path'], '/sql/sequence.sql']),
-                node_id=node_id)
-
-            status, res = conn.execute_dict(SQL)
-            if not status:
-                current_app.logger.error(res)
-                failed_objects.append('sequence')
-            else:
-                res_data.extend(res['rows'])
-
-        # Fetch Tables against schema
-        if ntype in ['schema', 'table']:
-            SQL = render_template("/".join(
-                [server_prop['template_path'], '/sql/table.sql']),
-                node_id=node_id)
-
-            status, res = conn.execute_dict(SQL)
-            if not status:
-                current_app.logger.error(res)
-                failed_objects.append('table')
-            else:
-                res_data.extend(res['rows'])
-
-        # Fetch Views against schema
-        if ntype in ['schema', 'view']:
-            SQL = render_template("/".join(
-                [server_prop['template_path'], '/sql/view.sql']),
-                node_id=node_id, node_type='v')
-
-            status, res = conn.execute_dict(SQL)
-            if not status:
-                current_app.logger.error(res)
-                failed_objects.append('view')
-            else:
-                res_data.extend(res['rows'])
-
-        # Fetch Materialzed Views against schema
-        if ntype in ['schema', 'mview']:
-            SQL = render_template("/".join(
-                [server_prop['template_path'], '/sql/view.sql']),
-                node_id=node_id, node_type='m')
-
-            status, res = conn.execute_dict(SQL)
-            if not status:
-                current_app.logger.error(res)
-                failed_objects.append('materialized view')
-            else:
-                res_data.extend(res['rows'])
+    # Object types: (node type, name, template, template arguments)
+    object_types = [
+        ('function', 'function', 'function.sql', dict(type='function'))
+    ]
+
+    # Fetch procedures only if server type is EPAS or PG >= 11
+    if len(server_prop) > 0 and (
+        server_prop['server_type'] == 'ppas' or
+        (server_prop['server_type'] == 'pg' and
+         server_prop['version'] >= 11000)
+    ):
+        object_types.append(
+            ('procedure', 'procedure', 'function.sql',
+             dict(type='procedure'))
+        )
+
+    object_types.extend([
+        ('trigger_function', 'trigger function', 'function.sql',
+         dict(type='trigger_function')),
+        ('sequence', 'sequence', 'sequence.sql', dict()),
+        ('table', 'table', 'table.sql', dict()),
+        ('view', 'view', 'view.sql', dict(node_type='v')),
+        ('mview', 'materialized view', 'view.sql', dict(node_type='m'))
+    ])
+
+    node_ids = ','.join(
+        str(row['oid']) for row in node_types if 'oid' in row
+    )
+
+    for idx, (otype, name, template, kwargs) in enumerate(object_types):
+        if not node_ids or ntype not in ['schema', otype]:
+            continue
+
+        SQL = render_template(
+            "/".join([server_prop['template_path'], '/sql/', template]),
+            node_ids=node_ids, name_filter=name_filter, **kwargs
+        )
+
+        status, res = conn.execute_dict(SQL)
+        if not status:
+            current_app.logger.error(res)
+            failed_objects.append(name)
+        else:
+            res_data.extend((idx, row) for row in res['rows'])
+
+    # List the objects of each schema together (in the order of the
+    # schemas), by their types.
+    schemas = dict(
+        (row['name'], pos) for pos, row in enumerate(node_types)
+    )
+    res_data.sort(key=lambda obj: (schemas.get(obj[1]['nspname'], 0),
+                                   obj[0]))
+    res_data = [row for idx, row in res_data]
 
     msg = None
     if len(failed_objects) > 0:
@@ -327,8 +328,14 @@ def properties(sid, did, node_id, node_type):
             ", ".join(failed_objects))
         )
 
+    data = None
+    if limit is not None:
+        data = {'total': len(res_data), 'offset': offset}
+        res_data = res_data[offset:offset + limit]
+
     return make_json_response(
         result=res_data,
+        data=data,
         info=msg,
         status=200
     )
@@ -385,47 +392,185 @@ def msql(sid, did):
                 acls['table']['acl'])
 
         # Pass database objects and get SQL for privileges
+        objects = data['objects']
         SQL_data = ''
-        data_func = {'objects': data['objects'],
-                     'priv': data['priv']['function']}
-        SQL = render_template(
-            "/".join([server_prop['template_path'],
-                      '/sql/grant_function.sql']),
-            data=data_func, conn=conn)
-        if SQL and SQL.strip('\n') != '':
-            SQL_data += SQL
+        if config.GRANT_WIZARD_COLLAPSE_SCHEMAS:
+            schemas, objects = collapse_objects(server_prop, conn, objects)
+            SQL_data += get_schemas_sql(
+                server_prop, conn, schemas, data['priv']
+            )
+        SQL_data += get_objects_sql(server_prop, conn, objects, data['priv'])
+
+        res = {'data': SQL_data}
+
+        return ajax_response(
+            response=res,
+            status=200
+        )
+
+    except Exception as e:
+        return make_json_response(
+            status=410,
+            success=0,
+            errormsg=e.message
+        )
+
 
-        data_seq = {'objects': data['objects'],
-                    'priv': data['priv']['sequence']}
+def get_objects_sql(server_prop, conn, objects, priv):
+    """
+    Returns the SQL applying the privileges (parsed by the type of the
+    objects) on the given objects.
+    """
+    SQL_data = ''
+    for template, priv_type in [
+        ('grant_function.sql', 'function'),
+        ('grant_sequence.sql', 'sequence'),
+        ('grant_table.sql', 'table')
+    ]:
         SQL = render_template(
-            "/".join([server_prop['template_path'],
-                      '/sql/grant_sequence.sql']),
-            data=data_seq, conn=conn)
+            "/".join([server_prop['template_path'], '/sql/', template]),
+            data={'objects': objects, 'priv': priv[priv_type]}, conn=conn)
         if SQL and SQL.strip('\n') != '':
             SQL_data += SQL
 
-        data_table = {'objects': data['objects'],
-                      'priv': data['priv']['table']}
+    return SQL_data
+
+
+def get_schemas_sql(server_prop, conn, schemas, priv):
+    """
+    Returns the SQL applying the privileges on all the tables, and sequences
+    of the given schemas (see batch.collapse_schema_objects).
+    """
+    SQL_data = ''
+    for all_type, priv_type in [('SEQUENCES', 'sequence'),
+                                ('TABLES', 'table')]:
+        if len(schemas[all_type]) == 0:
+            continue
         SQL = render_template(
-            "/".join([server_prop['template_path'], '/sql/grant_table.sql']),
-            data=data_table, conn=conn)
+            "/".join([server_prop['template_path'], '/sql/grant_schema.sql']),
+            data={'schemas': schemas[all_type], 'type': all_type,
+                  'priv': priv[priv_type]},
+            conn=conn)
         if SQL and SQL.strip('\n') != '':
             SQL_data += SQL
 
-        res = {'data': SQL_data}
+    return SQL_data
 
-        return ajax_response(
-            response=res,
-            status=200
+
+def collapse_objects(server_prop, conn, objects):
+    """
+    Finds the schemas whose all the tables (or, sequences) are selected (see
+    batch.collapse_schema_objects).
+
+    Returns:
+        (schemas, remaining objects)
+    """
+    names = sorted(set(obj['nspname'] for obj in objects))
+    if len(names) == 0:
+        return collapse_schema_objects(objects, dict())
+
+    SQL = render_template(
+        "/".join([server_prop['template_path'],
+                  '/sql/count_schema_objects.sql']),
+        names=names, conn=conn)
+    status, res = conn.execute_dict(SQL)
+    if not status:
+        # Grant the objects one by one
+        current_app.logger.error(res)
+        return collapse_schema_objects(objects, dict())
+
+    counts = dict(
+        (row['name'], {'TABLES': row['tables'],
+                       'SEQUENCES': row['sequences']})
+        for row in res['rows']
+    )
+
+    return collapse_schema_objects(objects, counts)
+
+
+def create_grant_job(sid, server_prop, conn, data, utility):
+    """
+    Applies the privileges by a background job, running the psql script
+    generated by batch.grant_script using the given psql utility.
+    """
+    server = Server.query.filter_by(
+        id=sid, user_id=current_user.id
+    ).first()
+
+    if server is None:
+        return make_json_response(
+            success=0,
+            errormsg=gettext("Could not find the specified server.")
         )
 
+    manager = server_prop['manager']
+
+    objects = data['objects']
+    schemas = dict(TABLES=[], SEQUENCES=[])
+    if config.GRANT_WIZARD_COLLAPSE_SCHEMAS:
+        schemas, objects = collapse_objects(server_prop, conn, objects)
+
+    script = grant_script(
+        objects, schemas,
+        lambda chunk: get_objects_sql(
+            server_prop, conn, chunk, data['priv']
+        ),
+        lambda collapsed: get_schemas_sql(
+            server_prop, conn, collapsed, data['priv']
+        ),
+        config.GRANT_WIZARD_BATCH_SIZE,
+        role=manager.role
+    )
+
+    def args(log_dir):
+        return [
+            '--host',
+            manager.local_bind_host if manager.use_ssh_tunnel
+            else server.host,
+            '--port',
+            str(manager.local_bind_port) if manager.use_ssh_tunnel
+            else str(server.port),
+            '--username', server.username, '--dbname', conn.db,
+            '--file', os.path.join(log_dir, 'grant.sql')
+        ]
+
+    try:
+        p = BatchProcess(
+            desc=Message(sid, conn.db, len(data['objects']),
+                         config.GRANT_WIZARD_BATCH_SIZE),
+            cmd=utility, args=args
+        )
+        with io.open(os.path.join(p.log_dir, 'grant.sql'), 'w',
+                     encoding='utf-8') as f:
+            f.write(script)
+
+        manager.export_password_env(p.id)
+        # Check for connection timeout and if it is greater than 0 then
+        # set the environment variable PGCONNECT_TIMEOUT.
+        if manager.connect_timeout > 0:
+            env = dict()
+            env['PGCONNECT_TIMEOUT'] = str(manager.connect_timeout)
+            p.set_env_variables(server, env=env)
+        else:
+            p.set_env_variables(server)
+
+        p.start()
+        jid = p.id
     except Exception as e:
+        current_app.logger.exception(e)
         return make_json_response(
             status=410,
             success=0,
-            errormsg=e.message
+            errormsg=str(e)
         )
 
+    return make_json_response(
+        success=1,
+        info=gettext("Grant Wizard job created."),
+        data={'job_id': jid, 'status': True,
+              'info': gettext('Grant Wizard job created.')}
+    )
+
 
 @blueprint.route(
     '/<int:sid>/<int:did>/', methods=['POST'], endpoint='apply'
@@ -471,34 +616,32 @@ def save(sid, did):
                 data['acl'],
                 acls['table']['acl'])
 
-        # Pass database objects and get SQL for privileges
+        objects = data['objects']
+        threshold = config.GRANT_WIZARD_JOB_THRESHOLD
+        if threshold is not None and len(objects) > threshold:
+            utility = manager.utility('sql')
+            ret_val = does_utility_exist(utility) if utility is not None \
+                else gettext("Could not find the psql utility.")
+            if ret_val is None:
+                return create_grant_job(
+                    sid, server_prop, conn, data, utility
+                )
+            # Without psql, apply the privileges within the request.
+            current_app.logger.warning(
+                u"Applying the privileges on {0} objects within the request, "
+                u"the grant job could not be created: {1}".format(
+                    len(objects), ret_val
+                )
+            )
+
         # Pass database objects and get SQL for privileges
         SQL_data = ''
-        data_func = {'objects': data['objects'],
-                     'priv': data['priv']['function']}
-        SQL = render_template(
-            "/".join([server_prop['template_path'],
-                      '/sql/grant_function.sql']),
-            data=data_func, conn=conn)
-        if SQL and SQL.strip('\n') != '':
-            SQL_data += SQL
-
-        data_seq = {'objects': data['objects'],
-                    'priv': data['priv']['sequence']}
-        SQL = render_template(
-            "/".join([server_prop['template_path'],
-                      '/sql/grant_sequence.sql']),
-            data=data_seq, conn=conn)
-        if SQL and SQL.strip('\n') != '':
-            SQL_data += SQL
-
-        data_table = {'objects': data['objects'],
-                      'priv': data['priv']['table']}
-        SQL = render_template(
-            "/".join([server_prop['template_path'], '/sql/grant_table.sql']),
-            data=data_table, conn=conn)
-        if SQL and SQL.strip('\n') != '':
-            SQL_data += SQL
+        if config.GRANT_WIZARD_COLLAPSE_SCHEMAS:
+            schemas, objects = collapse_objects(server_prop, conn, objects)
+            SQL_data += get_schemas_sql(
+                server_prop, conn, schemas, data['priv']
+            )
+        SQL_data += get_objects_sql(server_prop, conn, objects, data['priv'])
 
         status, res = conn.execute_dict(SQL_data)
         if not status:
@@ -0,0 +1,134 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Applying the privileges of the grant wizard on a large number of objects.
+
+The GRANT statements are written to a psql script, which is run by a
+background job. The objects are granted in chunks, each one of them in its
+own transaction, so that the locks are not held till the end of the job, and
+the progress is logged by psql. When all the tables (or, sequences) of a
+schema are selected, they can be granted by a single GRANT ... ON ALL TABLES
+(or, SEQUENCES) IN SCHEMA statement.
+"""
+
+from flask_babelex import gettext
+
+# Object types granted by the ON ALL ... IN SCHEMA statements
+SCHEMA_OBJECT_TYPES = {
+    'Table': 'TABLES',
+    'View': 'TABLES',
+    'Materialized View': 'TABLES',
+    'Sequence': 'SEQUENCES'
+}
+
+
+def chunks(objects, size):
+    """Yields the objects in the chunks of the given size."""
+    size = max(1, size)
+    for idx in range(0, len(objects), size):
+        yield objects[idx:idx + size]
+
+
+def collapse_schema_objects(objects, counts):
+    """
+    Finds the schemas whose all the tables (or, sequences) are selected.
+
+    Args:
+        objects: the selected objects (with 'name', 'nspname', and
+            'object_type')
+        counts: the number of the tables, and sequences of the schemas
+            ({nspname: {'TABLES': count, 'SEQUENCES': count}})
+
+    Returns:
+        ({'TABLES': [nspname], 'SEQUENCES': [nspname]}, remaining objects)
+    """
+    selected = dict()
+    for obj in objects:
+        all_type = SCHEMA_OBJECT_TYPES.get(obj['object_type'])
+        if all_type is not None:
+            selected.setdefault((obj['nspname'], all_type), set()).add(
+                obj['name']
+            )
+
+    collapsed = set(
+        key for key, names in selected.items()
+        if len(names) == counts.get(key[0], dict()).get(key[1])
+    )
+
+    schemas = dict(TABLES=[], SEQUENCES=[])
+    for nspname, all_type in sorted(collapsed):
+        schemas[all_type].append(nspname)
+
+    remaining = [
+        obj for obj in objects
+        if (obj['nspname'], SCHEMA_OBJECT_TYPES.get(obj['object_type']))
+        not in collapsed
+    ]
+
+    return schemas, remaining
+
+
+def _quote_literal(value):
+    return u"'{0}'".format(value.replace("'", "''"))
+
+
+def _echo(message):
+    return u"\\echo {0}\n".format(_quote_literal(message))
+
+
+def grant_script(objects, schemas, render_objects, render_schemas,
+                 batch_size, role=None):
+    """
+    Returns the psql script applying the privileges.
+
+    Args:
+        objects: the objects to be granted one by one
+        schemas: the schemas to be granted as a whole (see
+            collapse_schema_objects)
+        render_objects: renders the GRANT statements of the given objects
+        render_schemas: renders the GRANT ... IN SCHEMA statements of the
+            given schemas
+        batch_size: number of the objects granted in each transaction
+        role: role to apply the privileges as (i.e. the role of the server,
+            set on the connections of pgAdmin too)
+    """
+    script = [u"\\set ON_ERROR_STOP on\n"]
+
+    if role:
+        script.append(u"SET ROLE TO {0};\n".format(_quote_literal(role)))
+
+    def transaction(message, sql):
+        if sql and sql.strip('\n') != '':
+            script.extend([_echo(message), u"BEGIN;\n", sql, u"\nCOMMIT;\n"])
+
+    count = len(schemas['TABLES']) + len(schemas['SEQUENCES'])
+    if count > 0:
+        transaction(
+            gettext(
+                'Applying the privileges on all the objects of {0} '
+                'schema(s)...'
+            ).format(count),
+            render_schemas(schemas)
+        )
+
+    done = 0
+    for chunk in chunks(objects, batch_size):
+        transaction(
+            gettext(
+                'Applying the privileges on the objects {0} - {1} of '
+                '{2}...'
+            ).format(done + 1, done + len(chunk), len(objects)),
+            render_objects(chunk)
+        )
+        done += len(chunk)
+
+    script.append(_echo(gettext('Privileges applied.')))
+
+    return u''.join(script)
@@ -1140,7 +1140,17 @@ define([
                       attrs: d,
                       validate: false,
                       cache: false,
-                      success: function() {
+                      success: function(m, res) {
+                        if (res && res.success === 0) {
+                          Alertify.alert(
+                            gettext('Grant Wizard job creation failed.'),
+                            res.errormsg
+                          );
+                        } else if (res && res.data && res.data.job_id) {
+                          // Privileges are applied by a background job
+                          Alertify.success(res.data.info);
+                          pgBrowser.Events.trigger('pgadmin-bgprocess:created', self);
+                        }
 
                         // Release wizard objects
                         self.releaseObjects();
@@ -1,5 +1,5 @@
 {# ===== Fetch list of Database object types(Functions) ====== #}
-{% if type and node_id %}
+{% if type and (node_id or node_ids) %}
 {% set func_type = 'Trigger Function' if type == 'trigger_function' else 'Function' %}
 {% set icon = 'icon-function' if type == 'function' else 'icon-trigger_function' %}
 SELECT
@@ -17,8 +17,15 @@ JOIN pg_namespace typns ON typns.oid=typ.typnamespace
 JOIN pg_language lng ON lng.oid=prolang
 LEFT OUTER JOIN pg_description des ON (des.objoid=pr.oid AND des.classoid='pg_proc'::regclass)
 WHERE
+{% if node_ids %}
+    proisagg = FALSE AND pronamespace IN ({{ node_ids }})
+{% else %}
     proisagg = FALSE AND pronamespace = {{ node_id }}::oid
+{% endif %}
     AND typname {{ 'NOT' if type != 'trigger_function' else '' }} IN ('trigger', 'event_trigger')
+{% if name_filter %}
+    AND pr.proname ILIKE {{ name_filter|qtLiteral }}
+{% endif %}
 ORDER BY
     proname
 {% endif %}
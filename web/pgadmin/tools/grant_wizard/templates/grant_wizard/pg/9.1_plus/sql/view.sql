@@ -1,5 +1,5 @@
 {# ===== Fetch list of Database object types(View) ===== #}
-{% if node_id and node_type %}
+{% if (node_id or node_ids) and node_type %}
 {% set ntype = "View" if node_type == 'v' else "Materialized View" %}
 SELECT
     c.relname AS name,
@@ -24,7 +24,14 @@ WHERE
       ))
      ) AND (c.relkind = '{{ node_type }}'::char)
     )
+{% if node_ids %}
+    AND c.relnamespace IN ({{ node_ids }})
+{% else %}
     AND c.relnamespace = {{ node_id }}::oid
+{% endif %}
+{% if name_filter %}
+    AND c.relname ILIKE {{ name_filter|qtLiteral }}
+{% endif %}
 ORDER BY
     c.relname
 {% endif %}
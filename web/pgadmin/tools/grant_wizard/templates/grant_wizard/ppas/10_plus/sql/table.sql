@@ -1,5 +1,5 @@
 {# ===== Fetch list of Database object types(Tables) ===== #}
-{% if node_id %}
+{% if node_id or node_ids %}
 SELECT
     rel.relname AS name,
     nsp.nspname AS nspname,
@@ -14,7 +14,14 @@ LEFT OUTER JOIN pg_constraint con ON con.conrelid=rel.oid AND con.contype='p'
 LEFT OUTER JOIN pg_class tst ON tst.oid = rel.reltoastrelid
 LEFT JOIN pg_type typ ON rel.reloftype=typ.oid
 WHERE
+{% if node_ids %}
+    rel.relkind IN ('r','s','t','p') AND rel.relnamespace IN ({{ node_ids }})
+{% else %}
     rel.relkind IN ('r','s','t','p') AND rel.relnamespace = {{ node_id }}::oid
+{% endif %}
+{% if name_filter %}
+    AND rel.relname ILIKE {{ name_filter|qtLiteral }}
+{% endif %}
 ORDER BY
     rel.relname
 {% endif %}
@@ -1,5 +1,5 @@
 {# ===== Fetch list of Database object types(Functions) ====== #}
-{% if type and node_id %}
+{% if type and (node_id or node_ids) %}
 {% set func_type = 'Trigger Function' if type == 'trigger_function' else 'Procedure' if type == 'procedure' else 'Function' %}
 {% set icon = 'icon-function' if type == 'function' else 'icon-procedure' if type == 'procedure' else 'icon-trigger_function' %}
 {% set kind = 'p' if type == 'procedure' else 'f' %}
@@ -18,10 +18,17 @@ JOIN pg_namespace typns ON typns.oid=typ.typnamespace
 JOIN pg_language lng ON lng.oid=prolang
 LEFT OUTER JOIN pg_description des ON (des.objoid=pr.oid AND des.classoid='pg_proc'::regclass)
 WHERE
+{% if node_ids %}
+    pronamespace IN ({{ node_ids }})
+{% else %}
     pronamespace = {{ node_id }}::oid
+{% endif %}
     AND typname {{ 'NOT' if type != 'trigger_function' else '' }} IN ('trigger', 'event_trigger')
     AND pr.prokind = '{{ kind }}'
     AND pr.protype = {{'0' if type != 'procedure' else '1'}}::char
+{% if name_filter %}
+    AND pr.proname ILIKE {{ name_filter|qtLiteral }}
+{% endif %}
 ORDER BY
     proname
 {% endif %}
@@ -0,0 +1,13 @@
+{# ===== Count the objects affected by ON ALL TABLES/SEQUENCES IN SCHEMA ===== #}
+SELECT
+    nsp.nspname AS name,
+    (SELECT count(*) FROM pg_class rel
+     WHERE rel.relnamespace = nsp.oid
+     AND rel.relkind IN ('r', 'p', 'v', 'm', 'f')) AS tables,
+    (SELECT count(*) FROM pg_class rel
+     WHERE rel.relnamespace = nsp.oid
+     AND rel.relkind = 'S') AS sequences
+FROM
+    pg_namespace nsp
+WHERE
+    nsp.nspname IN ({% for name in names %}{% if loop.index != 1 %}, {% endif %}{{ name|qtLiteral }}{% endfor %})
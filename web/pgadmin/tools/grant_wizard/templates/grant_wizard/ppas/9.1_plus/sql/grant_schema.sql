@@ -0,0 +1,11 @@
+{# ===== Grant Permissions on all the objects of the Schemas Selected ==== #}
+{% for schema in data.schemas -%}
+{% for priv in data.priv -%}
+{% if priv['without_grant'] %}
+GRANT {{ priv['without_grant']|join(', ') }} ON ALL {{ data.type }} IN SCHEMA {{ conn|qtIdent(schema) }} TO {{ priv['grantee'] }};
+{% endif %}
+{% if priv['with_grant'] %}
+GRANT {{ priv['with_grant']|join(', ') }} ON ALL {{ data.type }} IN SCHEMA {{ conn|qtIdent(schema) }} TO {{ priv['grantee'] }} WITH GRANT OPTION;
+{% endif %}
+{% endfor -%}
+{% endfor -%}
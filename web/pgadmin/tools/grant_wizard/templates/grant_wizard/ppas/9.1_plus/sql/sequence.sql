@@ -1,5 +1,5 @@
 {# ===== Fetch list of Database object types(Sequence) ===== #}
-{% if node_id %}
+{% if node_id or node_ids %}
 SELECT
     cl.relname AS name,
     nsp.nspname AS nspname,
@@ -10,7 +10,14 @@ FROM
 JOIN pg_namespace nsp ON nsp.oid=cl.relnamespace
 LEFT OUTER JOIN pg_description des ON (des.objoid=cl.oid AND des.classoid='pg_class'::regclass)
 WHERE
-    relkind = 'S' AND relnamespace  = {{ node_id }}::oid
+{% if node_ids %}
+    relkind = 'S' AND relnamespace IN ({{ node_ids }})
+{% else %}
+    relkind = 'S' AND relnamespace = {{ node_id }}::oid
+{% endif %}
+{% if name_filter %}
+    AND cl.relname ILIKE {{ name_filter|qtLiteral }}
+{% endif %}
 ORDER BY
     cl.relname
 {% endif %}
@@ -0,0 +1,93 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.grant_wizard.batch import collapse_schema_objects, \
+    grant_script
+
+OBJECTS = [
+    {'name': 't1', 'nspname': 'public', 'object_type': 'Table'},
+    {'name': 'v1', 'nspname': 'public', 'object_type': 'View'},
+    {'name': 's1', 'nspname': 'public', 'object_type': 'Sequence'},
+    {'name': 'f1', 'nspname': 'public', 'object_type': 'Function'},
+    {'name': 't2', 'nspname': 'app', 'object_type': 'Table'}
+]
+
+
+class TestGrantBatch(BaseTestGenerator):
+    """ This class will test the chunked application of the privileges. """
+    scenarios = [
+        (
+            'When no schema has all its objects selected',
+            dict(counts={'public': {'TABLES': 3, 'SEQUENCES': 2},
+                         'app': {'TABLES': 2, 'SEQUENCES': 0}},
+                 batch_size=2,
+                 schemas={'TABLES': [], 'SEQUENCES': []},
+                 remaining=['t1', 'v1', 's1', 'f1', 't2'],
+                 chunks=[['t1', 'v1'], ['s1', 'f1'], ['t2']],
+                 role="o'brien")
+        ), (
+            'When all the tables of the schemas are selected',
+            dict(counts={'public': {'TABLES': 2, 'SEQUENCES': 2},
+                         'app': {'TABLES': 1, 'SEQUENCES': 0}},
+                 batch_size=1000,
+                 schemas={'TABLES': ['app', 'public'], 'SEQUENCES': []},
+                 remaining=['s1', 'f1'],
+                 chunks=[['s1', 'f1']],
+                 role=None)
+        ), (
+            'When all the objects of a schema are selected',
+            dict(counts={'public': {'TABLES': 2, 'SEQUENCES': 1}},
+                 batch_size=1,
+                 schemas={'TABLES': ['public'], 'SEQUENCES': ['public']},
+                 remaining=['f1', 't2'],
+                 chunks=[['f1'], ['t2']],
+                 role=None)
+        )
+    ]
+
+    def runTest(self):
+        schemas, objects = collapse_schema_objects(OBJECTS, self.counts)
+
+        self.assertEqual(schemas, self.schemas)
+        self.assertEqual([obj['name'] for obj in objects], self.remaining)
+
+        rendered = []
+
+        def render_objects(chunk):
+            rendered.append([obj['name'] for obj in chunk])
+            return 'GRANT ON {0};'.format(
+                ', '.join(obj['name'] for obj in chunk)
+            )
+
+        def render_schemas(schemas):
+            return 'GRANT ON ALL IN {0};'.format(
+                ', '.join(schemas['TABLES'] + schemas['SEQUENCES'])
+            )
+
+        script = grant_script(
+            objects, schemas, render_objects, render_schemas,
+            self.batch_size, role=self.role
+        )
+
+        self.assertEqual(rendered, self.chunks)
+        # Each chunk (and, the schemas) is applied in its own transaction
+        has_schemas = len(self.schemas['TABLES'] +
+                          self.schemas['SEQUENCES']) > 0
+        self.assertEqual(script.count('BEGIN;'),
+                         len(self.chunks) + (1 if has_schemas else 0))
+        self.assertEqual(script.count('BEGIN;'), script.count('COMMIT;'))
+        self.assertEqual('GRANT ON ALL IN' in script, has_schemas)
+        self.assertTrue(script.startswith('\\set ON_ERROR_STOP on\n'))
+        # The privileges are applied as the role of the server (if any)
+        self.assertEqual(
+            "SET ROLE TO 'o''brien';\n" in script, self.role is not None
+        )
+        if self.role is not None:
+            self.assertLess(script.index('SET ROLE'), script.index('BEGIN;'))
@@ -161,7 +161,8 @@ class BatchProcessTest(BaseTestGenerator):
                 self.acknowledge = None
                 self.process_state = 0
 
-        process_mock.query.filter_by.return_value = [
+        mock_result = process_mock.query.filter_by.return_value
+        mock_result.order_by.return_value = [
             TestMockProcess(restore_obj,
                             self.class_params['args'],
                             self.class_params['cmd'])
@@ -21,10 +21,17 @@ from flask_security import current_user, login_required
 from flask_babelex import gettext
 from pgadmin.utils import PgAdminModule
 from pgadmin.utils.ajax import make_json_response, bad_request, \
-    make_response as ajax_response, not_implemented
+    make_response as ajax_response, not_implemented, internal_server_error, \
+    precondition_required
 from pgadmin.model import Server
 from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
 from pgadmin.tools.schema_diff.model import SchemaDiffModel
+from pgadmin.tools.schema_diff.executor import SchemaDiffExecutor, \
+    compare_progress
+from pgadmin.tools.schema_diff.snapshot import SchemaSnapshot, \
+    SNAPSHOT_NEVER, SNAPSHOT_ALWAYS, SNAPSHOT_MODES, capture_snapshot, \
+    load_snapshot, remove_snapshot, snapshot_path
+import config
 from config import PG_DEFAULT_DRIVER
 from pgadmin.utils.driver import get_driver
 
@@ -64,6 +71,7 @@ class SchemaDiffModule(PgAdminModule):
             'schema_diff.schemas',
             'schema_diff.compare',
             'schema_diff.poll',
+            'schema_diff.snapshot',
             'schema_diff.ddl_compare',
             'schema_diff.connect_server',
             'schema_diff.connect_database',
@@ -399,7 +407,36 @@ def compare(trans_id, source_sid, source_did, source_scid,
     if error_msg == gettext('Transaction ID not found in the session.'):
         return make_json_response(success=0, errormsg=error_msg, status=404)
 
-    if not check_version_compatibility(source_sid, target_sid):
+    # The stored snapshots of the source/target schema are compared instead
+    # of the live schemas, only when requested (see load_snapshot), or
+    # configured by SCHEMA_DIFF_SNAPSHOT_MODE.
+    snapshots = dict()
+    for side, sid, did, scid in (
+        ('source', source_sid, source_did, source_scid),
+        ('target', target_sid, target_did, target_scid)
+    ):
+        mode = request.args.get(
+            side + '_snapshot',
+            getattr(config, 'SCHEMA_DIFF_SNAPSHOT_MODE', SNAPSHOT_NEVER)
+        )
+        if mode not in SNAPSHOT_MODES:
+            return bad_request(errormsg=gettext(
+                "Invalid snapshot mode - {0}."
+            ).format(mode))
+
+        snapshots[side] = load_snapshot(sid, did, scid, mode)
+        if snapshots[side] is None and mode == SNAPSHOT_ALWAYS:
+            return make_json_response(
+                success=0, status=404,
+                errormsg=gettext('Snapshot of the {0} schema not found.')
+                .format(side)
+            )
+
+    if not check_version_compatibility(
+        source_sid, target_sid,
+        snapshots['source'].version if snapshots['source'] else None,
+        snapshots['target'].version if snapshots['target'] else None
+    ):
         return not_implemented(errormsg=gettext("Version mismatch."))
 
     comparison_result = []
@@ -409,29 +446,19 @@ def compare(trans_id, source_sid, source_did, source_scid,
                                     diff_model_obj)
 
     try:
-        all_registered_nodes = SchemaDiffRegistry.get_registered_nodes()
-        node_percent = round(100 / len(all_registered_nodes))
-        total_percent = 0
-
-        for node_name, node_view in all_registered_nodes.items():
-            view = SchemaDiffRegistry.get_node_view(node_name)
-            if hasattr(view, 'compare'):
-                msg = "Comparing " + view.blueprint.COLLECTION_LABEL + " ..."
-                diff_model_obj.set_comparison_info(msg, total_percent)
-                # Update the message and total percentage in session object
-                update_session_diff_transaction(trans_id, session_obj,
-                                                diff_model_obj)
-
-                res = view.compare(source_sid=source_sid,
-                                   source_did=source_did,
-                                   source_scid=source_scid,
-                                   target_sid=target_sid,
-                                   target_did=target_did,
-                                   target_scid=target_scid)
-
-                if res is not None:
-                    comparison_result = comparison_result + res
-            total_percent = total_percent + node_percent
+        # Compare the node types concurrently, the progress and the partial
+        # results are reported by the poll requests.
+        executor = SchemaDiffExecutor(
+            trans_id,
+            SchemaDiffRegistry.get_registered_nodes().keys(),
+            dict(source_sid=source_sid, source_did=source_did,
+                 source_scid=source_scid, target_sid=target_sid,
+                 target_did=target_did, target_scid=target_scid,
+                 source_snapshot=snapshots['source'],
+                 target_snapshot=snapshots['target']),
+            getattr(config, 'SCHEMA_DIFF_MAX_WORKERS', 1)
+        )
+        comparison_result = executor.run()
 
         msg = "Successfully compare the specified schemas."
         total_percent = 100
@@ -441,10 +468,54 @@ def compare(trans_id, source_sid, source_did, source_scid,
 
     except Exception as e:
         app.logger.exception(e)
+        diff_model_obj.set_comparison_info(
+            "Failed to compare the specified schemas.", 100
+        )
+        update_session_diff_transaction(trans_id, session_obj, diff_model_obj)
+        return internal_server_error(errormsg=str(e))
 
     return make_json_response(data=comparison_result)
 
 
+@blueprint.route(
+    '/snapshot/<int:sid>/<int:did>/<int:scid>',
+    methods=["GET", "POST", "DELETE"],
+    endpoint="snapshot"
+)
+@login_required
+def snapshot(sid, did, scid):
+    """
+    This function is used to capture (POST), get the information about (GET)
+    or remove (DELETE) the stored snapshot of the specified schema.
+    """
+    try:
+        if request.method == 'POST':
+            status, res = capture_snapshot(sid, did, scid)
+            if not status:
+                return precondition_required(errormsg=res)
+            return make_json_response(data=res.info())
+
+        if request.method == 'DELETE':
+            if not remove_snapshot(sid, did, scid):
+                return make_json_response(
+                    success=0, status=404,
+                    errormsg=gettext('Snapshot of the schema not found.')
+                )
+            return make_json_response(data={'removed': True})
+
+        res = SchemaSnapshot.load(snapshot_path(sid, did, scid))
+        if res is None:
+            return make_json_response(
+                success=0, status=404,
+                errormsg=gettext('Snapshot of the schema not found.')
+            )
+        return make_json_response(data=res.info())
+
+    except Exception as e:
+        app.logger.exception(e)
+        return internal_server_error(errormsg=str(e))
+
+
 @blueprint.route(
     '/poll/<int:trans_id>', methods=["GET"], endpoint="poll"
 )
@@ -463,7 +534,19 @@ def poll(trans_id):
     if error_msg == gettext('Transaction ID not found in the session.'):
         return make_json_response(success=0, errormsg=error_msg, status=404)
 
-    msg, diff_percentage = diff_model_obj.get_comparison_info()
+    # The results of the node types compared after the given number of the
+    # node types are returned along with the progress.
+    offset = request.args.get('offset', 0, type=int)
+    results = []
+    node_count = offset
+
+    progress = compare_progress.get(trans_id)
+    if progress is not None:
+        msg, diff_percentage, results, node_count = progress.get(offset)
+        if progress.done:
+            compare_progress.remove(trans_id)
+    else:
+        msg, diff_percentage = diff_model_obj.get_comparison_info()
 
     if diff_percentage == 100:
         diff_model_obj.set_comparison_info("Comparing objects...", 0)
@@ -471,7 +554,9 @@ def poll(trans_id):
                                         diff_model_obj)
 
     return make_json_response(data={'compare_msg': msg,
-                                    'diff_percentage': diff_percentage})
+                                    'diff_percentage': diff_percentage,
+                                    'results': results,
+                                    'node_count': node_count})
 
 
 @blueprint.route(
@@ -578,15 +663,22 @@ def ddl_compare(trans_id, source_sid, source_did, source_scid,
     )
 
 
-def check_version_compatibility(sid, tid):
-    """Check the version compatibility of source and target servers."""
+def check_version_compatibility(sid, tid, src_version=None,
+                                tar_version=None):
+    """
+    Check the version compatibility of source and target servers. The
+    version of the server of a stored snapshot can be given instead.
+    """
 
     driver = get_driver(PG_DEFAULT_DRIVER)
-    src_server = Server.query.filter_by(id=sid).first()
-    src_manager = driver.connection_manager(src_server.id)
 
-    tar_server = Server.query.filter_by(id=tid).first()
-    tar_manager = driver.connection_manager(tar_server.id)
+    if src_version is None:
+        src_server = Server.query.filter_by(id=sid).first()
+        src_version = driver.connection_manager(src_server.id).version
+
+    if tar_version is None:
+        tar_server = Server.query.filter_by(id=tid).first()
+        tar_version = driver.connection_manager(tar_server.id).version
 
     def get_round_val(x):
         if x < 10000:
@@ -594,8 +686,7 @@ def check_version_compatibility(sid, tid):
         else:
             return x if x % 10000 == 0 else x + 10000 - x % 10000
 
-    if get_round_val(src_manager.version) == \
-            get_round_val(tar_manager.version):
+    if get_round_val(src_version) == get_round_val(tar_version):
         return True
 
     return False
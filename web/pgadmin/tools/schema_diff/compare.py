@@ -18,6 +18,8 @@ from config import PG_DEFAULT_DRIVER
 from pgadmin.tools.schema_diff.directory_compare import compare_dictionaries,\
     directory_diff
 from pgadmin.tools.schema_diff.model import SchemaDiffModel
+from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
+from pgadmin.tools.schema_diff.executor import fetch_concurrently
 from abc import abstractmethod
 
 
@@ -74,9 +76,18 @@ class SchemaDiffObjectCompare():
         if 'target_tid' in kwargs:
             target_params['tid'] = kwargs['target_tid']
 
-        source = self.fetch_objects_to_compare(**source_params)
-
-        target = self.fetch_objects_to_compare(**target_params)
+        # The target objects are fetched using another view object, as the
+        # fetch may run concurrently (see fetch_concurrently).
+        target_view = SchemaDiffRegistry.get_node_view(self.node_type)
+
+        # The stored snapshots of the schemas (if given) are compared
+        # instead of the live schemas.
+        source, target = fetch_concurrently(
+            lambda: self.fetch_schema_objects(
+                kwargs.get('source_snapshot'), **source_params),
+            lambda: target_view.fetch_schema_objects(
+                kwargs.get('target_snapshot'), **target_params)
+        )
 
         # If both the dict have no items then return None.
         if not (source or target) or (
@@ -88,6 +99,21 @@ class SchemaDiffObjectCompare():
                                     self.blueprint.COLLECTION_LABEL,
                                     self.keys_to_ignore)
 
+    def fetch_schema_objects(self, snapshot=None, **kwargs):
+        """
+        This function returns the objects of the node type to be compared,
+        either from the given snapshot of the schema, or fetched from the
+        database.
+
+        :param snapshot: SchemaSnapshot object
+        :param kwargs: Server, database and schema id
+        :return: Objects keyed by their names
+        """
+        if snapshot is not None:
+            return snapshot.get_objects(self.node_type)
+
+        return self.fetch_objects_to_compare(**kwargs)
+
     def ddl_compare(self, **kwargs):
         """
         This function will compare object properties and
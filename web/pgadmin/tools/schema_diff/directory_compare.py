@@ -10,9 +10,13 @@
 """Directory comparison"""
 
 import copy
+import hashlib
+from itertools import count
 from pgadmin.tools.schema_diff.model import SchemaDiffModel
 
-count = 1
+# Ids of the comparison result rows. The node types may be compared
+# concurrently, and next() on the counter is atomic.
+row_ids = count(1)
 
 
 def compare_dictionaries(source_dict, target_dict, node, node_label,
@@ -27,58 +31,52 @@ def compare_dictionaries(source_dict, target_dict, node, node_label,
     :return:
     """
 
-    dict1 = copy.deepcopy(source_dict)
-    dict2 = copy.deepcopy(target_dict)
+    ignore_keys = set(ignore_keys or [])
 
     # Find the duplicate keys in both the dictionaries
-    dict1_keys = set(dict1.keys())
-    dict2_keys = set(dict2.keys())
+    dict1_keys = set(source_dict.keys())
+    dict2_keys = set(target_dict.keys())
     intersect_keys = dict1_keys.intersection(dict2_keys)
 
     # Keys that are available in source and missing in target.
     source_only = []
     added = dict1_keys - dict2_keys
-    global count
     for item in added:
         source_only.append({
-            'id': count,
+            'id': next(row_ids),
             'type': node,
             'label': node_label,
             'title': item,
             'oid': source_dict[item]['oid'],
             'status': SchemaDiffModel.COMPARISON_STATUS['source_only']
         })
-        count += 1
 
     target_only = []
     # Keys that are available in target and missing in source.
     removed = dict2_keys - dict1_keys
     for item in removed:
         target_only.append({
-            'id': count,
+            'id': next(row_ids),
             'type': node,
             'label': node_label,
             'title': item,
             'oid': target_dict[item]['oid'],
             'status': SchemaDiffModel.COMPARISON_STATUS['target_only']
         })
-        count += 1
 
     # Compare the values of duplicates keys.
     identical = []
     different = []
     for key in intersect_keys:
-        # ignore the keys if available.
-        for ig_key in ignore_keys:
-            if ig_key in dict1[key]:
-                dict1[key].pop(ig_key)
-            if ig_key in dict2[key]:
-                dict2[key].pop(ig_key)
-
-        # Recursively Compare the two dictionary
-        if are_dictionaries_identical(dict1[key], dict2[key], ignore_keys):
+        # The objects having the same fingerprint are identical, only the
+        # rest of them need to be compared recursively (i.e. an integer and
+        # a float value may still be equal).
+        if fingerprint(source_dict[key], ignore_keys) == \
+                fingerprint(target_dict[key], ignore_keys) or \
+                are_dictionaries_identical(source_dict[key], target_dict[key],
+                                           ignore_keys):
             identical.append({
-                'id': count,
+                'id': next(row_ids),
                 'type': node,
                 'label': node_label,
                 'title': key,
@@ -89,7 +87,7 @@ def compare_dictionaries(source_dict, target_dict, node, node_label,
             })
         else:
             different.append({
-                'id': count,
+                'id': next(row_ids),
                 'type': node,
                 'label': node_label,
                 'title': key,
@@ -98,7 +96,6 @@ def compare_dictionaries(source_dict, target_dict, node, node_label,
                 'target_oid': target_dict[key]['oid'],
                 'status': SchemaDiffModel.COMPARISON_STATUS['different']
             })
-        count += 1
 
     return source_only + target_only + different + identical
 
@@ -136,37 +133,22 @@ def are_dictionaries_identical(source_dict, target_dict, ignore_keys):
     :param target_dict:
     :return:
     """
-
-    src_keys = set(source_dict.keys())
-    tar_keys = set(target_dict.keys())
+    ignore_keys = ignore_keys or []
 
     # ignore the keys if available.
-    for ig_key in ignore_keys:
-        if ig_key in src_keys:
-            source_dict.pop(ig_key)
-        if ig_key in target_dict:
-            target_dict.pop(ig_key)
-
-    # Keys that are available in source and missing in target.
-    src_only = src_keys - tar_keys
-    # Keys that are available in target and missing in source.
-    tar_only = tar_keys - src_keys
+    src_keys = set(source_dict.keys()).difference(ignore_keys)
+    tar_keys = set(target_dict.keys()).difference(ignore_keys)
 
-    # If number of keys are different in source and target then
-    # return False
-    if len(src_only) != len(tar_only):
+    # If the keys are different in source and target then return False
+    if src_keys != tar_keys:
         return False
-    else:
-        # If number of keys are same but key is not present in target then
-        # return False
-        for key in src_only:
-            if key not in tar_only:
-                return False
 
-    for key in source_dict.keys():
+    for key in src_keys:
         if type(source_dict[key]) is dict:
-            if not are_dictionaries_identical(source_dict[key],
-                                              target_dict[key], ignore_keys):
+            if type(target_dict[key]) is not dict or \
+                    not are_dictionaries_identical(source_dict[key],
+                                                   target_dict[key],
+                                                   ignore_keys):
                 return False
         elif type(source_dict[key]) is list:
             if not are_lists_identical(source_dict[key], target_dict[key],
@@ -179,6 +161,44 @@ def are_dictionaries_identical(source_dict, target_dict, ignore_keys):
     return True
 
 
+def fingerprint(value, ignore_keys=None):
+    """
+    This function returns a stable hash of the (nested) dictionaries and
+    lists, ignoring the given keys at every level. The values having the
+    same fingerprint are identical for are_dictionaries_identical.
+
+    :param value: Object to hash
+    :param ignore_keys: Keys to be ignored
+    :return: Hex digest
+    """
+    parts = []
+    _fingerprint_parts(parts, value, set(ignore_keys or []))
+    return hashlib.sha1(u''.join(parts).encode('utf-8')).hexdigest()
+
+
+def _fingerprint_parts(parts, value, ignore_keys):
+    if type(value) is dict:
+        parts.append(u'{')
+        for key in sorted(
+            (k for k in value.keys() if k not in ignore_keys), key=repr
+        ):
+            parts.append(repr(key))
+            parts.append(u':')
+            _fingerprint_parts(parts, value[key], ignore_keys)
+            parts.append(u',')
+        parts.append(u'}')
+    elif type(value) is list:
+        parts.append(u'[')
+        for item in value:
+            _fingerprint_parts(parts, item, ignore_keys)
+            parts.append(u',')
+        parts.append(u']')
+    else:
+        # The strings are quoted (and escaped) by repr(), hence - they can
+        # not be mistaken for the delimiters above.
+        parts.append(repr(value))
+
+
 def directory_diff(source_dict, target_dict, ignore_keys=[], difference={}):
     """
     This function is used to recursively compare two dictionaries and
@@ -0,0 +1,265 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Concurrent execution of the schema comparison.
+
+The node types (tables, functions, views, etc.) are independent of each
+other, and so are the source and the target schema. The SchemaDiffExecutor
+compares the node types using a bounded number of the worker threads. Each
+worker uses its own database connections (see connection_scope), and fetches
+the source and the target objects concurrently (see fetch_concurrently).
+
+The progress, and the results of the node types compared so far, are kept
+in the process (the session is only saved at the end of the compare
+request), so that the poll requests can report them while the comparison
+is still running.
+"""
+
+import threading
+from collections import deque, OrderedDict
+from itertools import chain
+
+from flask import copy_current_request_context, current_app, session
+
+from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
+from pgadmin.utils.driver.connection_scope import connection_scope, \
+    current_scope, scope_connections
+
+
+class CompareProgress(object):
+    """
+    class CompareProgress
+
+        Progress of a running comparison, and the results of the node types
+        compared so far (in the order they were completed).
+    """
+
+    def __init__(self, node_count):
+        self._lock = threading.Lock()
+        self.node_count = max(node_count, 1)
+        self.msg = 'Comparing objects...'
+        self.results = []
+
+    def started(self, label):
+        with self._lock:
+            self.msg = 'Comparing ' + label + ' ...'
+
+    def completed(self, result):
+        with self._lock:
+            self.results.append(result or [])
+
+    def finished(self, msg):
+        with self._lock:
+            self.msg = msg
+            self.node_count = len(self.results)
+
+    @property
+    def done(self):
+        return len(self.results) >= self.node_count
+
+    def get(self, offset=0):
+        """
+        Returns the message, the percentage done, the results of the node
+        types completed after the given number of the node types, and the
+        number of the completed node types.
+        """
+        with self._lock:
+            completed = len(self.results)
+            return (
+                self.msg,
+                int(round(completed * 100.0 / self.node_count)),
+                list(chain(*self.results[offset:])),
+                completed
+            )
+
+
+class CompareProgressRegistry(object):
+    """
+    class CompareProgressRegistry
+
+        A size bounded map of (session id, transaction id) to the progress
+        of the comparison running (or finished lately) for the transaction.
+    """
+
+    def __init__(self, max_entries=100):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(trans_id):
+        return getattr(session, 'sid', None), str(trans_id)
+
+    def get(self, trans_id):
+        with self._lock:
+            return self._entries.get(self._key(trans_id))
+
+    def register(self, trans_id, progress):
+        key = self._key(trans_id)
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = progress
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def remove(self, trans_id):
+        with self._lock:
+            self._entries.pop(self._key(trans_id), None)
+
+
+compare_progress = CompareProgressRegistry()
+
+
+def fetch_concurrently(fetch_source, fetch_target):
+    """
+    Fetch the source and the target objects using the given functions.
+
+    When run by the SchemaDiffExecutor (i.e. within a connection scope), the
+    target objects are fetched in another thread, on its own connections,
+    while the source objects are being fetched. The functions must not share
+    the view objects, as the views keep the connection in their attributes.
+
+    Returns:
+        (source objects, target objects)
+    """
+    scope = current_scope()
+    if scope is None:
+        return fetch_source(), fetch_target()
+
+    result = dict()
+    connections = scope_connections()
+
+    @copy_current_request_context
+    def target():
+        try:
+            with connection_scope(scope + ':target', connections):
+                result['target'] = fetch_target()
+        except Exception as e:
+            result['error'] = e
+
+    thread = threading.Thread(target=target)
+    thread.daemon = True
+    thread.start()
+
+    try:
+        source = fetch_source()
+    finally:
+        thread.join()
+
+    if 'error' in result:
+        raise result['error']
+
+    return source, result['target']
+
+
+class SchemaDiffExecutor(object):
+    """
+    class SchemaDiffExecutor
+
+        Compares the given node types of the source and the target schema
+        using up to max_workers threads.
+    """
+
+    def __init__(self, trans_id, nodes, params, max_workers=1):
+        """
+        Args:
+            trans_id: Schema diff transaction id
+            nodes: List of the names of the node types to compare
+            params: Source and target server, database and schema ids
+            max_workers: Maximum number of the worker threads
+        """
+        self.trans_id = trans_id
+        self.nodes = list(nodes)
+        self.params = params
+        self.max_workers = max(1, min(max_workers or 1, len(self.nodes)))
+        self.progress = CompareProgress(len(self.nodes))
+
+    def _compare_node(self, node_name):
+        view = SchemaDiffRegistry.get_node_view(node_name)
+        if not hasattr(view, 'compare'):
+            return None
+
+        self.progress.started(view.blueprint.COLLECTION_LABEL)
+        return view.compare(**self.params)
+
+    def _worker(self, pending, results, errors, idx):
+        def compare_nodes():
+            while not errors:
+                try:
+                    node_name = pending.popleft()
+                except IndexError:
+                    return
+
+                try:
+                    results[node_name] = self._compare_node(node_name)
+                except Exception as e:
+                    current_app.logger.exception(e)
+                    # Stop comparing the remaining node types, the
+                    # comparison fails.
+                    errors[node_name] = e
+                    return
+
+                self.progress.completed(results[node_name])
+
+        if self.max_workers == 1:
+            return compare_nodes
+
+        @copy_current_request_context
+        def worker():
+            with connection_scope(
+                'schema_diff:{0}:{1}'.format(self.trans_id, idx)
+            ):
+                compare_nodes()
+
+        return worker
+
+    def run(self):
+        """
+        Compare all the node types, and returns the comparison result in
+        the order of the node types.
+
+        Raises:
+            The exception raised while comparing a node type (of the first
+            failed node type), after all the workers have stopped.
+        """
+        compare_progress.register(self.trans_id, self.progress)
+
+        pending = deque(self.nodes)
+        results = dict()
+        errors = dict()
+
+        if self.max_workers == 1:
+            self._worker(pending, results, errors, 0)()
+        else:
+            threads = [
+                threading.Thread(
+                    target=self._worker(pending, results, errors, idx)
+                )
+                for idx in range(self.max_workers)
+            ]
+            for thread in threads:
+                thread.daemon = True
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        if errors:
+            error = next(errors[node] for node in self.nodes
+                         if node in errors)
+            self.progress.finished(
+                "Failed to compare the specified schemas."
+            )
+            raise error
+
+        self.progress.finished("Successfully compare the specified schemas.")
+
+        return list(chain(*[results.get(node) or [] for node in self.nodes]))
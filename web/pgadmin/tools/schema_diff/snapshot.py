@@ -0,0 +1,235 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Schema snapshots for the schema diff.
+
+A snapshot holds the objects of a schema, as fetched for the comparison by
+each node type (see SchemaDiffObjectCompare.fetch_schema_objects), and is
+stored in a compressed file keyed by the server, database and schema id.
+It also records the catalog change marker of the database at the time of
+the capture, so that it can be compared instead of the live schema (when
+requested, see load_snapshot), as long as the database has not been changed
+since then.
+"""
+
+import gzip
+import os
+import pickle
+import tempfile
+import time
+
+from flask import render_template
+from flask_babelex import gettext
+from flask_security import current_user
+
+import config
+from config import PG_DEFAULT_DRIVER
+from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
+from pgadmin.utils.driver import get_driver
+
+# Modes of using the stored snapshot of a schema for the comparison.
+SNAPSHOT_NEVER = 'never'
+SNAPSHOT_AUTO = 'auto'
+SNAPSHOT_ALWAYS = 'always'
+SNAPSHOT_MODES = (SNAPSHOT_NEVER, SNAPSHOT_AUTO, SNAPSHOT_ALWAYS)
+
+
+class SchemaSnapshot(object):
+    """
+    class SchemaSnapshot
+
+        The objects of a schema per node type, along with the version and the
+        type of the server, and the catalog change marker of the database.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, sid, did, scid, version, server_type, marker,
+                 objects=None):
+        self.sid = sid
+        self.did = did
+        self.scid = scid
+        self.version = version
+        self.server_type = server_type
+        self.marker = marker
+        self.created = time.time()
+        self.objects = objects if objects is not None else dict()
+
+    def get_objects(self, node_type):
+        """
+        Returns the objects of the given node type (keyed by the object
+        name).
+        """
+        return self.objects.get(node_type, dict())
+
+    def info(self):
+        return {
+            'sid': self.sid,
+            'did': self.did,
+            'scid': self.scid,
+            'version': self.version,
+            'server_type': self.server_type,
+            'marker': self.marker,
+            'created': self.created,
+            'node_count': len(self.objects),
+            'object_count': sum(
+                len(objects) for objects in self.objects.values()
+            )
+        }
+
+    def save(self, path):
+        """
+        Write the snapshot to the given file. The file is replaced
+        atomically, the readers never see a partially written snapshot.
+        """
+        directory = os.path.dirname(path)
+        if not os.path.exists(directory):
+            os.makedirs(directory, 0o700)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                with gzip.GzipFile(fileobj=f, mode='wb') as gz:
+                    pickle.dump((self.FORMAT_VERSION, self.__dict__), gz, 2)
+            if os.path.exists(path) and os.name == 'nt':
+                os.remove(path)
+            os.rename(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read the snapshot from the given file, returns None, when it does not
+        exist (or, has been written by an incompatible version).
+        """
+        if not os.path.exists(path):
+            return None
+
+        with gzip.open(path, 'rb') as gz:
+            format_version, data = pickle.load(gz)
+
+        if format_version != cls.FORMAT_VERSION:
+            return None
+
+        snapshot = cls.__new__(cls)
+        snapshot.__dict__.update(data)
+        return snapshot
+
+
+def snapshot_path(sid, did, scid):
+    """
+    Returns the path of the snapshot file of the given schema for the current
+    user.
+    """
+    return os.path.join(
+        config.SCHEMA_DIFF_SNAPSHOT_DIR, str(current_user.id),
+        '{0}_{1}_{2}.snapshot'.format(sid, did, scid)
+    )
+
+
+def get_catalog_marker(conn):
+    """
+    Returns the catalog change marker of the database, None when it can not
+    be determined.
+    """
+    status, marker = conn.execute_scalar(
+        render_template('schema_diff/sql/catalog_marker.sql')
+    )
+    return marker if status else None
+
+
+def _get_connection(sid, did):
+    manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(sid)
+    return manager, manager.connection(did=did)
+
+
+def capture_snapshot(sid, did, scid):
+    """
+    Fetch the objects of all the node types of the schema, and store them
+    in the snapshot file of the schema.
+
+    Returns:
+        (True, snapshot) or (False, error message)
+    """
+    manager, conn = _get_connection(sid, did)
+    if not conn.connected():
+        return False, gettext('Please connect to the database first.')
+
+    # Fetch the marker first, so that a change made while the objects are
+    # being fetched invalidates the snapshot.
+    snapshot = SchemaSnapshot(
+        sid, did, scid, manager.version, manager.server_type,
+        get_catalog_marker(conn)
+    )
+
+    for node_name in SchemaDiffRegistry.get_registered_nodes():
+        view = SchemaDiffRegistry.get_node_view(node_name)
+        if not hasattr(view, 'fetch_schema_objects'):
+            continue
+
+        objects = view.fetch_schema_objects(sid=sid, did=did, scid=scid)
+        if objects is False or objects is None:
+            objects = dict()
+        elif not isinstance(objects, dict):
+            return False, gettext(
+                'Could not fetch the {0} of the schema.'
+            ).format(view.blueprint.COLLECTION_LABEL)
+
+        snapshot.objects[node_name] = objects
+
+    snapshot.save(snapshot_path(sid, did, scid))
+
+    return True, snapshot
+
+
+def load_snapshot(sid, did, scid, mode=SNAPSHOT_NEVER):
+    """
+    Returns the stored snapshot of the schema to be compared instead of the
+    live schema, depending on the mode:
+     * never  - None.
+     * auto   - the snapshot, when the catalog change marker of the database
+                still matches the one of the snapshot. The statistics
+                counters are reported asynchronously, a change committed
+                lately by another session may not have changed the marker
+                yet.
+     * always - the snapshot, without connecting to the database at all.
+    """
+    if mode not in (SNAPSHOT_AUTO, SNAPSHOT_ALWAYS):
+        return None
+
+    snapshot = SchemaSnapshot.load(snapshot_path(sid, did, scid))
+    if snapshot is None or mode == SNAPSHOT_ALWAYS:
+        return snapshot
+
+    if snapshot.marker is None:
+        return None
+
+    try:
+        manager, conn = _get_connection(sid, did)
+        if not conn.connected() or manager.version != snapshot.version or \
+                get_catalog_marker(conn) != snapshot.marker:
+            return None
+    except Exception:
+        # The live schema is going to be compared (and, the error reported).
+        return None
+
+    return snapshot
+
+
+def remove_snapshot(sid, did, scid):
+    """Remove the stored snapshot of the schema, if any."""
+    path = snapshot_path(sid, did, scid)
+    if os.path.exists(path):
+        os.remove(path)
+        return True
+    return False
@@ -480,10 +480,19 @@ export default class SchemaDiffUI {
       method: 'GET',
       dataType: 'json',
       contentType: 'application/json',
+      data: {'offset': self.diff_node_count},
     })
       .done(function (res) {
         let msg = res.data.compare_msg + res.data.diff_percentage + '% completed';
         $('#diff_fetching_data').find('.schema-diff-busy-text').text(msg);
+
+        /* Render the results of the node types compared so far */
+        if (self.diff_poller_int_id && res.data.results &&
+            res.data.node_count > self.diff_node_count) {
+          self.diff_node_count = res.data.node_count;
+          self.diff_results = self.diff_results.concat(res.data.results);
+          self.render_grid(self.diff_results);
+        }
       })
       .fail(function (xhr) {
         self.raise_error_on_fail(gettext('Poll error'), xhr);
@@ -492,6 +501,8 @@ export default class SchemaDiffUI {
   }
 
   startDiffPoller() {
+    this.diff_node_count = 0;
+    this.diff_results = [];
     $('#ddl_comp_fetching_data').addClass('d-none');
     $('#diff_fetching_data').removeClass('d-none');
     /* Execute once for the first time as setInterval will not do */
@@ -501,6 +512,7 @@ export default class SchemaDiffUI {
 
   stopDiffPoller(status) {
     clearInterval(this.diff_poller_int_id);
+    this.diff_poller_int_id = null;
     // The last polling for comparison
     if (status !== 'fail') this.getCompareStatus();
 
@@ -0,0 +1,40 @@
+{# ============= Fetch the change marker of the catalogs compared by the schema diff ============= #}
+{# The marker is built from the tuple counters of the catalogs, and will be NULL when the counters are not being tracked. #}
+{# The catalogs are looked up by name, as some of them do not exist on the older servers (i.e. pg_policy, pg_sequence). #}
+SELECT
+    CASE WHEN current_setting('track_counts')::boolean THEN (
+        SELECT sum(
+            pg_stat_get_tuples_inserted(c.oid) +
+            pg_stat_get_tuples_updated(c.oid) +
+            pg_stat_get_tuples_deleted(c.oid) +
+            pg_stat_get_xact_tuples_inserted(c.oid) +
+            pg_stat_get_xact_tuples_updated(c.oid) +
+            pg_stat_get_xact_tuples_deleted(c.oid)
+        )::text
+        FROM pg_catalog.pg_class c
+        WHERE c.relnamespace = (
+            SELECT oid FROM pg_catalog.pg_namespace WHERE nspname = 'pg_catalog'
+        ) AND c.relname IN (
+            'pg_namespace',
+            'pg_class',
+            'pg_attribute',
+            'pg_attrdef',
+            'pg_constraint',
+            'pg_index',
+            'pg_trigger',
+            'pg_rewrite',
+            'pg_type',
+            'pg_proc',
+            'pg_collation',
+            'pg_ts_config',
+            'pg_ts_dict',
+            'pg_ts_parser',
+            'pg_ts_template',
+            'pg_foreign_table',
+            'pg_description',
+            'pg_seclabel',
+            'pg_authid',
+            'pg_sequence',
+            'pg_policy'
+        )
+    ) END AS marker
@@ -0,0 +1,53 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.schema_diff.executor import SchemaDiffExecutor
+
+
+class FakeSchemaDiffExecutor(SchemaDiffExecutor):
+    """Compares the node types without the database servers."""
+
+    def _compare_node(self, node_name):
+        if node_name == 'failing':
+            raise Exception('Failed to compare ' + node_name)
+        return [{'type': node_name}]
+
+
+class TestCompareExecutor(BaseTestGenerator):
+    """ This class will test the failures of the schema comparison. """
+    scenarios = [
+        (
+            'When all the node types are compared',
+            dict(nodes=['table', 'view'], error=None)
+        ), (
+            'When a node type fails to compare',
+            dict(nodes=['table', 'failing', 'view'],
+                 error='Failed to compare failing')
+        )
+    ]
+
+    def runTest(self):
+        executor = FakeSchemaDiffExecutor(1, self.nodes, dict())
+
+        with self.app.test_request_context():
+            if self.error is None:
+                self.assertEqual(
+                    executor.run(),
+                    [{'type': node} for node in self.nodes]
+                )
+                self.assertEqual(executor.progress.msg,
+                                 'Successfully compare the specified schemas.')
+            else:
+                with self.assertRaises(Exception) as context:
+                    executor.run()
+                self.assertEqual(str(context.exception), self.error)
+                # The failure is never reported as a success
+                self.assertEqual(executor.progress.msg,
+                                 'Failed to compare the specified schemas.')
@@ -0,0 +1,48 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.schema_diff.executor import CompareProgress
+
+
+class TestCompareProgress(BaseTestGenerator):
+    """ This class will test the progress of a running schema comparison. """
+    scenarios = [
+        (
+            'When no node type has been compared',
+            dict(results=[], offset=0,
+                 expected=(0, [], 0, False))
+        ), (
+            'When some of the node types have been compared',
+            dict(results=[[{'id': 1}], None], offset=0,
+                 expected=(50, [{'id': 1}], 2, False))
+        ), (
+            'When the results are fetched after an offset',
+            dict(results=[[{'id': 1}], [{'id': 2}, {'id': 3}], [{'id': 4}]],
+                 offset=1,
+                 expected=(75, [{'id': 2}, {'id': 3}, {'id': 4}], 3, False))
+        ), (
+            'When all the node types have been compared',
+            dict(results=[[{'id': 1}], [], [{'id': 2}], []], offset=4,
+                 expected=(100, [], 4, True))
+        )
+    ]
+
+    def runTest(self):
+        progress = CompareProgress(4)
+        progress.started('Tables')
+
+        for result in self.results:
+            progress.completed(result)
+
+        msg, percentage, results, node_count = progress.get(self.offset)
+
+        self.assertEqual(msg, 'Comparing Tables ...')
+        self.assertEqual((percentage, results, node_count, progress.done),
+                         self.expected)
@@ -0,0 +1,84 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import copy
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.schema_diff.directory_compare import compare_dictionaries, \
+    fingerprint
+
+
+class TestCompareDictionaries(BaseTestGenerator):
+    """ This class will test the comparison of the schema objects. """
+    scenarios = [
+        (
+            'When the objects are identical except the ignored keys',
+            dict(
+                source={'oid': 1, 'name': 't1', 'acl': [{'grantee': 'a'}],
+                        'columns': [{'name': 'c1', 'attnum': 1}]},
+                target={'oid': 2, 'name': 't1', 'acl': [{'grantee': 'a'}],
+                        'columns': [{'name': 'c1', 'attnum': 3}]},
+                expected='Identical',
+                same_fingerprint=True
+            )
+        ), (
+            'When the keys are in a different order',
+            dict(
+                source={'oid': 1, 'name': 't1', 'options': {'a': 1, 'b': 2}},
+                target={'options': {'b': 2, 'a': 1}, 'name': 't1', 'oid': 2},
+                expected='Identical',
+                same_fingerprint=True
+            )
+        ), (
+            'When the nested values are different',
+            dict(
+                source={'oid': 1, 'columns': [{'name': 'c1', 'typ': 'int'}]},
+                target={'oid': 2, 'columns': [{'name': 'c1', 'typ': 'text'}]},
+                expected='Different',
+                same_fingerprint=False
+            )
+        ), (
+            'When a key is missing in the target',
+            dict(
+                source={'oid': 1, 'name': 't1', 'comment': None},
+                target={'oid': 2, 'name': 't1'},
+                expected='Different',
+                same_fingerprint=False
+            )
+        ), (
+            'When the values are equal, but of different types',
+            dict(
+                source={'oid': 1, 'fillfactor': 100},
+                target={'oid': 2, 'fillfactor': 100.0},
+                expected='Identical',
+                same_fingerprint=False
+            )
+        )
+    ]
+
+    def runTest(self):
+        ignore_keys = ['oid', 'attnum']
+        source = {'obj': self.source}
+        target = {'obj': self.target}
+        source_copy = copy.deepcopy(source)
+
+        result = compare_dictionaries(source, target, 'table', 'Tables',
+                                      ignore_keys)
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]['status'], self.expected)
+        self.assertEqual(result[0]['source_oid'], 1)
+        self.assertEqual(result[0]['target_oid'], 2)
+        self.assertEqual(
+            fingerprint(self.source, ignore_keys) ==
+            fingerprint(self.target, ignore_keys),
+            self.same_fingerprint
+        )
+        # The fetched objects must not be modified by the comparison
+        self.assertEqual(source, source_copy)
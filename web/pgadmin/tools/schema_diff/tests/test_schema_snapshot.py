@@ -0,0 +1,80 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import gzip
+import os
+import pickle
+import shutil
+import tempfile
+from decimal import Decimal
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.schema_diff.snapshot import SchemaSnapshot
+
+
+class TestSchemaSnapshot(BaseTestGenerator):
+    """ This class will test the storage of the schema snapshots. """
+    scenarios = [
+        (
+            'When the snapshot is saved and loaded',
+            dict(scenario='roundtrip')
+        ), (
+            'When the snapshot is replaced',
+            dict(scenario='replace')
+        ), (
+            'When the snapshot does not exist',
+            dict(scenario='missing')
+        ), (
+            'When the snapshot has been written by another version',
+            dict(scenario='format')
+        )
+    ]
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, '1', '1_2_3.snapshot')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def runTest(self):
+        objects = {
+            'table': {
+                't1': {'oid': 10, 'name': 't1', 'fillfactor': Decimal('90'),
+                       'columns': [{'name': 'c1', 'cltype': 'integer'}]}
+            },
+            'function': {}
+        }
+        snapshot = SchemaSnapshot(1, 2, 3, 120002, 'pg', '42', objects)
+
+        if self.scenario == 'roundtrip':
+            snapshot.save(self.path)
+            loaded = SchemaSnapshot.load(self.path)
+
+            self.assertEqual(loaded.get_objects('table'), objects['table'])
+            self.assertEqual(loaded.get_objects('view'), {})
+            self.assertEqual(loaded.info(), snapshot.info())
+            self.assertEqual(loaded.info()['object_count'], 1)
+            self.assertEqual(os.listdir(os.path.dirname(self.path)),
+                             ['1_2_3.snapshot'])
+        elif self.scenario == 'replace':
+            snapshot.save(self.path)
+            SchemaSnapshot(1, 2, 3, 120002, 'pg', '43').save(self.path)
+
+            loaded = SchemaSnapshot.load(self.path)
+            self.assertEqual(loaded.marker, '43')
+            self.assertEqual(loaded.get_objects('table'), {})
+        elif self.scenario == 'missing':
+            self.assertIsNone(SchemaSnapshot.load(self.path))
+        else:
+            os.makedirs(os.path.dirname(self.path))
+            with gzip.open(self.path, 'wb') as gz:
+                pickle.dump((0, snapshot.__dict__), gz, 2)
+
+            self.assertIsNone(SchemaSnapshot.load(self.path))
@@ -9,13 +9,12 @@
 
 """A blueprint module implementing the sqleditor frame."""
 import os
-import pickle
 import sys
 import re
 
 import simplejson as json
 from flask import Response, url_for, render_template, session, request, \
-    current_app
+    current_app, stream_with_context
 from flask_babelex import gettext
 from flask_security import login_required, current_user
 
@@ -43,6 +42,9 @@ from pgadmin.tools.sqleditor.utils.query_tool_fs_utils import \
     read_file_generator
 from pgadmin.tools.sqleditor.utils.filter_dialog import FilterDialog
 from pgadmin.tools.sqleditor.utils.query_history import QueryHistory
+from pgadmin.tools.sqleditor.utils.compressed_stream import gzip_stream
+from pgadmin.tools.sqleditor.utils.transaction_registry import \
+    transaction_registry
 
 MODULE_NAME = 'sqleditor'
 
@@ -161,9 +163,8 @@ def check_transaction_status(trans_id):
         ), None, None, None
 
     # Fetch the object for the specified transaction id.
-    # Use pickle.loads function to get the command object
     session_obj = grid_data[str(trans_id)]
-    trans_obj = pickle.loads(session_obj['command_obj'])
+    trans_obj = transaction_registry.get(trans_id, session_obj)
 
     try:
         manager = get_driver(
@@ -244,7 +245,7 @@ def start_view_data(trans_id):
         sql = trans_obj.get_sql(default_conn)
         pk_names, primary_keys = trans_obj.get_primary_keys(default_conn)
 
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+        transaction_registry.store(trans_id, session_obj, trans_obj)
 
         has_oids = False
         if trans_obj.object_type == 'table':
@@ -417,8 +418,8 @@ def poll(trans_id):
                         pk_names, primary_keys = trans_obj.get_primary_keys()
                         session_obj['has_oids'] = trans_obj.has_oids()
                         # Update command_obj in session obj
-                        session_obj['command_obj'] = pickle.dumps(
-                            trans_obj, -1)
+                        transaction_registry.store(
+                            trans_id, session_obj, trans_obj)
                         # If primary_keys exist, add them to the session_obj to
                         # allow for saving any changes to the data
                         if primary_keys is not None:
@@ -476,8 +477,6 @@ def poll(trans_id):
                             rows_fetched_from + res_len)
                         rows_fetched_from += 1
                         rows_fetched_to = trans_obj.get_fetched_row_cnt()
-                        session_obj['command_obj'] = pickle.dumps(
-                            trans_obj, -1)
 
                 # As we changed the transaction object we need to
                 # restore it and update the session variable.
@@ -554,11 +553,21 @@ def compose_type_name(col_info, typname):
 )
 @login_required
 def fetch(trans_id, fetch_all=None):
+    """
+    This method fetches the next batch of records of the query result. When
+    the result is spooled on the server, a batch can also be fetched at any
+    row offset (zero based) given by the 'offset' request argument.
+
+    Args:
+        trans_id: unique transaction id
+        fetch_all: fetch all the remaining records, if 1
+    """
     result = None
     has_more_rows = False
     rows_fetched_from = 0
     rows_fetched_to = 0
     fetch_row_cnt = -1 if fetch_all == 1 else ON_DEMAND_RECORD_COUNT
+    offset = request.args.get('offset', None, type=int)
 
     # Check the transaction and connection status
     status, error_msg, conn, trans_obj, session_obj = \
@@ -570,7 +579,8 @@ def fetch(trans_id, fetch_all=None):
                                   status=404)
 
     if status and conn is not None and session_obj is not None:
-        status, result = conn.async_fetchmany_2darray(fetch_row_cnt)
+        status, result = conn.async_fetchmany_2darray(
+            fetch_row_cnt, offset=offset)
         if not status:
             status = 'Error'
         else:
@@ -579,13 +589,18 @@ def fetch(trans_id, fetch_all=None):
             if fetch_row_cnt != -1 and res_len == ON_DEMAND_RECORD_COUNT:
                 has_more_rows = True
 
-            if res_len:
+            if res_len and offset is not None:
+                # Random access to the spooled result does not change the
+                # number of the records fetched sequentially.
+                rows_fetched_from = offset + 1
+                rows_fetched_to = offset + res_len
+            elif res_len:
                 rows_fetched_from = trans_obj.get_fetched_row_cnt()
                 trans_obj.update_fetched_row_cnt(rows_fetched_from + res_len)
                 rows_fetched_from += 1
+                # The live transaction object has been updated, the
+                # session does not need to be written.
                 rows_fetched_to = trans_obj.get_fetched_row_cnt()
-                session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
-                update_session_grid_transaction(trans_id, session_obj)
     else:
         status = 'NotConnected'
         result = error_msg
@@ -793,7 +808,7 @@ def append_filter_inclusive(trans_id):
 
         # As we changed the transaction object we need to
         # restore it and update the session variable.
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+        transaction_registry.store(trans_id, session_obj, trans_obj)
         update_session_grid_transaction(trans_id, session_obj)
     else:
         status = False
@@ -849,7 +864,7 @@ def append_filter_exclusive(trans_id):
 
         # As we changed the transaction object we need to
         # restore it and update the session variable.
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+        transaction_registry.store(trans_id, session_obj, trans_obj)
         update_session_grid_transaction(trans_id, session_obj)
     else:
         status = False
@@ -890,7 +905,7 @@ def remove_filter(trans_id):
 
         # As we changed the transaction object we need to
         # restore it and update the session variable.
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+        transaction_registry.store(trans_id, session_obj, trans_obj)
         update_session_grid_transaction(trans_id, session_obj)
     else:
         status = False
@@ -934,7 +949,7 @@ def set_limit(trans_id):
 
         # As we changed the transaction object we need to
         # restore it and update the session variable.
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+        transaction_registry.store(trans_id, session_obj, trans_obj)
         update_session_grid_transaction(trans_id, session_obj)
     else:
         status = False
@@ -972,9 +987,8 @@ def cancel_transaction(trans_id):
             info='DATAGRID_TRANSACTION_REQUIRED', status=404)
 
     # Fetch the object for the specified transaction id.
-    # Use pickle.loads function to get the command object
     session_obj = grid_data[str(trans_id)]
-    trans_obj = pickle.loads(session_obj['command_obj'])
+    trans_obj = transaction_registry.get(trans_id, session_obj)
 
     if trans_obj is not None and session_obj is not None:
 
@@ -1090,7 +1104,7 @@ def set_auto_commit(trans_id):
 
         # As we changed the transaction object we need to
         # restore it and update the session variable.
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+        transaction_registry.store(trans_id, session_obj, trans_obj)
         update_session_grid_transaction(trans_id, session_obj)
     else:
         status = False
@@ -1135,7 +1149,7 @@ def set_auto_rollback(trans_id):
 
         # As we changed the transaction object we need to
         # restore it and update the session variable.
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+        transaction_registry.store(trans_id, session_obj, trans_obj)
         update_session_grid_transaction(trans_id, session_obj)
     else:
         status = False
@@ -1343,16 +1357,37 @@ def start_query_download_tool(trans_id):
                         }
                     )
 
+                csv_data = gen(
+                    quote=blueprint.csv_quoting.get(),
+                    quote_char=blueprint.csv_quote_char.get(),
+                    field_separator=blueprint.csv_field_separator.get(),
+                    replace_nulls_with=blueprint.replace_nulls_with.get()
+                )
+
+                # The request parameter overrides the preference.
+                compression = data.get(
+                    'compression', blueprint.csv_compression.get()
+                )
+                # Compress only if the client can decompress it.
+                compress = compression == 'gzip' and \
+                    request.accept_encodings['gzip'] > 0
+
+                if compress:
+                    csv_data = gzip_stream(
+                        csv_data,
+                        blueprint.csv_compression_flush_interval.get() * 1024
+                    )
+
+                # The generator keeps fetching the rows from the server side
+                # cursor, while the response is being streamed.
                 r = Response(
-                    gen(
-                        quote=blueprint.csv_quoting.get(),
-                        quote_char=blueprint.csv_quote_char.get(),
-                        field_separator=blueprint.csv_field_separator.get(),
-                        replace_nulls_with=blueprint.replace_nulls_with.get()
-                    ),
-                    mimetype='text/csv'
+                    stream_with_context(csv_data), mimetype='text/csv'
                 )
 
+                if compress:
+                    r.headers['Content-Encoding'] = 'gzip'
+                    r.headers['Vary'] = 'Accept-Encoding'
+
                 if 'filename' in data and data['filename'] != "":
                     filename = data['filename']
                 else:
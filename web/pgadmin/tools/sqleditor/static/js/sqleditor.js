@@ -3104,15 +3104,17 @@ define('tools.querytool', [
               if(is_added) {
               // Update the rows in a grid after addition
                 dataView.beginUpdate();
+                // Map the temp_ids to the row indexes
+                var added_rows = _.invert(req_data.added_index);
                 _.each(res.data.query_results, function(r) {
                   if (!_.isNull(r.row_added)) {
-                  // Fetch temp_id returned by server after addition
-                    var row_id = Object.keys(r.row_added)[0];
-                    _.each(req_data.added_index, function(v, k) {
-                      if (v == row_id) {
+                  // Fetch temp_ids returned by server after addition (a
+                  // query may have added multiple rows)
+                    _.each(r.row_added, function(row_added, row_id) {
+                      if (_.has(added_rows, row_id)) {
                       // Fetch item data through row index
-                        var item = grid.getDataItem(k);
-                        _.extend(item, r.row_added[row_id]);
+                        var item = grid.getDataItem(added_rows[row_id]);
+                        _.extend(item, row_added);
                       }
                     });
                   }
@@ -0,0 +1,9 @@
+{# Insert the new rows (parameters of each row start with its prefix) #}
+INSERT INTO {{ conn|qtIdent(nsp_name, object_name) }} (
+{% for col in columns %}
+{% if not loop.first %}, {% endif %}{{ conn|qtIdent(col) }}{% endfor %}
+) VALUES
+{% for prefix in rows %}
+{% if not loop.first %}, {% endif %}({% for col in columns %}{% if not loop.first %}, {% endif %}%({{ prefix }}{{ pgadmin_alias[col] }})s::{{ data_type[col] }}{% endfor %})
+{% endfor %}
+ returning {% if has_oids %}oid, {% endif %}*;
@@ -0,0 +1,13 @@
+{# Update the rows with primary keys (specified in primary_keys of each row) #}
+UPDATE {{ conn|qtIdent(nsp_name, object_name) }} SET
+{% for col in columns %}
+{% if not loop.first %}, {% endif %}{{ conn|qtIdent(col) }} = pgadmin_rows.c{{ loop.index0 }}{% endfor %}
+
+ FROM (VALUES
+{% for row in rows %}
+{% if not loop.first %}, {% endif %}({% for pk in pk_names %}{{ row.primary_keys[pk]|qtLiteral }}::{{ data_type[pk] }}, {% endfor %}{% for col in columns %}{% if not loop.first %}, {% endif %}%({{ row.prefix }}{{ pgadmin_alias[col] }})s::{{ data_type[col] }}{% endfor %})
+{% endfor %}
+) AS pgadmin_rows ({% for pk in pk_names %}k{{ loop.index0 }}, {% endfor %}{% for col in columns %}{% if not loop.first %}, {% endif %}c{{ loop.index0 }}{% endfor %})
+ WHERE
+{% for pk in pk_names %}
+{% if not loop.first %} AND {% endif %}{{ conn|qtIdent(nsp_name, object_name) }}.{{ conn|qtIdent(pk) }} = pgadmin_rows.k{{ loop.index0 }}{% endfor %};
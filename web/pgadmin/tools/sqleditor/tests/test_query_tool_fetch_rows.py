@@ -0,0 +1,91 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+import random
+
+import config
+from pgadmin.browser.server_groups.servers.databases.tests import utils as \
+    database_utils
+from pgadmin.utils.route import BaseTestGenerator
+from regression import parent_node_dict
+from regression.python_test_utils import test_utils as utils
+
+
+class TestQueryToolFetchRows(BaseTestGenerator):
+    """ This class will test the rows returned by the query tool. """
+    scenarios = [
+        ('When the result has duplicate column names',
+         dict(
+             sql="SELECT 1 AS a, 2 AS a, 3 AS b;",
+             expected_columns=['a', 'a-2', 'b'],
+             expected_first_row=[1, 2, 3],
+             expected_next_row=None
+         )),
+        ('When the result has more rows than a batch',
+         dict(
+             sql="SELECT i, i * 2 AS double FROM generate_series(1, {0}) i;"
+                 .format(config.ON_DEMAND_RECORD_COUNT + 10),
+             expected_columns=['i', 'double'],
+             expected_first_row=[1, 2],
+             expected_next_row=[config.ON_DEMAND_RECORD_COUNT + 1,
+                                (config.ON_DEMAND_RECORD_COUNT + 1) * 2]
+         )),
+    ]
+
+    def runTest(self):
+        """ This function will check the rows returned by poll and fetch. """
+        database_info = parent_node_dict["database"][-1]
+        self.server_id = database_info["server_id"]
+
+        self.db_id = database_info["db_id"]
+        db_con = database_utils.connect_database(self,
+                                                 utils.SERVER_GROUP,
+                                                 self.server_id,
+                                                 self.db_id)
+        if not db_con["info"] == "Database connected.":
+            raise Exception("Could not connect to the database.")
+
+        # Initialize query tool
+        self.trans_id = str(random.randint(1, 9999999))
+        url = '/datagrid/initialize/query_tool/{0}/{1}/{2}/{3}'.format(
+            self.trans_id, utils.SERVER_GROUP, self.server_id, self.db_id)
+        response = self.tester.post(url)
+        self.assertEquals(response.status_code, 200)
+
+        url = '/sqleditor/query_tool/start/{0}'.format(self.trans_id)
+        response = self.tester.post(url, data=json.dumps({"sql": self.sql}),
+                                    content_type='html/json')
+        self.assertEquals(response.status_code, 200)
+
+        url = '/sqleditor/poll/{0}'.format(self.trans_id)
+        response = self.tester.get(url)
+        self.assertEquals(response.status_code, 200)
+        response_data = json.loads(response.data.decode('utf-8'))['data']
+
+        self.assertEquals(self.expected_columns,
+                          [col['name'] for col in response_data['colinfo']])
+        self.assertEquals(self.expected_first_row,
+                          response_data['result'][0])
+        self.assertEquals(self.expected_next_row is not None,
+                          response_data['has_more_rows'])
+
+        if self.expected_next_row is not None:
+            url = '/sqleditor/fetch/{0}'.format(self.trans_id)
+            response = self.tester.get(url)
+            self.assertEquals(response.status_code, 200)
+            response_data = json.loads(response.data.decode('utf-8'))['data']
+
+            self.assertEquals(config.ON_DEMAND_RECORD_COUNT + 1,
+                              response_data['rows_fetched_from'])
+            self.assertEquals(self.expected_next_row,
+                              response_data['result'][0])
+
+        # Disconnect the database
+        database_utils.disconnect_database(self, self.server_id, self.db_id)
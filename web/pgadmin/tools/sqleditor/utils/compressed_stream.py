@@ -0,0 +1,54 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Compress the chunks of a streamed response on the fly."""
+
+import zlib
+
+# Compression level used for the streamed responses. The higher levels cost
+# a lot more CPU time for a little gain on the typical textual data.
+COMPRESSION_LEVEL = 6
+
+
+def gzip_stream(chunks, flush_interval=1024 * 1024, encoding='utf-8'):
+    """
+    Compress the given chunks in the gzip format, and yield the compressed
+    data.
+
+    The compressor holds the data back as long as it can, hence - it is
+    flushed after every 'flush_interval' bytes of the input, so that the
+    client keeps receiving the data while a large result is being
+    downloaded. The input is never buffered by us.
+
+    Args:
+        chunks: iterable of the text (or bytes) chunks
+        flush_interval: number of the input bytes between two flushes
+        encoding: encoding used for the text chunks
+    """
+    # wbits > 16 makes zlib write the gzip header and trailer.
+    compressor = zlib.compressobj(
+        COMPRESSION_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+    )
+    pending = 0
+
+    for chunk in chunks:
+        if not isinstance(chunk, bytes):
+            chunk = chunk.encode(encoding)
+
+        data = compressor.compress(chunk)
+        pending += len(chunk)
+
+        if pending >= flush_interval:
+            data += compressor.flush(zlib.Z_SYNC_FLUSH)
+            pending = 0
+
+        if data:
+            yield data
+
+    yield compressor.flush()
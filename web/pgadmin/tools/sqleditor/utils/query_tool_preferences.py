@@ -258,6 +258,33 @@ def RegisterQueryToolPreferences(self):
         allow_blanks=True
     )
 
+    self.csv_compression = self.preference.register(
+        'CSV_output', 'csv_compression',
+        gettext("Compress the download"), 'options', 'none',
+        category_label=gettext('CSV output'),
+        options=[{'label': gettext('None'), 'value': 'none'},
+                 {'label': 'gzip', 'value': 'gzip'}],
+        select2={
+            'allowClear': False,
+            'tags': False
+        },
+        help_str=gettext('Specifies whether or not to compress the query '
+                         'results being downloaded as CSV, while they are '
+                         'transferred to the browser. The downloaded file '
+                         'itself is not compressed.')
+    )
+
+    self.csv_compression_flush_interval = self.preference.register(
+        'CSV_output', 'csv_compression_flush_interval',
+        gettext("Compression flush interval (KB)"), 'integer', 1024,
+        min_val=1, max_val=102400,
+        category_label=gettext('CSV output'),
+        help_str=gettext('Specifies the amount of the CSV data (in '
+                         'kilobytes), after which the compressed data is '
+                         'sent to the browser, while downloading the query '
+                         'results.')
+    )
+
     self.results_grid_quoting = self.preference.register(
         'Results_grid', 'results_grid_quoting',
         gettext("Result copy quoting"), 'options', 'strings',
@@ -14,6 +14,9 @@ try:
 except ImportError:
     from ordereddict import OrderedDict
 
+# Maximum number of the rows inserted, or updated by a single statement
+SAVE_BATCH_SIZE = 1000
+
 
 def save_changed_data(changed_data, columns_info, conn, command_obj,
                       client_primary_key, auto_commit=True):
@@ -140,7 +143,8 @@ def save_changed_data(changed_data, columns_info, conn, command_obj,
                     'sql': sql, 'data': data,
                     'client_row': tmp_row_index,
                     'select_sql': select_sql,
-                    'row_id': data.get(client_primary_key)
+                    'row_id': data.get(client_primary_key),
+                    'columns': tuple(sorted(column_data))
                 })
                 # Reset column data
                 column_data = {}
@@ -168,7 +172,9 @@ def save_changed_data(changed_data, columns_info, conn, command_obj,
                 list_of_sql[of_type].append({'sql': sql,
                                              'data': data,
                                              'row_id':
-                                                 data.get(client_primary_key)})
+                                                 data.get(client_primary_key),
+                                             'primary_keys': pk_escaped,
+                                             'columns': tuple(sorted(data))})
 
         # For deleted rows
         elif of_type == 'deleted':
@@ -212,7 +218,14 @@ def save_changed_data(changed_data, columns_info, conn, command_obj,
             )
             list_of_sql[of_type].append({'sql': sql, 'data': {}})
 
-    def failure_handle(res, row_id):
+        # Save the consecutive rows with the same columns together
+        if of_type in ('added', 'updated'):
+            list_of_sql[of_type] = make_batches(
+                of_type, list_of_sql[of_type], command_obj, pgadmin_alias,
+                column_type
+            )
+
+    def failure_handle(res, row_id, item):
         mogrified_sql = conn.mogrify(item['sql'], item['data'])
         mogrified_sql = mogrified_sql if mogrified_sql is not None \
             else item['sql']
@@ -245,55 +258,144 @@ def save_changed_data(changed_data, columns_info, conn, command_obj,
 
         return False, res, query_results, row_id
 
+    def alias_data(item):
+        item['data'] = {
+            pgadmin_alias[k] if k in pgadmin_alias else k: v
+            for k, v in item['data'].items()
+        }
+
+    def execute_row(item):
+        """
+        Execute the SQL of a single row, returns the failure result (if
+        any).
+        """
+        alias_data(item)
+
+        row_added = None
+        res = None
+
+        try:
+            # Fetch oids/primary keys
+            if 'select_sql' in item and item['select_sql']:
+                status, res = conn.execute_dict(
+                    item['sql'], item['data'])
+            else:
+                status, res = conn.execute_void(
+                    item['sql'], item['data'])
+        except Exception as _:
+            failure_handle(res, item.get('row_id', 0), item)
+            raise
+
+        if not status:
+            return failure_handle(res, item.get('row_id', 0), item)
+
+        # Select added row from the table
+        if 'select_sql' in item:
+            status, sel_res = conn.execute_dict(
+                item['select_sql'], res['rows'][0])
+
+            if not status:
+                return failure_handle(sel_res, item.get('row_id', 0), item)
+
+            if 'rows' in sel_res and len(sel_res['rows']) > 0:
+                row_added = {
+                    item['client_row']: sel_res['rows'][0]}
+
+        rows_affected = conn.rows_affected()
+        mogrified_sql = conn.mogrify(item['sql'], item['data'])
+        mogrified_sql = mogrified_sql if mogrified_sql is not None \
+            else item['sql']
+        # store the result of each query in dictionary
+        query_results.append({
+            'status': status,
+            'result': None if row_added else res,
+            'sql': mogrified_sql,
+            'rows_affected': rows_affected,
+            'row_added': row_added
+        })
+
+        return None
+
+    def execute_batch(batch):
+        """
+        Execute the SQL of a batch of rows. If it fails, or the inserted
+        rows can not be matched with the rows of the client, the rows are
+        saved one by one to find the row at fault.
+        """
+        res = None
+        try:
+            status, res = conn.execute_void('SAVEPOINT save_data_rows;')
+            if status:
+                if batch['type'] == 'added':
+                    status, res = conn.execute_dict(
+                        batch['sql'], batch['data'])
+                    if status and len(res['rows']) != len(batch['rows']):
+                        # i.e. a trigger has skipped some of the rows
+                        status = False
+                else:
+                    status, res = conn.execute_void(
+                        batch['sql'], batch['data'])
+        except Exception as _:
+            failure_handle(res, None, batch)
+            raise
+
+        if not status:
+            status, res = conn.execute_void(
+                'ROLLBACK TO SAVEPOINT save_data_rows;'
+            )
+            if not status:
+                return failure_handle(res, None, batch)
+
+            for item in batch['rows']:
+                result = execute_row(item)
+                if result is not None:
+                    return result
+
+            status, res = conn.execute_void(
+                'RELEASE SAVEPOINT save_data_rows;'
+            )
+            if not status:
+                return failure_handle(res, None, batch)
+            return None
+
+        rows_affected = conn.rows_affected()
+        row_added = None
+        if batch['type'] == 'added':
+            # The rows are returned in the order of the VALUES list
+            row_added = {
+                item['client_row']: row
+                for item, row in zip(batch['rows'], res['rows'])
+            }
+
+        status, release_res = conn.execute_void(
+            'RELEASE SAVEPOINT save_data_rows;'
+        )
+        if not status:
+            return failure_handle(release_res, None, batch)
+
+        mogrified_sql = conn.mogrify(batch['sql'], batch['data'])
+        mogrified_sql = mogrified_sql if mogrified_sql is not None \
+            else batch['sql']
+        query_results.append({
+            'status': True,
+            'result': None if row_added else res,
+            'sql': mogrified_sql,
+            'rows_affected': rows_affected,
+            'row_added': row_added
+        })
+
+        return None
+
     for opr, sqls in list_of_sql.items():
         for item in sqls:
             if item['sql']:
-                item['data'] = {
-                    pgadmin_alias[k] if k in pgadmin_alias else k: v
-                    for k, v in item['data'].items()
-                }
+                if 'rows' in item:
+                    result = execute_batch(item)
+                else:
+                    result = execute_row(item)
 
-                row_added = None
-
-                try:
-                    # Fetch oids/primary keys
-                    if 'select_sql' in item and item['select_sql']:
-                        status, res = conn.execute_dict(
-                            item['sql'], item['data'])
-                    else:
-                        status, res = conn.execute_void(
-                            item['sql'], item['data'])
-                except Exception as _:
-                    failure_handle(res, item.get('row_id', 0))
-                    raise
-
-                if not status:
-                    return failure_handle(res, item.get('row_id', 0))
-
-                # Select added row from the table
-                if 'select_sql' in item:
-                    status, sel_res = conn.execute_dict(
-                        item['select_sql'], res['rows'][0])
-
-                    if not status:
-                        return failure_handle(sel_res, item.get('row_id', 0))
-
-                    if 'rows' in sel_res and len(sel_res['rows']) > 0:
-                        row_added = {
-                            item['client_row']: sel_res['rows'][0]}
-
-                rows_affected = conn.rows_affected()
-                mogrified_sql = conn.mogrify(item['sql'], item['data'])
-                mogrified_sql = mogrified_sql if mogrified_sql is not None \
-                    else item['sql']
-                # store the result of each query in dictionary
-                query_results.append({
-                    'status': status,
-                    'result': None if row_added else res,
-                    'sql': mogrified_sql,
-                    'rows_affected': rows_affected,
-                    'row_added': row_added
-                })
+                if result is not None:
+                    return result
 
     # Commit the transaction if no error is found & autocommit is activated
     if auto_commit:
@@ -321,3 +423,85 @@ def execute_void_wrapper(conn, sql, query_results):
             'row_added': None
         })
     return status, res
+
+
+def make_batches(of_type, items, command_obj, pgadmin_alias, data_type):
+    """
+    Group the consecutive rows to be added (or updated) with the same
+    columns into the batches of at most SAVE_BATCH_SIZE rows, which are saved
+    by a single statement.
+
+    Args:
+        of_type: 'added', or 'updated'
+        items: The SQL (along with its data) of each row
+        command_obj: The transaction object (command_obj or trans_obj)
+        pgadmin_alias: Argument names of the columns
+        data_type: Data type of the columns
+
+    Returns:
+        The list of the batches, and the rows, which are saved on their own
+    """
+    pk_names = None
+    if of_type == 'updated':
+        pk_names = list(items[0]['primary_keys']) if items else []
+        # The rows are matched using all the primary keys
+        if not pk_names or \
+                any(pk not in data_type for pk in pk_names) or \
+                any(list(item['primary_keys']) != pk_names
+                    for item in items):
+            return items
+
+    groups = []
+    for item in items:
+        if groups and groups[-1][-1]['columns'] == item['columns'] and \
+                len(groups[-1]) < SAVE_BATCH_SIZE:
+            groups[-1].append(item)
+        else:
+            groups.append([item])
+
+    result = []
+    for rows in groups:
+        columns = rows[0]['columns']
+        if len(rows) == 1 or len(columns) == 0:
+            result.extend(rows)
+            continue
+
+        data = {}
+        prefixes = []
+        for idx, row in enumerate(rows):
+            prefix = 'r{0}_'.format(idx)
+            prefixes.append(prefix)
+            for col in columns:
+                data[prefix + pgadmin_alias.get(col, col)] = row['data'][col]
+
+        if of_type == 'added':
+            sql = render_template(
+                "/".join([command_obj.sql_path, 'insert_rows.sql']),
+                columns=columns,
+                rows=prefixes,
+                pgadmin_alias=pgadmin_alias,
+                object_name=command_obj.object_name,
+                nsp_name=command_obj.nsp_name,
+                data_type=data_type,
+                has_oids=command_obj.has_oids()
+            )
+        else:
+            sql = render_template(
+                "/".join([command_obj.sql_path, 'update_rows.sql']),
+                columns=columns,
+                rows=[
+                    {'prefix': prefix, 'primary_keys': row['primary_keys']}
+                    for prefix, row in zip(prefixes, rows)
+                ],
+                pk_names=pk_names,
+                pgadmin_alias=pgadmin_alias,
+                object_name=command_obj.object_name,
+                nsp_name=command_obj.nsp_name,
+                data_type=data_type
+            )
+
+        result.append({
+            'sql': sql, 'data': data, 'rows': rows, 'type': of_type
+        })
+
+    return result
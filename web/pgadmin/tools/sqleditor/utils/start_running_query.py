@@ -9,7 +9,6 @@
 
 """Start executing the query in async mode."""
 
-import pickle
 import random
 
 from flask import Response
@@ -21,6 +20,8 @@ from pgadmin.tools.sqleditor.utils.apply_explain_plan_wrapper import \
 from pgadmin.tools.sqleditor.utils.constant_definition import TX_STATUS_IDLE, \
     TX_STATUS_INERROR
 from pgadmin.tools.sqleditor.utils.is_begin_required import is_begin_required
+from pgadmin.tools.sqleditor.utils.transaction_registry import \
+    transaction_registry
 from pgadmin.tools.sqleditor.utils.update_session_grid_transaction import \
     update_session_grid_transaction
 from pgadmin.utils.ajax import make_json_response, internal_server_error
@@ -49,7 +50,7 @@ class StartRunningQuery:
         session_obj.pop('primary_keys', None)
         session_obj.pop('oids', None)
 
-        transaction_object = pickle.loads(session_obj['command_obj'])
+        transaction_object = transaction_registry.get(trans_id, session_obj)
         can_edit = False
         can_filter = False
         notifies = None
@@ -168,7 +169,7 @@ class StartRunningQuery:
     def save_transaction_in_session(session, transaction_id, transaction):
         # As we changed the transaction object we need to
         # restore it and update the session variable.
-        session['command_obj'] = pickle.dumps(transaction, -1)
+        transaction_registry.store(transaction_id, session, transaction)
         update_session_grid_transaction(transaction_id, session)
 
     @staticmethod
@@ -189,5 +190,4 @@ class StartRunningQuery:
                 status=404
             )
         # Fetch the object for the specified transaction id.
-        # Use pickle.loads function to get the command object
         return grid_data[str(transaction_id)]
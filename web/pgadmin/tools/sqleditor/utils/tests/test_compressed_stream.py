@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+import gzip
+import io
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.sqleditor.utils.compressed_stream import gzip_stream
+
+
+class TestGzipStream(BaseTestGenerator):
+    """
+    Check that the gzip_stream method compresses the chunks on the fly
+    """
+
+    scenarios = [
+        (
+            'When the flush interval is smaller than a chunk',
+            dict(flush_interval=1, min_parts=11)
+        ),
+        (
+            'When the flush interval is larger than the whole data',
+            dict(flush_interval=1024 * 1024, min_parts=1)
+        ),
+    ]
+
+    def runTest(self):
+        chunks = [u'"a","b"\n'] + [u'1,"été"\n' * 100] * 10
+
+        parts = list(gzip_stream(chunks, self.flush_interval))
+
+        self.assertTrue(len(parts) >= self.min_parts)
+        with gzip.GzipFile(fileobj=io.BytesIO(b''.join(parts))) as f:
+            self.assertEqual(f.read().decode('utf-8'), u''.join(chunks))
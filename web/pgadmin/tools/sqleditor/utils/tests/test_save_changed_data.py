@@ -19,6 +19,34 @@ from pgadmin.tools.sqleditor.tests.execute_query_test_utils \
     import execute_query
 
 
+TEST_COLUMNS = [
+    {"name": "pk_col",
+     "display_name": "pk_col",
+     "column_type": "[PK] integer",
+     "column_type_internal": "integer",
+     "pos": 0,
+     "label": "pk_col<br>[PK] integer",
+     "cell": "number",
+     "can_edit": True,
+     "type": "integer",
+     "not_null": True,
+     "has_default_val": False,
+     "is_array": False},
+    {"name": "normal_col",
+     "display_name": "normal_col",
+     "column_type": "character varying",
+     "column_type_internal": "character varying",
+     "pos": 1,
+     "label": "normal_col<br>character varying",
+     "cell": "string",
+     "can_edit": True,
+     "type": "character varying",
+     "not_null": False,
+     "has_default_val": False,
+     "is_array": False}
+]
+
+
 class TestSaveChangedData(BaseTestGenerator):
     """ This class tests saving data changes to updatable query resultsets """
     scenarios = [
@@ -256,6 +284,95 @@ class TestSaveChangedData(BaseTestGenerator):
             check_sql='SELECT * FROM %s WHERE pk_col = 2',
             check_result='SELECT 0'
         )),
+        ('When inserting multiple new valid rows', dict(
+            save_payload={
+                "updated": {},
+                "added": {
+                    "2": {
+                        "err": False,
+                        "data": {
+                            "pk_col": "3",
+                            "__temp_PK": "2",
+                            "normal_col": "three"
+                        }
+                    },
+                    "3": {
+                        "err": False,
+                        "data": {
+                            "normal_col": "four",
+                            "__temp_PK": "3",
+                            "pk_col": "4"
+                        }
+                    }
+                },
+                "staged_rows": {},
+                "deleted": {},
+                "updated_index": {},
+                "added_index": {"2": "2", "3": "3"},
+                "columns": TEST_COLUMNS
+            },
+            save_status=True,
+            check_sql='SELECT * FROM %s WHERE pk_col > 2 ORDER BY pk_col',
+            check_result=[[3, "three"], [4, "four"]]
+        )),
+        ('When inserting multiple new rows with an invalid row', dict(
+            save_payload={
+                "updated": {},
+                "added": {
+                    "2": {
+                        "err": False,
+                        "data": {
+                            "pk_col": "3",
+                            "__temp_PK": "2",
+                            "normal_col": "three"
+                        }
+                    },
+                    "3": {
+                        "err": False,
+                        "data": {
+                            "pk_col": "1",
+                            "__temp_PK": "3",
+                            "normal_col": "four"
+                        }
+                    }
+                },
+                "staged_rows": {},
+                "deleted": {},
+                "updated_index": {},
+                "added_index": {"2": "2", "3": "3"},
+                "columns": TEST_COLUMNS
+            },
+            save_status=False,
+            check_sql='SELECT * FROM %s WHERE pk_col = 3',
+            check_result='SELECT 0'
+        )),
+        ('When updating multiple rows', dict(
+            save_payload={
+                "updated": {
+                    "1":
+                        {"err": False,
+                         "data": {"normal_col": "ONE"},
+                         "primary_keys":
+                             {"pk_col": 1}
+                         },
+                    "2":
+                        {"err": False,
+                         "data": {"normal_col": "TWO"},
+                         "primary_keys":
+                             {"pk_col": 2}
+                         }
+                },
+                "added": {},
+                "staged_rows": {},
+                "deleted": {},
+                "updated_index": {"1": "1", "2": "2"},
+                "added_index": {},
+                "columns": TEST_COLUMNS
+            },
+            save_status=True,
+            check_sql='SELECT * FROM %s ORDER BY pk_col',
+            check_result=[[1, "ONE"], [2, "TWO"]]
+        )),
     ]
 
     def setUp(self):
@@ -429,14 +429,16 @@ class StartRunningQueryTest(BaseTestGenerator):
            '.apply_explain_plan_wrapper_if_needed')
     @patch('pgadmin.tools.sqleditor.utils.start_running_query'
            '.make_json_response')
-    @patch('pgadmin.tools.sqleditor.utils.start_running_query.pickle')
+    @patch('pgadmin.tools.sqleditor.utils.start_running_query'
+           '.transaction_registry')
     @patch('pgadmin.tools.sqleditor.utils.start_running_query.get_driver')
     @patch('pgadmin.tools.sqleditor.utils.start_running_query'
            '.internal_server_error')
     @patch('pgadmin.tools.sqleditor.utils.start_running_query'
            '.update_session_grid_transaction')
     def runTest(self, update_session_grid_transaction_mock,
-                internal_server_error_mock, get_driver_mock, pickle_mock,
+                internal_server_error_mock, get_driver_mock,
+                transaction_registry_mock,
                 make_json_response_mock,
                 apply_explain_plan_wrapper_if_needed_mock):
         """Check correct function is called to handle to run query."""
@@ -448,7 +450,7 @@ class StartRunningQueryTest(BaseTestGenerator):
         make_json_response_mock.return_value = expected_response
         if self.expect_internal_server_error_called_with is not None:
             internal_server_error_mock.return_value = expected_response
-        pickle_mock.loads.return_value = self.pickle_load_return
+        transaction_registry_mock.get.return_value = self.pickle_load_return
         blueprint_mock = MagicMock(
             info_notifier_timeout=MagicMock(get=lambda: 5))
 
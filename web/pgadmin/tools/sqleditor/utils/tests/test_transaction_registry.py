@@ -0,0 +1,70 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+import pickle
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.sqleditor.utils.transaction_registry import \
+    TransactionRegistry
+
+
+class _Command(object):
+    def __init__(self, limit):
+        self.limit = limit
+
+
+class TestTransactionRegistry(BaseTestGenerator):
+    """
+    Check that the live command objects are reused, until the pickled
+    object in the session is replaced.
+    """
+
+    scenarios = [
+        (
+            'When the same transaction is requested again',
+            dict(scenario=1)
+        ),
+        (
+            'When the command object is stored',
+            dict(scenario=2)
+        ),
+        (
+            'When the session has been updated by another process',
+            dict(scenario=3)
+        ),
+        (
+            'When the transaction is removed',
+            dict(scenario=4)
+        ),
+    ]
+
+    def runTest(self):
+        registry = TransactionRegistry(10)
+        session_obj = {'command_obj': pickle.dumps(_Command(100), -1)}
+
+        with self.app.test_request_context():
+            trans_obj = registry.get(1, session_obj)
+
+            if self.scenario == 1:
+                # The changes to the live object are not lost
+                trans_obj.limit = 200
+                self.assertIs(registry.get(1, session_obj), trans_obj)
+            elif self.scenario == 2:
+                trans_obj.limit = 200
+                registry.store(1, session_obj, trans_obj)
+                self.assertIs(registry.get(1, session_obj), trans_obj)
+                self.assertEqual(
+                    pickle.loads(session_obj['command_obj']).limit, 200
+                )
+            elif self.scenario == 3:
+                session_obj['command_obj'] = pickle.dumps(_Command(300), -1)
+                self.assertEqual(registry.get(1, session_obj).limit, 300)
+            elif self.scenario == 4:
+                registry.remove(1)
+                self.assertEqual(len(registry), 0)
+                self.assertIsNot(registry.get(1, session_obj), trans_obj)
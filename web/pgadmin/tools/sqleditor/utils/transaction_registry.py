@@ -0,0 +1,99 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+In-process registry of the live command objects of the Query Tool and the
+View Data transactions.
+
+The command object of a transaction is stored pickled in the session. The
+registry keeps the unpickled object together with the pickled data it
+belongs to, so that it is unpickled again only when the data in the session
+has been replaced (i.e. by another worker process). The changes, which
+matter only to the worker holding the connection of the transaction (i.e.
+the number of the fetched rows), are made to the live object, and are not
+written to the session at all.
+"""
+
+import pickle
+import threading
+from collections import OrderedDict
+
+from flask import session
+
+import config
+
+
+class TransactionRegistry(object):
+    """
+    class TransactionRegistry
+
+        A size bounded LRU map of (session id, transaction id) to the
+        (pickled data, command object).
+
+    Methods:
+    -------
+    * get(trans_id, session_obj)
+      - Returns the command object for the transaction.
+
+    * store(trans_id, session_obj, trans_obj)
+      - Pickle the command object into the session object, after a change,
+        which must survive the current process (i.e. a filter, or a limit).
+
+    * remove(trans_id)
+      - Remove the command object, when the transaction is closed.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(trans_id):
+        return getattr(session, 'sid', None), str(trans_id)
+
+    def get(self, trans_id, session_obj):
+        data = session_obj['command_obj']
+        key = self._key(trans_id)
+
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None and (entry[0] is data or entry[0] == data):
+                self._entries[key] = entry
+                return entry[1]
+
+        trans_obj = pickle.loads(data)
+        self._register(key, data, trans_obj)
+
+        return trans_obj
+
+    def store(self, trans_id, session_obj, trans_obj):
+        data = pickle.dumps(trans_obj, -1)
+        session_obj['command_obj'] = data
+        self._register(self._key(trans_id), data, trans_obj)
+
+    def remove(self, trans_id):
+        with self._lock:
+            self._entries.pop(self._key(trans_id), None)
+
+    def _register(self, key, data, trans_obj):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (data, trans_obj)
+
+            while len(self._entries) > max(self.max_entries, 1):
+                self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+transaction_registry = TransactionRegistry(
+    getattr(config, 'QUERY_TOOL_MAX_LIVE_TRANSACTIONS', 1000)
+)
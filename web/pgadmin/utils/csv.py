@@ -56,6 +56,7 @@ Agreement.
 # Handle the null value if value is None or equal to
 # 'replace_nulls_with' then it represents the null value, so no need to
 # quote it.
+# The writer replaces the null value with 'replace_nulls_with' (if given).
 ############################################################################
 
 from __future__ import unicode_literals, absolute_import
@@ -130,7 +131,10 @@ class QuoteStrategy(object):
         return self.dialect.escapechar
 
     def prepare(self, raw_field, only=None):
-        field = text_type(raw_field if raw_field is not None else '')
+        if raw_field is None:
+            field = text_type(self.dialect.replace_nulls_with or '')
+        else:
+            field = text_type(raw_field)
         quoted = self.quoted(field=field, raw_field=raw_field, only=only)
 
         escape_re = self.escape_re(quoted=quoted)
@@ -10,6 +10,7 @@
 from flask import current_app
 
 from .registry import DriverRegistry
+from . import affinity
 
 
 def get_driver(type, app=None):
@@ -38,6 +39,7 @@ def init_app(app):
 
     setattr(app, '_pgadmin_server_drivers', drivers)
     DriverRegistry.load_drivers()
+    affinity.init_app(app)
 
     return drivers
 
@@ -109,11 +109,14 @@ class BaseConnection(object):
       - Implement this method to execute the given query and returns the result
         as an array of dict (column name -> value) format.
 
-    * def async_fetchmany_2darray(records=-1, formatted_exception_msg=False):
+    * def async_fetchmany_2darray(records=-1, formatted_exception_msg=False,
+                                 offset=None):
       - Implement this method to retrieve result of asynchronous connection and
         polling with no_result flag set to True.
         This returns the result as a 2 dimensional array.
         If records is -1 then fetchmany will behave as fetchall.
+        If offset is given, the records are retrieved from that row offset
+        (supported only when the result has been spooled).
 
     * connected()
       - Implement this method to get the status of the connection. It should
@@ -151,6 +154,11 @@ class BaseConnection(object):
       - Implement this method to poll the data of query running on asynchronous
         connection.
 
+    * wait_for_server(timeout)
+      - Implement this method to wait (at most timeout seconds) for the
+        database server to send the result, or a message of the query running
+        on asynchronous connection.
+
     * cancel_transaction(conn_id, did=None)
       - Implement this method to cancel the running transaction.
 
@@ -203,7 +211,7 @@ class BaseConnection(object):
 
     @abstractmethod
     def async_fetchmany_2darray(self, records=-1,
-                                formatted_exception_msg=False):
+                                formatted_exception_msg=False, offset=None):
         pass
 
     @abstractmethod
@@ -238,6 +246,10 @@ class BaseConnection(object):
     def poll(self, formatted_exception_msg=True, no_result=False):
         pass
 
+    @abstractmethod
+    def wait_for_server(self, timeout):
+        pass
+
     @abstractmethod
     def status_message(self):
         pass
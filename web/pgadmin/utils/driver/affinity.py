@@ -0,0 +1,66 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Connection affinity of the user sessions.
+
+Every pgAdmin process keeps its own server connection managers (and the
+database connections) for a session, as the database connections can not be
+shared between the processes. When the requests of a session are served by
+several processes, each one of them restores the managers from the session,
+and opens its own set of the database connections.
+
+To keep a single set of the connections per session, run several pgAdmin
+instances (each one of them a single process, serving the requests in
+threads) on their own ports, give each one of them a unique WORKER_ID, and
+put a load balancer in front of them. The instance serving a request sends
+its WORKER_ID in the CONNECTION_AFFINITY_COOKIE cookie, and the load
+balancer routes the next requests of the session to the instance named by
+the cookie (see the server deployment documentation). The cookie is sent
+again only when the session lands on another instance (i.e. the named
+instance is down), which then owns the connections of the session. The
+connections left on the previous instance are released by its gc after
+MAX_SESSION_IDLE_TIME.
+"""
+
+from flask import request
+
+import config
+
+
+def worker_id():
+    """
+    Returns the id of this pgAdmin instance, as known to the load balancer
+    (None, if not configured).
+    """
+    return getattr(config, 'WORKER_ID', None) or None
+
+
+def init_app(app):
+    """
+    Send the id of the instance serving the requests of the session in a
+    cookie (if configured), so that the load balancer can route the next
+    requests of the session to it.
+    """
+    cookie_name = getattr(config, 'CONNECTION_AFFINITY_COOKIE', None)
+
+    if not worker_id() or not cookie_name:
+        return
+
+    @app.after_request
+    def set_affinity_cookie(response):
+        worker = worker_id()
+        if request.cookies.get(cookie_name) != worker:
+            response.set_cookie(
+                cookie_name, worker,
+                path=config.COOKIE_DEFAULT_PATH,
+                domain=config.COOKIE_DEFAULT_DOMAIN,
+                httponly=True
+            )
+        return response
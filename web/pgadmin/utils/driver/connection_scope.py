@@ -0,0 +1,79 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Thread scoped database connections.
+
+The node views get the default connection of the database from the server
+manager (i.e. manager.connection(did=did)), which is shared by all the
+requests of the session. A thread running the views concurrently with other
+threads (i.e. the schema diff comparison executor) enters a connection
+scope, and the server managers then return a dedicated connection of that
+scope for the database instead. The connections are opened on demand, and
+released when the thread leaves the scope.
+"""
+
+import threading
+from contextlib import contextmanager
+
+_local = threading.local()
+
+
+def current_scope():
+    """Returns the name of the connection scope of the current thread."""
+    return getattr(_local, 'name', None)
+
+
+def register_scoped_connection(manager, conn_id):
+    """
+    Remember the connection opened by the server manager for the current
+    scope, so that it is released when the thread leaves the scope.
+    """
+    connections = getattr(_local, 'connections', None)
+    if connections is not None and (manager, conn_id) not in connections:
+        connections.append((manager, conn_id))
+
+
+def scope_connections():
+    """
+    Returns the list of the connections opened in the scope of the current
+    thread.
+    """
+    return getattr(_local, 'connections', None)
+
+
+@contextmanager
+def connection_scope(name, connections=None):
+    """
+    Use the dedicated database connections, identified by the given name,
+    in the current thread till the end of the block.
+
+    Args:
+        name: Unique name of the scope (i.e. it includes the transaction id)
+        connections: The list of the connections of the parent scope (see
+            scope_connections). The connections opened in this scope are
+            added to it, and are released along with the parent scope,
+            instead of at the end of the block.
+    """
+    previous = (current_scope(), scope_connections())
+    _local.name = name
+    _local.connections = [] if connections is None else connections
+
+    try:
+        yield
+    finally:
+        opened = _local.connections
+        _local.name, _local.connections = previous
+
+        # The connections of a nested scope are released by the parent.
+        for manager, conn_id in opened if connections is None else []:
+            try:
+                manager.release(conn_id=conn_id)
+            except Exception:
+                pass
@@ -63,7 +63,7 @@ class Driver(BaseDriver):
 
         super(Driver, self).__init__()
 
-    def connection_manager(self, sid=None):
+    def connection_manager(self, sid=None, server=None):
         """
         connection_manager(...)
 
@@ -73,11 +73,17 @@ class Driver(BaseDriver):
         Parameters:
             sid
             - Server ID
+            server
+            - Server object of the given id (if already fetched by the
+              caller), to avoid fetching it again
         """
         assert (sid is not None and isinstance(sid, int))
         managers = None
 
-        server_data = Server.query.filter_by(id=sid).first()
+        if server is not None and server.id == sid:
+            server_data = server
+        else:
+            server_data = Server.query.filter_by(id=sid).first()
         if server_data is None:
             return None
 
@@ -109,12 +115,7 @@ class Driver(BaseDriver):
 
         managers['pinged'] = datetime.datetime.now()
         if str(sid) not in managers:
-            s = Server.query.filter_by(id=sid).first()
-
-            if not s:
-                return None
-
-            managers[str(sid)] = ServerManager(s)
+            managers[str(sid)] = ServerManager(server_data)
 
             return managers[str(sid)]
 
@@ -209,7 +210,7 @@ class Driver(BaseDriver):
 
         curr_time = datetime.datetime.now()
 
-        for sess in self.managers:
+        for sess in list(self.managers):
             sess_mgr = self.managers[sess]
 
             if sess == session.sid:
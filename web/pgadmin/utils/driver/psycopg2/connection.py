@@ -14,6 +14,7 @@ object.
 """
 
 import random
+import re
 import select
 import sys
 import six
@@ -32,11 +33,12 @@ from pgadmin.model import User
 from pgadmin.utils.exception import ConnectionLost, CryptKeyMissing
 from pgadmin.utils import get_complete_file_path
 from ..abstract import BaseConnection
-from .cursor import DictCursor
+from .cursor import DictCursor, TupleCursor
 from .typecast import register_global_typecasters, \
     register_string_typecasters, register_binary_typecasters, \
     register_array_to_string_typecasters, ALL_JSON_TYPES
 from .encoding import getEncoding, configureDriverEncodings
+from .spool import ResultSpool
 from pgadmin.utils import csv
 from pgadmin.utils.master_password import get_crypt_key
 
@@ -53,6 +55,34 @@ _ = gettext
 register_global_typecasters()
 configureDriverEncodings(encodings)
 
+# Leading white spaces and comments of a query.
+_LEADING_COMMENTS_RE = re.compile(r'^(\s+|--[^\n]*(\n|$)|/\*.*?\*/)+', re.S)
+_SELECT_RE = re.compile(r'^(select|values|table|with)\b', re.I)
+# Queries, which can not be (or, may not be safely) used for a cursor.
+_NOT_CURSOR_QUERY_RE = re.compile(r'\b(insert|update|delete|into|share)\b',
+                                  re.I)
+
+
+def _plain_select_query(query):
+    """
+    Returns the query without the leading comments and the trailing
+    semicolons, if it is a single SELECT (or VALUES/TABLE) query, which can
+    be used to declare a cursor, otherwise - None.
+
+    The check is conservative, i.e. a query having a semicolon or a data
+    modifying keyword anywhere (even in a literal) is never accepted.
+    """
+    if not isinstance(query, six.string_types):
+        return None
+
+    query = _LEADING_COMMENTS_RE.sub('', query).rstrip().rstrip(';').rstrip()
+
+    if not _SELECT_RE.match(query) or ';' in query or \
+            _NOT_CURSOR_QUERY_RE.search(query):
+        return None
+
+    return query
+
 
 class Connection(BaseConnection):
     """
@@ -115,6 +145,10 @@ class Connection(BaseConnection):
       - This method is used to poll the data of query running on asynchronous
         connection.
 
+    * async_fetchmany_2darray(records, formatted_exception_msg, offset)
+      - This method is used to fetch the result of the query executed on the
+        asynchronous connection (from the result spool, when spooled).
+
     * status_message()
       - Returns the status message returned by the last command executed on
       the server.
@@ -162,6 +196,9 @@ class Connection(BaseConnection):
         self.async_ = async_
         self.__async_cursor = None
         self.__async_query_id = None
+        self.__async_status_message = None
+        self.__spool = None
+        self.__spool_pos = 0
         self.__backend_pid = None
         self.execution_aborted = False
         self.row_count = 0
@@ -468,26 +505,27 @@ class Connection(BaseConnection):
                 manager.ver = row['version']
                 manager.sversion = self.conn.server_version
 
-        status = _execute(cur, """
-SELECT
-    db.oid as did, db.datname, db.datallowconn,
-    pg_encoding_to_char(db.encoding) AS serverencoding,
-    has_database_privilege(db.oid, 'CREATE') as cancreate, datlastsysoid
-FROM
-    pg_database db
-WHERE db.datname = current_database()""")
+        # The database and the user information is shared by all the
+        # connections of the server, fetch it only when it is not known yet.
+        manager.db_info = manager.db_info or dict()
+        if manager.metadata_expired('db_info') or not any(
+            isinstance(info, dict) and info.get('datname') == self.db
+            for info in manager.db_info.values()
+        ):
+            status = _execute(cur, manager.DB_INFO_SQL)
 
-        if status is None:
-            manager.db_info = manager.db_info or dict()
-            if cur.rowcount > 0:
-                res = cur.fetchmany(1)[0]
-                manager.db_info[res['did']] = res.copy()
+            if status is None and cur.rowcount > 0:
+                rows = cur.fetchall()
+                manager.update_db_info(rows)
 
                 # We do not have database oid for the maintenance database.
-                if len(manager.db_info) == 1:
-                    manager.did = res['did']
+                # The current database is the first one.
+                if manager.did is None and self.db == manager.db:
+                    manager.did = rows[0]['did']
 
-        status = _execute(cur, """
+        if manager.metadata_expired('user_info') or \
+                getattr(manager, 'user_info', None) is None:
+            status = _execute(cur, """
 SELECT
     oid as id, rolname as name, rolsuper as is_superuser,
     CASE WHEN rolsuper THEN true ELSE rolcreaterole END as can_create_role,
@@ -497,10 +535,12 @@ FROM
 WHERE
     rolname = current_user""")
 
-        if status is None:
-            manager.user_info = dict()
-            if cur.rowcount > 0:
-                manager.user_info = cur.fetchmany(1)[0]
+            if status is None:
+                manager.user_info = dict()
+                if cur.rowcount > 0:
+                    manager.user_info = cur.fetchmany(1)[0]
+                manager.metadata_fetched['user_info'] = \
+                    datetime.datetime.now()
 
         if 'password' in kwargs:
             manager.password = kwargs['password']
@@ -524,7 +564,7 @@ WHERE
 
         return True, None
 
-    def __cursor(self, server_cursor=False):
+    def __cursor(self, server_cursor=False, tuple_cursor=False):
 
         if not get_crypt_key()[0]:
             raise CryptKeyMissing()
@@ -545,7 +585,7 @@ WHERE
             self.conn_id.encode('utf-8')
         ), None)
 
-        if self.connected() and cur and not cur.closed:
+        if self.connected() and cur and not cur.closed and not tuple_cursor:
             if not server_cursor or (server_cursor and cur.name):
                 return True, cur
 
@@ -576,6 +616,10 @@ WHERE
                 cur = self.conn.cursor(
                     name=cursor_name, cursor_factory=DictCursor
                 )
+            elif tuple_cursor:
+                # The tuple cursor returns the rows positionally, and it is
+                # not shared with the other executions in this request.
+                return True, self.conn.cursor(cursor_factory=TupleCursor)
             else:
                 cur = self.conn.cursor(cursor_factory=DictCursor)
         except psycopg2.Error as pe:
@@ -601,7 +645,7 @@ WHERE
                         )
                     )
                     return self.__attempt_execution_reconnect(
-                        self.__cursor, server_cursor
+                        self.__cursor, server_cursor, tuple_cursor
                     )
                 else:
                     raise ConnectionLost(
@@ -669,15 +713,23 @@ WHERE
         """
         To fetch query result and generate CSV output
 
+        A plain SELECT query is executed through a server side cursor, and
+        the rows are fetched from it in batches of the given size, so that
+        the whole result is never kept in the memory. The cursor is declared
+        using the DECLARE statement, as psycopg2 does not allow to create a
+        named cursor on an asynchronous connection.
+
+        Any other query is executed as it is.
+
         Args:
             query: SQL
             params: Additional parameters
             formatted_exception_msg: For exception
-            records: Number of initial records
+            records: Number of records fetched at once
         Returns:
             Generator response
         """
-        status, cur = self.__cursor()
+        status, cur = self.__cursor(tuple_cursor=True)
         self.row_count = 0
 
         if not status:
@@ -695,10 +747,77 @@ WHERE
                 query_id=query_id
             )
         )
+
+        # Name of the server side cursor, and whether we have started the
+        # transaction for it.
+        cursor_name = None
+        began = False
+
+        select_query = _plain_select_query(query)
+        txn_status = self.conn.get_transaction_status()
+        if select_query is not None and txn_status in (
+            psycopg2.extensions.TRANSACTION_STATUS_IDLE,
+            psycopg2.extensions.TRANSACTION_STATUS_INTRANS
+        ):
+            cursor_name = 'pgadmin_csv_{0}'.format(query_id)
+            # The cursor lives only till the end of the transaction.
+            began = self.conn.autocommit and \
+                txn_status == psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+        def release():
+            """
+            Close the server side cursor (and end the transaction started
+            for it), and the cursor object.
+            """
+            try:
+                txn_status = self.conn.get_transaction_status()
+                if began:
+                    self.__internal_blocking_execute(
+                        cur,
+                        'ROLLBACK' if txn_status ==
+                        psycopg2.extensions.TRANSACTION_STATUS_INERROR
+                        else 'COMMIT',
+                        None
+                    )
+                elif cursor_name is not None and txn_status == \
+                        psycopg2.extensions.TRANSACTION_STATUS_INTRANS:
+                    self.__internal_blocking_execute(
+                        cur, 'CLOSE {0}'.format(cursor_name), None
+                    )
+            except psycopg2.Error as pe:
+                current_app.logger.exception(pe)
+            finally:
+                if not cur.closed:
+                    cur.close()
+
+        def fetch():
+            if cursor_name is None:
+                return cur.fetchmany(records)
+
+            self.__internal_blocking_execute(
+                cur, 'FETCH FORWARD {0} FROM {1}'.format(
+                    records, cursor_name
+                ), None
+            )
+            return cur.fetchall()
+
         try:
-            self.__internal_blocking_execute(cur, query, params)
+            if began:
+                self.__internal_blocking_execute(cur, 'BEGIN', None)
+
+            if cursor_name is None:
+                self.__internal_blocking_execute(cur, query, params)
+            else:
+                self.__internal_blocking_execute(
+                    cur, 'DECLARE {0} NO SCROLL CURSOR FOR {1}'.format(
+                        cursor_name, select_query
+                    ), params
+                )
+
+            # The execution errors (i.e. division by zero) of the server
+            # side cursor are reported by the first fetch.
+            results = fetch()
         except psycopg2.Error as pe:
-            cur.close()
             errmsg = self._formatted_exception_msg(pe, formatted_exception_msg)
             current_app.logger.error(
                 u"failed to execute query ((with server cursor) "
@@ -711,11 +830,13 @@ WHERE
                     query_id=query_id
                 )
             )
+            release()
             return False, errmsg
 
         # http://initd.org/psycopg/docs/cursor.html#cursor.description
         # to avoid no-op
         if cur.description is None:
+            release()
             return False, \
                 gettext('The query executed did not return any data.')
 
@@ -726,7 +847,7 @@ WHERE
             We will dump json data as proper json instead of unicode values
 
             Args:
-                json_columns: Columns which contains json data
+                json_columns: Positions of the columns with json data
                 results: Query result
 
             Returns:
@@ -734,151 +855,80 @@ WHERE
             """
             # Only if Python2 and there are columns with JSON type
             if IS_PY2 and len(json_columns) > 0:
-                temp_results = []
-                for row in results:
-                    res = dict()
-                    for k, v in row.items():
-                        if k in json_columns:
-                            res[k] = json.dumps(v)
-                        else:
-                            res[k] = v
-                    temp_results.append(res)
-                results = temp_results
-            return results
-
-        def convert_keys_to_unicode(results, conn_encoding):
-            """
-            [ This is only for Python2.x]
-            We need to convert all keys to unicode as psycopg2
-            sends them as string
-
-            Args:
-                res: Query result set from psycopg2
-                conn_encoding: Connection encoding
-
-            Returns:
-                Result set (With all the keys converted to unicode)
-            """
-            new_results = []
-            for row in results:
-                new_results.append(
-                    dict([(k.decode(conn_encoding), v)
-                          for k, v in row.items()])
-                )
-            return new_results
-
-        def handle_null_values(results, replace_nulls_with):
-            """
-            This function is used to replace null values with the given string
-
-            :param results:
-            :param replace_nulls_with: null values will be replaced by this
-            string.
-            :return: modified result
-            """
-
-            temp_results = []
-            for row in results:
-                res = dict()
-                for k, v in row.items():
-                    if v is None:
-                        res[k] = replace_nulls_with
-                    else:
-                        res[k] = v
-                temp_results.append(res)
-            results = temp_results
-
+                results = [
+                    [json.dumps(v) if idx in json_columns else v
+                     for idx, v in enumerate(row)]
+                    for row in results
+                ]
             return results
 
         def gen(quote='strings', quote_char="'", field_separator=',',
                 replace_nulls_with=None):
+            try:
+                if not results:
+                    yield gettext(
+                        'The query executed did not return any data.'
+                    )
+                    return
+
+                header = []
+                json_columns = set()
+                conn_encoding = encodings[cur.connection.encoding]
+
+                for idx, c in enumerate(cur.ordered_description()):
+                    # This is to handle the case in which column name is
+                    # non-ascii
+                    column_name = c.to_dict()['name']
+                    if IS_PY2:
+                        column_name = column_name.decode(conn_encoding)
+                    header.append(column_name)
+                    if c.to_dict()['type_code'] in ALL_JSON_TYPES:
+                        json_columns.add(idx)
+
+                if quote == 'strings':
+                    quote = csv.QUOTE_NONNUMERIC
+                elif quote == 'all':
+                    quote = csv.QUOTE_ALL
+                else:
+                    quote = csv.QUOTE_NONE
 
-            results = cur.fetchmany(records)
-            if not results:
-                if not cur.closed:
-                    cur.close()
-                yield gettext('The query executed did not return any data.')
-                return
-
-            header = []
-            json_columns = []
-            conn_encoding = encodings[cur.connection.encoding]
-
-            for c in cur.ordered_description():
-                # This is to handle the case in which column name is non-ascii
-                column_name = c.to_dict()['name']
-                if IS_PY2:
-                    column_name = column_name.decode(conn_encoding)
-                header.append(column_name)
-                if c.to_dict()['type_code'] in ALL_JSON_TYPES:
-                    json_columns.append(column_name)
-
-            if IS_PY2:
-                results = convert_keys_to_unicode(results, conn_encoding)
-
-            res_io = StringIO()
-
-            if quote == 'strings':
-                quote = csv.QUOTE_NONNUMERIC
-            elif quote == 'all':
-                quote = csv.QUOTE_ALL
-            else:
-                quote = csv.QUOTE_NONE
-
-            if hasattr(str, 'decode'):
-                # Decode the field_separator
-                try:
-                    field_separator = field_separator.decode('utf-8')
-                except Exception as e:
-                    current_app.logger.error(e)
-
-                # Decode the quote_char
-                try:
-                    quote_char = quote_char.decode('utf-8')
-                except Exception as e:
-                    current_app.logger.error(e)
-
-            csv_writer = csv.DictWriter(
-                res_io, fieldnames=header, delimiter=field_separator,
-                quoting=quote,
-                quotechar=quote_char,
-                replace_nulls_with=replace_nulls_with
-            )
-
-            csv_writer.writeheader()
-            results = handle_json_data(json_columns, results)
-            # Replace the null values with given string if configured.
-            if replace_nulls_with is not None:
-                results = handle_null_values(results, replace_nulls_with)
-            csv_writer.writerows(results)
-
-            yield res_io.getvalue()
+                if hasattr(str, 'decode'):
+                    # Decode the field_separator
+                    try:
+                        field_separator = field_separator.decode('utf-8')
+                    except Exception as e:
+                        current_app.logger.error(e)
 
-            while True:
-                results = cur.fetchmany(records)
+                    # Decode the quote_char
+                    try:
+                        quote_char = quote_char.decode('utf-8')
+                    except Exception as e:
+                        current_app.logger.error(e)
 
-                if not results:
-                    if not cur.closed:
-                        cur.close()
-                    break
+                # The same writer (and buffer) is used for all the batches,
+                # and it replaces the null values with the given string
+                # itself (if configured).
                 res_io = StringIO()
-
-                csv_writer = csv.DictWriter(
-                    res_io, fieldnames=header, delimiter=field_separator,
+                csv_writer = csv.writer(
+                    res_io, delimiter=field_separator,
                     quoting=quote,
                     quotechar=quote_char,
                     replace_nulls_with=replace_nulls_with
                 )
 
-                if IS_PY2:
-                    results = convert_keys_to_unicode(results, conn_encoding)
+                csv_writer.writerow(header)
+
+                rows = results
+                while rows:
+                    csv_writer.writerows(handle_json_data(json_columns, rows))
 
-                results = handle_json_data(json_columns, results)
-                # Replace the null values with given string if configured.
-                if replace_nulls_with is not None:
-                    results = handle_null_values(results, replace_nulls_with)
-                csv_writer.writerows(results)
-                yield res_io.getvalue()
+                    yield res_io.getvalue()
+                    res_io.seek(0)
+                    res_io.truncate(0)
+
+                    rows = fetch()
+            finally:
+                release()
 
         return True, gen
 
@@ -954,7 +1004,8 @@ WHERE
         params = self.escape_params_sqlascii(params)
 
         self.__async_cursor = None
-        status, cur = self.__cursor()
+        self._close_spool()
+        status, cur = self.__cursor(tuple_cursor=True)
 
         if not status:
             return False, str(cur)
@@ -1219,45 +1270,52 @@ WHERE
         return True, {'columns': columns, 'rows': rows}
 
     def async_fetchmany_2darray(self, records=2000,
-                                formatted_exception_msg=False):
+                                formatted_exception_msg=False, offset=None):
         """
         User should poll and check if status is ASYNC_OK before calling this
         function
         Args:
           records: no of records to fetch. use -1 to fetchall.
           formatted_exception_msg:
+          offset: fetch the records starting at the given row offset, only
+                  supported when the result has been spooled.
 
         Returns:
 
         """
+        if self.__spool is not None:
+            return self._fetch_from_spool(records, offset)
+
         cur = self.__async_cursor
         if not cur:
             return False, gettext(
                 "Cursor could not be found for the async connection."
             )
 
+        if offset is not None:
+            return False, gettext(
+                "Fetching the records at a given offset is only supported, "
+                "when the query result is spooled."
+            )
+
         if self.conn.isexecuting():
             return False, gettext(
                 "Asynchronous query execution/operation underway."
             )
 
         if self.row_count > 0:
-            result = []
             # For DDL operation, we may not have result.
             #
             # Because - there is not direct way to differentiate DML and
             # DDL operations, we need to rely on exception to figure
             # that out at the moment.
             try:
+                # The asynchronous cursor returns the rows as tuples, having
+                # the values in the order of the columns.
                 if records == -1:
-                    res = cur.fetchall()
+                    result = cur.fetchall()
                 else:
-                    res = cur.fetchmany(records)
-                for row in res:
-                    new_row = []
-                    for col in self.column_info:
-                        new_row.append(row[col['name']])
-                    result.append(new_row)
+                    result = cur.fetchmany(records)
             except psycopg2.ProgrammingError as e:
                 result = None
         else:
@@ -1268,6 +1326,85 @@ WHERE
 
         return True, result
 
+    def _fetch_from_spool(self, records, offset=None):
+        """
+        Returns the records from the spooled result. The records are read
+        sequentially, unless the offset is given.
+
+        Args:
+          records: no of records to fetch. use -1 to fetch all.
+          offset: row offset to fetch the records from.
+        """
+        if self.__spool.closed:
+            return False, gettext(
+                "The spooled result is no longer available."
+            )
+
+        if offset is None:
+            offset = self.__spool_pos
+
+        try:
+            result = self.__spool.read(offset, records)
+        except (IOError, OSError) as e:
+            # The cursor has already been released, the result can not be
+            # served anymore.
+            current_app.logger.warning(
+                u"Failed to read the spooled result for (Query-id: "
+                u"{query_id}):\n{error}".format(
+                    query_id=self.__async_query_id, error=e
+                )
+            )
+            self.__spool.close()
+            return False, gettext(
+                "The spooled result is no longer available."
+            )
+
+        self.__spool_pos = offset + len(result)
+
+        return True, result
+
+    def _spool_result(self, cur):
+        """
+        Spool the result of the asynchronous cursor to a spool file, and
+        close the cursor, so that the result is not held in the memory by the
+        psycopg2/libpq client, while its pages are being fetched.
+
+        Args:
+          cur: asynchronous cursor having the result
+        """
+        spool = None
+        try:
+            spool = ResultSpool(
+                len(self.column_info), config.QUERY_TOOL_SPOOL_DIR,
+                source=cur.fetchmany,
+                batch_size=config.ON_DEMAND_RECORD_COUNT
+            )
+            spool.fill(-1)
+        except (psycopg2.ProgrammingError, IOError, OSError) as e:
+            # Keep serving the result from the cursor.
+            current_app.logger.warning(
+                u"Failed to spool the result for (Query-id: {query_id}):\n"
+                u"{error}".format(query_id=self.__async_query_id, error=e)
+            )
+            if spool is not None:
+                spool.close()
+            cur.scroll(0, mode='absolute')
+            return
+
+        self.__async_status_message = cur.statusmessage
+        # Release the result held by the cursor
+        cur.close()
+
+        self.__spool = spool
+        self.__spool_pos = 0
+
+    def _close_spool(self):
+        if self.__spool is not None:
+            self.__spool.close()
+            self.__spool = None
+        self.__spool_pos = 0
+        self.__async_status_message = None
+
     def connected(self):
         if self.conn:
             if not self.conn.closed:
@@ -1348,6 +1485,7 @@ Failed to reset the connection to the server due to following error:
         return self.execute_scalar('SELECT 1')
 
     def _release(self):
+        self._close_spool()
         if self.wasConnected:
             if self.conn:
                 self.conn.close()
@@ -1496,31 +1634,60 @@ Failed to reset the connection to the server due to following error:
                     pos += 1
 
             self.row_count = cur.rowcount
-            if not no_result:
+            # Spool the large results of the Query Tool (if configured), the
+            # records will be fetched from the spool file later.
+            if no_result and config.QUERY_TOOL_RESULT_SPOOLING and \
+                    self.__spool is None and \
+                    self.column_info is not None and \
+                    cur.rowcount > config.ON_DEMAND_RECORD_COUNT:
+                self._spool_result(cur)
+            elif not no_result:
                 if cur.rowcount > 0:
-                    result = []
                     # For DDL operation, we may not have result.
                     #
                     # Because - there is not direct way to differentiate DML
                     # and DDL operations, we need to rely on exception to
                     # figure that out at the moment.
                     try:
-                        for row in cur:
-                            new_row = []
-                            for col in self.column_info:
-                                new_row.append(row[col['name']])
-                            result.append(new_row)
-
+                        result = cur.fetchall()
                     except psycopg2.ProgrammingError:
                         result = None
 
         return status, result
 
+    def wait_for_server(self, timeout):
+        """
+        Waits till the database server sends any data (i.e. the result, or a
+        notice) on the asynchronous connection, at most timeout seconds. The
+        data is read by the next poll().
+
+        Args:
+            timeout: Maximum time to wait (in seconds)
+
+        Returns:
+            False, if nothing has been received in the given time.
+        """
+        if self.conn is None or self.conn.closed:
+            return True
+
+        try:
+            readable, _, _ = select.select(
+                [self.conn.fileno()], [], [], timeout
+            )
+        except (select.error, ValueError):
+            # Let the poll() report the error
+            return True
+
+        return len(readable) > 0
+
     def status_message(self):
         """
         This function will return the status message returned by the last
         command executed on the server.
         """
+        if self.__spool is not None:
+            return self.__async_status_message
+
         cur = self.__async_cursor
         if not cur:
             return gettext(
@@ -11,6 +11,10 @@
 Implementation of an extended cursor, which returns ordered dictionary when
 fetching results from it, and also takes care of the duplicate column name in
 result.
+
+It also implements a cursor, which returns the rows as plain tuples, used
+for the asynchronous query execution, where the rows are consumed
+positionally.
 """
 
 try:
@@ -240,3 +244,32 @@ class DictCursor(_cursor):
                 yield self._dict_tuple(next(it))
         except StopIteration:
             pass
+
+
+class TupleCursor(DictCursor):
+    """
+    TupleCursor
+
+    A cursor returning the rows as tuples (as the regular cursor does), but
+    the ordered description (with the duplicate column names taken care of)
+    is still available for the column information.
+
+    The values of a row are in the same order as the columns in the
+    ordered_description(), hence - no dictionary needs to be generated for
+    each row, only to be converted back to a list later.
+    """
+
+    def fetchmany(self, size=None):
+        """
+        Fetch many tuples.
+        """
+        return _cursor.fetchmany(self, size)
+
+    def fetchall(self):
+        """
+        Fetch all tuples.
+        """
+        return _cursor.fetchall(self)
+
+    def __iter__(self):
+        return _cursor.__iter__(self)
@@ -25,6 +25,8 @@ from pgadmin.model import Server, User
 from pgadmin.utils.exception import ConnectionLost, SSHTunnelConnectionLost,\
     CryptKeyMissing
 from pgadmin.utils.master_password import get_crypt_key
+from pgadmin.utils.driver.connection_scope import current_scope, \
+    register_scoped_connection
 
 if config.SUPPORT_SSH_TUNNEL:
     from sshtunnel import SSHTunnelForwarder, BaseSSHTunnelForwarderError
@@ -38,6 +40,17 @@ class ServerManager(object):
     And, acts as connection manager for that particular session.
     """
 
+    # Information about all the databases of the server. The current
+    # database is always the first one.
+    DB_INFO_SQL = u"""
+SELECT
+    db.oid as did, db.datname, db.datallowconn,
+    pg_encoding_to_char(db.encoding) AS serverencoding,
+    has_database_privilege(db.oid, 'CREATE') as cancreate, datlastsysoid
+FROM
+    pg_database db
+ORDER BY db.datname = current_database() DESC"""
+
     def __init__(self, server):
         self.connections = dict()
         self.local_bind_host = '127.0.0.1'
@@ -70,6 +83,8 @@ class ServerManager(object):
         self.ssl_mode = server.ssl_mode
         self.pinged = datetime.datetime.now()
         self.db_info = dict()
+        # Time, when the database/user information was fetched last time.
+        self.metadata_fetched = dict()
         self.server_types = None
         self.db_res = server.db_res
         self.passfile = server.passfile
@@ -141,8 +156,10 @@ class ServerManager(object):
 
         connections = res['connections'] = dict()
 
-        for conn_id in self.connections:
-            conn = self.connections[conn_id].as_dict()
+        # The connections may be added by the other threads in the meantime
+        # (see connection_scope).
+        for conn_id, conn in list(self.connections.items()):
+            conn = conn.as_dict()
 
             if conn is not None:
                 connections[conn_id] = conn
@@ -196,18 +213,13 @@ class ServerManager(object):
                         conn.connect()
 
                     if conn.connected():
-                        status, res = conn.execute_dict(u"""
-SELECT
-    db.oid as did, db.datname, db.datallowconn,
-    pg_encoding_to_char(db.encoding) AS serverencoding,
-    has_database_privilege(db.oid, 'CREATE') as cancreate, datlastsysoid
-FROM
-    pg_database db
-WHERE db.oid = {0}""".format(did))
+                        # Fetch all the databases at once, the other ones
+                        # are likely to be connected soon too.
+                        status, res = conn.execute_dict(self.DB_INFO_SQL)
 
-                        if status and len(res['rows']) > 0:
-                            for row in res['rows']:
-                                self.db_info[did] = row
+                        if status:
+                            self.update_db_info(res['rows'])
+                            if did in self.db_info:
                                 database = self.db_info[did]['datname']
 
                         if did not in self.db_info:
@@ -226,11 +238,22 @@ WHERE db.oid = {0}""".format(did))
             else:
                 raise ConnectionLost(self.sid, None, None)
 
+        # Use the dedicated connection of the scope of the current thread,
+        # instead of the default connection of the database (if any).
+        scope = current_scope() if conn_id is None else None
+        if scope is not None:
+            conn_id = u'{0}:{1}'.format(scope, database)
+
         my_id = (u'CONN:{0}'.format(conn_id)) if conn_id is not None else \
             (u'DB:{0}'.format(database))
 
         self.pinged = datetime.datetime.now()
 
+        if scope is not None:
+            return self._scoped_connection(
+                my_id, conn_id, database, auto_reconnect
+            )
+
         if my_id in self.connections:
             return self.connections[my_id]
         else:
@@ -246,6 +269,65 @@ WHERE db.oid = {0}""".format(did))
 
             return self.connections[my_id]
 
+    def _scoped_connection(self, my_id, conn_id, database, auto_reconnect):
+        """
+        Returns the (connected) connection of the current connection scope
+        for the database.
+        """
+        if my_id not in self.connections:
+            self.connections[my_id] = Connection(
+                self, my_id, database, auto_reconnect, 0
+            )
+        conn = self.connections[my_id]
+        register_scoped_connection(self, conn_id)
+
+        if not conn.connected():
+            status, msg = conn.connect()
+            if not status:
+                raise Exception(msg)
+
+        return conn
+
+    def update_db_info(self, rows):
+        """
+        Update the information about the databases fetched using the
+        DB_INFO_SQL query.
+
+        The query fetches all the databases of the server, hence - the
+        databases, which are not part of it, have been dropped and are
+        removed from the information. The other information kept in it
+        (i.e. pgAgent) is not touched.
+        """
+        db_info = dict(
+            (key, info) for key, info in self.db_info.items()
+            if not isinstance(info, dict) or 'did' not in info
+        )
+        for row in rows:
+            db_info[row['did']] = dict(row)
+        self.db_info = db_info
+        self.metadata_fetched['db_info'] = datetime.datetime.now()
+
+    def metadata_expired(self, name):
+        """
+        Returns True, if the given information (i.e. 'db_info', 'user_info')
+        needs to be fetched again from the server.
+
+        The information is shared by all the connections of the server for
+        config.SERVER_METADATA_CACHE_TTL seconds, or until it is invalidated.
+        """
+        fetched = self.metadata_fetched.get(name, None)
+
+        return fetched is None or \
+            (datetime.datetime.now() - fetched).total_seconds() >= \
+            config.SERVER_METADATA_CACHE_TTL
+
+    def invalidate_metadata(self):
+        """
+        Fetch the database/user information again for the next connection.
+        i.e. after creating, renaming, or dropping a database.
+        """
+        self.metadata_fetched = dict()
+
     def _restore(self, data):
         """
         Helps restoring to reconnect the auto-connect connections smoothly on
@@ -391,6 +473,7 @@ WHERE db.oid = {0}""".format(did))
                     del self.db_info[did]
 
                 if len(self.connections) == 0:
+                    self.invalidate_metadata()
                     self.ver = None
                     self.sversion = None
                     self.server_type = None
@@ -407,6 +490,7 @@ WHERE db.oid = {0}""".format(did))
             self.connections[con]._release()
 
         self.connections = dict()
+        self.invalidate_metadata()
         self.ver = None
         self.sversion = None
         self.server_type = None
@@ -0,0 +1,156 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Implementation of ResultSpool.
+
+The result of a query executed on an asynchronous connection is spooled to
+a temporary file, so that the cursor (and the result buffered by the
+psycopg2/libpq client for it) can be released, and the pages requested by
+the Query Tool can be served from the file at any offset.
+
+The rows are fetched from the source (i.e. the cursor) in batches, when they
+are requested, or all of them at once by fill(-1). The cursor can be
+released, once all the rows have been spooled.
+"""
+
+import os
+import pickle
+import tempfile
+from bisect import bisect_right
+
+
+class ResultSpool(object):
+    """
+    class ResultSpool(object)
+
+        The rows are stored in chunks. Each chunk holds the values of a batch
+        of the rows column-wise (one list per column), and is pickled
+        separately. Only the position of each chunk in the file is kept in
+        the memory.
+
+    Methods:
+    -------
+    * write(rows)
+      - Append a batch of rows (list of lists) to the spool.
+
+    * fill(count)
+      - Spool the rows from the source, till (at least) the given number of
+        the rows have been spooled. Use -1 as count to spool all of them.
+
+    * read(offset, count)
+      - Returns the rows (list of lists) starting at the given offset (after
+        spooling them from the source, if required). Use -1 as count to read
+        all the remaining rows.
+
+    * close()
+      - Close (and remove) the spool file.
+    """
+
+    def __init__(self, column_count, directory=None, source=None,
+                 batch_size=1000):
+        """
+        Args:
+            column_count: Number of the columns of the result
+            directory: Directory of the spool file (system temporary
+                directory, if not given)
+            source: Function returning the next batch of (at most the given
+                number of) rows, i.e. fetchmany of the cursor
+            batch_size: Number of the rows fetched from the source at once
+        """
+        self.column_count = column_count
+        self.row_count = 0
+        self._source = source
+        self._batch_size = batch_size
+
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        # The file is removed automatically, when it is closed.
+        self._file = tempfile.TemporaryFile(
+            prefix='pgadmin_spool_', dir=directory or None
+        )
+        # List of (first row number, file position, size) for each chunk.
+        self._chunks = []
+        self._chunk_rows = []
+
+    def write(self, rows):
+        if not rows:
+            return
+
+        columns = [
+            [row[idx] for row in rows] for idx in range(self.column_count)
+        ]
+        data = pickle.dumps((len(rows), columns), -1)
+
+        self._file.seek(0, os.SEEK_END)
+        self._chunks.append((self.row_count, self._file.tell(), len(data)))
+        self._chunk_rows.append(self.row_count)
+        self._file.write(data)
+
+        self.row_count += len(rows)
+
+    def _read_chunk(self, idx):
+        first_row, pos, size = self._chunks[idx]
+        self._file.seek(pos)
+        count, columns = pickle.loads(self._file.read(size))
+
+        if self.column_count == 0:
+            return first_row, [[] for _ in range(count)]
+        return first_row, [list(row) for row in zip(*columns)]
+
+    @property
+    def complete(self):
+        """True, if all the rows of the source have been spooled."""
+        return self._source is None
+
+    def fill(self, count):
+        while self._source is not None and \
+                (count < 0 or self.row_count < count):
+            rows = self._source(self._batch_size)
+            if rows:
+                self.write(rows)
+            if not rows or len(rows) < self._batch_size:
+                self._source = None
+
+    def read(self, offset, count):
+        if offset < 0 or count == 0:
+            return []
+
+        self.fill(-1 if count < 0 else offset + count)
+
+        if offset >= self.row_count:
+            return []
+
+        end = self.row_count if count < 0 else \
+            min(offset + count, self.row_count)
+
+        result = []
+        idx = bisect_right(self._chunk_rows, offset) - 1
+        while offset < end:
+            first_row, rows = self._read_chunk(idx)
+            rows = rows[offset - first_row:end - first_row]
+            result.extend(rows)
+            offset += len(rows)
+            idx += 1
+
+        return result
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._source = None
+        self._chunks = []
+        self._chunk_rows = []
+        self.row_count = 0
+
+    @property
+    def closed(self):
+        return self._file is None
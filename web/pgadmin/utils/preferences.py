@@ -16,7 +16,7 @@ import decimal
 import simplejson as json
 
 import dateutil.parser as dateutil_parser
-from flask import current_app
+from flask import current_app, g, has_app_context
 from flask_babelex import gettext
 from flask_security import current_user
 
@@ -25,6 +25,34 @@ from pgadmin.model import db, Preferences as PrefTable, \
     PreferenceCategory as PrefCategoryTbl
 
 
+def _user_preferences(uid):
+    """
+    Returns the snapshot of the preferences of the user for the current
+    request, i.e. the values stored in the configuration database (by the
+    preference id), and the values converted in the proper format (filled on
+    demand).
+
+    All the preferences of the user are loaded using a single query, once per
+    request.
+    """
+    snapshot = g.get('user_preferences', None) if has_app_context() \
+        else None
+
+    if snapshot is None or snapshot['uid'] != uid:
+        snapshot = {
+            'uid': uid,
+            'values': dict(
+                db.session.query(UserPrefTable.pid, UserPrefTable.value)
+                .filter_by(uid=uid).all()
+            ),
+            'typed': dict()
+        }
+        if has_app_context():
+            g.user_preferences = snapshot
+
+    return snapshot
+
+
 class _Preference(object):
     """
     Internal class representing module, and categoy bound preference.
@@ -103,56 +131,71 @@ class _Preference(object):
 
         :returns: value for this preference.
         """
-        res = UserPrefTable.query.filter_by(
-            pid=self.pid
-        ).filter_by(uid=current_user.id).first()
+        snapshot = _user_preferences(current_user.id)
 
+        if self.pid not in snapshot['typed']:
+            snapshot['typed'][self.pid] = self._value(
+                snapshot['values'].get(self.pid, None)
+            )
+
+        return snapshot['typed'][self.pid]
+
+    def _value(self, value):
+        """
+        _value
+        Convert the value stored in the configuration table in the proper
+        format.
+
+        :param value: value stored for the user (None, if not available)
+
+        :returns: value for this preference.
+        """
         # Could not find any preference for this user, return default value.
-        if res is None:
+        if value is None:
             return self.default
 
         # The data stored in the configuration will be in string format, we
         # need to convert them in proper format.
         if self._type == 'boolean' or self._type == 'switch' or \
                 self._type == 'node':
-            return res.value == 'True'
+            return value == 'True'
         if self._type == 'integer':
             try:
-                return int(res.value)
+                return int(value)
             except Exception as e:
                 current_app.logger.exeception(e)
                 return self.default
         if self._type == 'numeric':
             try:
-                return decimal.Decimal(res.value)
+                return decimal.Decimal(value)
             except Exception as e:
                 current_app.logger.exeception(e)
                 return self.default
         if self._type == 'date' or self._type == 'datetime':
             try:
-                return dateutil_parser.parse(res.value)
+                return dateutil_parser.parse(value)
             except Exception as e:
                 current_app.logger.exeception(e)
                 return self.default
         if self._type == 'options':
             for opt in self.options:
-                if 'value' in opt and opt['value'] == res.value:
-                    return res.value
+                if 'value' in opt and opt['value'] == value:
+                    return value
             if self.select2 and self.select2['tags']:
-                return res.value
+                return value
             return self.default
         if self._type == 'text':
-            if res.value == '' and (self.allow_blanks is None or
-                                    not self.allow_blanks):
+            if value == '' and (self.allow_blanks is None or
+                                not self.allow_blanks):
                 return self.default
         if self._type == 'keyboardshortcut':
             try:
-                return json.loads(res.value)
+                return json.loads(value)
             except Exception as e:
                 current_app.logger.exeception(e)
                 return self.default
 
-        return res.value
+        return value
 
     def set(self, value):
         """
@@ -233,6 +276,11 @@ class _Preference(object):
             pref.value = value
         db.session.commit()
 
+        # Keep the snapshot of the preferences for this request up to date
+        snapshot = _user_preferences(current_user.id)
+        snapshot['values'][self.pid] = value
+        snapshot['typed'].pop(self.pid, None)
+
         return True, None
 
     def to_json(self):
@@ -509,12 +557,6 @@ class Preferences(object):
 
     @staticmethod
     def raw_value(_module, _preference, _category=None, _user_id=None):
-        # Find the entry for this module in the configuration database.
-        module = ModulePrefTable.query.filter_by(name=_module).first()
-
-        if module is None:
-            return None
-
         if _category is None:
             _category = _module
 
@@ -523,6 +565,20 @@ class Preferences(object):
             if _user_id is None:
                 return None
 
+        # Use the snapshot of the preferences of the user, when the
+        # preference has already been registered.
+        m = Preferences.modules.get(_module, None)
+        if m is not None and _category in m.categories and \
+                _preference in m.categories[_category]['preferences']:
+            pref = m.categories[_category]['preferences'][_preference]
+            return _user_preferences(_user_id)['values'].get(pref.pid, None)
+
+        # Find the entry for this module in the configuration database.
+        module = ModulePrefTable.query.filter_by(name=_module).first()
+
+        if module is None:
+            return None
+
         cat = PrefCategoryTbl.query.filter_by(
             mid=module.id).filter_by(name=_category).first()
 
@@ -21,19 +21,20 @@ import hmac
 import hashlib
 import os
 import random
+import sqlite3
 import string
 import time
 import config
 from uuid import uuid4
-from threading import Lock
+from threading import Lock, local
 from flask import current_app, request, flash, redirect
 from flask_login import login_url
 from pgadmin.utils.ajax import make_json_response
 
 try:
-    from cPickle import dump, load
+    from cPickle import dump, load, dumps, loads, HIGHEST_PROTOCOL
 except ImportError:
-    from pickle import dump, load
+    from pickle import dump, load, dumps, loads, HIGHEST_PROTOCOL
 
 try:
     from collections import OrderedDict
@@ -55,8 +56,69 @@ def _calc_hmac(body, secret):
 sess_lock = Lock()
 LAST_CHECK_SESSION_FILES = None
 
+# The session managers serialize the access to a session using one of these
+# locks (chosen by the session id), so that the requests of the different
+# sessions do not wait for each other.
+SESSION_LOCK_STRIPES = 64
+session_locks = [Lock() for _ in range(SESSION_LOCK_STRIPES)]
+
+
+def session_lock(sid):
+    """Returns the lock for the given session id."""
+    return session_locks[hash(sid) % SESSION_LOCK_STRIPES]
+
+
+class TrackedDict(dict):
+    """
+    Dictionary, which remembers the keys changed since the last write of the
+    session, so that only their values are written again (see
+    ManagedSession.SPLIT_KEYS).
+
+    It is stored as a plain dictionary.
+    """
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        self.changed_keys = set()
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+    def __setitem__(self, key, value):
+        self.changed_keys.add(key)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self.changed_keys.add(key)
+        dict.__delitem__(self, key)
+
+    def clear(self):
+        self.changed_keys.update(self.keys())
+        dict.clear(self)
+
+    def pop(self, key, *args):
+        self.changed_keys.add(key)
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        self.changed_keys.add(key)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        self.changed_keys.add(key)
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
 
 class ManagedSession(CallbackDict, SessionMixin):
+    # The changes of the entries of these dictionaries (i.e. the Query Tool
+    # transactions in 'gridData') are tracked separately, as they are changed
+    # in place.
+    SPLIT_KEYS = ('gridData', '__debugger_sessions')
+
     def __init__(self, initial=None, sid=None, new=False, randval=None,
                  hmac_digest=None):
         def on_update(self):
@@ -71,6 +133,61 @@ class ManagedSession(CallbackDict, SessionMixin):
         self.force_write = False
         self.hmac_digest = hmac_digest
         self.permanent = True
+        # Keys of the stored entries (used by the SQLite backend).
+        self.stored_keys = None
+        # Keys changed since the last write.
+        self.changed_keys = set()
+
+        for name in self.SPLIT_KEYS:
+            if isinstance(self.get(name), dict):
+                dict.__setitem__(self, name, TrackedDict(self[name]))
+
+    def __setitem__(self, key, value):
+        if key in self.SPLIT_KEYS and isinstance(value, dict):
+            # The changes of the same dictionary are tracked by itself.
+            if value is not self.get(key):
+                value = TrackedDict(value)
+                self.changed_keys.add(key)
+        else:
+            self.changed_keys.add(key)
+        CallbackDict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self.changed_keys.add(key)
+        CallbackDict.__delitem__(self, key)
+
+    def clear(self):
+        self.changed_keys.update(self.keys())
+        CallbackDict.clear(self)
+
+    def pop(self, key, *args):
+        self.changed_keys.add(key)
+        return CallbackDict.pop(self, key, *args)
+
+    def popitem(self):
+        key, value = CallbackDict.popitem(self)
+        self.changed_keys.add(key)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        elif key not in self.SPLIT_KEYS:
+            # The value may be changed in place
+            self.changed_keys.add(key)
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def reset_changes(self):
+        """Forget the changes, after the session has been written."""
+        self.changed_keys = set()
+        for name in self.SPLIT_KEYS:
+            value = self.get(name)
+            if isinstance(value, TrackedDict):
+                value.changed_keys = set()
 
     def sign(self, secret):
         if not self.hmac_digest:
@@ -107,8 +224,18 @@ class SessionManager(object):
         'Store a managed session'
         raise NotImplementedError
 
+    def cleanup(self, lifetime):
+        'Remove the sessions not written for longer than the given lifetime'
+        pass
+
 
 class CachingSessionManager(SessionManager):
+    """
+    Keeps the recently used sessions in the memory.
+
+    The global 'sess_lock' only guards the cache itself, the session storage
+    is accessed under the lock of the session (see session_lock).
+    """
     def __init__(self, parent, num_to_store, skip_paths=[]):
         self.parent = parent
         self.num_to_store = num_to_store
@@ -137,28 +264,26 @@ class CachingSessionManager(SessionManager):
         return session
 
     def remove(self, sid):
-        with sess_lock:
+        with session_lock(sid):
             self.parent.remove(sid)
-            if sid in self._cache:
-                del self._cache[sid]
+            with sess_lock:
+                self._cache.pop(sid, None)
 
     def exists(self, sid):
         with sess_lock:
             if sid in self._cache:
                 return True
-            return self.parent.exists(sid)
+        return self.parent.exists(sid)
 
     def get(self, sid, digest):
         session = None
-        with sess_lock:
-            if sid in self._cache:
-                session = self._cache[sid]
+        with session_lock(sid):
+            with sess_lock:
+                # reset order in Dict
+                session = self._cache.pop(sid, None)
                 if session and session.hmac_digest != digest:
                     session = None
 
-                # reset order in Dict
-                del self._cache[sid]
-
             if not session:
                 session = self.parent.get(sid, digest)
 
@@ -167,13 +292,14 @@ class CachingSessionManager(SessionManager):
                 if request.path.startswith(sp):
                     return session
 
-            self._cache[sid] = session
+            with sess_lock:
+                self._cache[sid] = session
         self._normalize()
 
         return session
 
     def put(self, session):
-        with sess_lock:
+        with session_lock(session.sid):
             self.parent.put(session)
 
             # Do not store the session if skip paths
@@ -181,15 +307,14 @@ class CachingSessionManager(SessionManager):
                 if request.path.startswith(sp):
                     return
 
-            if session.sid in self._cache:
-                try:
-                    del self._cache[session.sid]
-                except Exception:
-                    pass
-
-            self._cache[session.sid] = session
+            with sess_lock:
+                self._cache.pop(session.sid, None)
+                self._cache[session.sid] = session
         self._normalize()
 
+    def cleanup(self, lifetime):
+        self.parent.cleanup(lifetime)
+
 
 class FileBackedSessionManager(SessionManager):
 
@@ -285,6 +410,234 @@ class FileBackedSessionManager(SessionManager):
             )
 
 
+class SqliteSessionManager(SessionManager):
+    """
+    Stores the sessions in a SQLite database.
+
+    Every entry of a session is pickled and stored separately, and the
+    entries of the dictionaries listed in SPLIT_KEYS (i.e. the Query Tool
+    transactions in 'gridData') are stored separately too. Only the entries
+    changed since the last write (see ManagedSession.changed_keys) are
+    pickled and written again.
+    """
+
+    SPLIT_KEYS = ManagedSession.SPLIT_KEYS
+
+    def __init__(self, path, secret, disk_write_delay, skip_paths=[]):
+        self.path = path
+        self.secret = secret
+        self.disk_write_delay = disk_write_delay
+        self.skip_paths = skip_paths
+        self._local = local()
+
+        dirname = os.path.dirname(self.path)
+        if dirname and not os.path.exists(dirname):
+            os.makedirs(dirname)
+
+        conn = self._connection()
+        conn.execute('PRAGMA journal_mode=WAL')
+        with conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS session ('
+                'sid TEXT PRIMARY KEY, randval TEXT, hmac_digest TEXT, '
+                'last_write REAL NOT NULL)'
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS session_entry ('
+                'sid TEXT NOT NULL, name TEXT NOT NULL, subkey TEXT NOT NULL, '
+                'value BLOB NOT NULL, PRIMARY KEY (sid, name, subkey))'
+            )
+
+    def _connection(self):
+        # The SQLite connections can not be shared between the threads.
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(
+                self.path, timeout=config.SQLITE_TIMEOUT / 1000.0
+            )
+        return conn
+
+    def _skip(self):
+        for sp in self.skip_paths:
+            if request.path.startswith(sp):
+                return True
+        return False
+
+    def exists(self, sid):
+        return self._connection().execute(
+            'SELECT 1 FROM session WHERE sid = ?', (sid,)
+        ).fetchone() is not None
+
+    def remove(self, sid):
+        conn = self._connection()
+        with conn:
+            conn.execute('DELETE FROM session_entry WHERE sid = ?', (sid,))
+            conn.execute('DELETE FROM session WHERE sid = ?', (sid,))
+
+    def new_session(self):
+        sid = str(uuid4())
+
+        while self.exists(sid):
+            sid = str(uuid4())
+
+        # Do not store the session if skip paths
+        if not self._skip():
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    'INSERT INTO session (sid, last_write) VALUES (?, ?)',
+                    (sid, time.time())
+                )
+
+        return ManagedSession(sid=sid)
+
+    def get(self, sid, digest):
+        'Retrieve a managed session by session-id, checking the HMAC digest'
+        conn = self._connection()
+
+        row = conn.execute(
+            'SELECT randval, hmac_digest FROM session WHERE sid = ?', (sid,)
+        ).fetchone()
+
+        if row is None or not row[1] or row[1] != digest:
+            return self.new_session()
+
+        data = dict()
+        stored_keys = set()
+
+        try:
+            for name, subkey, value in conn.execute(
+                'SELECT name, subkey, value FROM session_entry '
+                'WHERE sid = ? ORDER BY name, subkey', (sid,)
+            ):
+                stored_keys.add((name, subkey))
+                value = loads(bytes(value))
+
+                # The split dictionary is stored first (without entries).
+                if subkey:
+                    data[name][subkey] = value
+                else:
+                    data[name] = value
+        except Exception:
+            return self.new_session()
+
+        if not data:
+            return self.new_session()
+
+        session = ManagedSession(
+            data, sid=sid, randval=row[0], hmac_digest=row[1]
+        )
+        session.stored_keys = stored_keys
+
+        return session
+
+    def _entries(self, session):
+        """
+        Returns the pickled entries of the session changed since the last
+        write as dict of (name, subkey) => value, and the keys of the
+        entries, which have been removed since then.
+        """
+        entries = dict()
+        changed = set()
+
+        if session.stored_keys is None:
+            # We do not know, what has been stored for this session.
+            names = set(session.keys())
+        else:
+            names = session.changed_keys
+
+        for name, value in session.items():
+            if name in names:
+                if name in self.SPLIT_KEYS and isinstance(value, dict):
+                    entries[(name, '')] = dumps(dict(), HIGHEST_PROTOCOL)
+                    subkeys = value.keys()
+                else:
+                    entries[(name, '')] = dumps(value, HIGHEST_PROTOCOL)
+                    subkeys = []
+            elif isinstance(value, TrackedDict):
+                subkeys = value.changed_keys
+            else:
+                subkeys = []
+
+            for subkey in subkeys:
+                changed.add((name, str(subkey)))
+                if subkey in value:
+                    entries[(name, str(subkey))] = \
+                        dumps(value[subkey], HIGHEST_PROTOCOL)
+
+        removed = [
+            key for key in (session.stored_keys or [])
+            if key not in entries and (key[0] in names or key in changed)
+        ]
+
+        return entries, removed
+
+    def put(self, session):
+        """Store a managed session"""
+        current_time = time.time()
+        if not session.hmac_digest:
+            session.sign(self.secret)
+        elif not session.force_write:
+            if session.last_write is not None and \
+                (current_time - float(session.last_write)) < \
+                    self.disk_write_delay:
+                return
+
+        session.last_write = current_time
+        session.force_write = False
+
+        # Do not store the session if skip paths
+        if self._skip():
+            return
+
+        entries, removed = self._entries(session)
+        changed = [
+            (session.sid, key[0], key[1], sqlite3.Binary(value))
+            for key, value in entries.items()
+        ]
+
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO session '
+                '(sid, randval, hmac_digest, last_write) VALUES (?, ?, ?, ?)',
+                (session.sid, session.randval, session.hmac_digest,
+                 current_time)
+            )
+            if session.stored_keys is None:
+                # We do not know, what has been stored for this session.
+                conn.execute(
+                    'DELETE FROM session_entry WHERE sid = ?', (session.sid,)
+                )
+            conn.executemany(
+                'DELETE FROM session_entry '
+                'WHERE sid = ? AND name = ? AND subkey = ?',
+                [(session.sid, key[0], key[1]) for key in removed]
+            )
+            conn.executemany(
+                'INSERT OR REPLACE INTO session_entry '
+                '(sid, name, subkey, value) VALUES (?, ?, ?, ?)', changed
+            )
+
+        session.stored_keys = \
+            (session.stored_keys or set()).difference(removed)
+        session.stored_keys.update(entries.keys())
+        session.reset_changes()
+
+    def cleanup(self, lifetime):
+        expired = time.time() - lifetime.total_seconds()
+
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                'DELETE FROM session_entry WHERE sid IN ('
+                'SELECT sid FROM session WHERE last_write < ?)', (expired,)
+            )
+            conn.execute(
+                'DELETE FROM session WHERE last_write < ?', (expired,)
+            )
+
+
 class ManagedSessionInterface(SessionInterface):
     def __init__(self, manager):
         self.manager = manager
@@ -327,18 +680,30 @@ class ManagedSessionInterface(SessionInterface):
         )
 
 
+def session_sqlite_path(app):
+    return app.config.get('SESSION_SQLITE_PATH', None) or \
+        os.path.join(app.config['SESSION_DB_PATH'], 'sessions.db')
+
+
 def create_session_interface(app, skip_paths=[]):
-    return ManagedSessionInterface(
-        CachingSessionManager(
-            FileBackedSessionManager(
-                app.config['SESSION_DB_PATH'],
-                app.config['SECRET_KEY'],
-                app.config.get('PGADMIN_SESSION_DISK_WRITE_DELAY', 10),
-                skip_paths
-            ),
-            1000,
+    if app.config.get('SESSION_BACKEND', 'file') == 'sqlite':
+        manager = SqliteSessionManager(
+            session_sqlite_path(app),
+            app.config['SECRET_KEY'],
+            app.config.get('PGADMIN_SESSION_DISK_WRITE_DELAY', 10),
             skip_paths
-        ))
+        )
+    else:
+        manager = FileBackedSessionManager(
+            app.config['SESSION_DB_PATH'],
+            app.config['SECRET_KEY'],
+            app.config.get('PGADMIN_SESSION_DISK_WRITE_DELAY', 10),
+            skip_paths
+        )
+
+    return ManagedSessionInterface(
+        CachingSessionManager(manager, 1000, skip_paths)
+    )
 
 
 def pga_unauthorised():
@@ -392,10 +757,19 @@ def cleanup_session_files():
             LAST_CHECK_SESSION_FILES = datetime.datetime.now()
 
     if iterate_session_files:
+        # Remove the expired sessions from the session database (if used).
+        current_app.session_interface.manager.cleanup(
+            current_app.permanent_session_lifetime + datetime.timedelta(days=1)
+        )
+
+        sqlite_path = session_sqlite_path(current_app)
         for root, dirs, files in os.walk(
                 current_app.config['SESSION_DB_PATH']):
             for file_name in files:
                 absolute_file_name = os.path.join(root, file_name)
+                # Do not remove the session database (and its WAL files).
+                if absolute_file_name.startswith(sqlite_path):
+                    continue
                 st = os.stat(absolute_file_name)
 
                 # Get the last modified time of the session file
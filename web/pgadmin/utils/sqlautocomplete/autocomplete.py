@@ -10,6 +10,7 @@
 """A blueprint module implementing the sql auto complete feature."""
 
 import re
+import heapq
 import operator
 import sys
 from itertools import count, repeat, chain
@@ -23,8 +24,11 @@ from .parseutils.meta import FunctionMetadata, ColumnMetadata, ForeignKey
 from .parseutils.utils import last_word
 from .parseutils.tables import TableReference
 from .prioritization import PrevalenceCounter
+from .metadata_cache import AutoCompleteMetadata, autocomplete_cache
+from .completion_index import PrefixIndex
 from flask import render_template
 from pgadmin.utils.driver import get_driver
+import config
 from config import PG_DEFAULT_DRIVER
 from pgadmin.utils.preferences import Preferences
 
@@ -95,13 +99,11 @@ class SQLAutoComplete(object):
         """
 
         self.sid = kwargs['sid'] if 'sid' in kwargs else None
+        self.did = kwargs['did'] if 'did' in kwargs else None
         self.conn = kwargs['conn'] if 'conn' in kwargs else None
-        self.keywords = []
         self.databases = []
         self.functions = []
         self.datatypes = []
-        self.dbmetadata = {'tables': {}, 'views': {}, 'functions': {},
-                           'datatypes': {}}
         self.text_before_cursor = None
         self.name_pattern = re.compile("^[_a-z][_a-z0-9\$]*$")
 
@@ -111,7 +113,6 @@ class SQLAutoComplete(object):
         self.sql_path = 'sqlautocomplete/sql/#{0}#'.format(manager.version)
 
         self.search_path = []
-        schema_names = []
         if self.conn.connected():
             # Fetch the search path
             query = render_template(
@@ -121,17 +122,64 @@ class SQLAutoComplete(object):
                 for record in res['rows']:
                     self.search_path.append(record['schema'])
 
-            # Fetch the schema names
-            query = render_template("/".join([self.sql_path, 'schema.sql']))
-            status, res = self.conn.execute_dict(query)
-            if status:
-                for record in res['rows']:
-                    schema_names.append(record['schema'])
-
             pref = Preferences.module('sqleditor')
             keywords_in_uppercase = \
                 pref.preference('keywords_in_uppercase').get()
 
+            # The catalog metadata is cached across the requests for the
+            # same server, database and search path.
+            self.metadata = autocomplete_cache.get(
+                self.sid, self.did, self.search_path, keywords_in_uppercase
+            )
+            with self.metadata.lock:
+                self._load_metadata(keywords_in_uppercase)
+        else:
+            self.metadata = AutoCompleteMetadata()
+            self.metadata.keywords = []
+            self.metadata.prioritizer = PrevalenceCounter([])
+            self.metadata.reserved_words = set()
+            self._bind_metadata()
+
+        # Below are the configurable options in pgcli which we don't have
+        # in pgAdmin4 at the moment. Setting the default value from the pgcli's
+        # config file.
+        self.signature_arg_style = '{arg_name} {arg_type}'
+        self.call_arg_style = '{arg_name: <{max_arg_len}} := {arg_default}'
+        self.call_arg_display_style = '{arg_name}'
+        self.call_arg_oneliner_max = 2
+        self.search_path_filter = True
+        self.generate_aliases = False
+        self.insert_col_skip_patterns = [
+            re.compile(r'^now\(\)$'),
+            re.compile(r'^nextval\(')]
+        self.qualify_columns = 'if_more_than_one_table'
+        self.asterisk_column_order = 'table_order'
+
+        # Maximum number of the suggestions returned by get_completions.
+        self.max_completions = getattr(
+            config, 'AUTOCOMPLETE_MAX_SUGGESTIONS', None)
+
+    def _load_metadata(self, keywords_in_uppercase):
+        """
+        Validate the cached catalog metadata against the catalog change
+        markers, and fetch the keywords and schema names, which are not
+        available in the cache.
+
+        Args:
+            keywords_in_uppercase: fetch the keywords in uppercase
+        """
+        metadata = self.metadata
+
+        rel_version = func_version = None
+        query = render_template(
+            "/".join([self.sql_path, 'catalog_version.sql']))
+        status, res = self.conn.execute_dict(query)
+        if status and len(res['rows']) > 0:
+            rel_version = res['rows'][0]['rel_version']
+            func_version = res['rows'][0]['func_version']
+
+        if metadata.keywords is None:
+            keywords = []
             # Fetch the keywords
             query = render_template("/".join([self.sql_path, 'keywords.sql']))
             # If setting 'Keywords in uppercase' is set to True in
@@ -147,31 +195,47 @@ class SQLAutoComplete(object):
                     # This is a hack to fix the issue in autocomplete.
                     if record['word'].lower() == 'public':
                         continue
-                    self.keywords.append(record['word'])
+                    keywords.append(record['word'])
 
-        self.prioritizer = PrevalenceCounter(self.keywords)
+            metadata.prioritizer = PrevalenceCounter(keywords)
+            metadata.reserved_words = set()
+            for x in keywords:
+                metadata.reserved_words.update(x.split())
 
-        self.reserved_words = set()
-        for x in self.keywords:
-            self.reserved_words.update(x.split())
+            # Do not cache the keywords, if we failed to fetch them.
+            if status:
+                metadata.keywords = keywords
+            else:
+                metadata.keywords = None
+                self.keywords = keywords
 
-        self.all_completions = set(self.keywords)
-        self.extend_schemata(schema_names)
+        metadata.validate(rel_version, func_version)
+        self._bind_metadata()
 
-        # Below are the configurable options in pgcli which we don't have
-        # in pgAdmin4 at the moment. Setting the default value from the pgcli's
-        # config file.
-        self.signature_arg_style = '{arg_name} {arg_type}'
-        self.call_arg_style = '{arg_name: <{max_arg_len}} := {arg_default}'
-        self.call_arg_display_style = '{arg_name}'
-        self.call_arg_oneliner_max = 2
-        self.search_path_filter = True
-        self.generate_aliases = False
-        self.insert_col_skip_patterns = [
-            re.compile(r'^now\(\)$'),
-            re.compile(r'^nextval\(')]
-        self.qualify_columns = 'if_more_than_one_table'
-        self.asterisk_column_order = 'table_order'
+        if metadata.schema_names is None:
+            schema_names = []
+            # Fetch the schema names
+            query = render_template("/".join([self.sql_path, 'schema.sql']))
+            status, res = self.conn.execute_dict(query)
+            if status:
+                for record in res['rows']:
+                    schema_names.append(record['schema'])
+                metadata.schema_names = schema_names
+            self.extend_schemata(schema_names)
+
+    def _bind_metadata(self):
+        """
+        Share the (cached) metadata structures with this object.
+        """
+        metadata = self.metadata
+
+        if metadata.keywords is not None:
+            self.keywords = metadata.keywords
+        self.prioritizer = metadata.prioritizer
+        self.reserved_words = metadata.reserved_words
+        self.dbmetadata = metadata.dbmetadata
+        self.all_completions = metadata.all_completions
+        self._arg_list_cache = metadata.arg_list_cache
 
     def escape_name(self, name):
         if name and (
@@ -195,6 +259,29 @@ class SQLAutoComplete(object):
     def escaped_names(self, names):
         return [self.escape_name(name) for name in names]
 
+    def _index_object(self, kind, schema, name):
+        """
+        Add the synonyms of the given object to the prefix index of the
+        schema, used by the strict matching mode of find_matches.
+        """
+        indexes = self.metadata.indexes[kind]
+        if schema not in indexes:
+            indexes[schema] = PrefixIndex()
+        index = indexes[schema]
+
+        for synonym in (name, generate_alias(name)):
+            index.add(self.unescape_name(synonym.lower()), name)
+
+    def _search_index(self, kind, schema, text):
+        """
+        Returns the set of object names of the given schema, having a
+        synonym starting with the given text.
+        """
+        index = self.metadata.indexes[kind].get(schema)
+        if index is None:
+            return set()
+        return index.search(self._match_text(text)[0])
+
     def extend_database_names(self, databases):
         self.databases.extend(databases)
 
@@ -246,7 +333,9 @@ class SQLAutoComplete(object):
             except KeyError:
                 print('%r %r listed in unrecognized schema %r',
                       kind, relname, schema)
+                continue
 
+            self._index_object(kind, schema, relname)
             self.all_completions.add(relname)
 
     def extend_columns(self, column_data, kind):
@@ -288,6 +377,7 @@ class SQLAutoComplete(object):
                 metadata[schema][func].append(f)
             else:
                 metadata[schema][func] = [f]
+                self._index_object('functions', schema, func)
 
             self.all_completions.add(func)
 
@@ -307,6 +397,7 @@ class SQLAutoComplete(object):
                       for func, metas in funcs.items()
                       for meta in metas))
                  for usage in ('call', 'call_display', 'signature'))
+        self.metadata.arg_list_cache = self._arg_list_cache
 
     def extend_foreignkeys(self, fk_data):
 
@@ -349,6 +440,7 @@ class SQLAutoComplete(object):
         for t in type_data:
             schema, type_name = self.escaped_names(t)
             meta[schema][type_name] = None
+            self._index_object('datatypes', schema, type_name)
             self.all_completions.add(type_name)
 
     def set_search_path(self, search_path):
@@ -362,6 +454,23 @@ class SQLAutoComplete(object):
                            'datatypes': {}}
         self.all_completions = set(self.keywords + self.functions)
 
+    def _match_text(self, text):
+        """
+        Returns the text to be matched against the completions, and the
+        length of the last word of the given text.
+        """
+        text = last_word(text, include='most_punctuations').lower()
+        text_len = len(text)
+
+        if text and text[0] == '"':
+            # text starts with double quote; user is manually escaping a name
+            # Match on everything that follows the double-quote. Note that
+            # text_len is calculated before removing the quote, so the
+            # Completion.position value is correct
+            text = text[1:]
+
+        return text, text_len
+
     def find_matches(self, text, collection, mode='fuzzy', meta=None):
         """Find completion matches for the given text.
 
@@ -393,15 +502,7 @@ class SQLAutoComplete(object):
             'table format'
         ]
         type_priority = prio_order.index(meta) if meta in prio_order else -1
-        text = last_word(text, include='most_punctuations').lower()
-        text_len = len(text)
-
-        if text and text[0] == '"':
-            # text starts with double quote; user is manually escaping a name
-            # Match on everything that follows the double-quote. Note that
-            # text_len is calculated before removing the quote, so the
-            # Completion.position value is correct
-            text = text[1:]
+        text, text_len = self._match_text(text)
 
         if mode == 'fuzzy':
             fuzzy = True
@@ -501,17 +602,25 @@ class SQLAutoComplete(object):
         matches = []
         suggestions = suggest_type(text, text_before_cursor)
 
-        for suggestion in suggestions:
-            suggestion_type = type(suggestion)
-
-            # Map suggestion type to method
-            # e.g. 'table' -> self.get_table_matches
-            matcher = self.suggestion_matchers[suggestion_type]
-            matches.extend(matcher(self, suggestion, word_before_cursor))
-
-        # Sort matches so highest priorities are first
-        matches = sorted(matches, key=operator.attrgetter('priority'),
-                         reverse=True)
+        # The metadata is shared with the other requests through the cache,
+        # and the matchers may extend it.
+        with self.metadata.lock:
+            for suggestion in suggestions:
+                suggestion_type = type(suggestion)
+
+                # Map suggestion type to method
+                # e.g. 'table' -> self.get_table_matches
+                matcher = self.suggestion_matchers[suggestion_type]
+                matches.extend(matcher(self, suggestion, word_before_cursor))
+
+        # Sort matches so highest priorities are first, keep only the top
+        # ones, when a limit is configured.
+        if self.max_completions and len(matches) > self.max_completions:
+            matches = heapq.nlargest(self.max_completions, matches,
+                                     key=operator.attrgetter('priority'))
+        else:
+            matches = sorted(matches, key=operator.attrgetter('priority'),
+                             reverse=True)
 
         result = dict()
         for m in matches:
@@ -742,7 +851,8 @@ class SQLAutoComplete(object):
         # name at this point, so keep unique names only
         funcs = set(
             self._make_cand(f, alias, suggestion, arg_mode)
-            for f in self.populate_functions(suggestion.schema, filt)
+            for f in self.populate_functions(suggestion.schema, filt,
+                                             word_before_cursor)
         )
 
         matches = self.find_matches(word_before_cursor, funcs,
@@ -853,7 +963,8 @@ class SQLAutoComplete(object):
         return Candidate(item, synonyms=synonyms, prio2=prio2, display=display)
 
     def get_table_matches(self, suggestion, word_before_cursor, alias=False):
-        tables = self.populate_schema_objects(suggestion.schema, 'tables')
+        tables = self.populate_schema_objects(
+            suggestion.schema, 'tables', word_before_cursor)
         tables.extend(
             SchemaObject(tbl.name) for tbl in suggestion.local_tables)
 
@@ -867,7 +978,8 @@ class SQLAutoComplete(object):
                                  mode='strict', meta='table')
 
     def get_view_matches(self, suggestion, word_before_cursor, alias=False):
-        views = self.populate_schema_objects(suggestion.schema, 'views')
+        views = self.populate_schema_objects(
+            suggestion.schema, 'views', word_before_cursor)
 
         if not suggestion.schema and (
                 not word_before_cursor.startswith('pg_')):
@@ -891,7 +1003,8 @@ class SQLAutoComplete(object):
 
     def get_datatype_matches(self, suggestion, word_before_cursor):
         # suggest custom datatypes
-        types = self.populate_schema_objects(suggestion.schema, 'datatypes')
+        types = self.populate_schema_objects(
+            suggestion.schema, 'datatypes', word_before_cursor)
         types = [self._make_cand(t, False, suggestion) for t in types]
         matches = self.find_matches(word_before_cursor, types,
                                     mode='strict', meta='datatype')
@@ -1013,10 +1126,12 @@ class SQLAutoComplete(object):
     def _maybe_schema(self, schema, parent):
         return None if parent or schema in self.search_path else schema
 
-    def populate_schema_objects(self, schema, obj_type):
+    def populate_schema_objects(self, schema, obj_type, text=None):
         """Returns a list of SchemaObjects representing tables or views.
 
         :param schema is the schema qualification input by the user (if any)
+        :param text is the word before the cursor (if any), only the objects
+        which can match it in the strict mode are returned
 
         """
         # Fetch the schema objects first
@@ -1028,15 +1143,20 @@ class SQLAutoComplete(object):
                 schema=(self._maybe_schema(schema=sch, parent=schema))
             )
             for sch in self._get_schemas(obj_type, schema)
-            for obj in self.dbmetadata[obj_type][sch].keys()
+            for obj in (
+                self.dbmetadata[obj_type][sch].keys() if text is None
+                else self._search_index(obj_type, sch, text)
+            )
         ]
 
-    def populate_functions(self, schema, filter_func):
+    def populate_functions(self, schema, filter_func, text=None):
         """Returns a list of function SchemaObjects.
 
         :param filter_func is a function that accepts a FunctionMetadata
         namedtuple and returns a boolean indicating whether that
         function should be kept or discarded
+        :param text is the word before the cursor (if any), only the
+        functions which can match it in the strict mode are returned
 
         """
 
@@ -1053,28 +1173,46 @@ class SQLAutoComplete(object):
                 meta=meta
             )
             for sch in self._get_schemas('functions', schema)
-            for (func, metas) in self.dbmetadata['functions'][sch].items()
+            for (func, metas) in (
+                self.dbmetadata['functions'][sch].items() if text is None
+                else ((f, self.dbmetadata['functions'][sch][f])
+                      for f in self._search_index('functions', sch, text))
+            )
             for meta in metas
             if filter_func(meta)
         ]
 
+    def _schemas_to_fetch(self, schema, obj_type):
+        """
+        Returns the list of schemas (the given schema, or the search path),
+        for which the objects of the given type are not yet in the metadata
+        cache.
+
+        :param schema is the schema qualification input by the user (if any)
+        :param obj_type is one of 'tables', 'views', 'datatypes', 'functions'
+
+        """
+        loaded = self.metadata.loaded[obj_type]
+        schemas = [schema] if schema else self.search_path
+
+        return [s for s in schemas if s not in loaded]
+
+    def _in_clause(self, schemas):
+        return ','.join('\'' + s + '\'' for s in schemas)
+
     def fetch_schema_objects(self, schema, obj_type):
         """
         This function is used to fetch schema objects like tables, views, etc..
         :return:
         """
-        in_clause = ''
         query = ''
         data = []
 
-        if schema:
-            in_clause = '\'' + schema + '\''
-        else:
-            for r in self.search_path:
-                in_clause += '\'' + r + '\','
-            # Remove extra comma
-            if len(in_clause) > 0:
-                in_clause = in_clause[:-1]
+        schemas = self._schemas_to_fetch(schema, obj_type)
+        if len(schemas) == 0:
+            return
+
+        in_clause = self._in_clause(schemas)
 
         if obj_type == 'tables':
             query = render_template("/".join([self.sql_path, 'tableview.sql']),
@@ -1095,6 +1233,7 @@ class SQLAutoComplete(object):
                     data.append(
                         (record['schema_name'], record['object_name'])
                     )
+                self.metadata.loaded[obj_type].update(schemas)
 
         if (obj_type == 'tables' or obj_type == 'views') and len(data) > 0:
             self.extend_relations(data, obj_type)
@@ -1114,20 +1253,14 @@ class SQLAutoComplete(object):
         :param schema:
         :return:
         """
-        in_clause = ''
         data = []
 
-        if schema:
-            in_clause = '\'' + schema + '\''
-        else:
-            for r in self.search_path:
-                in_clause += '\'' + r + '\','
-            # Remove extra comma
-            if len(in_clause) > 0:
-                in_clause = in_clause[:-1]
+        schemas = self._schemas_to_fetch(schema, 'functions')
+        if len(schemas) == 0:
+            return
 
         query = render_template("/".join([self.sql_path, 'functions.sql']),
-                                schema_names=in_clause)
+                                schema_names=self._in_clause(schemas))
 
         if self.conn.connected():
             status, res = self.conn.execute_dict(query)
@@ -1153,6 +1286,7 @@ class SQLAutoComplete(object):
                         if row['arg_defaults'] is not None
                         else row['arg_defaults']
                     ))
+                self.metadata.loaded['functions'].update(schemas)
 
         if len(data) > 0:
             self.extend_functions(data)
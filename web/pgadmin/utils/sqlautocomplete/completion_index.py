@@ -0,0 +1,83 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Prefix index over the completion collections used by the sql auto complete
+feature.
+
+The strict matching mode of SQLAutoComplete.find_matches only accepts the
+candidates having one of its synonyms starting with the text typed by the
+user. Instead of scanning (and building a Candidate for) every object in the
+schema, the matchers look up the names having a matching synonym in a
+sorted list of the synonyms using binary search.
+"""
+
+from bisect import bisect_left
+
+
+class PrefixIndex(object):
+    """
+    class PrefixIndex
+
+        Maps the (normalized) synonyms to the object names.
+
+        The entries are collected by add(...), and sorted only once, when
+        they are searched for the first time after the change.
+    """
+
+    def __init__(self):
+        self._keys = []
+        self._values = []
+        self._pending = []
+
+    def add(self, key, value):
+        """
+        Add an entry to the index.
+
+        Args:
+            key: normalized synonym of the object
+            value: name of the object
+        """
+        self._pending.append((key, value))
+
+    def _build(self):
+        if not self._pending:
+            return
+
+        entries = sorted(
+            list(zip(self._keys, self._values)) + self._pending
+        )
+        self._keys = [e[0] for e in entries]
+        self._values = [e[1] for e in entries]
+        self._pending = []
+
+    def search(self, prefix):
+        """
+        Returns the set of the object names, having at least one of the
+        synonyms starting with the given prefix.
+
+        Args:
+            prefix: normalized text typed by the user
+        """
+        self._build()
+
+        keys = self._keys
+        if not prefix:
+            return set(self._values)
+
+        result = set()
+        idx = bisect_left(keys, prefix)
+        while idx < len(keys) and keys[idx].startswith(prefix):
+            result.add(self._values[idx])
+            idx += 1
+
+        return result
+
+    def __len__(self):
+        return len(self._keys) + len(self._pending)
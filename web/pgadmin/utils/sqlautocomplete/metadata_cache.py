@@ -0,0 +1,169 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Process wide cache of the catalog metadata used by the sql auto complete
+feature.
+
+Every auto complete request used to build a fresh SQLAutoComplete object,
+which fetched the keywords, schemas, relations, columns, foreign keys and
+functions from the catalog again. The objects in this module keep that
+metadata between the requests, keyed by (server, database, search_path),
+and keep it valid using a cheap catalog change probe.
+"""
+
+import threading
+from collections import OrderedDict
+
+import config
+
+# Object types, which are loaded per schema on demand.
+RELATION_TYPES = ('tables', 'views', 'datatypes')
+FUNCTION_TYPES = ('functions',)
+
+
+class AutoCompleteMetadata(object):
+    """
+    class AutoCompleteMetadata
+
+        Holds the catalog metadata fetched by the SQLAutoComplete for one
+        (server, database, search_path) combination.
+
+        The relation related metadata (schemas, tables, views, columns,
+        foreign keys and datatypes) and the function metadata are tracked
+        with separate catalog change markers, so that a change in pg_proc
+        does not throw away the relations and vice versa.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+
+        # Keywords never change for a server, hence - they are not part of
+        # the change markers.
+        self.keywords = None
+        self.reserved_words = None
+        self.prioritizer = None
+
+        self.rel_version = None
+        self.func_version = None
+
+        self.schema_names = None
+        self.dbmetadata = {'tables': {}, 'views': {}, 'functions': {},
+                           'datatypes': {}}
+        self.all_completions = set()
+        self.arg_list_cache = None
+
+        # Set of the (escaped) schema names, for which the objects of the
+        # given type have already been fetched.
+        self.loaded = dict((t, set()) for t in RELATION_TYPES + FUNCTION_TYPES)
+
+        # Prefix indexes over the object names per object type and schema,
+        # i.e. indexes['tables']['public'] is a PrefixIndex object.
+        self.indexes = dict((t, {}) for t in RELATION_TYPES + FUNCTION_TYPES)
+
+    def validate(self, rel_version, func_version):
+        """
+        Compare the stored catalog change markers with the current ones, and
+        discard the stale part of the metadata.
+
+        A marker of None means, the change can not be detected on this
+        server (i.e. 'track_counts' is off), and we must not trust anything
+        from the cache.
+
+        Args:
+            rel_version: marker for the relation related catalogs
+            func_version: marker for the pg_proc catalog
+        """
+        rel_changed = rel_version is None or rel_version != self.rel_version
+
+        if rel_changed:
+            self.schema_names = None
+            for obj_type in RELATION_TYPES:
+                self.dbmetadata[obj_type] = {}
+                self.loaded[obj_type] = set()
+                self.indexes[obj_type] = {}
+
+        # The function metadata is kept per schema, hence - it needs to be
+        # reloaded too, when the schema list is going to be reloaded.
+        if rel_changed or func_version is None or \
+                func_version != self.func_version:
+            self.dbmetadata['functions'] = {}
+            self.loaded['functions'] = set()
+            self.indexes['functions'] = {}
+            self.arg_list_cache = None
+
+        self.rel_version = rel_version
+        self.func_version = func_version
+
+        if self.schema_names is None:
+            self.all_completions = set(self.keywords or [])
+
+
+class AutoCompleteCache(object):
+    """
+    class AutoCompleteCache
+
+        A size bounded LRU cache of AutoCompleteMetadata objects.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, sid, did, search_path, keywords_in_uppercase=False):
+        """
+        Returns the metadata object for the given server, database and
+        search path. A new (empty) object is created, if not found, and the
+        least recently used ones are evicted to keep the size in limit.
+
+        Args:
+            sid: Server ID
+            did: Database ID
+            search_path: list of the schema names in the search path
+            keywords_in_uppercase: keywords are fetched in uppercase
+        """
+        key = (sid, did, tuple(search_path), bool(keywords_in_uppercase))
+
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                entry = AutoCompleteMetadata()
+            self._entries[key] = entry
+
+            while len(self._entries) > max(self.max_entries, 1):
+                self._entries.popitem(last=False)
+
+        return entry
+
+    def invalidate(self, sid=None, did=None):
+        """
+        Remove the cached metadata for the given server (and database).
+        Removes everything when no server id is given.
+
+        Args:
+            sid: Server ID
+            did: Database ID
+        """
+        with self._lock:
+            if sid is None:
+                self._entries.clear()
+                return
+
+            for key in list(self._entries.keys()):
+                if key[0] == sid and (did is None or key[1] == did):
+                    del self._entries[key]
+
+    def __len__(self):
+        return len(self._entries)
+
+
+autocomplete_cache = AutoCompleteCache(
+    getattr(config, 'AUTOCOMPLETE_CACHE_MAX_ENTRIES', 32)
+)
@@ -0,0 +1,96 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.sqlautocomplete.metadata_cache import AutoCompleteCache
+
+
+class TestAutoCompleteMetadataCache(BaseTestGenerator):
+    """ This class will test the auto complete metadata cache. """
+    scenarios = [
+        (
+            'When the same key is requested twice',
+            dict(scenario=1)
+        ), (
+            'When the search path is different',
+            dict(scenario=2)
+        ), (
+            'When the cache is full',
+            dict(scenario=3)
+        ), (
+            'When the function catalog has changed',
+            dict(scenario=4)
+        ), (
+            'When the relation catalog has changed',
+            dict(scenario=5)
+        ), (
+            'When the change markers are not available',
+            dict(scenario=6)
+        ), (
+            'When the server is invalidated',
+            dict(scenario=7)
+        )
+    ]
+
+    def setUp(self):
+        self.cache = AutoCompleteCache(2)
+
+    def runTest(self):
+        if self.scenario == 1:
+            entry = self.cache.get(1, 2, ['public'])
+            self.assertIs(entry, self.cache.get(1, 2, ['public']))
+        elif self.scenario == 2:
+            entry = self.cache.get(1, 2, ['public'])
+            self.assertIsNot(entry, self.cache.get(1, 2, ['other']))
+        elif self.scenario == 3:
+            first = self.cache.get(1, 1, ['public'])
+            second = self.cache.get(1, 2, ['public'])
+            # Mark the first entry as recently used
+            self.cache.get(1, 1, ['public'])
+            self.cache.get(1, 3, ['public'])
+            self.assertEqual(len(self.cache), 2)
+            self.assertIs(first, self.cache.get(1, 1, ['public']))
+            self.assertIsNot(second, self.cache.get(1, 2, ['public']))
+        elif self.scenario == 4:
+            entry = self._loaded_entry()
+            entry.validate('1', '2')
+            self.assertEqual(entry.schema_names, ['public'])
+            self.assertEqual(entry.loaded['tables'], set(['public']))
+            self.assertEqual(entry.loaded['functions'], set())
+            self.assertIsNone(entry.arg_list_cache)
+        elif self.scenario == 5:
+            entry = self._loaded_entry()
+            entry.validate('2', '1')
+            self.assertIsNone(entry.schema_names)
+            self.assertEqual(entry.loaded['tables'], set())
+            self.assertEqual(entry.loaded['functions'], set())
+            # The function marker is still accepted after reloading
+            entry.loaded['functions'].add('public')
+            entry.validate('2', '1')
+            self.assertEqual(entry.loaded['functions'], set(['public']))
+        elif self.scenario == 6:
+            entry = self._loaded_entry(None, None)
+            entry.validate(None, None)
+            self.assertIsNone(entry.schema_names)
+            self.assertEqual(entry.loaded['functions'], set())
+        elif self.scenario == 7:
+            entry = self.cache.get(1, 2, ['public'])
+            other = self.cache.get(2, 2, ['public'])
+            self.cache.invalidate(1)
+            self.assertIsNot(entry, self.cache.get(1, 2, ['public']))
+            self.assertIs(other, self.cache.get(2, 2, ['public']))
+
+    def _loaded_entry(self, rel_version='1', func_version='1'):
+        entry = self.cache.get(1, 2, ['public'])
+        entry.validate(rel_version, func_version)
+        entry.schema_names = ['public']
+        entry.loaded['tables'].add('public')
+        entry.loaded['functions'].add('public')
+        entry.arg_list_cache = {}
+        return entry
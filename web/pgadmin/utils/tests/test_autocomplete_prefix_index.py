@@ -0,0 +1,47 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.sqlautocomplete.completion_index import PrefixIndex
+
+
+class TestAutoCompletePrefixIndex(BaseTestGenerator):
+    """ This class will test the prefix index used by auto complete. """
+    scenarios = [
+        (
+            'When the prefix is empty',
+            dict(prefix='', expected=set(['orders', 'order_items',
+                                          'customers']))
+        ), (
+            'When the prefix matches the names',
+            dict(prefix='order', expected=set(['orders', 'order_items']))
+        ), (
+            'When the prefix matches a synonym',
+            dict(prefix='oi', expected=set(['order_items']))
+        ), (
+            'When the prefix matches the name and the synonym',
+            dict(prefix='c', expected=set(['customers']))
+        ), (
+            'When the prefix does not match',
+            dict(prefix='z', expected=set())
+        )
+    ]
+
+    def setUp(self):
+        self.index = PrefixIndex()
+        for name, alias in (('orders', 'o'), ('customers', 'c')):
+            self.index.add(name, name)
+            self.index.add(alias, name)
+        # Search once to make sure, the entries added later are merged
+        self.index.search('')
+        self.index.add('order_items', 'order_items')
+        self.index.add('oi', 'order_items')
+
+    def runTest(self):
+        self.assertEqual(self.index.search(self.prefix), self.expected)
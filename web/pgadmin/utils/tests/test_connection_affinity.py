@@ -0,0 +1,66 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from flask import Flask
+
+import config
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.driver import affinity
+
+
+class TestConnectionAffinityCookie(BaseTestGenerator):
+    """ This class will test the connection affinity cookie. """
+    scenarios = [
+        (
+            'When the request has no affinity cookie',
+            dict(worker='w1', cookie=None, expected='w1')
+        ), (
+            'When the request is routed to the named worker',
+            dict(worker='w1', cookie='w1', expected=None)
+        ), (
+            'When the session moves to another worker',
+            dict(worker='w2', cookie='w1', expected='w2')
+        ), (
+            'When the worker id is not configured',
+            dict(worker=None, cookie=None, expected=None)
+        )
+    ]
+
+    def setUp(self):
+        self.worker_id = config.WORKER_ID
+        config.WORKER_ID = self.worker
+
+    def runTest(self):
+        app = Flask(__name__)
+        app.add_url_rule('/', 'index', lambda: 'ok')
+        affinity.init_app(app)
+
+        client = app.test_client()
+        if self.cookie is not None:
+            client.set_cookie(
+                'localhost', config.CONNECTION_AFFINITY_COOKIE, self.cookie
+            )
+
+        response = client.get('/')
+        cookies = [
+            header for header in response.headers.getlist('Set-Cookie')
+            if header.startswith(config.CONNECTION_AFFINITY_COOKIE + '=')
+        ]
+
+        if self.expected is None:
+            self.assertEqual(cookies, [])
+        else:
+            self.assertEqual(len(cookies), 1)
+            self.assertTrue(cookies[0].startswith(
+                '{0}={1};'.format(config.CONNECTION_AFFINITY_COOKIE,
+                                  self.expected)
+            ))
+
+    def tearDown(self):
+        config.WORKER_ID = self.worker_id
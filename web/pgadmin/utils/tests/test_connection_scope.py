@@ -0,0 +1,60 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.driver.connection_scope import connection_scope, \
+    current_scope, register_scoped_connection, scope_connections
+
+
+class _Manager(object):
+    def __init__(self):
+        self.released = []
+
+    def release(self, conn_id=None):
+        self.released.append(conn_id)
+
+
+class TestConnectionScope(BaseTestGenerator):
+    """ This class will test the thread scoped database connections. """
+    scenarios = [
+        (
+            'When the connections are released at the end of the scope',
+            dict(nested=False)
+        ), (
+            'When the connections are released by the parent scope',
+            dict(nested=True)
+        )
+    ]
+
+    def runTest(self):
+        manager = _Manager()
+
+        self.assertIsNone(current_scope())
+
+        with connection_scope('diff:1'):
+            self.assertEqual(current_scope(), 'diff:1')
+            register_scoped_connection(manager, 'diff:1:db')
+
+            if self.nested:
+                with connection_scope('diff:1:target', scope_connections()):
+                    self.assertEqual(current_scope(), 'diff:1:target')
+                    register_scoped_connection(manager, 'diff:1:target:db')
+
+                self.assertEqual(current_scope(), 'diff:1')
+                self.assertEqual(manager.released, [])
+
+            # The same connection is registered only once
+            register_scoped_connection(manager, 'diff:1:db')
+
+        self.assertIsNone(current_scope())
+        self.assertEqual(
+            manager.released,
+            ['diff:1:db', 'diff:1:target:db'] if self.nested else
+            ['diff:1:db']
+        )
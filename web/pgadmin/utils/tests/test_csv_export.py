@@ -0,0 +1,85 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils import csv
+from pgadmin.utils.driver.psycopg2.connection import _plain_select_query
+
+if csv.PY3:
+    from io import StringIO
+else:
+    from StringIO import StringIO
+
+
+class TestCSVWriterNullValues(BaseTestGenerator):
+    """ This class will test the null value replacement of the csv writer """
+    scenarios = [
+        (
+            'When the null values are not replaced',
+            dict(quoting=csv.QUOTE_NONNUMERIC, replace_nulls_with=None,
+                 expected=u"'a',1,\r\n")
+        ), (
+            'When the null values are replaced',
+            dict(quoting=csv.QUOTE_NONNUMERIC, replace_nulls_with='NULL',
+                 expected=u"'a',1,NULL\r\n")
+        ), (
+            'When all the fields are quoted',
+            dict(quoting=csv.QUOTE_ALL, replace_nulls_with='NULL',
+                 expected=u"'a','1',NULL\r\n")
+        )
+    ]
+
+    def runTest(self):
+        res_io = StringIO()
+        writer = csv.writer(
+            res_io, quoting=self.quoting, quotechar="'",
+            replace_nulls_with=self.replace_nulls_with
+        )
+
+        # The writer is reused for the next batch
+        writer.writerows([(u'a', 1, None)])
+        self.assertEqual(res_io.getvalue(), self.expected)
+        res_io.seek(0)
+        res_io.truncate(0)
+        writer.writerows([(u'a', 1, None)])
+        self.assertEqual(res_io.getvalue(), self.expected)
+
+
+class TestPlainSelectQuery(BaseTestGenerator):
+    """
+    This class will test the detection of the queries, which can be run
+    through a server side cursor for the csv export.
+    """
+    scenarios = [
+        (
+            'When the query is a plain select',
+            dict(query='SELECT * FROM t;', expected='SELECT * FROM t')
+        ), (
+            'When the query has leading comments',
+            dict(query='-- comment\n/* block */\n  with a as (select 1) '
+                       'select * from a',
+                 expected='with a as (select 1) select * from a')
+        ), (
+            'When there are multiple queries',
+            dict(query='SELECT 1; SELECT 2', expected=None)
+        ), (
+            'When the query modifies the data',
+            dict(query='WITH d AS (DELETE FROM t RETURNING *) SELECT * '
+                       'FROM d', expected=None)
+        ), (
+            'When the query creates a table',
+            dict(query='SELECT * INTO t2 FROM t', expected=None)
+        ), (
+            'When the query is not a select',
+            dict(query='EXPLAIN SELECT 1', expected=None)
+        )
+    ]
+
+    def runTest(self):
+        self.assertEqual(_plain_select_query(self.query), self.expected)
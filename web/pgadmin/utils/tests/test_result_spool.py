@@ -0,0 +1,102 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.driver.psycopg2.spool import ResultSpool
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestResultSpool(BaseTestGenerator):
+    """ This class will test the query result spool. """
+    scenarios = [
+        (
+            'When reading the first batch',
+            dict(offset=0, count=3, expected=[0, 1, 2])
+        ), (
+            'When reading across the chunks',
+            dict(offset=3, count=4, expected=[3, 4, 5, 6])
+        ), (
+            'When reading beyond the last row',
+            dict(offset=8, count=5, expected=[8, 9])
+        ), (
+            'When reading all the remaining rows',
+            dict(offset=5, count=-1, expected=[5, 6, 7, 8, 9])
+        ), (
+            'When the offset is out of range',
+            dict(offset=10, count=5, expected=[])
+        )
+    ]
+
+    def setUp(self):
+        self.spool = ResultSpool(3)
+        rows = [[idx, u'row {0}'.format(idx), None] for idx in range(10)]
+        # Write the rows in uneven chunks
+        for start, end in ((0, 4), (4, 5), (5, 10)):
+            self.spool.write(rows[start:end])
+
+    def runTest(self):
+        self.assertEqual(self.spool.row_count, 10)
+        self.assertEqual(
+            self.spool.read(self.offset, self.count),
+            [[idx, u'row {0}'.format(idx), None] for idx in self.expected]
+        )
+
+    def tearDown(self):
+        self.spool.close()
+        self.assertTrue(self.spool.closed)
+
+
+class TestResultSpoolSource(BaseTestGenerator):
+    """ This class will test the incremental spooling of the result. """
+    scenarios = [
+        (
+            'When reading the first page',
+            dict(reads=[(0, 3)], expected=[[0, 1, 2]],
+                 spooled=4, complete=False)
+        ), (
+            'When reading the pages sequentially',
+            dict(reads=[(0, 4), (4, 4)], expected=[[0, 1, 2, 3],
+                                                   [4, 5, 6, 7]],
+                 spooled=8, complete=False)
+        ), (
+            'When reading at an offset',
+            dict(reads=[(8, 5)], expected=[[8, 9]],
+                 spooled=10, complete=True)
+        ), (
+            'When reading all the rows',
+            dict(reads=[(2, -1)], expected=[list(range(2, 10))],
+                 spooled=10, complete=True)
+        )
+    ]
+
+    def setUp(self):
+        self.rows = [[idx] for idx in range(10)]
+        self.fetched = 0
+
+        def fetchmany(size):
+            rows = self.rows[self.fetched:self.fetched + size]
+            self.fetched += len(rows)
+            return rows
+
+        self.spool = ResultSpool(1, source=fetchmany, batch_size=4)
+
+    def runTest(self):
+        # Nothing is spooled till the rows are read
+        self.assertEqual(self.spool.row_count, 0)
+
+        for (offset, count), expected in zip(self.reads, self.expected):
+            self.assertEqual(
+                self.spool.read(offset, count), [[idx] for idx in expected]
+            )
+
+        self.assertEqual(self.spool.row_count, self.spooled)
+        self.assertEqual(self.fetched, self.spooled)
+        self.assertEqual(self.spool.complete, self.complete)
+
+    def tearDown(self):
+        self.spool.close()
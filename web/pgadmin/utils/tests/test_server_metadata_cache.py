@@ -0,0 +1,84 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import datetime
+
+import config
+from pgadmin.model import Server
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.driver.psycopg2.server_manager import ServerManager
+
+
+class TestServerMetadataCache(BaseTestGenerator):
+    """
+    This class will test the database/user information shared by the
+    connections of a server manager.
+    """
+    scenarios = [
+        (
+            'When the information has not been fetched yet',
+            dict(scenario=1)
+        ), (
+            'When all the databases are fetched at once',
+            dict(scenario=2)
+        ), (
+            'When the information is too old',
+            dict(scenario=3)
+        ), (
+            'When the information is invalidated',
+            dict(scenario=4)
+        ), (
+            'When a database has been dropped',
+            dict(scenario=5)
+        )
+    ]
+
+    def setUp(self):
+        # The manager saves itself in the session, when created.
+        with self.app.test_request_context():
+            self.manager = ServerManager(Server(
+                id=1, name='test', host='localhost', port=5432,
+                maintenance_db='postgres', username='postgres',
+                ssl_mode='prefer'
+            ))
+
+    def runTest(self):
+        if self.scenario == 1:
+            self.assertTrue(self.manager.metadata_expired('db_info'))
+            self.assertTrue(self.manager.metadata_expired('user_info'))
+        elif self.scenario == 2:
+            self.manager.update_db_info([
+                {'did': 1, 'datname': 'postgres'},
+                {'did': 2, 'datname': 'db2'}
+            ])
+            self.assertFalse(self.manager.metadata_expired('db_info'))
+            self.assertEqual(self.manager.db_info[2]['datname'], 'db2')
+        elif self.scenario == 3:
+            self.manager.update_db_info([{'did': 1, 'datname': 'postgres'}])
+            self.manager.metadata_fetched['db_info'] -= datetime.timedelta(
+                seconds=config.SERVER_METADATA_CACHE_TTL
+            )
+            self.assertTrue(self.manager.metadata_expired('db_info'))
+        elif self.scenario == 4:
+            self.manager.update_db_info([{'did': 1, 'datname': 'postgres'}])
+            self.manager.invalidate_metadata()
+            self.assertTrue(self.manager.metadata_expired('db_info'))
+            # The known databases can still be looked up by oid
+            self.assertIn(1, self.manager.db_info)
+        elif self.scenario == 5:
+            self.manager.update_db_info([
+                {'did': 1, 'datname': 'postgres'},
+                {'did': 2, 'datname': 'db2'}
+            ])
+            self.manager.db_info['pgAgent'] = {'has_connstr': True}
+            self.manager.update_db_info([{'did': 1, 'datname': 'postgres'}])
+            self.assertNotIn(2, self.manager.db_info)
+            self.assertIn(1, self.manager.db_info)
+            # The other information is kept
+            self.assertIn('pgAgent', self.manager.db_info)
@@ -0,0 +1,103 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import datetime
+import os
+import shutil
+import tempfile
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.session import SqliteSessionManager
+
+
+class TestSqliteSessionManager(BaseTestGenerator):
+    """ This class will test the SQLite session storage. """
+    scenarios = [
+        (
+            'When the session is stored and loaded',
+            dict(scenario=1)
+        ), (
+            'When only a query tool transaction is changed',
+            dict(scenario=2)
+        ), (
+            'When a query tool transaction is removed',
+            dict(scenario=3)
+        ), (
+            'When the digest does not match',
+            dict(scenario=4)
+        ), (
+            'When the session has expired',
+            dict(scenario=5)
+        ), (
+            'When the session is loaded and the query tool data is replaced',
+            dict(scenario=6)
+        )
+    ]
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.manager = SqliteSessionManager(
+            os.path.join(self.directory, 'sessions.db'), 'secret', 0
+        )
+
+    def runTest(self):
+        with self.app.test_request_context():
+            session = self.manager.new_session()
+            session['user'] = 'admin'
+            session['gridData'] = {'1': {'command_obj': 'a'},
+                                   '2': {'command_obj': 'b'}}
+            self.manager.put(session)
+
+            if self.scenario == 1:
+                loaded = self.manager.get(session.sid, session.hmac_digest)
+                self.assertEqual(dict(loaded), dict(session))
+            elif self.scenario == 2:
+                session['gridData']['2'] = {'command_obj': 'c'}
+                self.assertEqual(
+                    self._changed_entries(session), [('gridData', '2')]
+                )
+                self.manager.put(session)
+                loaded = self.manager.get(session.sid, session.hmac_digest)
+                self.assertEqual(
+                    loaded['gridData']['2'], {'command_obj': 'c'}
+                )
+            elif self.scenario == 3:
+                del session['gridData']['1']
+                self.assertEqual(
+                    self._changed_entries(session), [('gridData', '1')]
+                )
+                self.manager.put(session)
+                loaded = self.manager.get(session.sid, session.hmac_digest)
+                self.assertEqual(list(loaded['gridData'].keys()), ['2'])
+            elif self.scenario == 4:
+                loaded = self.manager.get(session.sid, 'wrong digest')
+                self.assertNotEqual(loaded.sid, session.sid)
+            elif self.scenario == 5:
+                self.manager.cleanup(datetime.timedelta(seconds=-1))
+                self.assertFalse(self.manager.exists(session.sid))
+            elif self.scenario == 6:
+                loaded = self.manager.get(session.sid, session.hmac_digest)
+                self.assertEqual(self._changed_entries(loaded), [])
+                loaded['gridData'] = {'3': {'command_obj': 'd'}}
+                self.assertEqual(
+                    sorted(self._changed_entries(loaded)),
+                    [('gridData', ''), ('gridData', '1'), ('gridData', '2'),
+                     ('gridData', '3')]
+                )
+                self.manager.put(loaded)
+                loaded = self.manager.get(session.sid, session.hmac_digest)
+                self.assertEqual(list(loaded['gridData'].keys()), ['3'])
+                self.assertEqual(loaded['user'], 'admin')
+
+    def _changed_entries(self, session):
+        entries, removed = self.manager._entries(session)
+        return list(entries.keys()) + removed
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
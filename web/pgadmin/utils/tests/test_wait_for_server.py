@@ -0,0 +1,75 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2020, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import socket
+import sys
+import time
+
+from pgadmin.utils.driver.psycopg2.connection import Connection
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info < (3, 3):
+    from mock import MagicMock
+else:
+    from unittest.mock import MagicMock
+
+
+class TestWaitForServer(BaseTestGenerator):
+    """
+    This class will test waiting for the database server on the asynchronous
+    connection.
+    """
+    scenarios = [
+        (
+            'When the server sends the data',
+            dict(scenario='readable', expected=True)
+        ), (
+            'When the server does not send anything in time',
+            dict(scenario='timeout', expected=False)
+        ), (
+            'When the connection has not been made',
+            dict(scenario='none', expected=True)
+        ), (
+            'When the connection has been closed',
+            dict(scenario='closed', expected=True)
+        ), (
+            'When the socket of the connection is invalid',
+            dict(scenario='invalid', expected=True)
+        )
+    ]
+
+    def setUp(self):
+        self.server, self.client = socket.socketpair()
+
+    def tearDown(self):
+        self.server.close()
+        self.client.close()
+
+    def runTest(self):
+        conn = Connection(MagicMock(), 'DB:postgres', 'postgres', async_=1)
+
+        if self.scenario != 'none':
+            conn.conn = MagicMock()
+            conn.conn.closed = 1 if self.scenario == 'closed' else 0
+            conn.conn.fileno.return_value = self.client.fileno()
+            if self.scenario == 'invalid':
+                conn.conn.fileno.return_value = -1
+
+        if self.scenario == 'readable':
+            self.server.send(b'N')
+
+        started = time.time()
+        self.assertEqual(conn.wait_for_server(0.5), self.expected)
+        elapsed = time.time() - started
+
+        if self.scenario == 'timeout':
+            self.assertGreaterEqual(elapsed, 0.4)
+        else:
+            # Returned without waiting
+            self.assertLess(elapsed, 0.4)